@@ -0,0 +1,210 @@
+"""Synthetic Star Citizen Game.log generator for parser benchmarks.
+
+Lines are modelled on the samples documented in parser.py (parse_kill_line,
+update_vehicle_destruction_context, the proximity parsers) and config.py
+(find_rsi_handle), so every event type takes the same code path as in a real
+log:
+
+    login / geid      <Legacy login response> ... Handle[...], AccountLoginCharacterStatus_Character
+    context           <Context Establisher Done> ... gamerules="..."
+    zone              OnEntityEnterZone -> Entity [ANVL_Hornet_F7A_Mk2_<id>] (local player)
+    spawn             CPlayerShipRespawnManager::OnVehicleSpawned (arena modes)
+    kill              <Actor Death> CActor::Kill by the local player, plus NPC deaths
+    vehicle           <Vehicle Destruction> with zone, position and 'caused by'
+    stall             <Actor stall> Actor stall detected, Player: ...
+    fake_hit          [OnHandleHit] Fake hit FROM ... TO <ship>. Being sent to child ...
+    noise             everything else (the bulk of a real log)
+
+A small share of noise lines carry invalid UTF-8 bytes, which the readers
+decode with errors="replace".
+
+Usage:
+    python benchmarks/gamelog_gen.py OUT.log [--lines 200000] [--kill-density 0.001] [--seed 1]
+"""
+import argparse
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+
+DEFAULT_HANDLE = "BenchPilot"
+DEFAULT_GEID = "202061381370"
+
+# Per-line probabilities for each event type; the remainder is noise
+DEFAULT_DENSITIES = {
+    'kill': 0.0005,
+    'npc_kill': 0.001,
+    'vehicle': 0.001,
+    'stall': 0.0005,
+    'fake_hit': 0.0003,
+    'zone': 0.002,
+    'spawn': 0.0005,
+    'context': 0.00005,
+    'invalid_utf8': 0.0002,
+}
+
+GAME_MODES = ("SC_Default", "SC_Default", "SC_Default", "EA_FreeFlight", "EA_SquadronBattle")
+SHIPS = ("ANVL_Hornet_F7A_Mk2", "AEGS_Gladius", "DRAK_Cutlass_Black", "RSI_Polaris", "ORIG_300i", "MISC_Freelancer")
+ZONES = ("OOC_Stanton_2a_Cellin", "SolarSystem", "stanton2a", "ellis3", "RR_HUR_LEO")
+WEAPONS = (
+    ("GATS_BallisticGatling_S3", "unknown", "VehicleDestruction"),
+    ("lbco_pistol_energy_01", "lbco_pistol_energy_01", "Bullet"),
+    ("RSI_Bespoke_BallisticCannon_A", "unknown", "VehicleDestruction"),
+    ("MRCK_S10_RSI_Polaris_Torpedo_lb", "MRCK_S10_RSI_Polaris_Torpedo_lb", "Explosion"),
+    ("behr_rifle_ballistic_01", "behr_rifle_ballistic_01", "Bullet"),
+)
+NOISE = (
+    "[Notice] <FatalCollision> Fatal Collision occured for vehicle {ship}_{id} [Part: body, Pos: x: 1.0, y: 2.0, z: 3.0] [Team_VehicleFeatures][Vehicle]",
+    "[Notice] <Spawn Flow> CSCPlayerPUSpawningComponent::UnregisterFromExternalSystems: Player '{other}' [{geid}] lost reservation for spawnpoint [Team_ActorFeatures][Spawning]",
+    "[Trace] <SHUDEvent_OnNotification> Added notification \"Entered Monitored Space: \" [{id}] to queue. New queue size: 1, MissionId: [00000000-0000-0000-0000-000000000000] [Team_CoreGameplayFeatures][Missions]",
+    "[Notice] <CEntity::OnOwnerRemoved> Entity {ship}_{id} removed from owner [Team_CoreTech][Entity]",
+    "[Notice] <InventoryManagement> New request[{id}] Player[{other}] Action[Store] [Team_CoreGameplayFeatures][Inventory]",
+    "[Warning] <CNetworkStream> Stream latency spike: {latency}ms [Team_Network][Network]",
+    "[Notice] <Jump Drive State Changed> Now Idle adam: {ship}_{id} in zone {zone} [Team_VehicleFeatures][Vehicle]",
+)
+OTHER_PLAYERS = ("Mercuriuss", "idkausername_27", "Pirate_Pete", "Quantum_Quinn", "SnareSam", "Bounty_Bea", "Vel_Ocity")
+
+
+class _Clock:
+    def __init__(self, start: datetime, rng: random.Random):
+        self.now = start
+        self.rng = rng
+
+    def stamp(self) -> str:
+        self.now += timedelta(milliseconds=self.rng.randint(1, 120))
+        return "<" + self.now.strftime("%Y-%m-%dT%H:%M:%S.") + f"{self.now.microsecond // 1000:03d}Z>"
+
+
+def _entity_id(rng: random.Random) -> str:
+    return str(rng.randint(2600000000000, 2799999999999))
+
+
+def _login_lines(clock: _Clock, handle: str, geid: str):
+    return [
+        f"{clock.stamp()} [Notice] <Legacy login response> [CIG-net] User Login Success - Handle[{handle}] - Time[{clock.now.timestamp():.0f}] [Team_GameServices][Login]",
+        f"{clock.stamp()} [Notice] <AccountLoginCharacterStatus_Character> Character: createdAt 1700000000000 - updatedAt 1700000000001 - geid {geid} - accountId 1 - name {handle} - state STATE_CURRENT [Team_GameServices][Login]",
+    ]
+
+
+def _context_line(clock: _Clock, mode: str) -> str:
+    return (f"{clock.stamp()} [Notice] <Context Establisher Done> establisher=\"CReplicationModel\" "
+            f"runningTime=12.345678 map=\"megamap\" gamerules=\"{mode}\" sessionId=\"bench\" "
+            f"[Team_Network][Network][Replication][Loading][GameState]")
+
+
+def _event_line(kind: str, clock: _Clock, rng: random.Random, handle: str, geid: str) -> str:
+    ts = clock.stamp()
+    other = rng.choice(OTHER_PLAYERS)
+    ship = rng.choice(SHIPS)
+    eid = _entity_id(rng)
+    if kind == 'kill':
+        weapon, klass, damage = rng.choice(WEAPONS)
+        zone = f"{ship}_{eid}" if damage == 'VehicleDestruction' else rng.choice(ZONES)
+        return (f"{ts} [Notice] <Actor Death> CActor::Kill: '{other}' [{rng.randint(200000000000, 209999999999)}] "
+                f"in zone '{zone}' killed by '{handle}' [{geid}] using '{weapon}_{_entity_id(rng)}' [Class {klass}] "
+                f"with damage type '{damage}' from direction x: 0.000000, y: 0.000000, z: 0.000000 [Team_ActorTech][Actor]")
+    if kind == 'npc_kill':
+        return (f"{ts} [Notice] <Actor Death> CActor::Kill: 'PU_Human_Enemy_GroundCombat_NPC_{eid}' [{eid}] "
+                f"in zone '{rng.choice(ZONES)}' killed by '{handle}' [{geid}] using 'behr_rifle_ballistic_01_{eid}' "
+                f"[Class behr_rifle_ballistic_01] with damage type 'Bullet' from direction x: 0.1, y: 0.2, z: 0.3 [Team_ActorTech][Actor]")
+    if kind == 'vehicle':
+        caused_by = handle if rng.random() < 0.5 else other
+        return (f"{ts} [Notice] <Vehicle Destruction> CVehicle::OnAdvanceDestroyLevel: Vehicle '{ship}_{eid}' [{eid}] "
+                f"in zone '{rng.choice(ZONES)}' [pos x: {rng.uniform(-1e6, 1e6):.6f}, y: {rng.uniform(-1e6, 1e6):.6f}, "
+                f"z: {rng.uniform(-1e6, 1e6):.6f} vel x: 0.000000, y: 0.000000, z: 0.000000] driven by '{other}' [{eid}] "
+                f"advanced from destroy level 0 to 1 caused by '{caused_by}' [{geid}] with 'Combat' [Team_VehicleFeatures][Vehicle]")
+    if kind == 'stall':
+        return (f"{ts} [Notice] <Actor stall> Actor stall detected, Player: {other}, Type: downstream, "
+                f"Length: {rng.uniform(1, 10):.1f}. [Team_ActorTech][Actor]")
+    if kind == 'fake_hit':
+        return (f"{ts} [Notice] <Debug Hostility Events> [OnHandleHit] Fake hit FROM {other} TO {ship}_{eid}. "
+                f"Being sent to child {handle} [Team_CoreGameplayFeatures][Hostility]")
+    if kind == 'zone':
+        return (f"{ts} [Notice] <CEntityComponentInstancedInterior::OnEntityEnterZone> Zone: [{ship}_{eid}] "
+                f"-> Entity [{ship}_{eid}] [{handle}] [Team_CoreGameplayFeatures][Interior]")
+    if kind == 'spawn':
+        return (f"{ts} [Notice] <CPlayerShipRespawnManager::OnVehicleSpawned> Vehicle spawned: '{ship}_{eid}' "
+                f"for player geid {geid} [Team_VehicleFeatures][Vehicle]")
+    template = rng.choice(NOISE)
+    return f"{ts} " + template.format(ship=ship, id=eid, other=other, geid=eid, zone=rng.choice(ZONES),
+                                      latency=rng.randint(20, 900))
+
+
+def generate_lines(lines: int = 200000, seed: int = 1, handle: str = DEFAULT_HANDLE, geid: str = DEFAULT_GEID,
+                   densities=None, kill_density: float = None, login_at: float = 0.0):
+    """Yield `lines` encoded log lines (bytes, with trailing newline).
+
+    `login_at` places the login/geid lines at that fraction of the file
+    (0.0 = start, as in a real log; 1.0 = end, the worst case for discovery).
+    """
+    rng = random.Random(seed)
+    clock = _Clock(datetime(2025, 4, 13, 17, 0, 0, tzinfo=timezone.utc), rng)
+    dens = dict(DEFAULT_DENSITIES)
+    dens.update(densities or {})
+    if kill_density is not None:
+        dens['kill'] = kill_density
+    kinds = [k for k in dens if k != 'invalid_utf8']
+    # Cumulative thresholds for one random draw per line
+    thresholds = []
+    total = 0.0
+    for k in kinds:
+        total += dens[k]
+        thresholds.append((total, k))
+    # Line 0 is the initial context; the two login lines follow at `login_at`
+    login_index = min(max(int(lines * login_at), 1), max(lines - 2, 1))
+
+    emitted = 0
+    while emitted < lines:
+        if emitted == 0:
+            yield (_context_line(clock, "SC_Default") + "\n").encode("utf-8")
+            emitted += 1
+            continue
+        if emitted == login_index:
+            for text in _login_lines(clock, handle, geid):
+                yield (text + "\n").encode("utf-8")
+                emitted += 1
+            continue
+        draw = rng.random()
+        kind = 'noise'
+        for bound, k in thresholds:
+            if draw < bound:
+                kind = k
+                break
+        if kind == 'context':
+            text = _context_line(clock, rng.choice(GAME_MODES))
+        else:
+            text = _event_line(kind, clock, rng, handle, geid)
+        data = (text + "\n").encode("utf-8")
+        if kind == 'noise' and rng.random() < dens['invalid_utf8'] / max(1.0 - total, 1e-9):
+            cut = rng.randint(10, max(11, len(data) - 2))
+            data = data[:cut] + b"\xff\xfe\xc3" + data[cut:]
+        yield data
+        emitted += 1
+
+
+def write_log(path: str, **kwargs) -> int:
+    """Write a generated log to `path`; returns its size in bytes."""
+    size = 0
+    with open(path, "wb") as f:
+        for data in generate_lines(**kwargs):
+            f.write(data)
+            size += len(data)
+    return size
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("output")
+    ap.add_argument("--lines", type=int, default=200000)
+    ap.add_argument("--kill-density", type=float, default=None, help="share of lines that are player kills")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--handle", default=DEFAULT_HANDLE)
+    ap.add_argument("--login-at", type=float, default=0.0, help="position of the login lines, 0.0-1.0")
+    args = ap.parse_args(argv)
+    size = write_log(args.output, lines=args.lines, seed=args.seed, handle=args.handle,
+                     kill_density=args.kill_density, login_at=args.login_at)
+    print(f"Wrote {args.lines} lines ({size / 1e6:.1f} MB) to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
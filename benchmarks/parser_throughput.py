@@ -0,0 +1,319 @@
+"""Parser throughput benchmark on synthetic Game.log files.
+
+Generates logs with benchmarks/gamelog_gen.py and measures, each in its own
+worker process so peak RSS is per benchmark:
+
+    read_log_line      lines/sec over a full log, decoded like tail_log, with
+                       per-event-type latency (p50/p95/p99/max) for kills,
+                       vehicle destruction, stalls, fake hits, zone changes...
+    parse_backup_logs  lines/sec over a directory of backup logs (no API key,
+                       so nothing is uploaded; kills go to a temporary kill DB)
+    discovery          find_rsi_handle and find_rsi_geid on a log whose login
+                       lines are at the end (worst case: full scan)
+
+Kills found by read_log_line are queued for the kill worker, which is not
+started, so no network requests are made. Runs headless (no Tk).
+
+Results are printed, appended to bench_output.txt and recorded with the
+current git commit in bench_history.jsonl; each run is compared with the
+latest recorded run of a different commit.
+
+Usage:
+    python benchmarks/parser_throughput.py [--lines 200000] [--backup-files 5] [--repeat 3] [--only read_log_line,...]
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+SRC_DIR = os.path.join(REPO_ROOT, "src")
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import gamelog_gen  # noqa: E402
+
+BENCHMARKS = ("read_log_line", "parse_backup_logs", "discovery")
+
+# Line markers used to attribute read_log_line latency to an event type
+EVENT_MARKERS = (
+    ("kill", "CActor::Kill"),
+    ("vehicle", "<Vehicle Destruction>"),
+    ("stall", "<Actor stall>"),
+    ("fake_hit", "Fake hit"),
+    ("zone", "OnEntityEnterZone"),
+    ("spawn", "OnVehicleSpawned"),
+    ("context", "<Context Establisher Done>"),
+)
+
+
+# --- worker side (runs in a fresh interpreter) ---
+
+class _NullLogger:
+    def log(self, message, level=None):
+        pass
+
+
+def _peak_rss_mb():
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KiB, macOS bytes
+        return round(peak / (1024.0 * 1024.0 if sys.platform == "darwin" else 1024.0), 1)
+    except Exception:
+        return None
+
+
+def _import_parser():
+    sys.path.insert(0, SRC_DIR)
+    import global_variables
+    global_variables.set_log_sink(_NullLogger())
+    for setter in ("set_play_kill_sound", "set_play_snare_sound", "set_play_proximity_sound"):
+        try:
+            getattr(global_variables, setter)(False)
+        except Exception:
+            pass
+    import parser
+    # Kills stay queued; the worker would scrape and upload them
+    parser._ensure_kill_worker = lambda: None
+    return parser
+
+
+def _classify(line):
+    for kind, marker in EVENT_MARKERS:
+        if marker in line:
+            return kind
+    return "noise"
+
+
+def _latency_summary(samples_ns):
+    samples = sorted(samples_ns)
+    n = len(samples)
+
+    def _pct(p):
+        return round(samples[min(n - 1, int(p * n))] / 1000.0, 2)
+
+    return {"count": n, "p50_us": _pct(0.50), "p95_us": _pct(0.95), "p99_us": _pct(0.99),
+            "max_us": round(samples[-1] / 1000.0, 2)}
+
+
+def _worker_read_log_line(log_path, handle):
+    parser = _import_parser()
+    with open(log_path, "rb") as f:
+        raw_lines = f.readlines()
+    per_kind = {}
+    perf = time.perf_counter_ns
+    started = time.perf_counter()
+    for bline in raw_lines:
+        line = bline.decode("utf-8", errors="replace")
+        t0 = perf()
+        parser.read_log_line(line, handle, True)
+        elapsed = perf() - t0
+        per_kind.setdefault(_classify(line), []).append(elapsed)
+    total = time.perf_counter() - started
+    return {
+        "lines": len(raw_lines),
+        "seconds": round(total, 4),
+        "lines_per_sec": round(len(raw_lines) / total, 1) if total else None,
+        "kills_queued": parser.kill_processing_queue.qsize(),
+        "latency": {kind: _latency_summary(v) for kind, v in sorted(per_kind.items())},
+    }
+
+
+def _worker_parse_backup_logs(backup_dir, handle):
+    parser = _import_parser()
+    lines = 0
+    for name in os.listdir(backup_dir):
+        with open(os.path.join(backup_dir, name), "rb") as f:
+            lines += sum(1 for _ in f)
+    started = time.perf_counter()
+    result = parser.parse_backup_logs(backup_dir, handle, user_id=None, suppress_file_logs=True)
+    total = time.perf_counter() - started
+    return {
+        "lines": lines,
+        "seconds": round(total, 4),
+        "lines_per_sec": round(lines / total, 1) if total else None,
+        "result": list(result) if isinstance(result, (list, tuple)) else result,
+    }
+
+
+def _worker_discovery(log_path, handle):
+    parser = _import_parser()
+    import config
+    timings = {}
+    started = time.perf_counter()
+    found = config.find_rsi_handle(log_path)
+    timings["find_rsi_handle_s"] = round(time.perf_counter() - started, 4)
+    started = time.perf_counter()
+    parser.find_rsi_geid(log_path)
+    timings["find_rsi_geid_s"] = round(time.perf_counter() - started, 4)
+    timings["handle_found"] = found == handle
+    timings["geid_found"] = parser.global_player_geid == gamelog_gen.DEFAULT_GEID
+    return timings
+
+
+def run_worker(name, path, handle):
+    fn = {
+        "read_log_line": _worker_read_log_line,
+        "parse_backup_logs": _worker_parse_backup_logs,
+        "discovery": _worker_discovery,
+    }[name]
+    result = fn(path, handle)
+    result["peak_rss_mb"] = _peak_rss_mb()
+    print(json.dumps(result))
+    return 0
+
+
+# --- driver side ---
+
+def _spawn(name, path, handle, data_dir, timeout):
+    env = dict(os.environ)
+    env["BEOWULFHUNTER_DATA_DIR"] = data_dir
+    env["BEOWULFHUNTER_TK_PROFILER"] = "0"
+    cmd = [sys.executable, os.path.abspath(__file__), "--worker", name, "--path", path, "--handle", handle]
+    proc = subprocess.run(cmd, cwd=data_dir, env=env, capture_output=True, text=True, timeout=timeout)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{name} worker failed:\n{proc.stderr.strip()}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True)
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def _median_run(runs, key):
+    """Return the run with the median value of `key`."""
+    ordered = sorted(runs, key=lambda r: r.get(key) or 0)
+    return ordered[len(ordered) // 2]
+
+
+def _previous_entry(history_path, commit):
+    try:
+        with open(history_path, "r", encoding="utf-8") as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+    except (OSError, ValueError):
+        return None
+    for entry in reversed(entries):
+        if entry.get("commit") != commit:
+            return entry
+    return None
+
+
+def _delta(now, before):
+    if not now or not before:
+        return ""
+    change = (now - before) / before * 100.0
+    return f" ({change:+.1f}% vs previous commit)"
+
+
+def format_report(entry, previous):
+    res = entry["results"]
+    prev = (previous or {}).get("results", {})
+    lines = [f"# parser throughput {entry['at']} commit {entry.get('commit') or '?'} "
+             f"({entry['lines']} lines, {entry['log_mb']} MB, repeat {entry['repeat']})"]
+    if "read_log_line" in res:
+        r = res["read_log_line"]
+        before = prev.get("read_log_line", {}).get("lines_per_sec")
+        lines.append(f"read_log_line       {r['lines_per_sec']:>12,.0f} lines/s  peak RSS {r.get('peak_rss_mb')} MB"
+                     f"{_delta(r['lines_per_sec'], before)}")
+        for kind, lat in r.get("latency", {}).items():
+            lines.append(f"  {kind:<10} n={lat['count']:<8} p50 {lat['p50_us']:>8}us  p95 {lat['p95_us']:>8}us  "
+                         f"p99 {lat['p99_us']:>8}us  max {lat['max_us']:>9}us")
+    if "parse_backup_logs" in res:
+        r = res["parse_backup_logs"]
+        before = prev.get("parse_backup_logs", {}).get("lines_per_sec")
+        lines.append(f"parse_backup_logs   {r['lines_per_sec']:>12,.0f} lines/s  peak RSS {r.get('peak_rss_mb')} MB"
+                     f"{_delta(r['lines_per_sec'], before)}")
+    if "discovery" in res:
+        r = res["discovery"]
+        lines.append(f"find_rsi_handle     {r['find_rsi_handle_s'] * 1000:>10.1f}ms  (found: {r['handle_found']})"
+                     f"{_delta(r['find_rsi_handle_s'], prev.get('discovery', {}).get('find_rsi_handle_s'))}")
+        lines.append(f"find_rsi_geid       {r['find_rsi_geid_s'] * 1000:>10.1f}ms  (found: {r['geid_found']})"
+                     f"{_delta(r['find_rsi_geid_s'], prev.get('discovery', {}).get('find_rsi_geid_s'))}")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--lines", type=int, default=200000)
+    ap.add_argument("--kill-density", type=float, default=None)
+    ap.add_argument("--backup-files", type=int, default=5, help="files the backup log set is split into")
+    ap.add_argument("--repeat", type=int, default=3, help="runs per benchmark; the median is reported")
+    ap.add_argument("--only", default=None, help="comma-separated subset of: " + ", ".join(BENCHMARKS))
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--timeout", type=float, default=600.0)
+    ap.add_argument("--output", default=os.path.join(REPO_ROOT, "bench_output.txt"))
+    ap.add_argument("--history", default=os.path.join(REPO_ROOT, "bench_history.jsonl"))
+    ap.add_argument("--worker", default=None, help=argparse.SUPPRESS)
+    ap.add_argument("--path", default=None, help=argparse.SUPPRESS)
+    ap.add_argument("--handle", default=gamelog_gen.DEFAULT_HANDLE, help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.worker:
+        return run_worker(args.worker, args.path, args.handle)
+
+    selected = [b.strip() for b in args.only.split(",")] if args.only else list(BENCHMARKS)
+    unknown = [b for b in selected if b not in BENCHMARKS]
+    if unknown:
+        ap.error(f"unknown benchmark(s): {', '.join(unknown)}")
+
+    workdir = tempfile.mkdtemp(prefix="beowulf_bench_")
+    try:
+        handle = args.handle
+        log_path = os.path.join(workdir, "Game.log")
+        size = gamelog_gen.write_log(log_path, lines=args.lines, seed=args.seed, handle=handle,
+                                     kill_density=args.kill_density)
+        backup_dir = os.path.join(workdir, "logbackups")
+        os.makedirs(backup_dir)
+        per_file = max(1, args.lines // max(1, args.backup_files))
+        for i in range(max(1, args.backup_files)):
+            gamelog_gen.write_log(os.path.join(backup_dir, f"Game Build(bench) {i:02d}.log"), lines=per_file,
+                                  seed=args.seed + 1 + i, handle=handle, kill_density=args.kill_density)
+        discovery_log = os.path.join(workdir, "Game-login-at-end.log")
+        gamelog_gen.write_log(discovery_log, lines=args.lines, seed=args.seed, handle=handle, login_at=1.0)
+
+        targets = {"read_log_line": log_path, "parse_backup_logs": backup_dir, "discovery": discovery_log}
+        results = {}
+        for name in selected:
+            runs = []
+            for i in range(max(1, args.repeat)):
+                # Fresh data dir per run so kill DB inserts do not accumulate
+                data_dir = os.path.join(workdir, f"data-{name}-{i}")
+                os.makedirs(data_dir)
+                runs.append(_spawn(name, targets[name], handle, data_dir, args.timeout))
+            key = "lines_per_sec" if name != "discovery" else "find_rsi_handle_s"
+            results[name] = _median_run(runs, key)
+
+        commit = _git_commit()
+        entry = {
+            "at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": commit,
+            "python": sys.version.split()[0],
+            "lines": args.lines,
+            "log_mb": round(size / 1e6, 1),
+            "repeat": args.repeat,
+            "results": results,
+        }
+        report = format_report(entry, _previous_entry(args.history, commit))
+        print(report)
+        if args.output:
+            with open(args.output, "a", encoding="utf-8") as f:
+                f.write(report + "\n")
+        if args.history:
+            with open(args.history, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,433 @@
+"""End-to-end load test of the network pipelines against the stand-in server.
+
+Starts benchmarks/standin_server.py with the requested latency and fault
+injection, then runs each scenario in a worker process whose base URLs point at
+it (BEOWULFHUNTER_API_BASE, see src/endpoints.py):
+
+    kill_pipeline   live kills from a synthetic Game.log through read_log_line,
+                    the kill worker (RSI profile scrape + reportkill) until the
+                    queue drains: kills/sec, queue wait and per-endpoint latency
+    backup_import   parse_backup_logs with an API key and user id: blackbox
+                    sync for duplicate detection, then one upload per new kill
+    tab_refresh     concurrent Piracy/Dogfighting tab refreshes and hit form
+                    loads through ironpoint_api (--cold clears its memory and
+                    disk caches before every refresh so each one reaches the
+                    server; otherwise stale entries are served while they
+                    revalidate in the background)
+
+Latency percentiles come from the app's own metrics registry (http.latency,
+kill_queue.wait), so they are the numbers the Diagnostics tab would show.
+The kill worker spaces RSI scrapes SCRAPE_INTERVAL_SECONDS apart to protect
+the live site; --scrape-interval overrides it for the run (default 0).
+
+Results are printed, appended to bench_output.txt and recorded with the
+current git commit in bench_pipeline_history.jsonl; each run is compared with
+the latest recorded run of a different commit with the same fault settings.
+
+Usage:
+    python benchmarks/pipeline_load.py [--kills 500] [--latency-ms 40 --jitter-ms 20]
+        [--error-rate 0.02] [--rate-429 0.01] [--only kill_pipeline,...] [--cold]
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+SRC_DIR = os.path.join(REPO_ROOT, "src")
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+
+import gamelog_gen  # noqa: E402
+
+SCENARIOS = ("kill_pipeline", "backup_import", "tab_refresh")
+# Matches the stand-in's keys_validatekey.json / blackbox_user.json fixtures
+BENCH_USER_ID = "700000000000000000"
+BENCH_KEY = "standin-bench-key"
+
+
+# --- worker side (runs in a fresh interpreter) ---
+
+class _NullLogger:
+    def log(self, message, level=None):
+        pass
+
+
+def _setup_app_state(args):
+    sys.path.insert(0, SRC_DIR)
+    import global_variables
+    global_variables.set_log_sink(_NullLogger())
+    for setter in ("set_play_kill_sound", "set_play_snare_sound", "set_play_proximity_sound"):
+        try:
+            getattr(global_variables, setter)(False)
+        except Exception:
+            pass
+    global_variables.set_key(BENCH_KEY)
+    global_variables.set_user_id(BENCH_USER_ID)
+    return global_variables
+
+
+def _http_metrics():
+    """Per-endpoint request count, errors and latency percentiles (ms) from the registry."""
+    import metrics
+    snap = metrics.snapshot().get("metrics", {})
+    out = {}
+    for key, data in snap.items():
+        if not key.startswith("http.latency{"):
+            continue
+        label = key[len("http.latency{endpoint="):-1]
+        errors = snap.get(f"http.errors{{endpoint={label}}}", {}).get("value", 0)
+        out[label] = {
+            "count": data.get("count", 0),
+            "errors": errors,
+            "p50_ms": _ms(data.get("p50")),
+            "p95_ms": _ms(data.get("p95")),
+            "p99_ms": _ms(data.get("p99")),
+            "max_ms": _ms(data.get("max")),
+        }
+    return out
+
+
+def _ms(seconds):
+    return round(seconds * 1000.0, 2) if seconds is not None else None
+
+
+def _percentiles_ms(samples):
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+    n = len(ordered)
+
+    def _pct(p):
+        return _ms(ordered[min(n - 1, int(p * n))])
+
+    return {"count": n, "p50_ms": _pct(0.50), "p95_ms": _pct(0.95), "p99_ms": _pct(0.99), "max_ms": _ms(ordered[-1])}
+
+
+def _worker_kill_pipeline(args):
+    _setup_app_state(args)
+    import metrics
+    import parser
+    parser.SCRAPE_INTERVAL_SECONDS = args.scrape_interval
+    with open(args.path, "rb") as f:
+        raw_lines = f.readlines()
+    started = time.perf_counter()
+    for bline in raw_lines:
+        parser.read_log_line(bline.decode("utf-8", errors="replace"), args.handle, True)
+    ingested = time.perf_counter() - started
+    queued = parser.kill_processing_queue.unfinished_tasks
+    # The worker calls task_done() per kill; join() returns once every kill was published
+    drained = threading.Event()
+    threading.Thread(target=lambda: (parser.kill_processing_queue.join(), drained.set()), daemon=True).start()
+    finished = drained.wait(args.timeout)
+    total = time.perf_counter() - started
+    wait = metrics.histogram("kill_queue.wait").snapshot()
+    return {
+        "kills": queued,
+        "drained": finished,
+        "ingest_s": round(ingested, 4),
+        "seconds": round(total, 4),
+        "kills_per_sec": round(queued / total, 2) if total and finished else None,
+        "queue_wait": {k: _ms(wait.get(k)) for k in ("p50", "p95", "p99", "max")},
+        "http": _http_metrics(),
+    }
+
+
+def _worker_backup_import(args):
+    _setup_app_state(args)
+    import parser
+    lines = 0
+    for name in os.listdir(args.path):
+        with open(os.path.join(args.path, name), "rb") as f:
+            lines += sum(1 for _ in f)
+    started = time.perf_counter()
+    uploaded, duplicates, found, failed = parser.parse_backup_logs(args.path, args.handle, user_id=BENCH_USER_ID,
+                                                                   suppress_file_logs=True)
+    total = time.perf_counter() - started
+    return {
+        "lines": lines,
+        "kills_found": found,
+        "uploaded": uploaded,
+        "duplicates": duplicates,
+        "failed": failed,
+        "seconds": round(total, 4),
+        "uploads_per_sec": round(uploaded / total, 2) if total else None,
+        "http": _http_metrics(),
+    }
+
+
+def _clear_ironpoint_caches(ironpoint_api):
+    import http_cache
+    http_cache.clear()
+    ironpoint_api._USER_DIRECTORY.reset()
+    ironpoint_api._COMMODITY_CATALOG.reset()
+    ironpoint_api.get_user_profile.cache_clear()
+
+
+def _leaderboard_refresh(ironpoint_api):
+    """What the Piracy and Dogfighting tab workers do on refresh."""
+    patch = ironpoint_api.get_latest_patch_version()
+    piracy = ironpoint_api.get_piracy_summary(patch) if patch else []
+    blackbox = ironpoint_api.get_blackbox_summary(patch) if patch else []
+    ironpoint_api.get_latest_pirate_hits()
+    import leaderboard_model
+    leaderboard_model.piracy_views(piracy, blackbox)
+    leaderboard_model.dogfighting_views(blackbox)
+
+
+def _hit_form_load(ironpoint_api):
+    """What the Add Hit form loads when it opens."""
+    ironpoint_api.get_recent_fleets()
+    ironpoint_api.get_user_directory()
+    ironpoint_api.get_commodity_catalog()
+    ironpoint_api.get_latest_patch_version()
+
+
+def _worker_tab_refresh(args):
+    _setup_app_state(args)
+    import ironpoint_api
+    samples = {"leaderboards": [], "hit_form": []}
+    failures = {"leaderboards": 0, "hit_form": 0}
+    lock = threading.Lock()
+
+    def _one(i):
+        if args.cold:
+            _clear_ironpoint_caches(ironpoint_api)
+        kind, fn = ("hit_form", _hit_form_load) if i % 3 == 2 else ("leaderboards", _leaderboard_refresh)
+        t0 = time.perf_counter()
+        try:
+            fn(ironpoint_api)
+        except Exception:
+            # The tabs catch these and keep their last data; count them the same way
+            with lock:
+                failures[kind] += 1
+        elapsed = time.perf_counter() - t0
+        with lock:
+            samples[kind].append(elapsed)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(_one, range(args.refreshes)))
+    total = time.perf_counter() - started
+    return {
+        "refreshes": args.refreshes,
+        "concurrency": args.concurrency,
+        "cold": args.cold,
+        "seconds": round(total, 4),
+        "refreshes_per_sec": round(args.refreshes / total, 2) if total else None,
+        "refresh_latency": {k: _percentiles_ms(v) for k, v in samples.items()},
+        "failed": failures,
+        "http": _http_metrics(),
+    }
+
+
+def run_worker(args):
+    fn = {
+        "kill_pipeline": _worker_kill_pipeline,
+        "backup_import": _worker_backup_import,
+        "tab_refresh": _worker_tab_refresh,
+    }[args.worker]
+    print(json.dumps(fn(args)))
+    return 0
+
+
+# --- driver side ---
+
+def _start_server(args):
+    cmd = [sys.executable, os.path.join(BENCH_DIR, "standin_server.py"), "--port", "0",
+           "--latency-ms", str(args.latency_ms), "--jitter-ms", str(args.jitter_ms),
+           "--error-rate", str(args.error_rate), "--rate-429", str(args.rate_429), "--seed", str(args.seed)]
+    if args.fault_match:
+        cmd += ["--fault-match", args.fault_match]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    line = proc.stdout.readline().strip()
+    if not line.startswith("listening on "):
+        proc.kill()
+        raise RuntimeError(f"stand-in server did not start: {line!r}")
+    return proc, line[len("listening on "):]
+
+
+def _server_call(base, path, payload=None):
+    data = json.dumps(payload).encode("utf-8") if payload is not None else None
+    with urllib.request.urlopen(urllib.request.Request(base + path, data=data), timeout=10) as resp:
+        return json.loads(resp.read())
+
+
+def _spawn(name, args, base, path, data_dir):
+    env = dict(os.environ)
+    env["BEOWULFHUNTER_DATA_DIR"] = data_dir
+    env["BEOWULFHUNTER_TK_PROFILER"] = "0"
+    env["BEOWULFHUNTER_API_BASE"] = base
+    cmd = [sys.executable, os.path.abspath(__file__), "--worker", name, "--path", path, "--handle", args.handle,
+           "--scrape-interval", str(args.scrape_interval), "--timeout", str(args.timeout),
+           "--refreshes", str(args.refreshes), "--concurrency", str(args.concurrency)]
+    if args.cold:
+        cmd.append("--cold")
+    proc = subprocess.run(cmd, cwd=data_dir, env=env, capture_output=True, text=True, timeout=args.timeout + 60)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{name} worker failed:\n{proc.stderr.strip()}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True)
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def _previous_entry(history_path, commit, faults):
+    try:
+        with open(history_path, "r", encoding="utf-8") as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+    except (OSError, ValueError):
+        return None
+    for entry in reversed(entries):
+        if entry.get("commit") != commit and entry.get("faults") == faults:
+            return entry
+    return None
+
+
+def _delta(now, before):
+    if not now or not before:
+        return ""
+    change = (now - before) / before * 100.0
+    return f" ({change:+.1f}% vs previous commit)"
+
+
+def _http_lines(http):
+    out = []
+    for label, h in sorted(http.items()):
+        out.append(f"    {label:<38} n={h['count']:<6} err={h['errors']:<5} p50 {h['p50_ms']}ms  "
+                   f"p95 {h['p95_ms']}ms  p99 {h['p99_ms']}ms  max {h['max_ms']}ms")
+    return out
+
+
+def format_report(entry, previous):
+    res = entry["results"]
+    prev = (previous or {}).get("results", {})
+    f = entry["faults"]
+    lines = [f"# pipeline load {entry['at']} commit {entry.get('commit') or '?'} "
+             f"(latency {f['latency_ms']}+{f['jitter_ms']}ms, errors {f['error_rate']:.1%}, 429 {f['rate_429']:.1%})"]
+    if "kill_pipeline" in res:
+        r = res["kill_pipeline"]
+        q = r["queue_wait"]
+        rate = f"{r['kills_per_sec']:,.1f} kills/s" if r["kills_per_sec"] else "did not drain"
+        lines.append(f"kill_pipeline   {r['kills']} kills, {rate} (ingest {r['ingest_s']}s)"
+                     f"{_delta(r['kills_per_sec'], prev.get('kill_pipeline', {}).get('kills_per_sec'))}")
+        lines.append(f"    queue wait p50 {q['p50']}ms  p95 {q['p95']}ms  p99 {q['p99']}ms  max {q['max']}ms")
+        lines.extend(_http_lines(r["http"]))
+    if "backup_import" in res:
+        r = res["backup_import"]
+        lines.append(f"backup_import   {r['kills_found']} kills, {r['uploaded']} uploaded, {r['duplicates']} duplicates, "
+                     f"{r['failed']} failed in {r['seconds']}s ({r['uploads_per_sec']} uploads/s)"
+                     f"{_delta(r['uploads_per_sec'], prev.get('backup_import', {}).get('uploads_per_sec'))}")
+        lines.extend(_http_lines(r["http"]))
+    if "tab_refresh" in res:
+        r = res["tab_refresh"]
+        lines.append(f"tab_refresh     {r['refreshes']} refreshes x{r['concurrency']}{' cold' if r['cold'] else ''}, "
+                     f"{r['refreshes_per_sec']} refreshes/s, {sum(r['failed'].values())} failed"
+                     f"{_delta(r['refreshes_per_sec'], prev.get('tab_refresh', {}).get('refreshes_per_sec'))}")
+        for kind, lat in r["refresh_latency"].items():
+            if lat.get("count"):
+                lines.append(f"    {kind:<38} n={lat['count']:<6} p50 {lat['p50_ms']}ms  p95 {lat['p95_ms']}ms  "
+                             f"p99 {lat['p99_ms']}ms  max {lat['max_ms']}ms")
+        lines.extend(_http_lines(r["http"]))
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--kills", type=int, default=500, help="player kills in the live and backup logs")
+    ap.add_argument("--backup-files", type=int, default=5)
+    ap.add_argument("--refreshes", type=int, default=60, help="tab refreshes in the tab_refresh scenario")
+    ap.add_argument("--concurrency", type=int, default=4, help="refreshes running at once")
+    ap.add_argument("--cold", action="store_true", help="clear ironpoint_api caches before each refresh")
+    ap.add_argument("--latency-ms", type=float, default=0.0)
+    ap.add_argument("--jitter-ms", type=float, default=0.0)
+    ap.add_argument("--error-rate", type=float, default=0.0)
+    ap.add_argument("--rate-429", type=float, default=0.0)
+    ap.add_argument("--fault-match", default=None, help="only inject faults on paths matching this regex")
+    ap.add_argument("--scrape-interval", type=float, default=0.0, help="kill worker RSI scrape spacing (app: 1.0)")
+    ap.add_argument("--only", default=None, help="comma-separated subset of: " + ", ".join(SCENARIOS))
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--timeout", type=float, default=600.0)
+    ap.add_argument("--output", default=os.path.join(REPO_ROOT, "bench_output.txt"))
+    ap.add_argument("--history", default=os.path.join(REPO_ROOT, "bench_pipeline_history.jsonl"))
+    ap.add_argument("--worker", default=None, help=argparse.SUPPRESS)
+    ap.add_argument("--path", default=None, help=argparse.SUPPRESS)
+    ap.add_argument("--handle", default=gamelog_gen.DEFAULT_HANDLE, help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.worker:
+        return run_worker(args)
+
+    selected = [s.strip() for s in args.only.split(",")] if args.only else list(SCENARIOS)
+    unknown = [s for s in selected if s not in SCENARIOS]
+    if unknown:
+        ap.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    workdir = tempfile.mkdtemp(prefix="beowulf_load_")
+    server, base = _start_server(args)
+    try:
+        # Mostly kill lines, so the run is dominated by the pipeline rather than parsing
+        lines = max(args.kills * 20, 1000)
+        density = args.kills / float(lines)
+        log_path = os.path.join(workdir, "Game.log")
+        gamelog_gen.write_log(log_path, lines=lines, seed=args.seed, handle=args.handle, kill_density=density)
+        backup_dir = os.path.join(workdir, "logbackups")
+        os.makedirs(backup_dir)
+        per_file = max(1, lines // max(1, args.backup_files))
+        for i in range(max(1, args.backup_files)):
+            gamelog_gen.write_log(os.path.join(backup_dir, f"Game Build(load) {i:02d}.log"), lines=per_file,
+                                  seed=args.seed + 1 + i, handle=args.handle, kill_density=density)
+        targets = {"kill_pipeline": log_path, "backup_import": backup_dir, "tab_refresh": ""}
+
+        results = {}
+        for name in selected:
+            _server_call(base, "/_reset", {})
+            data_dir = os.path.join(workdir, f"data-{name}")
+            os.makedirs(data_dir)
+            results[name] = _spawn(name, args, base, targets[name], data_dir)
+            results[name]["server"] = _server_call(base, "/_stats")["routes"]
+
+        commit = _git_commit()
+        faults = {"latency_ms": args.latency_ms, "jitter_ms": args.jitter_ms, "error_rate": args.error_rate,
+                  "rate_429": args.rate_429, "fault_match": args.fault_match}
+        entry = {
+            "at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": commit,
+            "python": sys.version.split()[0],
+            "kills": args.kills,
+            "faults": faults,
+            "results": results,
+        }
+        report = format_report(entry, _previous_entry(args.history, commit, faults))
+        print(report)
+        if args.output:
+            with open(args.output, "a", encoding="utf-8") as f:
+                f.write(report + "\n")
+        if args.history:
+            with open(args.history, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            server.kill()
+        shutil.rmtree(workdir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
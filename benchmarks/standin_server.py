@@ -0,0 +1,362 @@
+"""Local stand-in for the backends the tracker talks to, for offline load tests.
+
+Serves recorded fixtures (benchmarks/fixtures/) for every service under the
+prefixes in src/endpoints.py, so the app or a benchmark can be pointed at it
+with a single variable:
+
+    python benchmarks/standin_server.py --port 8765
+    BEOWULFHUNTER_API_BASE=http://127.0.0.1:8765 python main.py
+
+Routes (GET unless noted):
+    /beowulf/api/reportkill                 POST, 200
+    /beowulf/api/blackbox/user              blackbox_user.json (filtered by ?since=)
+    /beowulf/api/keys/validatekey           keys_validatekey.json
+    /ironpoint/api/api/users/[<id>]         users.json, or one user (404 if unknown)
+    /ironpoint/api/api/gameversion/         gameversion.json
+    /ironpoint/api/api/beowulfhuntersummarybypatch/patch/<p>
+    /ironpoint/api/api/hittracker/latest    hittracker_latest.json
+    /ironpoint/api/api/hittracker/          POST, 201
+    /ironpoint/api/api/recentfleets/        recentfleets.json
+    /ironpoint/api/api/uex/summarizedcommodities/
+    /rsi/en/citizens/<handle>               citizen.html with the handle filled in
+    /rsi/media/...                          a 1x1 PNG
+    /scapi/<key>/v1/cache/versions          versions.json
+    /github/repos/<owner>/<repo>/releases/latest
+
+GET responses carry an ETag (hash of the body); a matching If-None-Match gets
+a 304, so conditional revalidation can be exercised.
+
+Faults are injected per request, before routing: a fixed latency plus uniform
+jitter, then a 429 (with Retry-After) at --rate-429 and a 500/502/503 at
+--error-rate. --fault-match limits faults to paths matching a regex.
+
+Knobs can be changed while the server runs and counters read back:
+    POST /_control  {"latency_ms": 50, "error_rate": 0.1, ...}
+    GET  /_stats    requests, statuses and POST bodies received per route
+    POST /_reset    clear the counters
+
+--record fetches each fixture-backed GET from the live service (forwarding the
+Authorization header) and saves the body over the fixture before serving it.
+
+When started, the server prints 'listening on http://HOST:PORT' on stdout.
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import struct
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+sys.path.insert(0, os.path.join(REPO_ROOT, "src"))
+
+import endpoints  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+KNOBS = ("latency_ms", "jitter_ms", "error_rate", "rate_429", "retry_after", "fault_match")
+
+
+def _tiny_png() -> bytes:
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xffffffff)
+    header = struct.pack(">IIBBBBB", 1, 1, 8, 6, 0, 0, 0)
+    pixels = zlib.compress(b"\x00\xff\x55\x55\xff")
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", pixels) + chunk(b"IEND", b"")
+
+
+PNG = _tiny_png()
+
+
+class StandinState:
+    def __init__(self, fixtures_dir=FIXTURES_DIR, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0,
+                 rate_429=0.0, retry_after=1, fault_match=None, record=False, seed=None):
+        self.fixtures_dir = fixtures_dir
+        self.latency_ms = float(latency_ms)
+        self.jitter_ms = float(jitter_ms)
+        self.error_rate = float(error_rate)
+        self.rate_429 = float(rate_429)
+        self.retry_after = int(retry_after)
+        self.fault_match = fault_match
+        self.record = record
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._fixtures = {}
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started = time.time()
+            self.routes = {}
+            self.posted = {}
+
+    def configure(self, **values):
+        with self._lock:
+            for key, value in values.items():
+                if key not in KNOBS:
+                    raise ValueError(f"unknown knob: {key}")
+                if key == "fault_match":
+                    self.fault_match = value or None
+                elif key == "retry_after":
+                    self.retry_after = int(value)
+                else:
+                    setattr(self, key, float(value))
+
+    def knobs(self):
+        return {k: getattr(self, k) for k in KNOBS}
+
+    def fault(self, path):
+        """(delay seconds, injected status or None) for one request."""
+        with self._lock:
+            delay = self.latency_ms + (self._rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0)
+            if self.fault_match and not re.search(self.fault_match, path):
+                return delay / 1000.0, None
+            draw = self._rng.random()
+            if draw < self.rate_429:
+                return delay / 1000.0, 429
+            if draw < self.rate_429 + self.error_rate:
+                return delay / 1000.0, self._rng.choice((500, 502, 503))
+            return delay / 1000.0, None
+
+    def count(self, route, status, body=None):
+        with self._lock:
+            stats = self.routes.setdefault(route, {"requests": 0, "status": {}})
+            stats["requests"] += 1
+            stats["status"][str(status)] = stats["status"].get(str(status), 0) + 1
+            if body is not None:
+                self.posted[route] = self.posted.get(route, 0) + 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                "uptime_s": round(time.time() - self.started, 1),
+                "knobs": self.knobs(),
+                "routes": json.loads(json.dumps(self.routes)),
+                "posted": dict(self.posted),
+            }
+
+    def fixture(self, name, raw=False):
+        with self._lock:
+            if name not in self._fixtures:
+                with open(os.path.join(self.fixtures_dir, name), "rb") as f:
+                    data = f.read()
+                self._fixtures[name] = data if raw or not name.endswith(".json") else json.loads(data)
+            return self._fixtures[name]
+
+    def save_fixture(self, name, body: bytes):
+        path = os.path.join(self.fixtures_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(body)
+        with self._lock:
+            self._fixtures.pop(name, None)
+
+
+# (method, service, path regex, route label, fixture or None)
+ROUTES = (
+    ("POST", "beowulf", r"^/reportkill/?$", "beowulf.reportkill", None),
+    ("GET", "beowulf", r"^/blackbox/user/?$", "beowulf.blackbox", "beowulf/blackbox_user.json"),
+    ("GET", "beowulf", r"^/keys/validatekey/?$", "beowulf.validatekey", "beowulf/keys_validatekey.json"),
+    ("POST", "beowulf", r"^/keys/validatekey/?$", "beowulf.validatekey", "beowulf/keys_validatekey.json"),
+    ("GET", "ironpoint", r"^/users/?$", "ironpoint.users", "ironpoint/users.json"),
+    ("GET", "ironpoint", r"^/users/(?P<user_id>[^/]+)/?$", "ironpoint.user", None),
+    ("GET", "ironpoint", r"^/gameversion/?$", "ironpoint.gameversion", "ironpoint/gameversion.json"),
+    ("GET", "ironpoint", r"^/beowulfhuntersummarybypatch/patch/[^/]+/?$", "ironpoint.summary",
+     "ironpoint/beowulfhuntersummarybypatch.json"),
+    ("GET", "ironpoint", r"^/hittracker/latest/?$", "ironpoint.hittracker_latest", "ironpoint/hittracker_latest.json"),
+    ("POST", "ironpoint", r"^/hittracker/?$", "ironpoint.hittracker", None),
+    ("GET", "ironpoint", r"^/recentfleets/?$", "ironpoint.recentfleets", "ironpoint/recentfleets.json"),
+    ("GET", "ironpoint", r"^/uex/summarizedcommodities/?$", "ironpoint.commodities",
+     "ironpoint/uex_summarizedcommodities.json"),
+    ("GET", "rsi", r"^/en/citizens/(?P<handle>[^/]+)/?$", "rsi.citizen", "rsi/citizen.html"),
+    ("GET", "rsi", r"^/media/.+$", "rsi.media", None),
+    ("GET", "scapi", r"^/[^/]+/v1/cache/versions/?$", "scapi.versions", "scapi/versions.json"),
+    ("GET", "github", r"^/repos/[^/]+/[^/]+/releases/latest/?$", "github.releases", "github/releases_latest.json"),
+)
+
+_COMPILED = [(m, s, re.compile(p), label, fx) for m, s, p, label, fx in ROUTES]
+
+
+def match_route(method, path):
+    """(route label, fixture, params dict, service path) for a request path, or None."""
+    for service, prefix in endpoints.STANDIN_PREFIXES.items():
+        if path != prefix and not path.startswith(prefix + "/"):
+            continue
+        rest = path[len(prefix):] or "/"
+        for m, s, regex, label, fixture in _COMPILED:
+            if m != method or s != service:
+                continue
+            found = regex.match(rest)
+            if found:
+                return label, fixture, {k: unquote(v) for k, v in found.groupdict().items()}, service, rest
+    return None
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "BeowulfStandin/1.0"
+    state: StandinState = None
+    verbose = False
+
+    def log_message(self, fmt, *args):
+        if self.verbose:
+            sys.stderr.write("%s - %s\n" % (self.address_string(), fmt % args))
+
+    def _send(self, status, body=b"", content_type="application/json", headers=None):
+        if not isinstance(body, (bytes, bytearray)):
+            body = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, str(value))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method):
+        parts = urlsplit(self.path)
+        path, query = parts.path, parse_qs(parts.query)
+        body = self._read_body() if method == "POST" else None
+        try:
+            if path.startswith("/_"):
+                return self._control(method, path, body)
+            route = match_route(method, path)
+            if route is None:
+                self.state.count("unmatched", 404)
+                return self._send(404, {"error": "no stand-in route", "path": path})
+            label, fixture, params, service, rest = route
+            delay, injected = self.state.fault(path)
+            if delay > 0:
+                time.sleep(delay)
+            if injected == 429:
+                self.state.count(label, 429)
+                return self._send(429, {"error": "rate limited"}, headers={"Retry-After": self.state.retry_after})
+            if injected:
+                self.state.count(label, injected)
+                return self._send(injected, {"error": "injected failure"})
+            if self.state.record and fixture and method == "GET":
+                self._record(fixture, service, rest, parts.query)
+            status, payload, content_type = self._respond(label, fixture, params, query, body)
+            if status == 200 and method == "GET":
+                if not isinstance(payload, (bytes, bytearray)):
+                    payload = json.dumps(payload).encode("utf-8")
+                etag = '"%s"' % hashlib.sha1(payload).hexdigest()[:16]
+                if self.headers.get("If-None-Match") == etag:
+                    self.state.count(label, 304)
+                    return self._send(304, b"", content_type, headers={"ETag": etag})
+                self.state.count(label, status, body)
+                return self._send(status, payload, content_type, headers={"ETag": etag})
+            self.state.count(label, status, body)
+            self._send(status, payload, content_type)
+        except Exception as e:
+            self.state.count("error", 500)
+            self._send(500, {"error": str(e)})
+
+    def _respond(self, label, fixture, params, query, body):
+        if label == "beowulf.reportkill":
+            return 200, {"ok": True}, "application/json"
+        if label == "ironpoint.hittracker":
+            return 201, {"ok": True}, "application/json"
+        if label == "rsi.media":
+            return 200, PNG, "image/png"
+        if label == "ironpoint.user":
+            for user in self.state.fixture("ironpoint/users.json"):
+                if str(user.get("id")) == params.get("user_id"):
+                    return 200, user, "application/json"
+            return 404, {"error": "user not found"}, "application/json"
+        if label == "rsi.citizen":
+            html = self.state.fixture(fixture, raw=True).decode("utf-8")
+            return 200, html.replace("{handle}", params.get("handle", "")).encode("utf-8"), "text/html; charset=utf-8"
+        data = self.state.fixture(fixture)
+        if label == "beowulf.blackbox" and query.get("since") and isinstance(data, list):
+            since = query["since"][0]
+            data = [k for k in data if str(k.get("timestamp") or "") > since]
+        return 200, data, "application/json"
+
+    def _record(self, fixture, service, rest, query):
+        url = endpoints.LIVE[service] + rest + (f"?{query}" if query else "")
+        headers = {"User-Agent": "BeowulfHunter/1.0"}
+        if self.headers.get("Authorization"):
+            headers["Authorization"] = self.headers["Authorization"]
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=15) as resp:
+                self.state.save_fixture(fixture, resp.read())
+        except (urllib.error.URLError, OSError) as e:
+            sys.stderr.write(f"record {url} failed: {e}\n")
+
+    def _control(self, method, path, body):
+        if path == "/_stats" and method == "GET":
+            return self._send(200, self.state.stats())
+        if path == "/_reset" and method == "POST":
+            self.state.reset()
+            return self._send(200, {"ok": True})
+        if path == "/_control" and method == "POST":
+            try:
+                self.state.configure(**json.loads(body or b"{}"))
+            except (ValueError, TypeError) as e:
+                return self._send(400, {"error": str(e)})
+            return self._send(200, self.state.knobs())
+        return self._send(404, {"error": "unknown control path"})
+
+
+def make_server(host="127.0.0.1", port=0, verbose=False, **state_kwargs):
+    """Build a stand-in server (not yet serving); port 0 picks a free port."""
+    handler = type("StandinHandler", (Handler,), {"state": StandinState(**state_kwargs), "verbose": verbose})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765, help="0 picks a free port")
+    ap.add_argument("--fixtures", default=FIXTURES_DIR)
+    ap.add_argument("--latency-ms", type=float, default=0.0, help="added to every response")
+    ap.add_argument("--jitter-ms", type=float, default=0.0, help="uniform extra latency, 0..N ms")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered 500/502/503")
+    ap.add_argument("--rate-429", type=float, default=0.0, help="share of requests answered 429")
+    ap.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429s")
+    ap.add_argument("--fault-match", default=None, help="only inject faults on paths matching this regex")
+    ap.add_argument("--seed", type=int, default=None, help="seed for reproducible fault sequences")
+    ap.add_argument("--record", action="store_true", help="refresh fixtures from the live services")
+    ap.add_argument("--verbose", action="store_true")
+    args = ap.parse_args(argv)
+
+    server = make_server(args.host, args.port, verbose=args.verbose, fixtures_dir=args.fixtures,
+                         latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+                         rate_429=args.rate_429, retry_after=args.retry_after, fault_match=args.fault_match,
+                         record=args.record, seed=args.seed)
+    host, port = server.server_address[:2]
+    print(f"listening on http://{host}:{port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
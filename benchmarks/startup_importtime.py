@@ -0,0 +1,127 @@
+"""Startup benchmark: import-time profile and time-to-first-window.
+
+Runs the app with BEOWULFHUNTER_STARTUP_PROBE set so it records how long it
+took to show the first window and then exits on its own (see
+main.install_startup_probe).
+
+Source run: `python -X importtime main.py`; the importtime report on stderr is
+summarized into the slowest top-level imports.
+Frozen run: pass `--exe dist/BeowulfHunter.exe`. Frozen builds ignore
+`-X importtime`, so only wall time and time-to-first-window are reported.
+
+Usage:
+    python benchmarks/startup_importtime.py [--runs 5] [--top 20] [--exe PATH] [--output bench_output.txt]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+
+def parse_importtime(stderr_text):
+    """Return [(cumulative_us, self_us, module)] for top-level imports in an importtime report."""
+    rows = []
+    for line in stderr_text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0].strip())
+            cum_us = int(parts[1].strip())
+        except ValueError:
+            continue  # header row
+        name = parts[2]
+        # Nested imports are indented by two spaces per level after the separator space
+        if name.startswith("  "):
+            continue
+        rows.append((cum_us, self_us, name.strip()))
+    return rows
+
+
+def run_once(cmd, cwd, timeout):
+    fd, probe_path = tempfile.mkstemp(prefix="beowulf_probe_", suffix=".json")
+    os.close(fd)
+    os.remove(probe_path)
+    env = dict(os.environ)
+    env["BEOWULFHUNTER_STARTUP_PROBE"] = probe_path
+    started = time.perf_counter()
+    proc = subprocess.run(cmd, cwd=cwd, env=env, capture_output=True, text=True, timeout=timeout)
+    wall = time.perf_counter() - started
+    probe = {}
+    try:
+        with open(probe_path, "r", encoding="utf-8") as f:
+            probe = json.load(f)
+    except Exception:
+        pass
+    finally:
+        try:
+            os.remove(probe_path)
+        except OSError:
+            pass
+    return {
+        "returncode": proc.returncode,
+        "wall_s": wall,
+        "first_window_s": probe.get("first_window_s"),
+        "stderr": proc.stderr or "",
+    }
+
+
+def summarize(label, runs):
+    walls = [r["wall_s"] for r in runs]
+    firsts = [r["first_window_s"] for r in runs if isinstance(r.get("first_window_s"), (int, float))]
+    lines = [f"== {label} ({len(runs)} runs) =="]
+    lines.append(f"process wall time      median {statistics.median(walls):.3f}s  min {min(walls):.3f}s")
+    if firsts:
+        lines.append(f"time to first window   median {statistics.median(firsts):.3f}s  min {min(firsts):.3f}s")
+    else:
+        lines.append("time to first window   n/a (probe file not written; check stderr of the app)")
+    return lines
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--top", type=int, default=20, help="number of slowest top-level imports to list")
+    ap.add_argument("--exe", default=None, help="path to a frozen BeowulfHunter executable")
+    ap.add_argument("--timeout", type=float, default=120.0)
+    ap.add_argument("--output", default=os.path.join(REPO_ROOT, "bench_output.txt"))
+    args = ap.parse_args(argv)
+
+    report = [f"# startup benchmark {datetime.now(timezone.utc).isoformat()}"]
+
+    source_cmd = [sys.executable, "-X", "importtime", os.path.join(REPO_ROOT, "main.py")]
+    source_runs = [run_once(source_cmd, REPO_ROOT, args.timeout) for _ in range(max(1, args.runs))]
+    report.extend(summarize("source run", source_runs))
+
+    # Import profile from the last run (warm disk cache, representative of steady state)
+    rows = parse_importtime(source_runs[-1]["stderr"])
+    if rows:
+        total_us = sum(r[0] for r in rows)
+        report.append(f"top-level imports total {total_us / 1000.0:.1f}ms; slowest {args.top}:")
+        for cum_us, self_us, name in sorted(rows, reverse=True)[:args.top]:
+            report.append(f"  {cum_us / 1000.0:9.1f}ms cumulative  {self_us / 1000.0:8.1f}ms self  {name}")
+
+    if args.exe:
+        exe_path = os.path.abspath(args.exe)
+        exe_runs = [run_once([exe_path], os.path.dirname(exe_path), args.timeout) for _ in range(max(1, args.runs))]
+        report.extend(summarize("frozen exe", exe_runs))
+
+    text = "\n".join(report) + "\n"
+    print(text)
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as f:
+            f.write(text + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
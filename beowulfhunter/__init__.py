@@ -0,0 +1 @@
+"""Package shim so the app can be started with `python -m beowulfhunter` from the repo root."""
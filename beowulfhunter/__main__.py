@@ -0,0 +1,24 @@
+"""`python -m beowulfhunter [--headless ...]`
+
+With --headless, runs the Tk-free daemon in src/headless.py; otherwise starts
+the GUI exactly like `python main.py`.
+"""
+import os
+import runpy
+import sys
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+# Modules under src are imported top-level, as in main.py
+sys.path.append(os.path.join(REPO_ROOT, 'src'))
+
+
+def _main():
+    if '--headless' in sys.argv[1:]:
+        import headless
+        return headless.main(sys.argv[1:])
+    runpy.run_path(os.path.join(REPO_ROOT, 'main.py'), run_name='__main__')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(_main())
@@ -6,7 +6,8 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('beohunter.png', '.'), ('beo.ico', '.')],
-    hiddenimports=[],
+    # Modules imported lazily via importlib are invisible to the analysis
+    hiddenimports=['tabs.piracy_tab', 'tabs.dogfighting_tab', 'tabs.proximity_tab', 'tabs.diagnostics_tab', 'graphs', 'plotly.graph_objects', 'kaleido', 'PIL.Image', 'PIL.ImageTk'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -1,5 +1,9 @@
+import time
+_STARTED_AT = time.perf_counter()  # reference point for the startup probe
+
 import os
 import sys
+import json
 
 # Add the 'src' directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
@@ -7,11 +11,12 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 import tkinter as tk
 from dotenv import load_dotenv
 from config import auto_shutdown, is_game_running
-from parser import refresh_api_kills_cache
-import threading
 from setup_gui import setup_gui
 from crash_detection import game_heartbeat
 import global_variables
+import log_sink
+import tk_profiler
+import profiling
 from filelock import FileLock, Timeout
 import tempfile
 
@@ -30,6 +35,32 @@ class EventLogger:
         self.text_widget.config(state=tk.DISABLED)
         self.text_widget.see(tk.END)
 
+def install_startup_probe(app):
+    """When BEOWULFHUNTER_STARTUP_PROBE names a file, record time-to-first-window there and exit.
+
+    Used by benchmarks/startup_importtime.py to time source and frozen (exe) runs.
+    """
+    probe_path = os.environ.get("BEOWULFHUNTER_STARTUP_PROBE")
+    if not probe_path:
+        return
+
+    def _report():
+        try:
+            with open(probe_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "first_window_s": time.perf_counter() - _STARTED_AT,
+                    "frozen": bool(getattr(sys, "frozen", False)),
+                }, f)
+        except Exception:
+            pass
+        try:
+            app.destroy()
+        except Exception:
+            pass
+
+    # Idle callbacks run once the first window has been mapped and drawn
+    app.after_idle(lambda: app.after(0, _report))
+
 if __name__ == '__main__':
     # Create a lock file in the system's temp directory
     lock_path = os.path.join(tempfile.gettempdir(), "beowulfhunter.lock")
@@ -41,6 +72,9 @@ if __name__ == '__main__':
         global_variables.log("Another instance of BeowulfHunter is already running.")
         sys.exit(1)
 
+    # Keep a rotating JSONL copy of all log output under the data directory
+    log_sink.install()
+
     game_running = is_game_running() # check processes to see if the game's running    
 
     app, logger = setup_gui(game_running) # setup the GUI or logger
@@ -48,20 +82,16 @@ if __name__ == '__main__':
     # Game services (log tail, heartbeat) are now started and managed by the GUI
     # via a live status monitor in setup_gui. No need to start them here.
 
-    # Refresh API kills cache in background so duplicate detection is ready
-    try:
-        threading.Thread(target=refresh_api_kills_cache, args=(global_variables.get_user_id(),), daemon=True).start()
-    except Exception:
-        try:
-            global_variables.log("Failed to start API kills cache refresh thread")
-        except Exception:
-            pass
+    # The API kills cache (duplicate detection) is refreshed in the background by
+    # KeyController once the saved key validates and the user_id is known.
 
-    
     # Initiate auto-shutdown after 72 hours (72 * 60 * 60 seconds)
     if logger:
         auto_shutdown(app, 72 * 60 * 60, logger)  # Pass logger only if initialized
     else:
         auto_shutdown(app, 72 * 60 * 60)  # Fallback without logger
 
+    install_startup_probe(app)
+    tk_profiler.install_from_config(app)
+    profiling.start_from_config(app)
     app.mainloop()
@@ -0,0 +1,57 @@
+"""In-memory catalog of UEX commodities for the Add Hit cargo inputs.
+
+Built from the /uex/summarizedcommodities/ rows that ironpoint_api keeps in
+the persistent HTTP cache; ironpoint_api rebuilds it only when the cached rows
+are refreshed, so cargo lookups never touch the network or scan the list:
+
+    record(name)   the commodity object for an exact name
+    price(name)    max(price_buy_avg, price_sell_avg), 0.0 when unknown
+    names()        unique names, sorted case-insensitively
+    search(prefix) names starting with `prefix` (prefix_index)
+"""
+from typing import Any, Dict, Iterable, List, Optional
+
+from prefix_index import PrefixIndex
+
+
+def _price(value: Any) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class CommodityCatalog:
+    __slots__ = ('_records', '_prices', '_index')
+
+    def __init__(self, rows: Optional[Iterable[Dict[str, Any]]] = None):
+        records: Dict[str, Dict[str, Any]] = {}
+        prices: Dict[str, float] = {}
+        for item in rows or ():
+            try:
+                name = str(item.get('commodity_name') or '').strip()
+            except Exception:
+                continue
+            if not name:
+                continue
+            records[name] = item
+            prices[name] = max(_price(item.get('price_buy_avg')), _price(item.get('price_sell_avg')))
+        self._records = records
+        self._prices = prices
+        self._index = PrefixIndex(records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def record(self, name: str) -> Optional[Dict[str, Any]]:
+        return self._records.get(name)
+
+    def price(self, name: str) -> float:
+        return self._prices.get(name, 0.0)
+
+    def names(self) -> List[str]:
+        return self._index.names()
+
+    def search(self, prefix: str, limit: int = 10, exclude: Iterable[str] = ()) -> List[str]:
+        """Up to `limit` commodity names starting with `prefix`, skipping `exclude`."""
+        return self._index.search(prefix, limit=limit, exclude=exclude)
@@ -1,23 +1,26 @@
 import os
-import psutil
 import threading
 import sys
 import time
 
 import global_variables
+from process_monitor import get_monitor, GAME_PROCESS_NAME, LAUNCHER_PROCESS_NAME
 
 
 @global_variables.log_exceptions
 def set_sc_log_location():
     """ Check for RSI Launcher and Star Citizen Launcher, and set SC_LOG_LOCATION accordingly. """
+    # One lookup for both processes; the monitor only rescans for whichever isn't already known
+    found = get_monitor().find_processes(LAUNCHER_PROCESS_NAME, GAME_PROCESS_NAME)
+
     # Check if RSI Launcher is running
-    rsi_launcher_path = check_if_process_running("RSI Launcher")
+    rsi_launcher_path = found.get(LAUNCHER_PROCESS_NAME)
     if not rsi_launcher_path:
         global_variables.log("RSI Launcher not running.")
         return None
 
     # Check if Star Citizen Launcher is running
-    sc_launcher_path = check_if_process_running("StarCitizen")
+    sc_launcher_path = found.get(GAME_PROCESS_NAME)
     if not sc_launcher_path:
         global_variables.log("Star Citizen Launcher not running.")
         return None
@@ -33,6 +36,19 @@ def set_sc_log_location():
         global_variables.log("Game.log not found in expected locations.")
         return None
     
+def get_data_dir() -> str:
+    """Return the directory for local app data (kill history, caches), creating it if needed.
+
+    Lives next to killtracker_key.cfg (the working directory) unless
+    BEOWULFHUNTER_DATA_DIR points elsewhere.
+    """
+    path = os.environ.get('BEOWULFHUNTER_DATA_DIR') or os.path.join(os.getcwd(), 'beowulfhunter_data')
+    try:
+        os.makedirs(path, exist_ok=True)
+    except Exception as e:
+        global_variables.log(f"Could not create data directory {path}: {e}")
+    return path
+
 @global_variables.log_exceptions
 def find_game_log_in_directory(directory):
     """ Search for Game.log in the directory and its parent directory. """
@@ -76,16 +92,14 @@ def auto_shutdown(app, delay_in_seconds, logger=None):
 @global_variables.log_exceptions
 def check_if_process_running(process_name):
     """ Check if a process is running by name. """
-    for proc in psutil.process_iter(['pid', 'name', 'exe']):
-        if process_name.lower() in proc.info['name'].lower():
-            return proc.info['exe']
-    return None
+    return get_monitor().find_processes(process_name).get(process_name)
 
 @global_variables.log_exceptions
 def find_rsi_handle(log_file_location):
     acct_str = "<Legacy login response> [CIG-net] User Login Success"
-    sc_log = open(log_file_location, "r")
-    lines = sc_log.readlines()
+    # Game.log can contain invalid UTF-8; decode it the way the parser does
+    with open(log_file_location, "r", encoding="utf-8", errors="replace") as sc_log:
+        lines = sc_log.readlines()
     for line in lines:
         if -1 != line.find(acct_str):
             line_index = line.index("Handle[") + len("Handle[")
@@ -98,12 +112,8 @@ def find_rsi_handle(log_file_location):
 
 @global_variables.log_exceptions
 def is_game_running():
-    """Check if Star Citizen is running."""
-    GAME_PROCESS_NAME = "StarCitizen"
-    for proc in psutil.process_iter(['pid', 'name', 'exe']):
-        if GAME_PROCESS_NAME.lower() in proc.info['name'].lower():
-            return proc.info['exe']
-    return None
+    """Check if Star Citizen is running (cached by the shared process monitor)."""
+    return get_monitor().is_game_running()
 
 @global_variables.log_exceptions
 def get_player_name(log_file_location):
@@ -5,6 +5,7 @@ import global_variables
 from config import set_sc_log_location, find_rsi_handle, is_game_running
 import parser
 from crash_detection import game_heartbeat
+from process_monitor import get_monitor
 
 
 class GameController:
@@ -68,7 +69,10 @@ class GameController:
         self._update_indicator(running_now)
         if running_now:
             self._start_game_services_once()
-        self._poll()
+        # The shared process monitor reports start/stop; no per-second scan here
+        monitor = get_monitor()
+        monitor.subscribe(self._on_game_state_changed)
+        monitor.start()
 
     def _update_indicator(self, running: bool):
         setattr(self.app, 'game_running_state', bool(running))
@@ -123,11 +127,14 @@ class GameController:
         except Exception as e:
             global_variables.log(f"Error starting game services: {e}")
 
-    def _poll(self):
+    def _on_game_state_changed(self, running, _exe=None):
+        """Process monitor callback (monitor thread); applies the change on the Tk thread."""
         try:
-            running = is_game_running()
+            self.app.after(0, lambda: self._apply_game_state(bool(running)))
         except Exception:
-            running = False
+            pass
+
+    def _apply_game_state(self, running: bool):
         # If state changed, update indicator and possibly start services
         try:
             prev = bool(getattr(self.app, 'game_running_state', False))
@@ -137,10 +144,6 @@ class GameController:
             self._update_indicator(running)
             if running:
                 self._start_game_services_once()
-        try:
-            self.app.after(1000, self._poll)
-        except Exception:
-            pass
 
     def _maybe_show_status_tooltip(self, event=None):
         try:
@@ -1,11 +1,16 @@
+import time
 import tkinter as tk
 from typing import Optional
 
 import backup_loader
 import global_variables
+import kill_sync
+import submission_queue
+import validation_cache
 from config import get_player_name, set_sc_log_location, find_rsi_handle
-from keys import validate_api_key, save_api_key, load_existing_key, get_org_key_value, validate_org_key
+from keys import validate_api_key, save_api_key, load_existing_key, get_org_key_value, validate_org_key, validated_username
 from theme import BUTTON_STYLE as THEME_BUTTON_STYLE
+from startup import get_orchestrator
 
 
 class KeyController:
@@ -130,84 +135,181 @@ class KeyController:
             pass
         self._gate_activate_button()
         if saved_key and (get_org_key_value() is not None and get_org_key_value() != ""):
-            self.log("Validating saved key")
-            # Validate org key first
+            # Show stored kill history right away; the API sync refreshes it once keys validate
+            self._load_kill_history()
             try:
-                okv = get_org_key_value()
+                okv = get_org_key_value() or ""
             except Exception:
-                okv = None
-            if not validate_org_key(okv or ""):
-                self.log("ORG key did not validate. Please enter a valid ORG key.")
-                # Show red error on main tab
-                try:
-                    refs = getattr(self.app, 'main_tab_refs', {})
-                    lbl = refs.get('org_error_label')
-                    btn_row = refs.get('button_row')
-                    if isinstance(lbl, tk.Label) and btn_row is not None:
-                        lbl.config(text="ORG key did not validate. Please enter a valid ORG key.")
-                        # Place inside button_row, below the Activate button
-                        lbl.pack_forget()
-                        lbl.pack(side=tk.TOP, anchor='w', padx=6, pady=(6, 0))
-                except Exception:
-                    pass
-                self._update_key_indicator(False)
-                # Keep tabs disabled and columns hidden
-                try:
-                    refs = getattr(self.app, 'main_tab_refs', {})
-                    hide_cols = refs.get('hide_kill_columns')
-                    if callable(hide_cols):
-                        hide_cols()
-                except Exception:
-                    pass
-                self._set_tabs_enabled(False)
+                okv = ""
+            cached = validation_cache.get_key_validation(saved_key, okv)
+            if cached:
+                # These exact keys validated recently: unlock now and re-check in the background
+                if cached.get('user_id'):
+                    global_variables.set_user_id(cached['user_id'])
+                self.log("Key is Valid (last verified "
+                         f"{self._format_age(cached.get('validated_at'))} ago); re-checking in the background")
+                self._on_key_accepted()
+                self._validate_keys_async(saved_key, okv, current_handle,
+                                          lambda org_ok, api_ok: self._apply_revalidation(saved_key, okv, org_ok, api_ok))
                 return
-            if validate_api_key(saved_key, current_handle):
-                self.log("Key is Valid")
-                # Hide org error if previously shown
-                try:
-                    refs = getattr(self.app, 'main_tab_refs', {})
-                    lbl = refs.get('org_error_label')
-                    if isinstance(lbl, tk.Label):
-                        lbl.pack_forget()
-                except Exception:
-                    pass
-                try:
-                    self.key_section.pack_forget()
-                except Exception:
-                    pass
-                # Show the columns now that a valid key exists
-                try:
-                    refs = getattr(self.app, 'main_tab_refs', {})
-                    show_cols = refs.get('show_kill_columns')
-                    if callable(show_cols):
-                        show_cols()
-                except Exception:
-                    pass
-                # Re-enable tabs
-                self._set_tabs_enabled(True)
-                # Populate main tab kills columns from API
-                try:
-                    self._populate_kills_from_api()
-                except Exception as e:
-                    self.log(f"Error populating kills from API: {e}")
-                # Now that key is validated, show the backup controls above the log
-                try:
-                    controls_parent = getattr(self.app, 'log_controls_container', None)
-                    if self.log_text_area is not None:
-                        backup_loader.create_load_prev_controls(self.app, self.log_text_area, getattr(self.app, 'BUTTON_STYLE', THEME_BUTTON_STYLE), controls_parent=controls_parent)
-                except Exception as e:
-                    self.log(f"Error creating backup controls: {e}")
-                # Update indicator to solid green
-                self._update_key_indicator(True)
-            else:
-                self.log("KEY IS INVALID. Please re-enter a valid key from the Discord bot using /key-create.")
-                self._update_key_indicator(False)
+            self.log("Validating saved key")
+            # Both checks run on background workers; the window stays responsive meanwhile
+            self._validate_keys_async(saved_key, okv, current_handle,
+                                      lambda org_ok, api_ok: self._apply_saved_key_result(saved_key, okv, org_ok, api_ok))
         else:
             self.log("Keys missing. Please enter both player and org keys.")
             self._update_key_indicator(False)
             # Ensure tabs remain disabled when no key exists
             self._set_tabs_enabled(False)
 
+    def _apply_saved_key_result(self, player_key: str, org_key: str, org_ok, api_ok):
+        """Apply the outcome of validating the saved keys (runs on the Tk thread)."""
+        if not org_ok:
+            if org_ok is False:
+                validation_cache.clear_key_validation()
+            self.log("ORG key did not validate. Please enter a valid ORG key.")
+            self._reject_org_key()
+            return
+        if api_ok:
+            self._remember_validation(player_key, org_key)
+            self.log("Key is Valid")
+            self._on_key_accepted()
+        else:
+            if api_ok is False:
+                validation_cache.clear_key_validation()
+            self.log("KEY IS INVALID. Please re-enter a valid key from the Discord bot using /key-create.")
+            self._update_key_indicator(False)
+
+    def _apply_revalidation(self, player_key: str, org_key: str, org_ok, api_ok):
+        """Background re-check after a launch from the validation cache (runs on the Tk thread).
+
+        Only an explicit rejection locks the UI again; when a server could not be
+        reached (None) the cached validation stands until the next launch.
+        """
+        if org_ok and api_ok:
+            self._remember_validation(player_key, org_key)
+            global_variables.log("Saved key re-validated.")
+            return
+        if org_ok is not False and api_ok is not False:
+            self.log("Could not re-check the saved keys right now; continuing with the last successful validation.")
+            return
+        validation_cache.clear_key_validation()
+        try:
+            self.key_section.pack()
+        except Exception:
+            pass
+        try:
+            refs = getattr(self.app, 'main_tab_refs', {})
+            hide_cols = refs.get('hide_kill_columns')
+            if callable(hide_cols):
+                hide_cols()
+        except Exception:
+            pass
+        self._set_tabs_enabled(False)
+        self._apply_saved_key_result(player_key, org_key, org_ok is not False, api_ok)
+
+    def _remember_validation(self, player_key: str, org_key: str):
+        validation_cache.put_key_validation(player_key, org_key, global_variables.get_user_id(),
+                                            validated_username.get("value"))
+
+    @staticmethod
+    def _format_age(stamp) -> str:
+        try:
+            minutes = max(0, int((time.time() - float(stamp)) // 60))
+        except Exception:
+            return "a while"
+        if minutes < 60:
+            return f"{minutes}m"
+        return f"{minutes // 60}h {minutes % 60}m"
+
+    def _validate_keys_async(self, player_key: str, org_key: str, rsi_handle, on_done):
+        """Validate the ORG and player keys concurrently off the Tk thread.
+
+        `on_done(org_ok, api_ok)` is called on the Tk thread once both checks return;
+        each is True, False, or None when the server could not be reached.
+        """
+        orchestrator = get_orchestrator(self.app)
+        results = {}
+
+        def _collect(name, ok):
+            results[name] = None if ok is None else bool(ok)
+            if len(results) == 2:
+                on_done(results['org'], results['api'])
+
+        orchestrator.submit('org_key', 'validating ORG key', lambda: validate_org_key(org_key),
+                            on_result=lambda ok: _collect('org', ok), on_error=lambda _e: _collect('org', None))
+        orchestrator.submit('api_key', 'validating player key', lambda: validate_api_key(player_key, rsi_handle),
+                            on_result=lambda ok: _collect('api', ok), on_error=lambda _e: _collect('api', None))
+
+    def _reject_org_key(self):
+        """Show the ORG key error and keep the key-gated UI locked."""
+        # Show red error on main tab
+        try:
+            refs = getattr(self.app, 'main_tab_refs', {})
+            lbl = refs.get('org_error_label')
+            btn_row = refs.get('button_row')
+            if isinstance(lbl, tk.Label) and btn_row is not None:
+                lbl.config(text="ORG key did not validate. Please enter a valid ORG key.")
+                # Place inside button_row, below the Activate button
+                lbl.pack_forget()
+                lbl.pack(side=tk.TOP, anchor='w', padx=6, pady=(6, 0))
+        except Exception:
+            pass
+        self._update_key_indicator(False)
+        # Keep tabs disabled and columns hidden
+        try:
+            refs = getattr(self.app, 'main_tab_refs', {})
+            hide_cols = refs.get('hide_kill_columns')
+            if callable(hide_cols):
+                hide_cols()
+        except Exception:
+            pass
+        self._set_tabs_enabled(False)
+
+    def _on_key_accepted(self):
+        """Unlock the UI after a successful validation and start the initial kill sync."""
+        # Hide org error if previously shown
+        try:
+            refs = getattr(self.app, 'main_tab_refs', {})
+            lbl = refs.get('org_error_label')
+            if isinstance(lbl, tk.Label):
+                lbl.pack_forget()
+        except Exception:
+            pass
+        try:
+            self.key_section.pack_forget()
+        except Exception:
+            pass
+        # Show the columns now that a valid key exists
+        try:
+            refs = getattr(self.app, 'main_tab_refs', {})
+            show_cols = refs.get('show_kill_columns')
+            if callable(show_cols):
+                show_cols()
+        except Exception:
+            pass
+        # Re-enable tabs
+        self._set_tabs_enabled(True)
+        # Kills queued while no key was set can be delivered now
+        try:
+            submission_queue.retry_pending()
+        except Exception:
+            pass
+        # Populate main tab kills columns from API (fetched in the background)
+        try:
+            self._populate_kills_from_api()
+        except Exception as e:
+            self.log(f"Error populating kills from API: {e}")
+        # Now that key is validated, show the backup controls above the log
+        try:
+            controls_parent = getattr(self.app, 'log_controls_container', None)
+            if self.log_text_area is not None:
+                backup_loader.create_load_prev_controls(self.app, self.log_text_area, getattr(self.app, 'BUTTON_STYLE', THEME_BUTTON_STYLE), controls_parent=controls_parent)
+        except Exception as e:
+            self.log(f"Error creating backup controls: {e}")
+        # Update indicator to solid green
+        self._update_key_indicator(True)
+
     def activate_key(self):
         try:
             self.key_section.pack()
@@ -265,89 +367,46 @@ class KeyController:
         if not current_player:
             self.log("RSI Handle not detected yet. Key validation can proceed; start the game to enable kill tracking.")
 
-        # Validate org key first; do not proceed if invalid
-        if not validate_org_key(entered_org_key):
-            self.log("ORG key did not validate. Please enter a valid ORG key.")
-            # Show red error under ORG field
-            try:
-                refs = getattr(self.app, 'main_tab_refs', {})
-                lbl = refs.get('org_error_label')
-                btn_row = refs.get('button_row')
-                if isinstance(lbl, tk.Label) and btn_row is not None:
-                    lbl.config(text="ORG key did not validate. Please enter a valid ORG key.")
-                    # Place inside button_row, below the Activate button
-                    lbl.pack_forget()
-                    lbl.pack(side=tk.TOP, anchor='w', padx=6, pady=(6, 0))
-            except Exception:
-                pass
-            self._update_key_indicator(False)
-            # Keep columns hidden and tabs disabled
-            try:
-                refs = getattr(self.app, 'main_tab_refs', {})
-                hide_cols = refs.get('hide_kill_columns')
-                if callable(hide_cols):
-                    hide_cols()
-            except Exception:
-                pass
-            self._set_tabs_enabled(False)
-            return
+        # Validate both keys in the background; keep Activate disabled meanwhile
+        try:
+            if self.activate_button is not None:
+                self.activate_button.config(state='disabled')
+        except Exception:
+            pass
 
-        if validate_api_key(entered_key, current_handle):
-            # Save both keys (player line1, org line2)
-            save_api_key(entered_key, entered_org_key)
-            global_variables.set_key(entered_key)
-            try:
-                global_variables.set_org_key(entered_org_key)
-            except Exception:
-                pass
-            self.log("Key activated and saved. Servitor connection established.")
-            # Hide org error if previously shown
-            try:
-                refs = getattr(self.app, 'main_tab_refs', {})
-                lbl = refs.get('org_error_label')
-                if isinstance(lbl, tk.Label):
-                    lbl.pack_forget()
-            except Exception:
-                pass
-            try:
-                self.key_section.pack_forget()
-            except Exception:
-                pass
-            # Show the columns once activated
-            try:
-                refs = getattr(self.app, 'main_tab_refs', {})
-                show_cols = refs.get('show_kill_columns')
-                if callable(show_cols):
-                    show_cols()
-            except Exception:
-                pass
-            # Enable tabs now that key is active
-            self._set_tabs_enabled(True)
-            # Populate main tab kills columns from API
-            try:
-                self._populate_kills_from_api()
-            except Exception as e:
-                self.log(f"Error populating kills from API: {e}")
-            try:
-                controls_parent = getattr(self.app, 'log_controls_container', None)
-                if self.log_text_area is not None:
-                    backup_loader.create_load_prev_controls(self.app, self.log_text_area, getattr(self.app, 'BUTTON_STYLE', THEME_BUTTON_STYLE), controls_parent=controls_parent)
-            except Exception as e:
-                self.log(f"Error creating backup controls: {e}")
-            self._update_key_indicator(True)
-        else:
-            self.log("Invalid player key. Please enter a valid API key.")
-            self._update_key_indicator(False)
-            # Keep columns hidden on invalid key
-            try:
-                refs = getattr(self.app, 'main_tab_refs', {})
-                hide_cols = refs.get('hide_kill_columns')
-                if callable(hide_cols):
-                    hide_cols()
-            except Exception:
-                pass
-            # Keep tabs disabled
-            self._set_tabs_enabled(False)
+        def _apply(org_ok: bool, api_ok: bool):
+            self._gate_activate_button()
+            # Do not proceed if the org key is invalid
+            if not org_ok:
+                self.log("ORG key did not validate. Please enter a valid ORG key.")
+                self._reject_org_key()
+                return
+            if api_ok:
+                # Save both keys (player line1, org line2)
+                save_api_key(entered_key, entered_org_key)
+                global_variables.set_key(entered_key)
+                try:
+                    global_variables.set_org_key(entered_org_key)
+                except Exception:
+                    pass
+                self._remember_validation(entered_key, entered_org_key)
+                self.log("Key activated and saved. Servitor connection established.")
+                self._on_key_accepted()
+            else:
+                self.log("Invalid player key. Please enter a valid API key.")
+                self._update_key_indicator(False)
+                # Keep columns hidden on invalid key
+                try:
+                    refs = getattr(self.app, 'main_tab_refs', {})
+                    hide_cols = refs.get('hide_kill_columns')
+                    if callable(hide_cols):
+                        hide_cols()
+                except Exception:
+                    pass
+                # Keep tabs disabled
+                self._set_tabs_enabled(False)
+
+        self._validate_keys_async(entered_key, entered_org_key, current_handle, _apply)
 
     # --- Key indicator management ---
     def setup_key_indicator(self):
@@ -458,16 +517,37 @@ class KeyController:
 
     # --- Kills population helpers ---
     def _populate_kills_from_api(self):
-        """Fetch kills using the API and render into the two columns."""
+        """Fetch kills using the API in the background and render into the two columns."""
         try:
             # Ensure we have a user_id (set during validate_api_key)
             # Fetch and classify
-            from parser import fetch_and_classify_api_kills_for_ui  # local import to avoid cycles
+            from parser import fetch_and_classify_api_kills_for_ui, refresh_api_kills_cache  # local import to avoid cycles
         except Exception:
             return
 
+        def _fetch():
+            try:
+                return fetch_and_classify_api_kills_for_ui()
+            except Exception:
+                return [], []
+
+        orchestrator = get_orchestrator(self.app)
+        orchestrator.submit('api_kills', 'loading kills', _fetch, on_result=self._render_api_kills)
+        # Duplicate-detection cache for live/backup uploads needs the user_id from validation
+        orchestrator.submit('kills_cache', 'syncing kill cache', lambda: refresh_api_kills_cache(global_variables.get_user_id()))
+
+    def _load_kill_history(self):
+        """Seed the kill store from the local history database in the background."""
+        def _on_loaded(count):
+            if count:
+                self._render_api_kills(kill_sync.get_split())
+
+        get_orchestrator(self.app).submit('kill_history', 'loading kill history', kill_sync.seed_from_db, on_result=_on_loaded)
+
+    def _render_api_kills(self, result):
+        """Render fetched (pu, ac) kill lists into the Main tab columns (Tk thread)."""
         try:
-            pu, ac = fetch_and_classify_api_kills_for_ui()
+            pu, ac = result
         except Exception:
             pu, ac = [], []
 
@@ -476,12 +556,10 @@ class KeyController:
             refs = getattr(self.app, 'main_tab_refs', {})
             clear_pu = refs.get('clear_pu_kills')
             clear_ac = refs.get('clear_ac_kills')
-            add_pu = refs.get('add_pu_kill_card')
-            add_ac = refs.get('add_ac_kill_card')
             set_pu_count = refs.get('set_pu_kills_count')
             set_ac_count = refs.get('set_ac_kills_count')
         except Exception:
-            clear_pu = clear_ac = add_pu = add_ac = set_pu_count = set_ac_count = None
+            clear_pu = clear_ac = set_pu_count = set_ac_count = None
 
         # Clear existing
         try:
@@ -495,7 +573,7 @@ class KeyController:
         except Exception:
             pass
 
-    # Update header counts (grand totals; display is capped separately at 10)
+        # Update header counts (grand totals; display is capped separately at 10)
         try:
             if callable(set_pu_count):
                 set_pu_count(len(pu))
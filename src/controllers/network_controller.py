@@ -0,0 +1,90 @@
+import tkinter as tk
+from typing import Optional
+
+import net
+import submission_queue
+
+
+class NetworkController:
+    """Banner indicator for net's circuit breakers.
+
+    Hidden while every host is reachable; amber while a host is being probed
+    (half-open) and red while one is offline. Hovering lists the offline hosts
+    and how many submissions wait in the outbox for them.
+    """
+
+    def __init__(self, app, banner_canvas: Optional[tk.Canvas] = None):
+        self.app = app
+        self.banner_canvas = banner_canvas
+        self._rect_id = None
+
+    def setup_indicator(self):
+        if self.banner_canvas is None or self._rect_id is not None:
+            return
+        try:
+            # Same row as the game and key indicators, right of the key square
+            self._rect_id = self.banner_canvas.create_rectangle(143, 8, 159, 24, fill="#7a2222", outline="#000000",
+                                                                width=1, state='hidden')
+            self.banner_canvas.tag_bind(self._rect_id, "<Enter>", lambda e: self._show_tooltip(e))
+            self.banner_canvas.tag_bind(self._rect_id, "<Leave>", lambda e: self._hide_tooltip())
+        except Exception:
+            self._rect_id = None
+        self.update()
+
+    def update(self, _events=None):
+        """Redraw from net.breaker_status(); called on every TOPIC_NETWORK batch."""
+        offline = net.breaker_status()
+        if self.banner_canvas is None or self._rect_id is None:
+            return
+        try:
+            if not offline:
+                self.banner_canvas.itemconfig(self._rect_id, state='hidden')
+                self._hide_tooltip()
+                return
+            probing = all(b['state'] == 'half_open' for b in offline)
+            self.banner_canvas.itemconfig(self._rect_id, state='normal', fill="#d4a017" if probing else "#ff4444")
+        except Exception:
+            pass
+
+    def _tooltip_text(self) -> str:
+        offline = net.breaker_status()
+        if not offline:
+            return "Online"
+        lines = ["Offline - requests fail fast until a probe succeeds:"]
+        for b in offline:
+            if b['state'] == 'half_open':
+                lines.append(f"  {b['host']}: checking...")
+            else:
+                lines.append(f"  {b['host']}: retry in {int(b['retry_in'])}s")
+        try:
+            pending = submission_queue.status().get('pending', 0)
+            if pending:
+                lines.append(f"{pending} submission{'s' if pending != 1 else ''} queued to send when back online")
+        except Exception:
+            pass
+        return "\n".join(lines)
+
+    def _show_tooltip(self, event=None):
+        try:
+            self._hide_tooltip()
+            tip = tk.Toplevel(self.app)
+            tip.wm_overrideredirect(True)
+            tip.config(bg="#202020")
+            x = (event.x_root + 12) if event else self.app.winfo_rootx() + 12
+            y = (event.y_root + 12) if event else self.app.winfo_rooty() + 12
+            tip.wm_geometry(f"+{x}+{y}")
+            lbl = tk.Label(tip, text=self._tooltip_text(), justify=tk.LEFT, bg="#202020", fg="#ffcccc", bd=1,
+                           relief="solid", font=("Times New Roman", 10))
+            lbl.pack(ipadx=6, ipady=3)
+            setattr(self.app, '_network_status_tooltip', tip)
+        except Exception:
+            pass
+
+    def _hide_tooltip(self):
+        try:
+            tip = getattr(self.app, '_network_status_tooltip', None)
+            if tip is not None:
+                tip.destroy()
+                setattr(self.app, '_network_status_tooltip', None)
+        except Exception:
+            pass
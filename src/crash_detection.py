@@ -4,32 +4,35 @@ import sys
 # Add the 'src' directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-import threading
-import time
-from config import set_sc_log_location, auto_shutdown, find_rsi_handle, is_game_running
+from config import set_sc_log_location, auto_shutdown, find_rsi_handle
+from process_monitor import get_monitor
 import global_variables
 
+_heartbeat_registered = False
+
 
 @global_variables.log_exceptions
 def game_heartbeat(check_interval, game_running):
-    """Check every X seconds if the game is running. When detected, trigger callback."""
-    def heartbeat_loop():
-        while game_running:
-            if is_game_running():
-                time.sleep(check_interval)
-                continue
-            if is_game_running() is None:
-                global_variables.log("Game Crashed")
-                global_variables.log("Will resume monitoring game.log once game is re-launched.")
-                while is_game_running() is None:
-                    game_running_check = is_game_running()
-                    time.sleep(check_interval)
-                global_variables.log("Game is running again.")
-                on_game_relaunch()
-                continue
-
-
-    threading.Thread(target=heartbeat_loop, daemon=True).start()
+    """Watch for the game stopping and relaunching via the shared process monitor.
+
+    `check_interval` is kept for callers; the monitor owns the polling cadence.
+    """
+    global _heartbeat_registered
+    if not game_running or _heartbeat_registered:
+        return
+    monitor = get_monitor()
+    monitor.subscribe(_on_game_state_changed)
+    monitor.start()
+    _heartbeat_registered = True
+
+
+def _on_game_state_changed(running, _exe):
+    if not running:
+        global_variables.log("Game Crashed")
+        global_variables.log("Will resume monitoring game.log once game is re-launched.")
+        return
+    global_variables.log("Game is running again.")
+    on_game_relaunch()
 
 @global_variables.log_exceptions
 def on_game_relaunch():
@@ -0,0 +1,77 @@
+"""Base URLs for every backend the tracker talks to.
+
+Defaults are the live services. Each base can be overridden from the
+environment, which is how load tests and offline development point the app at
+the stand-in server in benchmarks/standin_server.py:
+
+    BEOWULFHUNTER_API_BASE=http://127.0.0.1:8765   all services on one stand-in
+    BEOWULFHUNTER_BEOWULF_API=...                    beowulf.ironpoint.org/api
+    BEOWULFHUNTER_IRONPOINT_API=...                  www.ironpoint.org/api/api
+    BEOWULFHUNTER_RSI_SITE=...                       robertsspaceindustries.com
+    BEOWULFHUNTER_SC_API=...                         api.starcitizen-api.com
+    BEOWULFHUNTER_GITHUB_API=...                     api.github.com
+
+With BEOWULFHUNTER_API_BASE each service is served under its own prefix
+(STANDIN_PREFIXES). Individual overrides win over the shared base. Values are
+read once at import, so set them before the app starts.
+"""
+import os
+
+LIVE = {
+    'beowulf': "https://beowulf.ironpoint.org/api",
+    'ironpoint': "https://www.ironpoint.org/api/api",
+    'rsi': "https://robertsspaceindustries.com",
+    'scapi': "https://api.starcitizen-api.com",
+    'github': "https://api.github.com",
+}
+
+# Path prefix of each service on a shared stand-in server
+STANDIN_PREFIXES = {
+    'beowulf': "/beowulf/api",
+    'ironpoint': "/ironpoint/api/api",
+    'rsi': "/rsi",
+    'scapi': "/scapi",
+    'github': "/github",
+}
+
+_ENV_NAMES = {
+    'beowulf': 'BEOWULFHUNTER_BEOWULF_API',
+    'ironpoint': 'BEOWULFHUNTER_IRONPOINT_API',
+    'rsi': 'BEOWULFHUNTER_RSI_SITE',
+    'scapi': 'BEOWULFHUNTER_SC_API',
+    'github': 'BEOWULFHUNTER_GITHUB_API',
+}
+
+
+def _resolve(service: str) -> str:
+    value = os.environ.get(_ENV_NAMES[service], '').strip()
+    if value:
+        return value.rstrip('/')
+    shared = os.environ.get('BEOWULFHUNTER_API_BASE', '').strip()
+    if shared:
+        return shared.rstrip('/') + STANDIN_PREFIXES[service]
+    return LIVE[service]
+
+
+BEOWULF_API = _resolve('beowulf')
+IRONPOINT_API = _resolve('ironpoint')
+RSI_SITE = _resolve('rsi')
+SC_API = _resolve('scapi')
+GITHUB_API = _resolve('github')
+
+
+def is_overridden() -> bool:
+    """True when any base URL points somewhere other than the live services."""
+    return any(_resolve(s) != LIVE[s] for s in LIVE)
+
+
+def rsi_url(path: str) -> str:
+    """Absolute RSI URL for a site-relative path such as '/media/...'; absolute URLs pass through."""
+    if path.startswith('/'):
+        return RSI_SITE + path
+    return path
+
+
+def citizen_url(handle: str) -> str:
+    """RSI citizen profile page for a handle (the handle is used as given)."""
+    return f"{RSI_SITE}/en/citizens/{handle}"
@@ -0,0 +1,146 @@
+"""In-process event bus between the log parser and the views.
+
+The parser publishes what happened; views subscribe to the topics they care
+about. Events published from any thread are queued and delivered on the Tk
+thread in one batch per frame, so a burst (a kill bumps the processing count,
+refreshes the kill list, overlay and proximity feed) costs a single
+`app.after` callback instead of one per view.
+
+Topics and their event fields (every event also carries 'topic'):
+    TOPIC_KILL              victim, ship, timestamp
+    TOPIC_SNARE             player, from_player, ship, timestamp
+    TOPIC_NEARBY            player, timestamp
+    TOPIC_PROCESSING_COUNT  count
+    TOPIC_API_DATA          cache (http_cache name whose data a background refresh replaced)
+    TOPIC_SUBMISSIONS       kind, id, result ('queued'|'sent'|'retry'|'failed'|'loaded'), pending, failed
+    TOPIC_NETWORK           host, state ('open'|'half_open'|'closed'), retry_in (net circuit breakers)
+
+Subscribers receive the list of events for their topics, in publish order:
+    event_bus.subscribe((TOPIC_KILL, TOPIC_SNARE), lambda events: ...)
+
+Without an attached app (headless mode), events are delivered immediately on
+the publishing thread.
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+import global_variables
+import metrics
+
+TOPIC_KILL = 'kill'
+TOPIC_SNARE = 'snare'
+TOPIC_NEARBY = 'nearby'
+TOPIC_PROCESSING_COUNT = 'processing_count'
+TOPIC_API_DATA = 'api_data'
+TOPIC_SUBMISSIONS = 'submissions'
+TOPIC_NETWORK = 'network'
+TOPICS = (TOPIC_KILL, TOPIC_SNARE, TOPIC_NEARBY, TOPIC_PROCESSING_COUNT, TOPIC_API_DATA, TOPIC_SUBMISSIONS,
+          TOPIC_NETWORK)
+
+# Proximity-style events shown in the feed and overlay
+PLAYER_TOPICS = (TOPIC_KILL, TOPIC_SNARE, TOPIC_NEARBY)
+
+# Delay before a batch is dispatched (~one frame at 60 Hz)
+FRAME_MS = 16
+
+_lock = threading.Lock()
+_subscribers: List[Dict[str, Any]] = []
+# (publish time, event) awaiting the next flush
+_pending: List[tuple] = []
+_scheduled = False
+_app = None
+
+
+def attach(app):
+    """Deliver events on `app`'s Tk thread from now on."""
+    global _app
+    _app = app
+
+
+def subscribe(topics: Union[str, Sequence[str]], callback: Callable[[List[Dict[str, Any]]], None]):
+    """Call `callback(events)` once per dispatched batch containing any of `topics`."""
+    if isinstance(topics, str):
+        topics = (topics,)
+    unknown = [t for t in topics if t not in TOPICS]
+    if unknown:
+        raise ValueError(f"Unknown event topic(s): {', '.join(unknown)}")
+    with _lock:
+        _subscribers.append({'topics': frozenset(topics), 'callback': callback})
+
+
+def unsubscribe(callback):
+    with _lock:
+        _subscribers[:] = [s for s in _subscribers if s['callback'] is not callback]
+
+
+def publish(topic: str, **fields):
+    """Queue an event for the next dispatch; safe from any thread."""
+    global _scheduled
+    if topic not in TOPICS:
+        raise ValueError(f"Unknown event topic: {topic}")
+    event = dict(fields, topic=topic)
+    app = _app
+    if app is None:
+        metrics.histogram('event_bus.dispatch_latency', topic=topic).observe(0.0)
+        _dispatch([event])
+        return
+    with _lock:
+        _pending.append((time.perf_counter(), event))
+        if _scheduled:
+            return
+        _scheduled = True
+    try:
+        app.after(FRAME_MS, _flush)
+    except Exception:
+        # Tk not running (e.g., shutting down); deliver on this thread instead
+        _flush()
+
+
+def _flush():
+    global _scheduled
+    with _lock:
+        pending = list(_pending)
+        _pending.clear()
+        _scheduled = False
+    if not pending:
+        return
+    now = time.perf_counter()
+    for published_at, event in pending:
+        metrics.histogram('event_bus.dispatch_latency', topic=event['topic']).observe(now - published_at)
+    _dispatch([event for _, event in pending])
+
+
+def _dispatch(batch: List[Dict[str, Any]]):
+    with _lock:
+        subscribers = list(_subscribers)
+    for sub in subscribers:
+        events = [e for e in batch if e['topic'] in sub['topics']]
+        if not events:
+            continue
+        try:
+            sub['callback'](events)
+        except Exception as e:
+            global_variables.log(f"Event subscriber failed: {e}")
+
+
+def report_line(event: Dict[str, Any]) -> Optional[str]:
+    """Proximity feed line for a player event, e.g. "[SNARE] From -> To (Ship)"."""
+    topic = event.get('topic')
+    ship = event.get('ship')
+    if topic == TOPIC_KILL:
+        victim = event.get('victim') or 'Victim'
+        return f"[KILL] {victim} ({ship})" if ship else f"[KILL] {victim}"
+    if topic == TOPIC_NEARBY:
+        return f"[NEAR] {event.get('player')}" if event.get('player') else None
+    if topic == TOPIC_SNARE:
+        player = event.get('player')
+        from_player = event.get('from_player')
+        if from_player and player:
+            line = f"[SNARE] {from_player} -> {player}"
+        elif player:
+            line = f"[SNARE] {player}"
+        else:
+            return None
+        return f"{line} ({ship})" if ship else line
+    return None
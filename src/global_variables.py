@@ -1,39 +1,100 @@
-import tkinter as tk
+import collections
 import functools
+import threading
 import traceback
 import os
 import time
 
-class EventLogger:
-    def __init__(self, text_widget):
-        self.text_widget = text_widget
+LOG_LEVELS = ('debug', 'info', 'warning', 'error')
+_LOG_LEVEL_RANK = {name: i for i, name in enumerate(LOG_LEVELS)}
+_ERROR_CUES = ('error', 'failed', 'exception', 'invalid', 'traceback')
+_WARNING_CUES = ('warning', 'not found', 'not running', 'skipping', 'retry')
 
-    def log(self, message):
-        """Log a message to the associated Tkinter Text widget in a thread-safe way.
 
-        If called from a non-main thread, we schedule the widget update with
-        `after(0, ...)` so Tkinter operations happen on the main loop. If the
-        text widget is not available or an error occurs, fall back to printing.
-        """
-        def _append():
-            try:
-                self.text_widget.config(state=tk.NORMAL)
-                self.text_widget.insert(tk.END, message + "\n")
-                self.text_widget.config(state=tk.DISABLED)
-                self.text_widget.see(tk.END)
-            except Exception:
-                # If widget operations fail for any reason, fallback to stdout
-                print(message)
+def infer_level(message) -> str:
+    """Best-effort level for untagged messages, from wording ('failed' -> error, ...)."""
+    try:
+        low = str(message).lower()
+    except Exception:
+        return 'info'
+    if any(cue in low for cue in _ERROR_CUES):
+        return 'error'
+    if any(cue in low for cue in _WARNING_CUES):
+        return 'warning'
+    return 'info'
 
+
+class EventLogger:
+    """Batched, bounded log console backed by a Tk Text widget.
+
+    `log()` only appends to a thread-safe buffer. The Tk thread drains it every
+    FLUSH_MS with one insert and trims the widget to MAX_LINES, so bursts (e.g.
+    backup imports) cost one widget update per tick and memory stays bounded
+    over long sessions. Messages below `min_level` are dropped.
+    """
+    FLUSH_MS = 100
+    MAX_LINES = 5000
+    # Pending messages kept when the UI can't keep up; older ones are dropped
+    MAX_PENDING = 5000
+
+    def __init__(self, text_widget, min_level: str = 'info'):
+        self.text_widget = text_widget
+        self.min_level = min_level if min_level in _LOG_LEVEL_RANK else 'info'
+        self._pending = collections.deque()
+        self._dropped = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        self._schedule()
+
+    def set_level(self, level: str):
+        if level in _LOG_LEVEL_RANK:
+            self.min_level = level
+
+    def log(self, message, level: str = None):
+        """Queue a message for the next flush; safe from any thread."""
+        level = level or infer_level(message)
+        if _LOG_LEVEL_RANK.get(level, 1) < _LOG_LEVEL_RANK[self.min_level]:
+            return
+        with self._lock:
+            self._pending.append(str(message))
+            if len(self._pending) > self.MAX_PENDING:
+                self._pending.popleft()
+                self._dropped += 1
+
+    def _schedule(self):
+        if self._closed:
+            return
         try:
-            # Schedule the append on the Tkinter main thread if possible
-            self.text_widget.after(0, _append)
+            self.text_widget.after(self.FLUSH_MS, self._flush)
         except Exception:
-            # If `after` is not available or fails, attempt direct call as a last resort
+            # Widget gone (window closed); stop draining
+            self._closed = True
+
+    def _flush(self):
+        with self._lock:
+            lines = list(self._pending)
+            self._pending.clear()
+            dropped, self._dropped = self._dropped, 0
+        if dropped:
+            lines.insert(0, f"[{dropped} log messages dropped]")
+        if lines:
             try:
-                _append()
+                # Tk constants spelled out so this module never imports tkinter
+                # (headless mode runs without it)
+                self.text_widget.config(state='normal')
+                self.text_widget.insert('end', "\n".join(lines) + "\n")
+                # Trim from the top so the widget never holds more than MAX_LINES
+                total = int(self.text_widget.index('end-1c').split('.')[0])
+                excess = total - self.MAX_LINES
+                if excess > 0:
+                    self.text_widget.delete('1.0', f'{excess + 1}.0')
+                self.text_widget.config(state='disabled')
+                self.text_widget.see('end')
             except Exception:
-                print(message)
+                # If widget operations fail for any reason, fallback to stdout
+                for line in lines:
+                    print(line)
+        self._schedule()
 
 # global_state.py
 rsi_handle = None
@@ -46,6 +107,10 @@ tk_app = None
 main_tab_refs = {}
 # When True, `log()` will suppress writing messages (useful during bulk ops)
 suppress_logs = False
+# Minimum level shown in the GUI log console
+log_level = 'info'
+# Optional structured file sink (log_sink.JsonlLogSink); receives every message
+file_sink = None
 org_key = None
 custom_sound_interdiction = None  # absolute path to custom sound for Interdicted (Fake Hit)
 custom_sound_nearby = None        # absolute path to custom sound for Nearby (Actor Stall)
@@ -75,9 +140,17 @@ api_kills_ac = []          # subset classified as AC
 api_kills_all = []         # combined list in API-like schema (API + live)
 # General-purpose combined list of all kills, referenced by graphs tab
 all_kills = []
+# Monotonic counter bumped whenever the combined kills list is replaced, so
+# derived views (e.g., rendered graphs) can tell when their inputs changed
+kills_version = 0
  # Last failed uploads from backup parsing (list of parsed kill dicts)
 last_failed_uploads = []
 kill_processing_count = 0
+# Seconds a visible Piracy/Dogfighting leaderboard is kept before refresh_scheduler refreshes it
+leaderboard_max_age = 300
+# Seconds a signed key validation / release check is trusted at launch (validation_cache; 0 = always wait)
+key_validation_ttl = 24 * 3600
+update_check_ttl = 6 * 3600
 
 """Player proximity-related event tracking.
 
@@ -115,7 +188,32 @@ def get_rsi_handle():
 
 def set_logger(text_area):
     global logger
-    logger = EventLogger(text_area)
+    logger = EventLogger(text_area, min_level=log_level)
+
+def set_log_level(level):
+    """Minimum level shown in the log console ('debug'|'info'|'warning'|'error')."""
+    global log_level
+    if level not in LOG_LEVELS:
+        return
+    log_level = level
+    try:
+        if isinstance(logger, EventLogger):
+            logger.set_level(level)
+    except Exception:
+        pass
+
+def get_log_level():
+    return log_level
+
+def set_file_sink(sink):
+    """Install a sink with `write(message, level, suppressed)` that records every log message."""
+    global file_sink
+    file_sink = sink
+
+def set_log_sink(sink):
+    """Install any object with a `log(message)` method as the logger (e.g. headless JSON output)."""
+    global logger
+    logger = sink
 
 def get_logger():
     return logger
@@ -443,7 +541,7 @@ def set_api_kills_all(items):
         "game_mode": str, "timestamp": str
     }
     """
-    global api_kills_all, all_kills
+    global api_kills_all, all_kills, kills_version
     try:
         api_kills_all = list(items) if items is not None else []
         # Keep all_kills in sync so other modules (e.g., graphs) can reference it
@@ -457,6 +555,8 @@ def set_api_kills_all(items):
             all_kills = []
         except Exception:
             pass
+    # Bump after the lists are replaced so a reader never caches old data under the new version
+    kills_version += 1
 
 
 def get_api_kills_all():
@@ -467,13 +567,14 @@ def get_api_kills_all():
 # --- all_kills direct access (alias for api_kills_all) ---
 def set_all_kills(items):
     """Set general-purpose all_kills list and keep api_kills_all in sync."""
-    global all_kills, api_kills_all
+    global all_kills, api_kills_all, kills_version
     try:
         all_kills = list(items) if items is not None else []
         api_kills_all = list(all_kills)
     except Exception:
         all_kills = []
         api_kills_all = []
+    kills_version += 1
 
 
 def get_all_kills():
@@ -481,6 +582,11 @@ def get_all_kills():
     return all_kills
 
 
+def get_kills_version() -> int:
+    """Return the version counter of the combined kills list (bumped on every set)."""
+    return kills_version
+
+
 # --- failed uploads from backup parsing ---
 def set_last_failed_uploads(items):
     """Store the most recent list of failed upload records from backup parsing."""
@@ -528,6 +634,53 @@ def dec_kill_processing_count(delta: int = 1) -> int:
         return get_kill_processing_count()
 
 
+# --- leaderboard refresh age ---
+def set_leaderboard_max_age(seconds: float):
+    global leaderboard_max_age
+    try:
+        leaderboard_max_age = max(30.0, float(seconds))
+    except Exception:
+        pass
+
+
+def get_leaderboard_max_age() -> float:
+    try:
+        return float(leaderboard_max_age)
+    except Exception:
+        return 300.0
+
+
+# --- validation cache TTLs ---
+def set_key_validation_ttl(seconds: float):
+    global key_validation_ttl
+    try:
+        key_validation_ttl = max(0.0, float(seconds))
+    except Exception:
+        pass
+
+
+def get_key_validation_ttl() -> float:
+    try:
+        return float(key_validation_ttl)
+    except Exception:
+        return 24 * 3600.0
+
+
+def set_update_check_ttl(seconds: float):
+    global update_check_ttl
+    try:
+        update_check_ttl = max(0.0, float(seconds))
+    except Exception:
+        pass
+
+
+def get_update_check_ttl() -> float:
+    try:
+        return float(update_check_ttl)
+    except Exception:
+        return 6 * 3600.0
+
+
 # --- Player event helpers ---
 def add_actor_stall_event(event: dict):
     """Append an actor stall event and also register a unified proximity report."""
@@ -639,15 +792,23 @@ def get_proximity_reports():
         return []
 
 
-def log(message):
+def log(message, level=None):
     """Convenience function to write a message to the GUI logger if present.
 
     Usage: import global_variables as gv; gv.log("message")
 
     This is safe to call from any thread. If no GUI logger has been set,
-    the message is printed to stdout.
+    the message is printed to stdout. `level` ('debug'|'info'|'warning'|'error')
+    is inferred from the message when omitted.
     """
     try:
+        # The structured log file records everything, including suppressed messages
+        if file_sink is not None:
+            try:
+                file_sink.write(message, level or infer_level(message), suppressed=bool(suppress_logs))
+            except Exception:
+                pass
+
         # quick global suppression hook used by backup loader to avoid
         # spamming the UI while parsing many files
         try:
@@ -657,7 +818,10 @@ def log(message):
             pass
 
         if logger is not None:
-            logger.log(message)
+            if level is None:
+                logger.log(message)
+            else:
+                logger.log(message, level=level)
         else:
             print(message)
     except Exception:
@@ -682,7 +846,7 @@ def log_exceptions(func):
         except Exception:
             tb = traceback.format_exc()
             try:
-                log(f"Exception in {func.__module__}.{func.__name__}:\n{tb}")
+                log(f"Exception in {func.__module__}.{func.__name__}:\n{tb}", level='error')
             except Exception:
                 # As a last resort, print the traceback
                 print(f"Exception in {func.__module__}.{func.__name__}:\n{tb}")
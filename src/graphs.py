@@ -1,22 +1,21 @@
 import io
+import threading
 import tkinter as tk
+from collections import OrderedDict
 from datetime import datetime, timezone, timedelta
-from PIL import Image, ImageTk
 import global_variables
+import kill_db
+import metrics
 import parser
+from lazy_loader import lazy_import, is_available
 
-try:
-    import plotly.graph_objects as go
-    PLOTLY_AVAILABLE = True
-except Exception:
-    PLOTLY_AVAILABLE = False
-
-try:
-    # kaleido is used by plotly to export images
-    import kaleido  # noqa: F401
-    KALEIDO_AVAILABLE = True
-except Exception:
-    KALEIDO_AVAILABLE = False
+# Heavy dependencies are imported on first render rather than at module load
+Image = lazy_import('PIL.Image')
+ImageTk = lazy_import('PIL.ImageTk')
+go = lazy_import('plotly.graph_objects')
+PLOTLY_AVAILABLE = is_available('plotly')
+# kaleido is used by plotly to export images
+KALEIDO_AVAILABLE = is_available('kaleido')
 
 
 def _parse_ts(ts):
@@ -53,7 +52,17 @@ def _parse_ts(ts):
 
 def _gather_kill_datetimes():
     try:
-        # Prefer the global_variables source ("all_kills" if present, else API-like getter)
+        # The local history database holds every kill (kill_sync keeps only a
+        # recent window in memory), with an indexed timestamp column
+        try:
+            if kill_db.get_active_user() and kill_db.is_available():
+                epochs = kill_db.kill_epochs()
+                if epochs:
+                    return [datetime.fromtimestamp(e, tz=timezone.utc) for e in epochs]
+        except Exception:
+            pass
+
+        # Then the global_variables source ("all_kills" if present, else API-like getter)
         items = None
         try:
             items = getattr(global_variables, 'all_kills', None)
@@ -113,6 +122,71 @@ def _gather_kill_datetimes():
         return []
 
 
+# LRU cache of rendered PNG bytes keyed by
+# (kills_version, mode, range_mode, width, height, window_day). PNG bytes are
+# cached rather than PhotoImages so entries can be produced off the Tk thread.
+RENDER_CACHE_MAX = 24
+# How often the Tk thread checks whether a background pre-render finished
+PRERENDER_POLL_MS = 100
+_render_cache = OrderedDict()
+_render_cache_lock = threading.Lock()
+# Kaleido drives a single export process; serialize exports across threads
+_export_lock = threading.Lock()
+# Parsed kill datetimes for the last seen kills_version
+_dts_cache = {'version': None, 'dts': []}
+
+ALL_VIEWS = (
+    ('cumulative', 'all'),
+    ('yearly', '1m'),
+    ('yearly', '3m'),
+    ('yearly', '6m'),
+    ('yearly', 'all'),
+)
+
+
+def _window_day(mode):
+    """Day the past-year window ends on (UTC); None for views not tied to today."""
+    if mode == 'yearly':
+        return datetime.now(timezone.utc).date().isoformat()
+    return None
+
+
+def _render_cache_key(mode, range_mode, w, h, version=None):
+    # Cumulative ignores the range selector, so all ranges share one entry
+    rng = range_mode if mode == 'yearly' else 'all'
+    if version is None:
+        version = global_variables.get_kills_version()
+    return (version, mode, rng, int(w), int(h), _window_day(mode))
+
+
+def _render_cache_get(key):
+    with _render_cache_lock:
+        png = _render_cache.get(key)
+        if png is not None:
+            _render_cache.move_to_end(key)
+    metrics.cache_lookup('graphs.render', png is not None)
+    return png
+
+
+def _render_cache_put(key, png):
+    with _render_cache_lock:
+        _render_cache[key] = png
+        _render_cache.move_to_end(key)
+        while len(_render_cache) > RENDER_CACHE_MAX:
+            _render_cache.popitem(last=False)
+
+
+def _get_kill_datetimes():
+    """Return parsed kill datetimes, reusing the last parse while kills are unchanged."""
+    version = global_variables.get_kills_version()
+    if _dts_cache.get('version') == version and _dts_cache.get('dts'):
+        return _dts_cache['dts']
+    dts = _gather_kill_datetimes()
+    _dts_cache['version'] = version
+    _dts_cache['dts'] = dts
+    return dts
+
+
 def _aggregate_by_day(dts):
     counts = {}
     for dt in dts:
@@ -127,6 +201,123 @@ def _aggregate_by_day(dts):
     return xs, ys
 
 
+def _build_cumulative_figure(dts, bg):
+    """Build the cumulative kills figure, or return None when there is nothing to plot."""
+    if not dts:
+        return None
+
+    # Count per day
+    xs_days, day_counts = _aggregate_by_day(dts)
+    if not xs_days:
+        return None
+
+    # Fill missing days to make a smooth cumulative line
+    start = xs_days[0]
+    end = xs_days[-1]
+    day_to_count = {d: c for d, c in zip(xs_days, day_counts)}
+    days = []
+    counts = []
+    cur = start
+    while cur <= end:
+        days.append(cur)
+        counts.append(day_to_count.get(cur, 0))
+        cur = cur + timedelta(days=1)
+
+    cumulative = []
+    total = 0
+    for c in counts:
+        total += c
+        cumulative.append(total)
+
+    x_strs = [d.isoformat() for d in days]
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=x_strs, y=cumulative, mode='lines+markers', line=dict(color='#ff5555')))
+    fig.update_layout(
+        title='',
+        plot_bgcolor=bg,
+        paper_bgcolor=bg,
+        font=dict(color='white'),
+        margin=dict(l=40, r=10, t=20, b=40),
+    )
+    return fig
+
+
+def _build_past_year_figure(dts, range_mode, bg):
+    """Build the daily kills bar figure for the selected window of the past year."""
+    # Non-cumulative daily kills for the past 365 days (including today)
+    if not dts:
+        return None
+
+    today = datetime.now(timezone.utc).date()
+    start = today - timedelta(days=364)
+
+    # Determine selected window based on header buttons
+    if range_mode == '1m':
+        sel_start = today - timedelta(days=30)
+    elif range_mode == '3m':
+        sel_start = today - timedelta(days=90)
+    elif range_mode == '6m':
+        sel_start = today - timedelta(days=180)
+    else:
+        sel_start = start
+
+    # Count kills per day within selected range
+    counts = {}
+    for dt in dts:
+        try:
+            day = dt.date()
+            if sel_start <= day <= today:
+                counts[day] = counts.get(day, 0) + 1
+        except Exception:
+            continue
+
+    # Build complete series including zero-count days
+    days = []
+    ys = []
+    cur = sel_start
+    while cur <= today:
+        days.append(cur)
+        ys.append(counts.get(cur, 0))
+        cur = cur + timedelta(days=1)
+
+    if not days:
+        return None
+
+    x_strs = [d.isoformat() for d in days]
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=x_strs, y=ys, marker_color='#ff5555'))
+    fig.update_layout(
+        title='',
+        plot_bgcolor=bg,
+        paper_bgcolor=bg,
+        font=dict(color='white'),
+        margin=dict(l=40, r=10, t=20, b=40),
+        xaxis=dict(
+            rangeslider=dict(visible=False),
+            type="date"
+        )
+    )
+    return fig
+
+
+def _render_view_png(dts, mode, range_mode, w, h, bg):
+    """Render one graph view to PNG bytes (None when there is nothing to plot)."""
+    if mode == 'cumulative':
+        fig = _build_cumulative_figure(dts, bg)
+    else:
+        fig = _build_past_year_figure(dts, range_mode, bg)
+    if fig is None:
+        return None
+    with _export_lock:
+        try:
+            return fig.to_image(format='png', engine='kaleido', width=w, height=h)
+        except Exception:
+            # Fallback once if engine argument causes issues
+            return fig.to_image(format='png', width=w, height=h)
+
+
 class GraphWidget:
     """Small widget that renders a Plotly chart to an image and embeds it in Tkinter.
 
@@ -220,6 +411,10 @@ class GraphWidget:
         self._resize_after_id = None
         self._last_w = None
         self._last_h = None
+        self._shown_key = None
+        # Background pre-render state (other modes/ranges at the current size)
+        self._prerender_running = False
+        self._prerender_pending = None
         self.frame.bind("<Configure>", self._on_resize)
 
         # initial render after layout stabilizes and we have meaningful size
@@ -247,11 +442,14 @@ class GraphWidget:
                 return
             except Exception:
                 pass
-        # Skip if size hasn't changed enough and not forced
+        # Skip if size hasn't changed enough, the data is unchanged, and not forced
         if not force and self._last_w is not None and self._last_h is not None:
             if abs(self.width - self._last_w) < 4 and abs(self.height - self._last_h) < 4:
-                # Nothing significant changed; keep current image
-                return
+                shown = self._shown_key
+                if (shown is not None and shown[0] == global_variables.get_kills_version()
+                        and shown[5] == _window_day(shown[1])):
+                    # Nothing significant changed; keep current image
+                    return
         if not PLOTLY_AVAILABLE:
             global_variables.log("Plotly not installed. Install plotly and kaleido to enable graphs.")
             self._show_text("Plotly not installed")
@@ -261,16 +459,13 @@ class GraphWidget:
             self._show_text("Kaleido not installed")
             return
 
-        dts = _gather_kill_datetimes()
+        dts = _get_kill_datetimes()
         if not dts:
             self._show_text("No kills available to plot")
             return
 
         try:
-            if self.mode == 'cumulative':
-                self._render_cumulative(dts)
-            else:
-                self._render_past_year(dts)
+            self._render_view(dts)
         except Exception as e:
             global_variables.log(f"Failed to render plotly image: {e}")
             self._show_text("Failed to render graph")
@@ -307,126 +502,94 @@ class GraphWidget:
     def _mode_label_text(self):
         return "Mode: Cumulative" if self.mode == 'cumulative' else "Mode: Past Year"
 
-    def _render_cumulative(self, dts):
-        # Build cumulative count per day across all time
-        if not dts:
-            self._show_text("No kills available to plot")
-            return
-
-        # Count per day
-        xs_days, day_counts = _aggregate_by_day(dts)
-        if not xs_days:
-            self._show_text("No kills available to plot")
-            return
-
-        # Fill missing days to make a smooth cumulative line
-        start = xs_days[0]
-        end = xs_days[-1]
-        day_to_count = {d: c for d, c in zip(xs_days, day_counts)}
-        days = []
-        counts = []
-        cur = start
-        while cur <= end:
-            days.append(cur)
-            counts.append(day_to_count.get(cur, 0))
-            cur = cur + timedelta(days=1)
-
-        cumulative = []
-        total = 0
-        for c in counts:
-            total += c
-            cumulative.append(total)
-
-        x_strs = [d.isoformat() for d in days]
-
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=x_strs, y=cumulative, mode='lines+markers', line=dict(color='#ff5555')))
-        fig.update_layout(
-            title='',
-            plot_bgcolor=self.bg,
-            paper_bgcolor=self.bg,
-            font=dict(color='white'),
-            margin=dict(l=40, r=10, t=20, b=40),
-        )
+    def _render_view(self, dts):
+        # Serve the current view from the render cache when possible
+        w, h = self._target_size()
+        key = _render_cache_key(self.mode, self.range_mode, w, h)
+        png = _render_cache_get(key)
+        if png is None:
+            png = _render_view_png(dts, self.mode, self.range_mode, w, h, self.bg)
+            if png is None:
+                if self.mode == 'cumulative':
+                    self._show_text("No kills available to plot")
+                else:
+                    self._show_text("No kills in the past year")
+                return
+            _render_cache_put(key, png)
+        self._show_png(png, key)
+        self._schedule_prerender(w, h)
 
-        self._render_to_image(fig)
+    def _target_size(self):
+        # Guard against invalid sizes
+        w = max(200, int(self.width)) if self.width else 600
+        h = max(150, int(self.height)) if self.height else 320
+        return w, h
 
-    def _render_past_year(self, dts):
-        # Non-cumulative daily kills for the past 365 days (including today)
-        if not dts:
-            self._show_text("No kills available to plot")
+    def _show_png(self, img_bytes, key):
+        # show PNG bytes in the label
+        pil_im = Image.open(io.BytesIO(img_bytes))
+        self._photo = ImageTk.PhotoImage(pil_im)
+        self.image_label.config(image=self._photo, text='')
+        # Track last rendered size and view
+        self._last_w = key[3]
+        self._last_h = key[4]
+        self._shown_key = key
+
+    def _schedule_prerender(self, w, h):
+        """Render the other mode/range views in the background so switching is instant."""
+        if self._prerender_running:
+            self._prerender_pending = (w, h)
             return
-
-        today = datetime.now(timezone.utc).date()
-        start = today - timedelta(days=364)
-
-        # Determine selected window based on header buttons
-        if self.range_mode == '1m':
-            sel_start = today - timedelta(days=30)
-        elif self.range_mode == '3m':
-            sel_start = today - timedelta(days=90)
-        elif self.range_mode == '6m':
-            sel_start = today - timedelta(days=180)
-        else:
-            sel_start = start
-
-        # Count kills per day within selected range
-        counts = {}
-        for dt in dts:
-            try:
-                day = dt.date()
-                if sel_start <= day <= today:
-                    counts[day] = counts.get(day, 0) + 1
-            except Exception:
-                continue
-
-        # Build complete series including zero-count days
-        days = []
-        ys = []
-        cur = sel_start
-        while cur <= today:
-            days.append(cur)
-            ys.append(counts.get(cur, 0))
-            cur = cur + timedelta(days=1)
-
-        if not days:
-            self._show_text("No kills in the past year")
+        views = [v for v in ALL_VIEWS if _render_cache_get(_render_cache_key(v[0], v[1], w, h)) is None]
+        if not views:
             return
+        # Most likely next view first: the other mode at the current range
+        views.sort(key=lambda v: (v[0] == self.mode, v[1] != self.range_mode))
+        self._prerender_running = True
+        # Tk is not thread-safe: the worker only sets this, the Tk thread polls it
+        done = threading.Event()
 
-        x_strs = [d.isoformat() for d in days]
-
-        fig = go.Figure()
-        fig.add_trace(go.Bar(x=x_strs, y=ys, marker_color='#ff5555'))
-        fig.update_layout(
-            title='',
-            plot_bgcolor=self.bg,
-            paper_bgcolor=self.bg,
-            font=dict(color='white'),
-            margin=dict(l=40, r=10, t=20, b=40),
-            xaxis=dict(
-                rangeslider=dict(visible=False),
-                type="date"
-            )
-        )
+        def _worker():
+            try:
+                version = global_variables.get_kills_version()
+                dts = _get_kill_datetimes()
+                for mode, rng in views:
+                    key = _render_cache_key(mode, rng, w, h, version)
+                    if _render_cache_get(key) is not None:
+                        continue
+                    try:
+                        png = _render_view_png(dts, mode, rng, w, h, self.bg)
+                    except Exception as e:
+                        global_variables.log(f"Graph pre-render failed: {e}")
+                        break
+                    if png is not None:
+                        _render_cache_put(key, png)
+            finally:
+                done.set()
 
-        self._render_to_image(fig)
+        try:
+            threading.Thread(target=_worker, daemon=True).start()
+        except Exception:
+            self._prerender_running = False
+            return
+        self._poll_prerender(done)
 
-    def _render_to_image(self, fig):
-        # export to PNG bytes and show in the label
-        # Guard against invalid sizes
-        w = max(200, int(self.width)) if self.width else 600
-        h = max(150, int(self.height)) if self.height else 320
+    def _poll_prerender(self, done):
+        if done.is_set():
+            self._on_prerender_done()
+            return
         try:
-            img_bytes = fig.to_image(format='png', engine='kaleido', width=w, height=h)
+            self.frame.after(PRERENDER_POLL_MS, lambda: self._poll_prerender(done))
         except Exception:
-            # Fallback once if engine argument causes issues
-            img_bytes = fig.to_image(format='png', width=w, height=h)
-        pil_im = Image.open(io.BytesIO(img_bytes))
-        self._photo = ImageTk.PhotoImage(pil_im)
-        self.image_label.config(image=self._photo, text='')
-        # Track last rendered size
-        self._last_w = w
-        self._last_h = h
+            # Widget destroyed; nothing left to pre-render for
+            self._prerender_running = False
+
+    def _on_prerender_done(self):
+        self._prerender_running = False
+        pending = self._prerender_pending
+        self._prerender_pending = None
+        if pending is not None:
+            self._schedule_prerender(*pending)
 
     # --- responsive sizing helpers ---
     def _on_resize(self, event):
@@ -0,0 +1,171 @@
+"""Headless daemon mode: tail Game.log and publish kills without Tkinter.
+
+Runs the same parser, kill worker and uploader as the GUI, but never imports
+tkinter, PIL or plotly. Log messages are written to stdout as JSON lines
+(`{"ts", "level", "thread", "msg"}`) so they can be collected by a service
+manager or parsed in CI.
+
+Usage:
+    python -m beowulfhunter --headless [--log-file PATH] [--handle NAME] [--replay] [--plain]
+
+Keys are read from killtracker_key.cfg in the working directory, as in the GUI.
+Set BEOWULFHUNTER_PROFILE=<seconds> to capture a CPU/memory profile (see profiling.py).
+"""
+import argparse
+import json
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+
+import global_variables
+
+EXIT_OK = 0
+EXIT_CONFIG = 2
+
+# Seconds between attempts to locate the game log / RSI handle
+DISCOVERY_RETRY_SECONDS = 5.0
+
+
+class JsonLogger:
+    """Logger sink writing one JSON object per message; drop-in for EventLogger."""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self._lock = threading.Lock()
+
+    def log(self, message, **fields):
+        text = str(message)
+        record = {
+            'ts': datetime.now(timezone.utc).isoformat(timespec='milliseconds'),
+            'level': fields.pop('level', None) or global_variables.infer_level(text),
+            'thread': threading.current_thread().name,
+            'msg': text,
+        }
+        record.update(fields)
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self._lock:
+            try:
+                self.stream.write(line + "\n")
+                self.stream.flush()
+            except Exception:
+                pass
+
+
+class PlainLogger:
+    """Logger sink printing timestamped plain text lines."""
+
+    def log(self, message, level=None):
+        print(f"{datetime.now().strftime('%H:%M:%S')} {message}", flush=True)
+
+
+def _discover_log_file(explicit_path=None):
+    """Return the Game.log path, waiting for the game to start if needed."""
+    if explicit_path:
+        return explicit_path
+    from config import set_sc_log_location
+    while True:
+        path = set_sc_log_location()
+        if path:
+            return path
+        global_variables.log("Waiting for Star Citizen to start...")
+        time.sleep(DISCOVERY_RETRY_SECONDS)
+
+
+def _discover_handle(log_file, explicit_handle=None):
+    """Return the RSI handle from the log, waiting for the login line if needed."""
+    if explicit_handle:
+        return explicit_handle
+    from config import find_rsi_handle
+    while True:
+        try:
+            handle = find_rsi_handle(log_file)
+        except Exception:
+            handle = None
+        if handle:
+            return handle
+        global_variables.log("RSI handle not found in Game.log yet; retry after login.")
+        time.sleep(DISCOVERY_RETRY_SECONDS)
+
+
+def _validate_keys(handle) -> bool:
+    import keys
+    player_key = keys.load_existing_key()
+    org_key = keys.get_org_key_value()
+    if not player_key or not org_key:
+        global_variables.log("Keys missing in killtracker_key.cfg; activate them once in the GUI.")
+        return False
+    if not keys.validate_org_key(org_key):
+        global_variables.log("ORG key did not validate.")
+        return False
+    if not keys.validate_api_key(player_key, handle):
+        global_variables.log("Player key is invalid for this RSI handle.")
+        return False
+    global_variables.log("Key is Valid")
+    return True
+
+
+def _prime_kill_store():
+    """Load local history and sync the duplicate-detection set before uploading."""
+    import kill_sync
+    try:
+        kill_sync.seed_from_db(global_variables.get_user_id())
+    except Exception:
+        pass
+    if not kill_sync.sync(global_variables.get_user_id(), delta=True):
+        global_variables.log("Kill sync failed; duplicate detection uses local history only.")
+
+
+def run(args) -> int:
+    log_file = _discover_log_file(args.log_file)
+    global_variables.set_log_file_location(log_file)
+    handle = _discover_handle(log_file, args.handle)
+    global_variables.set_rsi_handle(handle)
+
+    if not _validate_keys(handle):
+        return EXIT_CONFIG
+    _prime_kill_store()
+    import profiling
+    profiling.start_from_config()
+
+    import parser
+    # Deliver kills queued while the API was unreachable, including those from earlier runs
+    import submission_queue
+    submission_queue.start()
+    if args.replay:
+        # Treat every line already in the log as live, then wait for uploads to finish
+        started = time.perf_counter()
+        parser.read_existing_log(log_file, handle)
+        parser.kill_processing_queue.join()
+        global_variables.log(f"Replay finished in {time.perf_counter() - started:.2f}s")
+        return EXIT_OK
+
+    if not args.log_file:
+        # Follow game restarts the same way the GUI does
+        from crash_detection import game_heartbeat
+        game_heartbeat(1, True)
+    parser.tail_log(log_file, handle)
+    return EXIT_OK
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog="beowulfhunter", description="BeowulfHunter headless kill tracker")
+    ap.add_argument("--headless", action="store_true", help="run without the GUI (required for this entry point)")
+    ap.add_argument("--log-file", default=None, help="Game.log to follow (default: discover from the running game)")
+    ap.add_argument("--handle", default=None, help="RSI handle (default: read from Game.log)")
+    ap.add_argument("--replay", action="store_true", help="process the existing log as live events, then exit")
+    ap.add_argument("--plain", action="store_true", help="plain text log output instead of JSON lines")
+    args = ap.parse_args(argv)
+
+    global_variables.set_log_sink(PlainLogger() if args.plain else JsonLogger())
+    import log_sink
+    log_sink.install()
+    try:
+        return run(args)
+    except KeyboardInterrupt:
+        global_variables.log("Interrupted; shutting down.")
+        return EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
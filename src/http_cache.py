@@ -0,0 +1,243 @@
+"""Persistent JSON cache for API GETs with stale-while-revalidate.
+
+Entries are kept in memory and under <data dir>/http_cache/ (one JSON file
+per key), so the last-known data is available immediately after a restart:
+
+    {"key", "url", "stored_at", "etag", "last_modified", "value"}
+
+`get_json(key, url, ttl)` returns:
+    fresh    age < ttl                  the stored value, no request
+    stale    ttl <= age < max_stale     the stored value at once, while one
+                                        background thread revalidates it
+    missing  or older than max_stale    a blocking fetch; concurrent callers for
+                                        the same key wait for the first one
+
+Revalidation is conditional (If-None-Match / If-Modified-Since from the stored
+ETag / Last-Modified); a 304 only renews the entry's age. When a background
+revalidation stores new data, event_bus.TOPIC_API_DATA is published with the
+cache name so views can redraw from the fresh entry. A failed blocking fetch
+falls back to any stored value, however old (stale-if-error), and raises only
+when there is nothing stored. A failed background revalidation is retried
+after REVALIDATE_BACKOFF seconds rather than on every read.
+
+Metrics: cache.hits / cache.misses{cache} (stale reads count as hits),
+http_cache.stale{cache} and http_cache.revalidations{cache, result}.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import global_variables
+import metrics
+import net
+
+CACHE_SUBDIR = 'http_cache'
+# Stale entries older than this are refetched before returning
+DEFAULT_MAX_STALE = 7 * 24 * 3600
+# Seconds before a failed background revalidation is retried
+REVALIDATE_BACKOFF = 30
+
+
+class Entry:
+    __slots__ = ('key', 'url', 'stored_at', 'etag', 'last_modified', 'value', 'retry_at')
+
+    def __init__(self, key: str, url: str, value: Any, stored_at: float,
+                 etag: Optional[str] = None, last_modified: Optional[str] = None):
+        self.key = key
+        self.url = url
+        self.value = value
+        self.stored_at = stored_at
+        self.etag = etag
+        self.last_modified = last_modified
+        self.retry_at = 0.0
+
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+    def to_json(self) -> Dict[str, Any]:
+        return {'key': self.key, 'url': self.url, 'stored_at': self.stored_at, 'etag': self.etag,
+                'last_modified': self.last_modified, 'value': self.value}
+
+
+_lock = threading.Lock()
+_entries: Dict[str, Entry] = {}
+# Keys whose file has been looked for (present or not)
+_loaded: set = set()
+_key_locks: Dict[str, threading.Lock] = {}
+_revalidating: set = set()
+
+
+def _cache_dir() -> str:
+    from config import get_data_dir
+    path = os.path.join(get_data_dir(), CACHE_SUBDIR)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _path(key: str) -> str:
+    return os.path.join(_cache_dir(), hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json')
+
+
+def _load(key: str) -> Optional[Entry]:
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None or key in _loaded:
+            return entry
+    entry = None
+    try:
+        with open(_path(key), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('key') == key:
+            entry = Entry(key, data.get('url') or '', data.get('value'), float(data.get('stored_at') or 0),
+                          data.get('etag'), data.get('last_modified'))
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        global_variables.log(f"Ignoring unreadable cache entry for {key}: {e}")
+    with _lock:
+        _loaded.add(key)
+        if entry is not None and key not in _entries:
+            _entries[key] = entry
+        return _entries.get(key)
+
+
+def _store(entry: Entry):
+    with _lock:
+        _entries[entry.key] = entry
+        _loaded.add(entry.key)
+    try:
+        path = _path(entry.key)
+        tmp = path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(entry.to_json(), f)
+        os.replace(tmp, path)
+    except Exception as e:
+        global_variables.log(f"Could not persist cache entry for {entry.key}: {e}")
+
+
+def _key_lock(key: str) -> threading.Lock:
+    with _lock:
+        lock = _key_locks.get(key)
+        if lock is None:
+            lock = _key_locks[key] = threading.Lock()
+        return lock
+
+
+def _fetch(key: str, url: str, previous: Optional[Entry], endpoint: Optional[str],
+           headers: Optional[Dict[str, str]], timeout: float, transform: Optional[Callable[[Any], Any]],
+           priority: Optional[str] = None):
+    """GET `url` (conditionally when `previous` has validators); returns (entry, changed)."""
+    request_headers = dict(headers or {})
+    if previous is not None:
+        if previous.etag:
+            request_headers['If-None-Match'] = previous.etag
+        if previous.last_modified:
+            request_headers['If-Modified-Since'] = previous.last_modified
+    resp = net.get(url, endpoint=endpoint, priority=priority, headers=request_headers, timeout=timeout)
+    if resp.status_code == 304 and previous is not None:
+        renewed = Entry(key, url, previous.value, time.time(), previous.etag, previous.last_modified)
+        _store(renewed)
+        return renewed, False
+    resp.raise_for_status()
+    data = resp.json()
+    value = transform(data) if transform is not None else data
+    entry = Entry(key, url, value, time.time(), resp.headers.get('ETag'), resp.headers.get('Last-Modified'))
+    _store(entry)
+    return entry, True
+
+
+def _revalidate_async(name: str, key: str, url: str, entry: Entry, endpoint, headers, timeout, transform, priority):
+    with _lock:
+        if key in _revalidating or time.time() < entry.retry_at:
+            return
+        _revalidating.add(key)
+
+    def _run():
+        try:
+            with _key_lock(key):
+                current = _load(key) or entry
+                _, changed = _fetch(key, url, current, endpoint, headers, timeout, transform, priority)
+            metrics.counter('http_cache.revalidations', cache=name,
+                            result='updated' if changed else 'not_modified').inc()
+            if changed:
+                import event_bus
+                event_bus.publish(event_bus.TOPIC_API_DATA, cache=name)
+        except Exception as e:
+            entry.retry_at = time.time() + REVALIDATE_BACKOFF
+            metrics.counter('http_cache.revalidations', cache=name, result='failed').inc()
+            global_variables.log(f"Background refresh of {name} failed: {e}")
+        finally:
+            with _lock:
+                _revalidating.discard(key)
+
+    threading.Thread(target=_run, name=f"revalidate-{name}", daemon=True).start()
+
+
+def get_json(key: str, url: str, ttl: float, name: Optional[str] = None, max_stale: float = DEFAULT_MAX_STALE,
+             endpoint: Optional[str] = None, headers: Optional[Dict[str, str]] = None, timeout: float = 10.0,
+             transform: Optional[Callable[[Any], Any]] = None, priority: Optional[str] = None) -> Any:
+    """Cached JSON for `url` stored under `key` (see the module docstring for the read rules).
+
+    `name` labels the cache in metrics and TOPIC_API_DATA events (defaults to
+    `key`); `endpoint` is the net metrics label. `transform(data)` is applied to
+    the decoded response before it is stored and must return JSON-serializable
+    data. `priority` is the net request class. Raises the fetch error when
+    nothing is stored for `key`.
+    """
+    name = name or key
+    entry = _load(key)
+    if entry is not None and entry.age() < max_stale:
+        metrics.cache_lookup(name, True)
+        if entry.age() >= ttl:
+            metrics.counter('http_cache.stale', cache=name).inc()
+            _revalidate_async(name, key, url, entry, endpoint, headers, timeout, transform, priority)
+        return entry.value
+    metrics.cache_lookup(name, False)
+    with _key_lock(key):
+        # Another caller may have fetched it while this one waited
+        current = _load(key)
+        if current is not None and current.age() < ttl:
+            return current.value
+        try:
+            fresh, _ = _fetch(key, url, current, endpoint, headers, timeout, transform, priority)
+        except Exception:
+            if current is not None:
+                metrics.counter('http_cache.stale', cache=name).inc()
+                return current.value
+            raise
+        return fresh.value
+
+
+def peek(key: str) -> Optional[Any]:
+    """The stored value for `key` regardless of age, without any request."""
+    entry = _load(key)
+    return entry.value if entry is not None else None
+
+
+def invalidate(key: str):
+    """Make the next read of `key` fetch again; the stored value is kept for stale-if-error."""
+    entry = _load(key)
+    if entry is not None:
+        entry.stored_at = 0.0
+
+
+def clear(persisted: bool = True):
+    """Drop every entry from memory and, with `persisted`, from disk."""
+    with _lock:
+        _entries.clear()
+        _loaded.clear()
+    if not persisted:
+        return
+    try:
+        directory = _cache_dir()
+        for fname in os.listdir(directory):
+            if fname.endswith('.json'):
+                try:
+                    os.remove(os.path.join(directory, fname))
+                except OSError:
+                    pass
+    except Exception as e:
+        global_variables.log(f"Could not clear the HTTP cache: {e}")
@@ -1,14 +1,23 @@
 import requests
 from datetime import datetime, timedelta, timezone
+import threading
 import time
 from packaging import version as pkg_version
 from typing import List, Dict, Any, Optional, Iterable
 from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import endpoints
+import http_cache
+import metrics
+import net
+import submission_queue
+from commodity_catalog import CommodityCatalog
+from user_directory import UserDirectory
+
 USER_AGENT = "BeowulfHunter/1.0"
 
-BASE_URL = "https://www.ironpoint.org/api/api"
+BASE_URL = endpoints.IRONPOINT_API
 
 # Only keep users whose `rank` contains one of these IDs
 # (Provided by user requirements)
@@ -19,22 +28,149 @@ ALLOWED_RANK_IDS = {
     "1034596054529736745",
 }
 
-# In-memory caches for user data
-_FILTERED_USER_ID_TO_NAME: Dict[str, str] = {}
-_ALL_USERS_FETCHED: bool = False
-_SUMMARY_CACHE: Dict[tuple, tuple] = {}
-_LATEST_HITS_CACHE: Dict[str, tuple] = {}
-_RECENT_FLEETS_CACHE: Dict[str, tuple] = {}
-_ALL_USERS_OPTIONS_CACHE: Dict[str, tuple] = {}
-_COMMODITY_NAMES_CACHE: Dict[str, tuple] = {}
-_COMMODITIES_FULL_CACHE: Dict[str, tuple] = {}
+
+# Seconds each endpoint's data is fresh. Older data is still returned at once
+# while it is refreshed in the background (http_cache), and survives restarts.
+GAME_VERSIONS_TTL = 300
+USERS_TTL = 300
+SUMMARY_TTL = 30
+LATEST_HITS_TTL = 20
+RECENT_FLEETS_TTL = 30
+COMMODITIES_TTL = 600
+# Seconds before a failed /users/ or commodities fetch (with nothing cached) is retried
+INDEX_RETRY_BACKOFF = 30
+
+
+class _CachedIndex:
+    """An index (user directory, commodity catalog) over a cached row list.
+
+    `fetch(timeout)` returns the rows from http_cache, which hands back the
+    same list object until the entry is refreshed; the index is rebuilt with
+    `build(rows)` only when that object changes. While nothing has loaded and
+    the last fetch failed, the empty index is returned without a request for
+    INDEX_RETRY_BACKOFF seconds so the UI does not block on every lookup.
+    """
+
+    def __init__(self, build, fetch):
+        self._build = build
+        self._fetch = fetch
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.index = self._build(None)
+        self.rows = None
+        self.retry_at = 0.0
+
+    def get(self, timeout: float):
+        if self.rows is None and time.time() < self.retry_at:
+            return self.index
+        try:
+            rows = self._fetch(timeout)
+        except Exception:
+            self.retry_at = time.time() + INDEX_RETRY_BACKOFF
+            return self.index
+        with self._lock:
+            if rows is not self.rows:
+                self.index = self._build(rows)
+                self.rows = rows
+            return self.index
+
+
+class _Flight:
+    """One in-flight call; concurrent callers with the same key wait on it."""
+    __slots__ = ('done', 'value', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+_IN_FLIGHT: Dict[tuple, _Flight] = {}
+_IN_FLIGHT_LOCK = threading.Lock()
+
+
+def _single_flight(key: tuple, fn):
+    """Run `fn()` once for concurrent callers with the same `key`.
+
+    The first caller runs it; callers arriving while it runs wait and receive
+    the same result (or the same exception). `key[0]` is the metrics label, so
+    keep it a short endpoint name. Nothing is cached once the call finishes.
+    """
+    with _IN_FLIGHT_LOCK:
+        flight = _IN_FLIGHT.get(key)
+        leader = flight is None
+        if leader:
+            flight = _IN_FLIGHT[key] = _Flight()
+    if not leader:
+        metrics.counter('ironpoint.coalesced', call=key[0]).inc()
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.value
+    try:
+        flight.value = fn()
+        return flight.value
+    except BaseException as e:
+        flight.error = e
+        raise
+    finally:
+        with _IN_FLIGHT_LOCK:
+            _IN_FLIGHT.pop(key, None)
+        flight.done.set()
+
+
+def _endpoint(url: str) -> str:
+    """Metrics label for an API URL: 'ironpoint.' plus the first path segment."""
+    path = url[len(BASE_URL):] if url.startswith(BASE_URL) else url
+    first = path.split('?', 1)[0].strip('/').split('/', 1)[0]
+    return f"ironpoint.{first or 'root'}"
 
 
 def _get_json(url: str, timeout: float = 8.0) -> Any:
-    headers = {"User-Agent": USER_AGENT}
-    resp = requests.get(url, headers=headers, timeout=timeout)
-    resp.raise_for_status()
-    return resp.json()
+    """GET and decode JSON; concurrent requests for the same URL share one download."""
+    label = _endpoint(url)
+
+    def _fetch():
+        headers = {"User-Agent": USER_AGENT}
+        resp = net.get(url, endpoint=label, priority='leaderboards', headers=headers, timeout=timeout)
+        resp.raise_for_status()
+        return resp.json()
+
+    return _single_flight((label, url), _fetch)
+
+
+def _cached_json(name: str, url: str, ttl: float, timeout: float, key: Optional[str] = None, transform=None) -> Any:
+    """GET through the persistent stale-while-revalidate cache (see http_cache).
+
+    `name` labels the cache in metrics and refresh events; `key` defaults to
+    the URL, which includes BASE_URL so live and stand-in data never mix.
+    Raises when the request fails and nothing is stored yet.
+    """
+    return http_cache.get_json(key or url, url, ttl, name=name, endpoint=_endpoint(url), priority='leaderboards',
+                               headers={"User-Agent": USER_AGENT}, timeout=timeout, transform=transform)
+
+
+def _list_or_empty(data: Any) -> List[Any]:
+    return data if isinstance(data, list) else []
+
+
+def _get_game_versions(timeout: float = 8.0) -> List[Dict[str, Any]]:
+    """The /gameversion/ list, shared by the latest-patch and patch-id lookups."""
+    return _cached_json('ironpoint.gameversion', f"{BASE_URL}/gameversion/", GAME_VERSIONS_TTL, timeout,
+                        transform=_list_or_empty)
+
+
+def _fetch_user_rows(timeout: float = 20.0) -> List[List[Any]]:
+    """Compact /users/ rows for the user directory: [id, display_name, is_member].
+
+    Only the rows are stored (not the full user objects), so the cache entry
+    stays small and the list is parsed once per download.
+    """
+    url = f"{BASE_URL}/users/"
+    return _cached_json('ironpoint.users', url, USERS_TTL, timeout, key=f"{url}#directory-v2",
+                        transform=_compact_users)
 
 
 def _post_json(url: str, payload: Dict[str, Any], timeout: float = 10.0) -> requests.Response:
@@ -43,7 +179,7 @@ def _post_json(url: str, payload: Dict[str, Any], timeout: float = 10.0) -> requ
     Raises requests.RequestException on errors so callers can handle/log.
     """
     headers = {"User-Agent": USER_AGENT, "Content-Type": "application/json"}
-    return requests.post(url, json=payload, headers=headers, timeout=timeout)
+    return net.post(url, endpoint=_endpoint(url), priority='publish', json=payload, headers=headers, timeout=timeout)
 
 
 def _extract_display_name_from_user_obj(user: Dict[str, Any]) -> str:
@@ -110,43 +246,43 @@ def _rank_ids_from_user_obj(user: Dict[str, Any]) -> List[str]:
     return ids
 
 
-def _ensure_filtered_users_loaded(timeout: float = 20.0) -> None:
-    """Fetch and cache the filtered users list once.
+def _compact_users(data: Any) -> List[List[Any]]:
+    rows: List[List[Any]] = []
+    for user in _list_or_empty(data):
+        try:
+            uid = str((user or {}).get("id") or "").strip()
+            if not uid:
+                continue
+            is_member = any(rid in ALLOWED_RANK_IDS for rid in _rank_ids_from_user_obj(user))
+            name = _extract_display_name_from_user_obj(user)
+            # Nameless users are listed by id, so autocomplete never offers "Unknown"
+            if not name or name == "Unknown":
+                name = uid
+            rows.append([uid, name, 1 if is_member else 0])
+        except Exception:
+            # Skip problematic user entries but continue processing
+            continue
+    return rows
+
+
+_USER_DIRECTORY = _CachedIndex(UserDirectory, lambda timeout: _fetch_user_rows(timeout=timeout))
+
 
-    We hit the users endpoint once, filter by ALLOWED_RANK_IDS, and build
-    a mapping of id -> preferred display name (nickname preferred).
+def get_user_directory(timeout: float = 20.0) -> UserDirectory:
+    """The user directory (see user_directory), loading /users/ on first use.
+
+    Served from the persistent cache; a background refresh of the cached rows
+    is picked up on the next call. Empty when nothing is cached and the fetch
+    fails.
     """
-    global _ALL_USERS_FETCHED, _FILTERED_USER_ID_TO_NAME
-    if _ALL_USERS_FETCHED and _FILTERED_USER_ID_TO_NAME:
-        return
-    try:
-        url = f"{BASE_URL}/users/"
-        data = _get_json(url, timeout=timeout)
-        if not isinstance(data, list):
-            _ALL_USERS_FETCHED = True
-            return
-        for user in data:
-            try:
-                uid = str(user.get("id") or "").strip()
-                if not uid:
-                    continue
-                rank_ids = set(_rank_ids_from_user_obj(user))
-                if not rank_ids:
-                    continue
-                if not any(rid in ALLOWED_RANK_IDS for rid in rank_ids):
-                    # Not in the desired rank set; skip
-                    continue
-                _FILTERED_USER_ID_TO_NAME[uid] = _extract_display_name_from_user_obj(user)
-            except Exception:
-                # Skip problematic user entries but continue processing
-                continue
-        _ALL_USERS_FETCHED = True
-    except Exception:
-        # If fetching fails, mark as fetched to avoid tight retry loops in UI
-        _ALL_USERS_FETCHED = True
+    return _USER_DIRECTORY.get(timeout)
+
+
+def _ensure_filtered_users_loaded(timeout: float = 20.0) -> Dict[str, str]:
+    """id -> display name for users holding one of ALLOWED_RANK_IDS."""
+    return get_user_directory(timeout=timeout).member_names
 
 
-@lru_cache(maxsize=128)
 def _get_patch_id_for_version(version_str: str, timeout: float = 8.0) -> Optional[str]:
     """Return the id for a given patch version string using the gameversion API.
 
@@ -155,10 +291,7 @@ def _get_patch_id_for_version(version_str: str, timeout: float = 8.0) -> Optiona
     if not version_str:
         return None
     try:
-        url = f"{BASE_URL}/gameversion/"
-        data = _get_json(url, timeout=timeout)
-        if not isinstance(data, list):
-            return None
+        data = _get_game_versions(timeout=timeout)
         for item in data:
             try:
                 if str(item.get("version", "")).strip() == str(version_str).strip():
@@ -192,10 +325,7 @@ def get_latest_patch_version(timeout: float = 8.0) -> Optional[str]:
 
     Example returns: "4.1", "4.2", etc. We compare using packaging.version.
     """
-    url = f"{BASE_URL}/gameversion/"
-    data = _get_json(url, timeout=timeout)
-    if not isinstance(data, list):
-        return None
+    data = _get_game_versions(timeout=timeout)
 
     best: Optional[str] = None
     best_v = None
@@ -213,6 +343,20 @@ def get_latest_patch_version(timeout: float = 8.0) -> Optional[str]:
     return best
 
 
+def _get_summary_rows(patch: str, timeout: float = 12.0) -> List[Dict[str, Any]]:
+    """Raw rows of the combined Beowulf Hunter summary for a patch.
+
+    Shared by the piracy and blackbox summaries and cached for SUMMARY_TTL.
+    The URL's end bound changes every millisecond, so the cache key (and the
+    coalescing of concurrent callers) uses only the patch and start.
+    """
+    pid = _get_patch_id_for_version(patch, timeout=timeout)
+    start_param = str(pid) if pid is not None else "0"
+    base = f"{BASE_URL}/beowulfhuntersummarybypatch/patch/{patch}?start={start_param}"
+    url = f"{base}&end={_tomorrow_utc_ms()}"
+    return _cached_json('ironpoint.summary', url, SUMMARY_TTL, timeout, key=base, transform=_list_or_empty)
+
+
 def get_piracy_summary(patch: str, timeout: float = 12.0) -> List[Dict[str, Any]]:
     """Fetch piracy-like summary for a patch using the Beowulf Hunter endpoint.
 
@@ -223,23 +367,7 @@ def get_piracy_summary(patch: str, timeout: float = 12.0) -> List[Dict[str, Any]
     if not patch:
         return []
     # Use shared combined summary cache to avoid duplicate HTTP calls
-    def _get_shared_data() -> List[Dict[str, Any]]:
-        pid = _get_patch_id_for_version(patch, timeout=timeout)
-        start_param = str(pid) if pid is not None else "0"
-        cache_key = ("beowulf", patch, start_param)
-        now = time.time()
-        cached = _SUMMARY_CACHE.get(cache_key)
-        # 30s TTL to share across tabs and functions
-        if cached and (now - cached[0] < 30):
-            return cached[1]  # type: ignore[index]
-        end_ms = _tomorrow_utc_ms()
-        url = f"{BASE_URL}/beowulfhuntersummarybypatch/patch/{patch}?start={start_param}&end={end_ms}"
-        data = _get_json(url, timeout=timeout)
-        rows = data if isinstance(data, list) else []
-        _SUMMARY_CACHE[cache_key] = (now, rows)
-        return rows
-
-    data = _get_shared_data()
+    data = _get_summary_rows(patch, timeout=timeout)
 
     out: List[Dict[str, Any]] = []
     for row in data:
@@ -286,22 +414,7 @@ def get_blackbox_summary(patch: str, timeout: float = 12.0) -> List[Dict[str, An
     if not patch:
         return []
     # Reuse the same shared combined summary used by piracy
-    def _get_shared_data() -> List[Dict[str, Any]]:
-        pid = _get_patch_id_for_version(patch, timeout=timeout)
-        start_param = str(pid) if pid is not None else "0"
-        cache_key = ("beowulf", patch, start_param)
-        now = time.time()
-        cached = _SUMMARY_CACHE.get(cache_key)
-        if cached and (now - cached[0] < 30):
-            return cached[1]  # type: ignore[index]
-        end_ms = _tomorrow_utc_ms()
-        url = f"{BASE_URL}/beowulfhuntersummarybypatch/patch/{patch}?start={start_param}&end={end_ms}"
-        data = _get_json(url, timeout=timeout)
-        rows = data if isinstance(data, list) else []
-        _SUMMARY_CACHE[cache_key] = (now, rows)
-        return rows
-
-    data = _get_shared_data()
+    data = _get_summary_rows(patch, timeout=timeout)
 
     out: List[Dict[str, Any]] = []
     for row in data:
@@ -354,11 +467,11 @@ def get_user_profile(user_id: str, timeout: float = 8.0) -> Optional[Dict[str, A
         return None
     # If cache already has this user, synthesize a minimal profile
     try:
-        _ensure_filtered_users_loaded()
-        if user_id in _FILTERED_USER_ID_TO_NAME:
+        members = _ensure_filtered_users_loaded()
+        if user_id in members:
             return {
                 "id": user_id,
-                "nickname": _FILTERED_USER_ID_TO_NAME[user_id],
+                "nickname": members[user_id],
             }
     except Exception:
         pass
@@ -371,7 +484,6 @@ def get_user_profile(user_id: str, timeout: float = 8.0) -> Optional[Dict[str, A
         return None
 
 
-@lru_cache(maxsize=8192)
 def get_user_display_name(user_id: str) -> str:
     """Return display name using only the preloaded filtered users cache.
 
@@ -381,8 +493,7 @@ def get_user_display_name(user_id: str) -> str:
     if not user_id:
         return "Unknown"
     try:
-        _ensure_filtered_users_loaded()
-        name = _FILTERED_USER_ID_TO_NAME.get(user_id)
+        name = _ensure_filtered_users_loaded().get(user_id)
         return name if isinstance(name, str) and name else user_id
     except Exception:
         return user_id
@@ -398,16 +509,16 @@ def resolve_user_display_names(user_ids: Iterable[str], max_workers: int = 8) ->
     if not ids:
         return results
 
-    # Ensure the filtered cache is loaded once
+    # Load the directory once for the whole batch
     try:
-        _ensure_filtered_users_loaded()
+        members = _ensure_filtered_users_loaded()
     except Exception:
-        pass
+        members = {}
 
-    # Resolve using the filtered cache only; if missing, keep the id
+    # Resolve using the filtered users only; if missing, keep the id
     for uid in ids:
         try:
-            name = _FILTERED_USER_ID_TO_NAME.get(uid)
+            name = members.get(uid)
             results[uid] = name if isinstance(name, str) and name else uid
         except Exception:
             results[uid] = uid
@@ -415,7 +526,6 @@ def resolve_user_display_names(user_ids: Iterable[str], max_workers: int = 8) ->
     return results
 
 
-@lru_cache(maxsize=4096)
 def get_user_display_name_fallback(user_id: str) -> str:
     """Resolve display name with a profile fetch fallback for single IDs.
 
@@ -425,8 +535,7 @@ def get_user_display_name_fallback(user_id: str) -> str:
     if not user_id:
         return "Unknown"
     try:
-        _ensure_filtered_users_loaded()
-        name = _FILTERED_USER_ID_TO_NAME.get(user_id)
+        name = _ensure_filtered_users_loaded().get(user_id)
         if isinstance(name, str) and name:
             return name
     except Exception:
@@ -441,87 +550,72 @@ def get_user_display_name_fallback(user_id: str) -> str:
 
 
 # --- Latest Pirate Hits ---
+def _normalize_hits(data: Any) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    # Normalize to a list of dicts
+    if isinstance(data, list):
+        src = data
+    elif isinstance(data, dict):
+        src = [data]
+    else:
+        src = []
+    for item in src:
+        if not isinstance(item, dict):
+            continue
+        # Best-effort conversion of numeric fields to ints
+        try:
+            if "total_value" in item and item["total_value"] is not None:
+                item["total_value"] = int(item["total_value"])  # type: ignore[assignment]
+        except Exception:
+            pass
+        rows.append(item)
+    return rows
+
+
 def get_latest_pirate_hits(timeout: float = 8.0) -> List[Dict[str, Any]]:
     """Return the latest pirate hits (up to 10) from the hittracker endpoint.
 
     The endpoint returns the last 10 hits in reverse chronological order.
-    We cache for a short TTL to avoid hammering the API from the UI thread.
+    Fresh for LATEST_HITS_TTL (enough for a manual-refresh UI); older hits are
+    returned while they are refreshed in the background.
     """
-    now = time.time()
-    cache_key = "hittracker/latest"
+    url = f"{BASE_URL}/hittracker/latest"
     try:
-        cached = _LATEST_HITS_CACHE.get(cache_key)
-        # 20s TTL is enough for a manual-refresh UI
-        if cached and (now - cached[0] < 20):
-            return cached[1]  # type: ignore[index]
+        return _cached_json('ironpoint.latest_hits', url, LATEST_HITS_TTL, timeout, transform=_normalize_hits)
     except Exception:
-        pass
+        # On failure, return empty list and do not raise (UI-friendly)
+        return []
 
-    url = f"{BASE_URL}/hittracker/latest"
+
+# --- Additional helpers for UI forms ---
+def _sort_fleets(data: Any, limit: int) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = list(data) if isinstance(data, list) else []
+    # Sort by timestamp desc if present
     try:
-        data = _get_json(url, timeout=timeout)
-        rows: List[Dict[str, Any]] = []
-        # Normalize to a list of dicts
-        if isinstance(data, list):
-            src = data
-        elif isinstance(data, dict):
-            src = [data]
-        else:
-            src = []
-        for item in src:
-            if not isinstance(item, dict):
-                continue
-            # Best-effort conversion of numeric fields to ints
+        def _ts(v):
             try:
-                if "total_value" in item and item["total_value"] is not None:
-                    item["total_value"] = int(item["total_value"])  # type: ignore[assignment]
+                s = str((v or {}).get("timestamp") or (v or {}).get("created_at") or "")
+                # Best effort: ISO8601 to epoch
+                return datetime.fromisoformat(s.replace("Z", "+00:00")).timestamp()
             except Exception:
-                pass
-            rows.append(item)
-        _LATEST_HITS_CACHE[cache_key] = (now, rows)
-        return rows
+                return 0.0
+        rows.sort(key=_ts, reverse=True)
     except Exception:
-        # On failure, return empty list and do not raise (UI-friendly)
-        return []
+        pass
+    if isinstance(limit, int) and limit > 0:
+        rows = rows[:limit]
+    return rows
 
 
-# --- Additional helpers for UI forms ---
 def get_recent_fleets(limit: int = 50, timeout: float = 8.0) -> List[Dict[str, Any]]:
     """Return recent fleets (gangs) from the API, cached briefly.
 
-    Uses a short TTL (30s) to avoid excessive network calls when the form opens repeatedly.
+    Fresh for RECENT_FLEETS_TTL so the form can open repeatedly without new calls.
     """
-    now = time.time()
-    cache_key = f"recentfleets/{limit}"
-    try:
-        cached = _RECENT_FLEETS_CACHE.get(cache_key)
-        if cached and (now - cached[0] < 30):
-            return cached[1]  # type: ignore[index]
-    except Exception:
-        pass
-
     url = f"{BASE_URL}/recentfleets/"
     try:
-        data = _get_json(url, timeout=timeout)
-        rows: List[Dict[str, Any]] = []
-        if isinstance(data, list):
-            rows = data
-        # Sort by timestamp desc if present
-        try:
-            def _ts(v):
-                try:
-                    s = str((v or {}).get("timestamp") or (v or {}).get("created_at") or "")
-                    # Best effort: ISO8601 to epoch
-                    return datetime.fromisoformat(s.replace("Z", "+00:00")).timestamp()
-                except Exception:
-                    return 0.0
-            rows.sort(key=_ts, reverse=True)
-        except Exception:
-            pass
-        if isinstance(limit, int) and limit > 0:
-            rows = rows[:limit]
-        _RECENT_FLEETS_CACHE[cache_key] = (now, rows)
-        return rows
+        return _cached_json('ironpoint.recent_fleets', url, RECENT_FLEETS_TTL, timeout, key=f"{url}#limit={limit}",
+                            transform=lambda data: _sort_fleets(data, limit))
     except Exception:
         return []
 
@@ -530,77 +624,43 @@ def get_all_user_display_options(timeout: float = 10.0) -> List[Dict[str, str]]:
     """Return simplified user options for selection: [{id, name}].
 
     Name preference: nickname, rsi_display_name, rsi_handle, username; id fallback.
-    Cached with a TTL of 5 minutes.
+    Built from the user directory; prefer get_user_directory() for lookups and search.
     """
-    now = time.time()
-    cache_key = "users/options"
-    try:
-        cached = _ALL_USERS_OPTIONS_CACHE.get(cache_key)
-        if cached and (now - cached[0] < 300):
-            return cached[1]  # type: ignore[index]
-    except Exception:
-        pass
-
-    url = f"{BASE_URL}/users/"
     try:
-        data = _get_json(url, timeout=timeout)
-        out: List[Dict[str, str]] = []
-        if isinstance(data, list):
-            for user in data:
-                try:
-                    uid = str((user or {}).get("id") or "").strip()
-                    if not uid:
-                        continue
-                    name = _extract_display_name_from_user_obj(user)
-                    if not name or name == "Unknown":
-                        name = uid
-                    out.append({"id": uid, "name": name})
-                except Exception:
-                    continue
-        # Sort case-insensitively by name
-        try:
-            out.sort(key=lambda x: x.get("name", "").lower())
-        except Exception:
-            pass
-        _ALL_USERS_OPTIONS_CACHE[cache_key] = (now, out)
-        return out
+        return get_user_directory(timeout=timeout).options()
     except Exception:
         return []
 
 
+def _dict_rows(data: Any) -> List[Dict[str, Any]]:
+    return [item for item in data if isinstance(item, dict)] if isinstance(data, list) else []
+
+
+def _fetch_commodity_rows(timeout: float = 10.0) -> List[Dict[str, Any]]:
+    """The /uex/summarizedcommodities/ objects, fresh for COMMODITIES_TTL (10 minutes)."""
+    return _cached_json('ironpoint.commodities', f"{BASE_URL}/uex/summarizedcommodities/", COMMODITIES_TTL,
+                        timeout, transform=_dict_rows)
+
+
+_COMMODITY_CATALOG = _CachedIndex(CommodityCatalog, lambda timeout: _fetch_commodity_rows(timeout=timeout))
+
+
+def get_commodity_catalog(timeout: float = 10.0) -> CommodityCatalog:
+    """The commodity catalog (see commodity_catalog): names, prices and prefix search.
+
+    One download of /uex/summarizedcommodities/, persisted across launches and
+    refreshed in the background; empty when nothing is cached and the fetch fails.
+    """
+    return _COMMODITY_CATALOG.get(timeout)
+
+
 def get_commodity_names(timeout: float = 10.0) -> List[str]:
     """Return list of commodity names from summarizedcommodities endpoint.
 
-    Cached with a TTL of 10 minutes.
+    Unique and sorted case-insensitively; built from the commodity catalog.
     """
-    now = time.time()
-    cache_key = "uex/summarizedcommodities/names"
-    try:
-        cached = _COMMODITY_NAMES_CACHE.get(cache_key)
-        if cached and (now - cached[0] < 600):
-            return cached[1]  # type: ignore[index]
-    except Exception:
-        pass
-
-    url = f"{BASE_URL}/uex/summarizedcommodities/"
     try:
-        data = _get_json(url, timeout=timeout)
-        names: List[str] = []
-        if isinstance(data, list):
-            for item in data:
-                try:
-                    nm = str((item or {}).get("commodity_name") or "").strip()
-                    if nm:
-                        names.append(nm)
-                except Exception:
-                    continue
-        # Unique and sorted
-        try:
-            names = sorted(sorted(set(names)), key=lambda s: s.lower())
-        except Exception:
-            pass
-        _COMMODITY_NAMES_CACHE[cache_key] = (now, names)
-        return names
+        return get_commodity_catalog(timeout=timeout).names()
     except Exception:
         return []
 
@@ -608,27 +668,10 @@ def get_commodity_names(timeout: float = 10.0) -> List[str]:
 def get_commodities_full(timeout: float = 10.0) -> List[Dict[str, Any]]:
     """Return full commodity objects from summarizedcommodities endpoint.
 
-    Cached with a TTL of 10 minutes. Includes price_buy_avg and price_sell_avg.
+    Fresh for COMMODITIES_TTL (10 minutes). Includes price_buy_avg and price_sell_avg.
     """
-    now = time.time()
-    cache_key = "uex/summarizedcommodities/full"
     try:
-        cached = _COMMODITIES_FULL_CACHE.get(cache_key)
-        if cached and (now - cached[0] < 600):
-            return cached[1]  # type: ignore[index]
-    except Exception:
-        pass
-
-    url = f"{BASE_URL}/uex/summarizedcommodities/"
-    try:
-        data = _get_json(url, timeout=timeout)
-        rows: List[Dict[str, Any]] = []
-        if isinstance(data, list):
-            for item in data:
-                if isinstance(item, dict):
-                    rows.append(item)
-        _COMMODITIES_FULL_CACHE[cache_key] = (now, rows)
-        return rows
+        return _fetch_commodity_rows(timeout=timeout)
     except Exception:
         return []
 
@@ -670,3 +713,70 @@ def post_hittracker(payload: Dict[str, Any], timeout: float = 12.0,
         if return_error:
             return (False, {"status": None, "message": "RequestException", "exception": str(e)})
         return False
+
+
+HIT_SUBMISSION_KIND = 'hittracker'
+
+
+def _send_queued_hit(payload: Dict[str, Any]):
+    """Queue sender for hits: post_hittracker, treating 409 as already recorded.
+
+    A retry after a timeout the server did process carries the same payload
+    `id`, so a conflict means the hit is stored and must not be retried.
+    """
+    ok, info = post_hittracker(payload, return_error=True)
+    if not ok and (info or {}).get('status') == 409:
+        ok = True
+    if ok:
+        # Show the new hit on the next Piracy tab refresh instead of the cached list
+        http_cache.invalidate(f"{BASE_URL}/hittracker/latest")
+    return ok, info
+
+
+submission_queue.register_sender(HIT_SUBMISSION_KIND, _send_queued_hit)
+
+
+def submit_hit(payload: Dict[str, Any]) -> bool:
+    """Queue a hit for durable delivery (see submission_queue); returns at once.
+
+    The payload's millisecond `id` is the idempotency key. Returns False when
+    a hit with that id is already queued.
+    """
+    return submission_queue.enqueue(HIT_SUBMISSION_KIND, str(payload.get("id") or int(time.time() * 1000)), payload)
+
+
+# --- Startup prefetch ---
+def prefetch_startup(timeout: float = 12.0) -> Dict[str, Any]:
+    """Warm the caches the Piracy and Dogfighting tabs read when they are built.
+
+    Runs the tabs' dependencies once, in order where they depend on each other:
+
+        /gameversion/ -> latest patch and patch id -> patch summary
+        /hittracker/latest and /users/               (in parallel with the above)
+
+    A tab refreshing while this runs joins the in-flight requests instead of
+    starting its own. Returns counts for the startup log.
+    """
+    result: Dict[str, Any] = {"patch": None, "summary_rows": 0, "latest_hits": 0, "users": 0}
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="ironpoint-prefetch") as pool:
+        users = pool.submit(_ensure_filtered_users_loaded)
+        hits = pool.submit(get_latest_pirate_hits, timeout)
+        try:
+            patch = get_latest_patch_version(timeout=timeout)
+        except Exception:
+            patch = None
+        result["patch"] = patch
+        if patch:
+            try:
+                result["summary_rows"] = len(_get_summary_rows(patch, timeout=timeout))
+            except Exception:
+                pass
+        try:
+            result["latest_hits"] = len(hits.result())
+        except Exception:
+            pass
+        try:
+            result["users"] = len(users.result())
+        except Exception:
+            pass
+    return result
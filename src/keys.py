@@ -2,13 +2,17 @@ import requests
 import os
 import sys
 import datetime
-from typing import Any  # Added for extended settings annotations
+from typing import Any, Optional  # Added for extended settings annotations
 from config import set_sc_log_location, get_player_name
 import global_variables
+import endpoints
+import net
 
 local_version = "7.0"
 api_key = {"value": None}
 org_api_key = {"value": None}
+# Username reported by the last successful validate_api_key (stored in validation_cache)
+validated_username = {"value": None}
 
 # Optional custom sound paths (persisted in config lines 3, 4 & 5 if present)
 custom_sound_interdiction = {"value": None}
@@ -53,7 +57,9 @@ def _get_assets_dir() -> str:
 
 @global_variables.log_exceptions
 def validate_api_key(api_key, rsi_handle):
-    url = "https://beowulf.ironpoint.org/api/keys/validatekey"
+    """True/False for a valid/rejected player key; None when Beowulf could not answer
+    (network error, 429 or 5xx), which callers that must decide treat as not valid."""
+    url = f"{endpoints.BEOWULF_API}/keys/validatekey"
     headers = {
         "Authorization": api_key,
         "Content-Type": "application/json"
@@ -64,7 +70,7 @@ def validate_api_key(api_key, rsi_handle):
     }
 
     try:
-        response = requests.get(url, headers=headers, json=data) # TODO: post or get? Why??
+        response = net.get(url, endpoint='beowulf.validatekey', headers=headers, json=data, timeout=10) # TODO: post or get? Why??
         if response.status_code == 200 or response.status_code == 201:
             # Try to parse JSON and extract a user_id if present
             try:
@@ -121,6 +127,7 @@ def validate_api_key(api_key, rsi_handle):
                     return None
 
                 username = _extract_username(resp_json)
+                validated_username["value"] = str(username) if username else None
                 if username:
                     try:
                         global_variables.log(f"Checking key for: {username}")
@@ -131,11 +138,14 @@ def validate_api_key(api_key, rsi_handle):
                 pass
 
             return True  # Success
+        elif response.status_code == 429 or response.status_code >= 500:
+            global_variables.log(f"API Key validation unavailable: HTTP {response.status_code}")
+            return None  # No verdict
         else:
             return False  # Failure
     except requests.RequestException as e:
         global_variables.log(f"API Key validation error: {e}")
-        return False
+        return None
 
 @global_variables.log_exceptions
 def save_api_key(key, org_key: str | None = None):
@@ -279,9 +289,11 @@ def _apply_extended_settings():
         ov_corner = extended_settings.get("overlay_corner")
         if ov_corner:
             global_variables.set_overlay_corner(ov_corner)
-        # After applying, ensure overlay state matches
+        # After applying, ensure overlay state matches (GUI only; headless mode has no Tk root)
         try:
-            if global_variables.is_overlay_enabled():
+            if global_variables.get_app() is None:
+                pass
+            elif global_variables.is_overlay_enabled():
                 from overlay_window import ensure_overlay, refresh_overlay  # type: ignore
                 ensure_overlay(); refresh_overlay()
             else:
@@ -289,6 +301,10 @@ def _apply_extended_settings():
                 disable_overlay()
         except Exception:
             pass
+        # Log console level filter
+        lvl = extended_settings.get("log_level")
+        if lvl:
+            global_variables.set_log_level(lvl.strip().lower())
         # Window geometry
         win_w = extended_settings.get("window_w")
         win_h = extended_settings.get("window_h")
@@ -298,6 +314,17 @@ def _apply_extended_settings():
                 app.geometry(f"{int(win_w)}x{int(win_h)}")
             except Exception:
                 pass
+        # Leaderboard refresh age (seconds)
+        max_age = extended_settings.get("leaderboard_max_age")
+        if max_age:
+            global_variables.set_leaderboard_max_age(max_age)
+        # How long a signed key validation / release check is trusted at launch (seconds)
+        key_ttl = extended_settings.get("key_validation_ttl")
+        if key_ttl:
+            global_variables.set_key_validation_ttl(key_ttl)
+        update_ttl = extended_settings.get("update_check_ttl")
+        if update_ttl:
+            global_variables.set_update_check_ttl(update_ttl)
         # Notices & sounds
         def _bool(name, default):
             val = extended_settings.get(name)
@@ -403,24 +430,27 @@ def get_org_key_value() -> str | None:
 
 
 @global_variables.log_exceptions
-def validate_org_key(org_key: str) -> bool:
+def validate_org_key(org_key: str) -> Optional[bool]:
     """Validate the ORG key by calling the Star Citizen API versions endpoint.
 
-    Endpoint: https://api.starcitizen-api.com/{org_key}/v1/cache/versions
+    Endpoint: {endpoints.SC_API}/{org_key}/v1/cache/versions
 
     Returns True when the response is HTTP 200 and JSON indicates success (success == 1).
-    Any non-200 status or JSON with success != 1 is treated as invalid.
+    Any other non-200 status or JSON with success != 1 is treated as invalid. Network
+    errors, 429 and 5xx return None: the key was not judged either way.
     """
     if not org_key:
         return False
-    url = f"https://api.starcitizen-api.com/{org_key}/v1/cache/versions"
+    url = f"{endpoints.SC_API}/{org_key}/v1/cache/versions"
     try:
-        resp = requests.get(url, timeout=5)
+        resp = net.get(url, endpoint='starcitizen-api.versions', timeout=5)
         if resp.status_code != 200:
             try:
                 global_variables.log(f"ORG key validation HTTP error: {resp.status_code}")
             except Exception:
                 pass
+            if resp.status_code == 429 or resp.status_code >= 500:
+                return None
             return False
         try:
             payload = resp.json()
@@ -438,4 +468,4 @@ def validate_org_key(org_key: str) -> bool:
         return False
     except requests.RequestException as e:
         global_variables.log(f"ORG Key validation error: {e}")
-        return False
\ No newline at end of file
+        return None
\ No newline at end of file
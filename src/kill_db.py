@@ -0,0 +1,433 @@
+"""Local SQLite kill history.
+
+Kills synced from the API, detected live and uploaded from backups are kept in
+`kills.sqlite3` under the data directory (see config.get_data_dir), so the
+Main tab, details window and graphs can query history directly and startup
+has data before (or without) the network.
+
+Rows are scoped by user_id and keyed by `record_key`, the same
+(victims, timestamp) identity kill_sync uses for de-duplication. Every victim
+of a kill also gets a row in `kill_victims`, so per-victim counts include
+multi-victim kills. Query helpers
+return records in the API-like schema used by the UI:
+    {"id", "user_id", "ship_used", "ship_killed", "value", "kill_count",
+     "victims", "patch", "game_mode", "timestamp", "location", "coordinates",
+     "zone", "org_sid", "org_picture", "victim_image"}
+"""
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import global_variables
+
+DB_FILENAME = "kills.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS kills (
+    record_key   TEXT NOT NULL,
+    user_id      TEXT NOT NULL,
+    source       TEXT NOT NULL,
+    api_id       TEXT,
+    victim       TEXT,
+    victims      TEXT,
+    timestamp    TEXT,
+    ts_epoch     REAL,
+    game_mode    TEXT,
+    is_ac        INTEGER NOT NULL DEFAULT 0,
+    ship_used    TEXT,
+    ship_killed  TEXT,
+    zone         TEXT,
+    location     TEXT,
+    coordinates  TEXT,
+    patch        TEXT,
+    value        INTEGER,
+    kill_count   INTEGER,
+    org_sid      TEXT,
+    org_picture  TEXT,
+    victim_image TEXT,
+    PRIMARY KEY (user_id, record_key)
+);
+CREATE INDEX IF NOT EXISTS idx_kills_user_ts ON kills (user_id, ts_epoch);
+CREATE INDEX IF NOT EXISTS idx_kills_user_ac_ts ON kills (user_id, is_ac, ts_epoch);
+CREATE INDEX IF NOT EXISTS idx_kills_victim ON kills (user_id, victim);
+CREATE INDEX IF NOT EXISTS idx_kills_game_mode ON kills (user_id, game_mode);
+CREATE INDEX IF NOT EXISTS idx_kills_ship_used ON kills (user_id, ship_used);
+CREATE INDEX IF NOT EXISTS idx_kills_ship_killed ON kills (user_id, ship_killed);
+CREATE TABLE IF NOT EXISTS kill_victims (
+    user_id    TEXT NOT NULL,
+    record_key TEXT NOT NULL,
+    pos        INTEGER NOT NULL,
+    victim     TEXT NOT NULL,
+    PRIMARY KEY (user_id, record_key, pos)
+);
+CREATE INDEX IF NOT EXISTS idx_kill_victims_victim ON kill_victims (user_id, victim);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_COLUMNS = (
+    'record_key', 'user_id', 'source', 'api_id', 'victim', 'victims', 'timestamp',
+    'ts_epoch', 'game_mode', 'is_ac', 'ship_used', 'ship_killed', 'zone', 'location',
+    'coordinates', 'patch', 'value', 'kill_count', 'org_sid', 'org_picture', 'victim_image',
+)
+_SELECT_COLUMNS = (
+    "api_id, user_id, ship_used, ship_killed, value, kill_count, victims, patch, game_mode, "
+    "timestamp, location, coordinates, zone, org_sid, org_picture, victim_image"
+)
+# PRAGMA user_version once existing rows have been migrated to the current schema
+_SCHEMA_VERSION = 1
+
+_lock = threading.RLock()
+_conn: Optional[sqlite3.Connection] = None
+_failed = False
+# User whose history the UI is showing; set by kill_sync
+_active_user_id: Optional[str] = None
+
+
+def _db_path() -> str:
+    try:
+        from config import get_data_dir
+        return os.path.join(get_data_dir(), DB_FILENAME)
+    except Exception:
+        return DB_FILENAME
+
+
+def _connect() -> Optional[sqlite3.Connection]:
+    """Open (once) the shared connection; returns None if the DB is unusable."""
+    global _conn, _failed
+    if _conn is not None or _failed:
+        return _conn
+    with _lock:
+        if _conn is not None or _failed:
+            return _conn
+        try:
+            conn = sqlite3.connect(_db_path(), check_same_thread=False, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            conn.commit()
+            _migrate(conn)
+            _conn = conn
+        except Exception as e:
+            _failed = True
+            global_variables.log(f"Kill history database unavailable: {e}")
+    return _conn
+
+
+def _victim_rows(user_id: str, record_key: str, victims_json: Optional[str]) -> List[Tuple]:
+    try:
+        victims = json.loads(victims_json) if victims_json else []
+    except Exception:
+        victims = []
+    return [(user_id, record_key, i, v) for i, v in enumerate(victims) if v]
+
+
+def _migrate(conn: sqlite3.Connection):
+    """Bring rows written by an older schema up to date (kill_victims backfill)."""
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version >= _SCHEMA_VERSION:
+        return
+    with conn:
+        if version < 1:
+            conn.execute("DELETE FROM kill_victims")
+            rows = []
+            for user_id, record_key, victims_json in conn.execute("SELECT user_id, record_key, victims FROM kills"):
+                rows.extend(_victim_rows(user_id, record_key, victims_json))
+            conn.executemany("INSERT OR REPLACE INTO kill_victims (user_id, record_key, pos, victim) VALUES (?, ?, ?, ?)", rows)
+        conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+
+def is_available() -> bool:
+    return _connect() is not None
+
+
+def _ts_epoch(ts: Optional[str]) -> Optional[float]:
+    if not ts:
+        return None
+    try:
+        s = str(ts).strip()
+        if s.startswith('<') and s.endswith('>'):
+            s = s[1:-1].strip()
+        if s.endswith('Z'):
+            s = s[:-1] + '+00:00'
+        dt = datetime.fromisoformat(s)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.timestamp()
+    except Exception:
+        try:
+            return float(ts)
+        except Exception:
+            return None
+
+
+def _record_key_text(key: Tuple) -> str:
+    victims, ts = key
+    return json.dumps([list(victims), ts], ensure_ascii=False)
+
+
+def _row_for(user_id: str, key: Tuple, source: str, api_item: Dict[str, Any], is_ac: bool) -> Tuple:
+    victims = [v for v in (api_item.get('victims') or []) if v]
+    ts = api_item.get('timestamp')
+    return (
+        _record_key_text(key),
+        str(user_id),
+        source,
+        api_item.get('id'),
+        victims[0] if victims else None,
+        json.dumps(victims, ensure_ascii=False),
+        ts,
+        _ts_epoch(ts),
+        api_item.get('game_mode'),
+        1 if is_ac else 0,
+        api_item.get('ship_used'),
+        api_item.get('ship_killed'),
+        api_item.get('zone'),
+        api_item.get('location'),
+        api_item.get('coordinates'),
+        api_item.get('patch'),
+        api_item.get('value') if isinstance(api_item.get('value'), int) else 0,
+        api_item.get('kill_count') if isinstance(api_item.get('kill_count'), int) else 1,
+        api_item.get('org_sid'),
+        api_item.get('org_picture'),
+        api_item.get('victim_image'),
+    )
+
+
+def _record_from_row(row) -> Dict[str, Any]:
+    try:
+        victims = json.loads(row[6]) if row[6] else []
+    except Exception:
+        victims = []
+    return {
+        'id': row[0],
+        'user_id': row[1],
+        'ship_used': row[2],
+        'ship_killed': row[3],
+        'value': row[4] or 0,
+        'kill_count': row[5] or 1,
+        'victims': victims,
+        'patch': row[7],
+        'game_mode': row[8],
+        'timestamp': row[9],
+        'location': row[10],
+        'coordinates': row[11],
+        'zone': row[12],
+        'org_sid': row[13],
+        'org_picture': row[14],
+        'victim_image': row[15],
+    }
+
+
+# --- writes ---
+def upsert_entries(user_id, entries: Iterable[Dict[str, Any]], replace_api: bool = False):
+    """Insert or update kill_sync store entries ({'key','source','api','is_ac'}).
+
+    With `replace_api=True` (a full API snapshot), API rows for this user that
+    are not in `entries` are removed; live/backup rows are kept.
+    """
+    conn = _connect()
+    if conn is None or not user_id:
+        return
+    uid = str(user_id)
+    rows = [_row_for(uid, e['key'], e.get('source') or 'api', e['api'], bool(e.get('is_ac'))) for e in entries]
+    victim_rows = []
+    for r in rows:
+        victim_rows.extend(_victim_rows(uid, r[0], r[5]))
+    placeholders = ", ".join("?" for _ in _COLUMNS)
+    try:
+        with _lock:
+            with conn:
+                if replace_api:
+                    conn.execute("CREATE TEMP TABLE IF NOT EXISTS _sync_keys (record_key TEXT PRIMARY KEY)")
+                    conn.execute("DELETE FROM _sync_keys")
+                    conn.executemany("INSERT OR IGNORE INTO _sync_keys (record_key) VALUES (?)", [(r[0],) for r in rows])
+                    conn.execute(
+                        "DELETE FROM kills WHERE user_id = ? AND source = 'api' "
+                        "AND record_key NOT IN (SELECT record_key FROM _sync_keys)",
+                        (uid,),
+                    )
+                    conn.execute(
+                        "DELETE FROM kill_victims WHERE user_id = ? "
+                        "AND record_key NOT IN (SELECT record_key FROM kills WHERE user_id = ?)",
+                        (uid, uid),
+                    )
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO kills ({', '.join(_COLUMNS)}) VALUES ({placeholders})",
+                    rows,
+                )
+                conn.executemany("DELETE FROM kill_victims WHERE user_id = ? AND record_key = ?",
+                                 [(uid, r[0]) for r in rows])
+                conn.executemany(
+                    "INSERT OR REPLACE INTO kill_victims (user_id, record_key, pos, victim) VALUES (?, ?, ?, ?)",
+                    victim_rows,
+                )
+    except Exception as e:
+        global_variables.log(f"Failed to store kills in history database: {e}")
+
+
+def set_meta(key: str, value: Optional[str]):
+    conn = _connect()
+    if conn is None:
+        return
+    try:
+        with _lock:
+            with conn:
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+    except Exception:
+        pass
+
+
+def get_meta(key: str) -> Optional[str]:
+    conn = _connect()
+    if conn is None:
+        return None
+    try:
+        with _lock:
+            row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    except Exception:
+        return None
+
+
+def set_active_user(user_id):
+    """Select the user whose history queries return by default; remembered for offline startup."""
+    global _active_user_id
+    _active_user_id = str(user_id) if user_id else None
+    if _active_user_id:
+        set_meta('last_user_id', _active_user_id)
+
+
+def get_active_user() -> Optional[str]:
+    return _active_user_id
+
+
+# --- queries ---
+def _query(sql: str, params: Tuple = ()) -> List[Any]:
+    conn = _connect()
+    if conn is None:
+        return []
+    try:
+        with _lock:
+            return conn.execute(sql, params).fetchall()
+    except Exception as e:
+        global_variables.log(f"Kill history query failed: {e}")
+        return []
+
+
+def _uid(user_id) -> Optional[str]:
+    return str(user_id) if user_id else _active_user_id
+
+
+def count_kills(user_id=None, ac: Optional[bool] = None) -> Optional[int]:
+    """Number of stored kills (optionally only AC or only PU); None if unavailable."""
+    uid = _uid(user_id)
+    if not uid or not is_available():
+        return None
+    if ac is None:
+        rows = _query("SELECT COUNT(*) FROM kills WHERE user_id = ?", (uid,))
+    else:
+        rows = _query("SELECT COUNT(*) FROM kills WHERE user_id = ? AND is_ac = ?", (uid, 1 if ac else 0))
+    return int(rows[0][0]) if rows else 0
+
+
+def latest_kills(user_id=None, ac: Optional[bool] = None, limit: int = 10, offset: int = 0) -> List[Dict[str, Any]]:
+    """Newest-first kills, optionally filtered to AC or PU."""
+    uid = _uid(user_id)
+    if not uid:
+        return []
+    if ac is None:
+        rows = _query(
+            f"SELECT {_SELECT_COLUMNS} FROM kills WHERE user_id = ? "
+            "ORDER BY ts_epoch DESC LIMIT ? OFFSET ?",
+            (uid, int(limit), int(offset)),
+        )
+    else:
+        rows = _query(
+            f"SELECT {_SELECT_COLUMNS} FROM kills WHERE user_id = ? AND is_ac = ? "
+            "ORDER BY ts_epoch DESC LIMIT ? OFFSET ?",
+            (uid, 1 if ac else 0, int(limit), int(offset)),
+        )
+    return [_record_from_row(r) for r in rows]
+
+
+def load_recent(user_id=None, limit: int = 500) -> List[Tuple[str, Dict[str, Any]]]:
+    """The newest `limit` stored kills, oldest-first, as (source, record) pairs."""
+    uid = _uid(user_id)
+    if not uid:
+        return []
+    rows = _query(
+        f"SELECT {_SELECT_COLUMNS}, source FROM kills WHERE user_id = ? ORDER BY ts_epoch DESC LIMIT ?",
+        (uid, int(limit)),
+    )
+    return [(r[16] or 'api', _record_from_row(r)) for r in reversed(rows)]
+
+
+def victim_timestamps(user_id=None) -> set:
+    """(victim, timestamp) for every victim of every stored kill, for duplicate detection."""
+    uid = _uid(user_id)
+    if not uid:
+        return set()
+    out = set()
+    for victims, ts in _query("SELECT victims, timestamp FROM kills WHERE user_id = ? AND timestamp IS NOT NULL", (uid,)):
+        try:
+            for v in json.loads(victims) if victims else []:
+                if v:
+                    out.add((v, ts))
+        except Exception:
+            continue
+    return out
+
+
+def kill_epochs(user_id=None) -> List[float]:
+    """Epoch seconds of every stored kill (for graphs)."""
+    uid = _uid(user_id)
+    if not uid:
+        return []
+    rows = _query("SELECT ts_epoch FROM kills WHERE user_id = ? AND ts_epoch IS NOT NULL ORDER BY ts_epoch", (uid,))
+    return [r[0] for r in rows]
+
+
+def top_victims(user_id=None, limit: int = 3) -> List[Tuple[str, int]]:
+    """Most-killed players, counting every victim of multi-victim kills."""
+    uid = _uid(user_id)
+    if not uid:
+        return []
+    rows = _query(
+        "SELECT victim, COUNT(*) AS n FROM kill_victims WHERE user_id = ? AND victim != '' "
+        "GROUP BY victim ORDER BY n DESC, victim LIMIT ?",
+        (uid, int(limit)),
+    )
+    return [(r[0], int(r[1])) for r in rows]
+
+
+def top_ships_killed(user_id=None, limit: int = 3) -> List[Tuple[str, int]]:
+    """Most-killed ships, excluding FPS kills."""
+    uid = _uid(user_id)
+    if not uid:
+        return []
+    rows = _query(
+        "SELECT TRIM(ship_killed) AS s, COUNT(*) AS n FROM kills WHERE user_id = ? "
+        "AND ship_killed IS NOT NULL AND TRIM(ship_killed) != '' AND UPPER(TRIM(ship_killed)) != 'FPS' "
+        "GROUP BY s ORDER BY n DESC, s LIMIT ?",
+        (uid, int(limit)),
+    )
+    return [(r[0], int(r[1])) for r in rows]
+
+
+def top_ships_used(user_id=None, limit: int = 3) -> List[Tuple[str, int]]:
+    uid = _uid(user_id)
+    if not uid:
+        return []
+    rows = _query(
+        "SELECT TRIM(ship_used) AS s, COUNT(*) AS n FROM kills WHERE user_id = ? "
+        "AND ship_used IS NOT NULL AND TRIM(ship_used) != '' AND LOWER(TRIM(ship_used)) != 'null' "
+        "GROUP BY s ORDER BY n DESC, s LIMIT ?",
+        (uid, int(limit)),
+    )
+    return [(r[0], int(r[1])) for r in rows]
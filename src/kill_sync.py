@@ -0,0 +1,507 @@
+"""Unified kill sync for the user's history on the Beowulf blackbox API.
+
+Startup, the Main tab and backup imports all need the same
+`/api/blackbox/user?user_id=` payload in different shapes. This module fetches
+it once, normalizes each record once into a shared store, and derives:
+
+- the duplicate-detection set of (victim, timestamp) tuples (`duplicate_keys`)
+- the normalized UI records split into PU and AC lists
+- the combined API-like list consumed by the Main tab, details window and graphs
+
+Concurrent callers share one in-flight request, and callers passing `max_age`
+reuse a recent snapshot instead of fetching again. With `delta=True`, a sync
+only asks for kills newer than the last seen timestamp (`since=` query
+parameter) and merges them into the store; a server that ignores the
+parameter simply returns the full list, which merges the same way.
+
+Every change is also written to the local SQLite history (kill_db), and
+`seed_from_db` loads the newest part of it at startup so the views have data
+before the first sync completes, or when the API is unreachable.
+
+While the history database is available, only the newest MEMORY_WINDOW
+records are kept in memory (the overlay, proximity feed and the newest live
+kills read those lists); counts, analytics, graphs and paged history are
+served by kill_db queries. `duplicate_keys` stays complete: it holds only
+(victim, timestamp) tuples and is reloaded from the database. Without the
+database the whole history stays in memory, as before.
+"""
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import global_variables
+import kill_db
+import metrics
+import endpoints
+import net
+
+BLACKBOX_USER_URL = f"{endpoints.BEOWULF_API}/blackbox/user"
+
+# Game modes / zone cues that classify a kill as Arena Commander
+AC_GAME_MODES = (
+    'arena_commander', 'ac', 'electronic_access', 'ea_starfighter',
+    'ea_duel', 'ea_freeflight', 'ea_vanduul_swarm',
+)
+AC_ZONE_CUES = ('arena', 'dying star', 'broken moon', 'electronic access')
+
+# Records kept in memory while kill_db holds the full history
+MEMORY_WINDOW = 500
+
+# Shared duplicate-detection set; updated in place so holders of the reference
+# (parser.api_kills_cache) always see the latest contents.
+duplicate_keys = set()
+
+_lock = threading.RLock()
+_sync_cond = threading.Condition(_lock)
+_sync_in_flight = False
+_state: Dict[str, Any] = {
+    'user_id': None,
+    # record key -> {'key', 'source': 'api'|'live'|'backup', 'norm': dict, 'api': dict}
+    'entries': {},
+    'order': [],            # record keys in insertion order
+    'last_seen': None,      # max timestamp string among API records
+    'synced_at': 0.0,       # epoch seconds of last successful sync
+    'ok': False,            # whether the last sync succeeded
+}
+
+
+def _clean(val) -> Optional[str]:
+    return str(val).strip() if val else None
+
+
+def _record_key(victims: List[str], time_str: Optional[str]) -> Tuple:
+    return (tuple(v for v in victims if v), time_str or '')
+
+
+def _local_norm(api_item: Dict[str, Any], source: str) -> Dict[str, Any]:
+    """Normalized UI record for a kill recorded locally (live or backup upload)."""
+    victims = [v for v in (api_item.get('victims') or []) if v]
+    return {
+        'victim': victims[0] if victims else None,
+        'time': api_item.get('timestamp'),
+        'zone': api_item.get('zone') or api_item.get('location'),
+        'weapon': None,
+        'game_mode': api_item.get('game_mode'),
+        'killers_ship': api_item.get('ship_used'),
+        'damage_type': None,
+        'ship_killed': api_item.get('ship_killed'),
+        'org_sid': api_item.get('org_sid'),
+        'org_picture': api_item.get('org_picture'),
+        'victim_image': api_item.get('victim_image'),
+        'source': source,
+    }
+
+
+def _persist(user_id, entries: List[Dict[str, Any]], replace_api: bool = False):
+    """Write store entries to the local history database."""
+    if not user_id:
+        return
+    try:
+        rows = [dict(e, is_ac=is_ac_record(e['norm'])) for e in entries]
+        kill_db.upsert_entries(user_id, rows, replace_api=replace_api)
+    except Exception as e:
+        global_variables.log(f"Failed to persist kills: {e}")
+
+
+def is_ac_record(rec: Dict[str, Any]) -> bool:
+    """Classify a normalized or API-like kill record as Arena Commander."""
+    gm = (rec.get('game_mode') or '').lower()
+    if gm in AC_GAME_MODES or any(cue in gm for cue in ('arena', 'electronic access')):
+        return True
+    z = (rec.get('zone') or rec.get('location') or '').lower()
+    return any(cue in z for cue in AC_ZONE_CUES)
+
+
+def normalize_item(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Normalize one API kill item into a store entry, or None if unusable."""
+    if not isinstance(item, dict):
+        return None
+    # Extract with fallbacks
+    victim = item.get('victim') or item.get('victim_name') or item.get('victimName')
+    if not victim and isinstance(item.get('victims'), (list, tuple)) and item.get('victims'):
+        try:
+            victim = item.get('victims')[0]
+        except Exception:
+            victim = None
+    time_val = item.get('timestamp') or item.get('time') or item.get('kill_time')
+    zone = item.get('zone') or item.get('location') or item.get('map')
+    weapon = item.get('weapon') or item.get('weapon_name')
+    game_mode_val = item.get('game_mode') or item.get('mode') or item.get('gameMode')
+    killers_ship = item.get('killers_ship') or item.get('ship') or item.get('ship_name')
+    # ship_killed indicates FPS vs ship kill per API; keep raw value
+    ship_killed = item.get('ship_killed') or item.get('shipKilled') or item.get('ship-killed')
+    damage_type = item.get('damage_type') or item.get('damageType')
+    org_sid = item.get('org_sid') or item.get('orgSid') or item.get('organization_sid')
+    org_picture = item.get('org_picture') or item.get('orgImage') or item.get('organization_image')
+    victim_image = item.get('victim_image') or item.get('victimImage') or item.get('profile_image') or item.get('profileImage')
+    id_val = item.get('id') or item.get('_id') or None
+    user_id_val = item.get('user_id') or item.get('userId') or None
+    ship_used = item.get('ship_used') or item.get('killers_ship') or item.get('ship') or None
+    patch = item.get('patch') or None
+    value = item.get('value') if isinstance(item.get('value'), int) else 0
+    kill_count = item.get('kill_count') if isinstance(item.get('kill_count'), int) else 1
+    if isinstance(item.get('victims'), (list, tuple)):
+        victims_list = [str(v).strip() for v in item.get('victims') if v]
+    else:
+        victims_list = [str(victim).strip()] if victim else []
+
+    norm = {
+        'victim': _clean(victim),
+        'time': _clean(time_val),
+        'zone': _clean(zone),
+        'weapon': _clean(weapon),
+        'game_mode': _clean(game_mode_val),
+        'killers_ship': _clean(killers_ship),
+        'damage_type': _clean(damage_type),
+        'ship_killed': str(ship_killed).strip() if ship_killed is not None else None,
+        'org_sid': _clean(org_sid),
+        'org_picture': _clean(org_picture),
+        'victim_image': _clean(victim_image),
+        'source': 'api'
+    }
+    # Skip entries with neither victim nor time; insufficient for display
+    if not norm['victim'] and not norm['time']:
+        return None
+
+    # API-like record for the combined list, including location/coordinates if present
+    loc_val = item.get('location') or item.get('zone') or item.get('map')
+    coords_val = item.get('coordinates') or item.get('coords')
+    api_item = {
+        'id': str(id_val) if id_val is not None else None,
+        'user_id': str(user_id_val) if user_id_val is not None else None,
+        'ship_used': _clean(ship_used),
+        'ship_killed': str(ship_killed).strip() if ship_killed is not None else None,
+        'value': int(value),
+        'kill_count': int(kill_count),
+        'victims': victims_list,
+        'patch': str(patch) if patch is not None else None,
+        'game_mode': _clean(game_mode_val),
+        'timestamp': _clean(time_val),
+        # Optional extras consumed by Details view
+        'location': _clean(loc_val),
+        'coordinates': _clean(coords_val),
+        'org_sid': _clean(org_sid),
+        'org_picture': _clean(org_picture),
+        'victim_image': _clean(victim_image),
+    }
+    return {
+        'key': _record_key(victims_list, api_item['timestamp']),
+        'source': 'api',
+        'norm': norm,
+        'api': api_item,
+    }
+
+
+def _fetch_candidates(user_id: str, since: Optional[str] = None) -> Optional[List[Any]]:
+    """GET the user's kills; returns the raw item list, or None on failure."""
+    headers = {}
+    key = global_variables.get_key()
+    if key:
+        headers['Authorization'] = key
+    params = {'user_id': user_id}
+    if since:
+        params['since'] = since
+    try:
+        resp = net.get(BLACKBOX_USER_URL, endpoint='beowulf.blackbox', headers=headers, params=params, timeout=10)
+        if resp.status_code != 200:
+            global_variables.log(f"Failed to fetch user kills: {resp.status_code}")
+            return None
+        data = resp.json()
+    except Exception as e:
+        global_variables.log(f"Error fetching user kills from API: {e}")
+        return None
+    # support a few common response shapes
+    if isinstance(data, dict):
+        return data.get('kills') or data.get('data') or data.get('results') or data.get('items') or []
+    if isinstance(data, list):
+        return data
+    global_variables.log("Unexpected API response format when fetching kills")
+    return []
+
+
+def _merge_api_entries(entries: List[Dict[str, Any]], full: bool):
+    """Merge fetched API entries into the store (caller holds the lock)."""
+    store = _state['entries']
+    order = _state['order']
+    fetched_keys = set()
+    for entry in entries:
+        k = entry['key']
+        fetched_keys.add(k)
+        if k not in store:
+            order.append(k)
+        store[k] = entry
+    if full:
+        # A full snapshot replaces API records; local live kills the server doesn't
+        # report yet are kept so they stay visible until the next sync
+        for k in list(order):
+            e = store.get(k)
+            if e is not None and e['source'] == 'api' and k not in fetched_keys:
+                del store[k]
+        _state['order'] = [k for k in order if k in store]
+    last_seen = _state.get('last_seen')
+    for entry in entries:
+        ts = entry['api'].get('timestamp')
+        if ts and (last_seen is None or ts > last_seen):
+            last_seen = ts
+    _state['last_seen'] = last_seen
+
+
+def _history_in_db() -> bool:
+    try:
+        return bool(_state['user_id']) and kill_db.is_available()
+    except Exception:
+        return False
+
+
+def _entry_dups(entries) -> set:
+    dups = set()
+    for entry in entries:
+        ts = entry['api'].get('timestamp')
+        if ts:
+            for v in entry['api'].get('victims') or []:
+                if v:
+                    dups.add((v, ts))
+    return dups
+
+
+def _add_duplicate_keys(entries):
+    duplicate_keys.update(_entry_dups(entries))
+
+
+def _reload_duplicate_keys():
+    """Rebuild the duplicate set from the full history (caller holds the lock)."""
+    if _history_in_db():
+        dups = kill_db.victim_timestamps(_state['user_id'])
+    else:
+        dups = _entry_dups(_state['entries'].values())
+    duplicate_keys.clear()
+    duplicate_keys.update(dups)
+
+
+def _trim_window():
+    """Drop the oldest in-memory records beyond MEMORY_WINDOW once they are in kill_db."""
+    order = _state['order']
+    if len(order) <= MEMORY_WINDOW or not _history_in_db():
+        return
+    store = _state['entries']
+    newest = sorted(order, key=lambda k: store[k]['api'].get('timestamp') or '', reverse=True)[:MEMORY_WINDOW]
+    keep = set(newest)
+    for k in order:
+        if k not in keep:
+            store.pop(k, None)
+    _state['order'] = [k for k in order if k in keep]
+
+
+def _rebuild_derived():
+    """Trim to the memory window and publish UI lists (caller holds the lock)."""
+    _trim_window()
+    store = _state['entries']
+    normalized = []
+    api_like = []
+    pu_list, ac_list = [], []
+    for k in _state['order']:
+        entry = store.get(k)
+        if entry is None:
+            continue
+        norm = entry['norm']
+        normalized.append(norm)
+        api_like.append(entry['api'])
+        if is_ac_record(norm):
+            ac_list.append(norm)
+        else:
+            pu_list.append(norm)
+    # Store for UI
+    global_variables.set_api_kills_data(normalized)
+    global_variables.set_api_kills_split(pu_list, ac_list)
+    global_variables.set_api_kills_all(api_like)
+
+
+def _reset_for_user(user_id):
+    kill_db.set_active_user(user_id)
+    _state['user_id'] = user_id
+    _state['entries'] = {}
+    _state['order'] = []
+    _state['last_seen'] = None
+    _state['synced_at'] = 0.0
+    _state['ok'] = False
+    duplicate_keys.clear()
+
+
+def sync(user_id=None, delta: bool = False, max_age: Optional[float] = None) -> bool:
+    """Synchronize the local kill store with the API.
+
+    Args:
+        user_id: user to sync; defaults to the validated user_id.
+        delta: when a snapshot exists, fetch only kills newer than the last seen timestamp.
+        max_age: reuse the current snapshot if it was synced less than this many seconds ago.
+
+    Returns True when the store reflects a successful sync.
+    """
+    global _sync_in_flight
+    if not user_id:
+        user_id = global_variables.get_user_id()
+    if not user_id:
+        with _lock:
+            _reset_for_user(None)
+            _rebuild_derived()
+        return False
+    user_id = str(user_id)
+
+    with _sync_cond:
+        if _state['user_id'] != user_id:
+            _reset_for_user(user_id)
+        # Another thread is already syncing: wait and share its result
+        if _sync_in_flight:
+            while _sync_in_flight:
+                _sync_cond.wait()
+            if _state['user_id'] == user_id:
+                return bool(_state['ok'])
+        if max_age is not None:
+            fresh = bool(_state['ok']) and (time.time() - _state['synced_at']) < max_age
+            metrics.cache_lookup('kill_sync', fresh)
+            if fresh:
+                return True
+        since = _state['last_seen'] if (delta and _state['ok']) else None
+        _sync_in_flight = True
+
+    try:
+        candidates = _fetch_candidates(user_id, since=since)
+    except BaseException:
+        with _sync_cond:
+            _sync_in_flight = False
+            _sync_cond.notify_all()
+        raise
+
+    # Merge and clear the in-flight flag in one critical section, so waiters
+    # sharing this request see the merged store and its final state
+    with _sync_cond:
+        try:
+            return _apply_candidates(user_id, since, candidates)
+        finally:
+            _sync_in_flight = False
+            _sync_cond.notify_all()
+
+
+def _apply_candidates(user_id: str, since, candidates) -> bool:
+    """Merge a fetch result into the store (caller holds _lock)."""
+    if _state['user_id'] != user_id:
+        return False
+    if candidates is None:
+        # Keep whatever the store holds (e.g. history seeded from the local
+        # database) so the views stay populated while offline
+        _state['ok'] = False
+        return False
+    entries = [e for e in (normalize_item(it) for it in candidates) if e is not None]
+    _state['synced_at'] = time.time()
+    _state['ok'] = True
+    if since is not None and not entries:
+        # Nothing new; keep derived lists (and the kills version) untouched
+        return True
+    _merge_api_entries(entries, full=since is None)
+    # Persist before publishing so views reading the database see the new version
+    _persist(user_id, entries, replace_api=since is None)
+    if since is None:
+        _reload_duplicate_keys()
+    else:
+        _add_duplicate_keys(entries)
+    _rebuild_derived()
+    return True
+
+
+def add_local_kill(api_item: Dict[str, Any], norm: Optional[Dict[str, Any]] = None):
+    """Record a kill detected live (already published) so all derived views include it."""
+    try:
+        if norm is None:
+            norm = _local_norm(api_item, 'live')
+        victims = [v for v in (api_item.get('victims') or []) if v]
+        k = _record_key(victims, api_item.get('timestamp'))
+        entry = {'key': k, 'source': 'live', 'norm': norm, 'api': api_item}
+        with _lock:
+            if k not in _state['entries']:
+                _state['order'].append(k)
+            _state['entries'][k] = entry
+            _persist(_state['user_id'] or global_variables.get_user_id(), [entry])
+            _add_duplicate_keys([entry])
+            _rebuild_derived()
+    except Exception as e:
+        global_variables.log(f"Failed to record live kill: {e}")
+
+
+def add_local_kills(api_items: List[Dict[str, Any]], source: str = 'backup'):
+    """Record a batch of locally published kills (e.g. a backup import) with one rebuild."""
+    if not api_items:
+        return
+    try:
+        entries = []
+        for api_item in api_items:
+            victims = [v for v in (api_item.get('victims') or []) if v]
+            k = _record_key(victims, api_item.get('timestamp'))
+            entries.append({'key': k, 'source': source, 'norm': _local_norm(api_item, source), 'api': api_item})
+        stored = []
+        with _lock:
+            for entry in entries:
+                k = entry['key']
+                existing = _state['entries'].get(k)
+                if existing is not None and existing['source'] == 'api':
+                    continue
+                if existing is None:
+                    _state['order'].append(k)
+                _state['entries'][k] = entry
+                stored.append(entry)
+            if not stored:
+                return
+            _persist(_state['user_id'] or global_variables.get_user_id(), stored)
+            _add_duplicate_keys(stored)
+            _rebuild_derived()
+    except Exception as e:
+        global_variables.log(f"Failed to record {source} kills: {e}")
+
+
+def seed_from_db(user_id=None) -> int:
+    """Load the newest stored kills for `user_id` (default: last user) into an empty store.
+
+    Only MEMORY_WINDOW records are loaded; the duplicate set covers the whole
+    history. Returns the number of records loaded. Does nothing once a sync has
+    populated the store for that user.
+    """
+    try:
+        if not user_id:
+            user_id = kill_db.get_meta('last_user_id')
+        if not user_id:
+            return 0
+        user_id = str(user_id)
+        rows = kill_db.load_recent(user_id, limit=MEMORY_WINDOW)
+        with _lock:
+            if _state['user_id'] not in (None, user_id) or _state['entries']:
+                return 0
+            _reset_for_user(user_id)
+            for source, rec in rows:
+                entry = normalize_item(rec)
+                if entry is None:
+                    continue
+                entry['source'] = source
+                entry['norm']['source'] = 'api' if source == 'api' else source
+                if entry['key'] not in _state['entries']:
+                    _state['order'].append(entry['key'])
+                _state['entries'][entry['key']] = entry
+                ts = entry['api'].get('timestamp')
+                if source == 'api' and ts and (_state['last_seen'] is None or ts > _state['last_seen']):
+                    _state['last_seen'] = ts
+            if _state['entries']:
+                _reload_duplicate_keys()
+                _rebuild_derived()
+            return len(_state['entries'])
+    except Exception as e:
+        global_variables.log(f"Failed to load kill history: {e}")
+        return 0
+
+
+def get_split() -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Return the (pu, ac) normalized lists derived from the store."""
+    return global_variables.get_api_kills_split()
+
+
+def get_last_sync_time() -> float:
+    """Epoch seconds of the last successful sync (0 when never synced)."""
+    with _lock:
+        return float(_state['synced_at'] or 0.0)
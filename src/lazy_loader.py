@@ -0,0 +1,124 @@
+"""Deferred imports and on-demand tab construction.
+
+Cold start is dominated by importing heavy libraries (plotly, kaleido, PIL
+plugins) and by building tab widgets the user may never open. This module
+provides two small helpers to push that work past the first window:
+
+- `lazy_import(name)` returns a module proxy that imports on first attribute access.
+- `LazyTabs` builds ttk.Notebook tabs the first time they are selected.
+"""
+import importlib
+import importlib.util
+import threading
+from typing import Any, Callable, Dict, Optional
+
+import global_variables
+
+
+class LazyModule:
+    """Proxy that imports `name` the first time one of its attributes is used."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._name)
+        return self._module
+
+    def is_loaded(self) -> bool:
+        return self._module is not None
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self._module is not None else 'deferred'
+        return f"<LazyModule {self._name} ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Return a proxy for module `name` without importing it yet."""
+    return LazyModule(name)
+
+
+def is_available(name: str) -> bool:
+    """Return True when module `name` can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except Exception:
+        return False
+
+
+class LazyTabs:
+    """Build notebook tab contents the first time each tab is selected.
+
+    Usage:
+        lazy = LazyTabs(notebook)
+        lazy.register('piracy', piracy_frame, build_fn, on_built=callback)
+
+    `build_fn(frame)` returns the tab's refs dict; `on_built(refs)` runs once
+    afterwards so callers can publish the refs (e.g., on the app object).
+    """
+
+    def __init__(self, notebook):
+        self.notebook = notebook
+        self._specs: Dict[str, Dict[str, Any]] = {}
+        try:
+            notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed, add='+')
+        except Exception:
+            pass
+
+    def register(self, name: str, frame, builder: Callable[[Any], Dict[str, Any]], on_built: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self._specs[name] = {
+            'frame': frame,
+            'builder': builder,
+            'on_built': on_built,
+            'built': False,
+            'refs': None,
+        }
+
+    def is_built(self, name: str) -> bool:
+        spec = self._specs.get(name)
+        return bool(spec and spec.get('built'))
+
+    def get_refs(self, name: str) -> Optional[Dict[str, Any]]:
+        spec = self._specs.get(name)
+        return spec.get('refs') if spec else None
+
+    def ensure_built(self, name: str) -> Optional[Dict[str, Any]]:
+        """Build tab `name` now if it has not been built yet; return its refs."""
+        spec = self._specs.get(name)
+        if spec is None:
+            return None
+        if spec['built']:
+            return spec['refs']
+        # Mark first so a re-entrant tab change during build doesn't build twice
+        spec['built'] = True
+        try:
+            refs = spec['builder'](spec['frame']) or {}
+        except Exception as e:
+            global_variables.log(f"Failed to build {name} tab: {e}")
+            refs = {}
+        spec['refs'] = refs
+        on_built = spec.get('on_built')
+        if callable(on_built):
+            try:
+                on_built(refs)
+            except Exception as e:
+                global_variables.log(f"Failed to publish {name} tab refs: {e}")
+        return refs
+
+    def _on_tab_changed(self, _evt=None):
+        try:
+            selected = self.notebook.select()
+        except Exception:
+            return
+        for name, spec in self._specs.items():
+            if not spec['built'] and str(spec['frame']) == str(selected):
+                self.ensure_built(name)
+                break
@@ -0,0 +1,151 @@
+"""Ranked, formatted leaderboard views for the Piracy and Dogfighting tabs.
+
+Everything here runs on the tabs' refresh worker, not the Tk thread: coercing
+the API numbers, resolving display names, dropping rows without a proper
+nickname, ranking and formatting. A view is a list of ready-to-insert rows:
+
+    [(text, user_id), ...]      text is "<value> - <display name>"
+
+Only the top `limit` rows are ranked, with heapq.nlargest (O(n log limit)
+instead of sorting every row); ties keep the API order, as the full sort did.
+"""
+import heapq
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+import global_variables as gv
+import ironpoint_api
+
+Row = Tuple[str, str]
+
+LIMIT = 100
+
+
+def as_int(value: Any) -> int:
+    try:
+        return int(value or 0)
+    except Exception:
+        return 0
+
+
+def as_float(value: Any) -> float:
+    try:
+        return float(value or 0)
+    except Exception:
+        return 0.0
+
+
+def as_number(value: Any):
+    """int when the value is integral text or int, else float, else 0."""
+    try:
+        return int(value or 0)
+    except Exception:
+        return as_float(value)
+
+
+def format_value(value: Any) -> str:
+    """Default listbox value: thousands separators, 2 decimals for floats."""
+    try:
+        if isinstance(value, (int, float)):
+            return f"{value:,.0f}" if isinstance(value, int) else f"{value:,.2f}"
+    except Exception:
+        pass
+    return str(value)
+
+
+def format_rating(value: Any) -> str:
+    try:
+        return f"{int(round(float(value))):,}"
+    except Exception:
+        return str(value)
+
+
+def format_money(value: Any) -> str:
+    try:
+        return f"${value:,}" if isinstance(value, int) else f"${float(value):,.2f}"
+    except Exception:
+        return f"${value}"
+
+
+def row_id(row: Dict[str, Any], *fields: str) -> str:
+    for field in fields:
+        value = row.get(field)
+        if value:
+            return str(value)
+    return ''
+
+
+def resolve_names(ids: Iterable[str]) -> Dict[str, str]:
+    """Display names for `ids`, including the current user even outside the filtered ranks."""
+    try:
+        names = ironpoint_api.resolve_user_display_names(ids)
+    except Exception:
+        names = {}
+    try:
+        cur_uid = gv.get_user_id()
+        if cur_uid:
+            friendly = ironpoint_api.get_user_display_name_fallback(cur_uid)
+            if isinstance(friendly, str) and friendly and friendly != cur_uid:
+                names[str(cur_uid)] = friendly
+    except Exception:
+        pass
+    return names
+
+
+def rank(entries: List[Tuple[str, Any]], names: Dict[str, str], limit: int = LIMIT,
+         fmt: Callable[[Any], str] = format_value) -> List[Row]:
+    """Top `limit` of (user_id, value) entries as rows, skipping ids without a proper nickname."""
+    named = []
+    for uid, value in entries:
+        disp = names.get(uid)
+        if isinstance(disp, str) and disp.strip() and disp != uid:
+            named.append((disp, uid, value))
+    top = heapq.nlargest(limit, named, key=lambda e: e[2])
+    return [(f"{fmt(value)} - {disp}", uid) for disp, uid, value in top]
+
+
+def piracy_views(piracy_rows: List[Dict[str, Any]], blackbox_rows: List[Dict[str, Any]],
+                 limit: int = LIMIT) -> Dict[str, List[Row]]:
+    """Views for the Piracy tab: uec_stolen, pirate_hits, fps_kills_ac, fps_kills_pu."""
+    stolen, hits, fps_ac, fps_pu = [], [], [], []
+    for r in piracy_rows or []:
+        uid = row_id(r, "player_id", "user_id")
+        stolen.append((uid, as_int(r.get("total_value"))))
+        hits.append((uid, as_int(r.get("hits_created"))))
+    for r in blackbox_rows or []:
+        uid = row_id(r, "user_id", "player_id")
+        fps_ac.append((uid, as_int(r.get("fps_kills_ac"))))
+        fps_pu.append((uid, as_int(r.get("fps_kills_pu"))))
+    names = resolve_names({uid for uid, _ in stolen + fps_ac})
+    return {
+        'uec_stolen': rank(stolen, names, limit),
+        'pirate_hits': rank(hits, names, limit),
+        'fps_kills_ac': rank(fps_ac, names, limit),
+        'fps_kills_pu': rank(fps_pu, names, limit),
+    }
+
+
+def dogfighting_views(blackbox_rows: List[Dict[str, Any]], limit: int = LIMIT) -> Dict[str, List[Row]]:
+    """Views for the Dogfighting tab: ac_rating, pu_damages, ship_kills_ac, ship_kills_pu.
+
+    Ship kills fall back to the fps_kills_* fields when ship_kills_* are absent.
+    """
+    rating, damages, ship_ac, ship_pu = [], [], [], []
+    for r in blackbox_rows or []:
+        uid = row_id(r, "user_id", "player_id")
+        rating.append((uid, as_float(r.get("rating"))))
+        damages.append((uid, as_number(r.get("value_pu"))))
+        ship_ac.append((uid, as_int(r.get("ship_kills_ac", r.get("fps_kills_ac")))))
+        ship_pu.append((uid, as_int(r.get("ship_kills_pu", r.get("fps_kills_pu")))))
+    names = resolve_names({uid for uid, _ in rating})
+    return {
+        'ac_rating': rank(rating, names, limit, fmt=format_rating),
+        'pu_damages': rank(damages, names, limit, fmt=format_money),
+        'ship_kills_ac': rank(ship_ac, names, limit),
+        'ship_kills_pu': rank(ship_pu, names, limit),
+    }
+
+
+def diff_rows(current: List[Row], new: List[Row]) -> Tuple[List[Tuple[int, Row]], int]:
+    """Edits turning `current` into `new`: ([(index, row) to replace or append], new length)."""
+    changes = [(i, row) for i, row in enumerate(new) if i >= len(current) or current[i] != row]
+    return changes, len(new)
@@ -0,0 +1,171 @@
+"""Rotating JSONL log file written by a background thread.
+
+Every message passed to `global_variables.log()` is also recorded here as one
+JSON object per line:
+    {"ts", "level", "thread", "msg", "suppressed"}
+so tracebacks and long sessions can be inspected after the window closes.
+Messages hidden from the console by `suppress_logs` (bulk backup imports) are
+still written, flagged with "suppressed": true.
+
+Files live in <data dir>/logs. When the active file exceeds MAX_BYTES it is
+renamed with a timestamp and gzip-compressed; only the newest BACKUP_COUNT
+archives are kept. Callers only enqueue; the writer thread does all disk I/O,
+and if it falls behind, new records are dropped (and counted) rather than
+blocking the caller.
+"""
+import atexit
+import glob
+import gzip
+import json
+import os
+import queue
+import shutil
+import threading
+from datetime import datetime, timezone
+from typing import Optional
+
+LOG_FILENAME = "beowulfhunter.jsonl"
+MAX_BYTES = 5 * 1024 * 1024
+BACKUP_COUNT = 10
+MAX_QUEUE = 10000
+# Max records written per wakeup before flushing
+WRITE_BATCH = 500
+
+
+class JsonlLogSink:
+    def __init__(self, directory: str, max_bytes: int = MAX_BYTES, backup_count: int = BACKUP_COUNT):
+        self.directory = directory
+        self.path = os.path.join(directory, LOG_FILENAME)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._queue: "queue.Queue[Optional[dict]]" = queue.Queue(maxsize=MAX_QUEUE)
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._file = None
+        self._thread = threading.Thread(target=self._run, name="log-sink", daemon=True)
+        self._thread.start()
+
+    # --- caller side ---
+    def write(self, message, level: str = 'info', suppressed: bool = False):
+        record = {
+            'ts': datetime.now(timezone.utc).isoformat(timespec='milliseconds'),
+            'level': level,
+            'thread': threading.current_thread().name,
+            'msg': str(message),
+        }
+        if suppressed:
+            record['suppressed'] = True
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped += 1
+
+    def close(self, timeout: float = 2.0):
+        """Flush pending records and stop the writer (called at exit)."""
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    # --- writer thread ---
+    def _open(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    def _rotate(self):
+        try:
+            self._file.close()
+        except Exception:
+            pass
+        self._file = None
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        rotated = os.path.join(self.directory, f"beowulfhunter-{stamp}.jsonl")
+        n = 1
+        while os.path.exists(rotated + '.gz'):
+            rotated = os.path.join(self.directory, f"beowulfhunter-{stamp}-{n}.jsonl")
+            n += 1
+        try:
+            os.replace(self.path, rotated)
+            with open(rotated, 'rb') as src, gzip.open(rotated + '.gz', 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            os.remove(rotated)
+        except Exception as e:
+            print(f"Log rotation failed: {e}")
+        archives = sorted(glob.glob(os.path.join(self.directory, "beowulfhunter-*.jsonl.gz")))
+        for old in archives[:-self.backup_count] if self.backup_count > 0 else archives:
+            try:
+                os.remove(old)
+            except Exception:
+                pass
+        self._open()
+
+    def _take_dropped(self) -> int:
+        with self._dropped_lock:
+            dropped, self._dropped = self._dropped, 0
+        return dropped
+
+    def _run(self):
+        try:
+            self._open()
+        except Exception as e:
+            print(f"Log file unavailable ({self.path}): {e}")
+            return
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            while len(batch) < WRITE_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            dropped = self._take_dropped()
+            if dropped:
+                batch.append({
+                    'ts': datetime.now(timezone.utc).isoformat(timespec='milliseconds'),
+                    'level': 'warning',
+                    'thread': 'log-sink',
+                    'msg': f"{dropped} log records dropped (writer behind)",
+                })
+            try:
+                for record in batch:
+                    if record is None:
+                        stopping = True
+                        continue
+                    self._file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                self._file.flush()
+                if self._file.tell() >= self.max_bytes:
+                    self._rotate()
+            except Exception as e:
+                print(f"Log file write failed: {e}")
+        try:
+            self._file.close()
+        except Exception:
+            pass
+
+
+_sink: Optional[JsonlLogSink] = None
+
+
+def install(directory: Optional[str] = None) -> Optional[JsonlLogSink]:
+    """Create the shared sink under <data dir>/logs and route global_variables.log to it."""
+    global _sink
+    if _sink is not None:
+        return _sink
+    import global_variables
+    try:
+        if directory is None:
+            from config import get_data_dir
+            directory = os.path.join(get_data_dir(), 'logs')
+        _sink = JsonlLogSink(directory)
+    except Exception as e:
+        global_variables.log(f"Structured log file disabled: {e}")
+        return None
+    global_variables.set_file_sink(_sink)
+    atexit.register(_sink.close)
+    return _sink
+
+
+def get_sink() -> Optional[JsonlLogSink]:
+    return _sink
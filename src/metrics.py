@@ -0,0 +1,335 @@
+"""Process-wide pipeline metrics: counters, gauges and latency histograms.
+
+Instrumented code records into named metrics, optionally split by labels:
+    metrics.counter('parser.lines').inc()
+    metrics.gauge('kill_queue.depth').set(n)
+    metrics.histogram('http.latency', endpoint='beowulf.reportkill').observe(seconds)
+    with metrics.timer('kill.scrape'):
+        ...
+
+All metrics are thread-safe and cheap to update (one lock, no I/O). The
+Diagnostics tab reads `snapshot()` once per second; `export_snapshot()` writes
+the same data as JSON under <data dir>/diagnostics.
+
+Names in use:
+    parser.lines                      counter    Game.log lines ingested (rate = lines/sec)
+    event_bus.dispatch_latency{topic} histogram  publish -> subscriber delivery
+    kill_queue.depth                  gauge      kills waiting for scrape/publish
+    kill_queue.wait                   histogram  time a kill spent queued
+    http.requests/errors{endpoint}    counter    per endpoint; errors are exceptions and HTTP >= 400
+    http.latency{endpoint}            histogram
+    cache.hits/misses{cache}          counter
+    tk.loop_lag                       histogram  Tk event loop delay beyond the scheduled time
+    tk.callback{callback}             histogram  run time of after() callbacks (tk_profiler)
+    tk.stalls                         counter    callbacks/handlers blocking the loop past the threshold
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+# Histogram bucket upper bounds, in seconds (last bucket is +Inf)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Recent observations kept per histogram for percentiles
+RESERVOIR_SIZE = 1024
+# Window used for counter rates, in seconds
+RATE_WINDOW = 10
+
+# Interval between Tk event loop lag probes
+TK_LAG_PROBE_MS = 250
+
+_started = time.monotonic()
+
+
+def _key(name: str, labels: Dict[str, Any]) -> str:
+    if not labels:
+        return name
+    inner = ','.join(f"{k}={labels[k]}" for k in sorted(labels))
+    return f"{name}{{{inner}}}"
+
+
+class Counter:
+    def __init__(self, name: str, labels: Dict[str, Any]):
+        self.name = name
+        self.labels = labels
+        self._lock = threading.Lock()
+        self._value = 0
+        # [second, count] buckets covering the last RATE_WINDOW seconds
+        self._recent: deque = deque()
+
+    def inc(self, n: int = 1):
+        sec = int(time.monotonic())
+        with self._lock:
+            self._value += n
+            if self._recent and self._recent[-1][0] == sec:
+                self._recent[-1][1] += n
+            else:
+                self._recent.append([sec, n])
+                while self._recent and self._recent[0][0] <= sec - RATE_WINDOW:
+                    self._recent.popleft()
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def rate(self) -> float:
+        """Events per second over the last RATE_WINDOW seconds."""
+        now = time.monotonic()
+        cutoff = int(now) - RATE_WINDOW
+        with self._lock:
+            total = sum(n for sec, n in self._recent if sec > cutoff)
+        window = min(RATE_WINDOW, max(now - _started, 1.0))
+        return total / window
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {'type': 'counter', 'value': self._value, 'rate': round(self.rate(), 3)}
+
+    def _reset(self):
+        with self._lock:
+            self._value = 0
+            self._recent.clear()
+
+
+class Gauge:
+    def __init__(self, name: str, labels: Dict[str, Any]):
+        self.name = name
+        self.labels = labels
+        self._lock = threading.Lock()
+        self._value = 0.0
+        self._max = 0.0
+
+    def set(self, value: float):
+        with self._lock:
+            self._value = value
+            if value > self._max:
+                self._max = value
+
+    def inc(self, n: float = 1):
+        with self._lock:
+            self._value += n
+            if self._value > self._max:
+                self._max = self._value
+
+    def dec(self, n: float = 1):
+        self.inc(-n)
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {'type': 'gauge', 'value': self._value, 'max': self._max}
+
+    def _reset(self):
+        with self._lock:
+            self._value = 0.0
+            self._max = 0.0
+
+
+class Histogram:
+    def __init__(self, name: str, labels: Dict[str, Any]):
+        self.name = name
+        self.labels = labels
+        self._lock = threading.Lock()
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self._recent: deque = deque(maxlen=RESERVOIR_SIZE)
+
+    def observe(self, value: float):
+        idx = len(LATENCY_BUCKETS)
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if value <= bound:
+                idx = i
+                break
+        with self._lock:
+            self._count += 1
+            self._sum += value
+            if value > self._max:
+                self._max = value
+            self._buckets[idx] += 1
+            self._recent.append(value)
+
+    @contextmanager
+    def time(self):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            count = self._count
+            total = self._sum
+            peak = self._max
+            buckets = list(self._buckets)
+            recent = sorted(self._recent)
+
+        def _pct(p):
+            if not recent:
+                return None
+            return round(recent[min(len(recent) - 1, int(p * len(recent)))], 6)
+
+        labels = [str(b) for b in LATENCY_BUCKETS] + ['+Inf']
+        return {
+            'type': 'histogram',
+            'count': count,
+            'mean': round(total / count, 6) if count else None,
+            'p50': _pct(0.50),
+            'p95': _pct(0.95),
+            'p99': _pct(0.99),
+            'max': round(peak, 6),
+            'buckets': {labels[i]: n for i, n in enumerate(buckets) if n},
+        }
+
+    def _reset(self):
+        with self._lock:
+            self._count = 0
+            self._sum = 0.0
+            self._max = 0.0
+            self._buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+            self._recent.clear()
+
+
+_lock = threading.Lock()
+_metrics: Dict[str, Any] = {}
+# name -> callable returning extra JSON-serializable data for snapshots
+_sections: Dict[str, Any] = {}
+
+
+def _get(cls, name: str, labels: Dict[str, Any]):
+    key = _key(name, labels)
+    metric = _metrics.get(key)
+    if metric is None:
+        with _lock:
+            metric = _metrics.get(key)
+            if metric is None:
+                metric = cls(name, dict(labels))
+                _metrics[key] = metric
+    if not isinstance(metric, cls):
+        raise TypeError(f"Metric {key} is a {type(metric).__name__}, not a {cls.__name__}")
+    return metric
+
+
+def counter(name: str, **labels) -> Counter:
+    return _get(Counter, name, labels)
+
+
+def gauge(name: str, **labels) -> Gauge:
+    return _get(Gauge, name, labels)
+
+
+def histogram(name: str, **labels) -> Histogram:
+    return _get(Histogram, name, labels)
+
+
+def timer(name: str, **labels):
+    """Context manager observing the elapsed seconds into histogram `name`."""
+    return histogram(name, **labels).time()
+
+
+def cache_lookup(cache: str, hit: bool):
+    """Record one cache lookup for the hit ratio of `cache`."""
+    counter('cache.hits' if hit else 'cache.misses', cache=cache).inc()
+
+
+def register_section(name: str, provider):
+    """Include `provider()` under snapshot()['sections'][name] (e.g., recent UI stalls)."""
+    with _lock:
+        _sections[name] = provider
+
+
+def reset():
+    """Zero every metric in place (the Diagnostics tab's Reset button).
+
+    Instrumented modules may hold metric objects, so they are cleared rather
+    than dropped from the registry. Each metric is zeroed under its own lock,
+    so updates racing the reset land either before or after it.
+    """
+    global _started
+    with _lock:
+        for m in _metrics.values():
+            m._reset()
+    _started = time.monotonic()
+
+
+def _derived(items) -> Dict[str, Any]:
+    """Ratios computed from paired counters: cache hit ratio and HTTP error rate."""
+    values = {key: m.value for key, m in items if isinstance(m, Counter)}
+    out: Dict[str, Any] = {}
+    caches = sorted({str(m.labels.get('cache')) for _, m in items if m.name in ('cache.hits', 'cache.misses')})
+    for cache in caches:
+        hits = values.get(_key('cache.hits', {'cache': cache}), 0)
+        misses = values.get(_key('cache.misses', {'cache': cache}), 0)
+        if hits + misses:
+            out[_key('cache.hit_ratio', {'cache': cache})] = round(hits / (hits + misses), 3)
+    for key, m in items:
+        if m.name == 'http.requests' and m.value:
+            endpoint = m.labels.get('endpoint')
+            errors = values.get(_key('http.errors', {'endpoint': endpoint}), 0)
+            out[_key('http.error_rate', {'endpoint': endpoint})] = round(errors / m.value, 3)
+    return out
+
+
+def snapshot() -> Dict[str, Any]:
+    """Current values of every metric, keyed by name{labels}, plus derived ratios and sections."""
+    with _lock:
+        items = sorted(_metrics.items())
+        sections = dict(_sections)
+    extra: Dict[str, Any] = {}
+    for name, provider in sections.items():
+        try:
+            extra[name] = provider()
+        except Exception as e:
+            extra[name] = {'error': str(e)}
+    return {
+        'taken_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'uptime_s': round(time.monotonic() - _started, 1),
+        'metrics': {key: m.snapshot() for key, m in items},
+        'derived': _derived(items),
+        'sections': extra,
+    }
+
+
+def export_snapshot(path: Optional[str] = None) -> str:
+    """Write `snapshot()` as JSON; defaults to <data dir>/diagnostics/metrics-<time>.json."""
+    if path is None:
+        from config import get_data_dir
+        directory = os.path.join(get_data_dir(), 'diagnostics')
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"metrics-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(snapshot(), f, indent=2, default=str)
+    return path
+
+
+def watch_tk_loop(app, interval_ms: int = TK_LAG_PROBE_MS):
+    """Sample Tk event loop lag: how late an `after(interval_ms)` callback runs."""
+    lag = histogram('tk.loop_lag')
+    state = {'due': 0.0}
+
+    def _probe():
+        now = time.perf_counter()
+        if state['due']:
+            lag.observe(max(0.0, now - state['due']))
+        state['due'] = now + interval_ms / 1000.0
+        try:
+            app.after(interval_ms, _probe)
+        except Exception:
+            pass
+
+    try:
+        app.after(interval_ms, _probe)
+        state['due'] = time.perf_counter() + interval_ms / 1000.0
+    except Exception:
+        pass
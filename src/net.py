@@ -0,0 +1,319 @@
+"""Instrumented HTTP helpers.
+
+Outbound requests go through `request()` (or `get()`/`post()`) so latency,
+request counts and errors are recorded per endpoint in the metrics registry and
+shown in the Diagnostics tab. Behaviour is otherwise identical to `requests`:
+the Response is returned as-is and exceptions propagate.
+
+`endpoint` is a short, stable label such as 'beowulf.reportkill'. When omitted
+it defaults to the URL's host only, so keys or player names embedded in paths
+never end up in metric names.
+
+Every host has a circuit breaker. After FAILURE_THRESHOLD consecutive failures
+(connection errors, timeouts, 5xx) it opens and requests to that host raise
+CircuitOpenError at once instead of waiting out their timeouts. CircuitOpenError
+is a requests ConnectionError, so existing `except RequestException` handling
+treats it as the network error it stands for. Once the open period has passed
+one request is let through as a probe (half-open): success closes the breaker,
+failure reopens it for twice as long, up to OPEN_MAX_SECONDS. Transitions are
+published as event_bus.TOPIC_NETWORK and kept in the gauge
+http.breaker_open{host}; `breaker_status()` lists the hosts currently offline.
+
+Requests are also admitted by priority class (`priority=`, highest first):
+
+    publish       kill reports and hit submissions
+    enrichment    kill enrichment scrapes; the default for unlabelled calls
+    prefetch      proximity feed / overlay profiles and avatars
+    leaderboards  IronPoint reads (leaderboards, hit form data)
+    thumbnails    avatar thumbnails and other cosmetic fetches (update check)
+
+At most MAX_IN_FLIGHT requests run at once, each class within
+CLASS_LIMITS, and the classes below enrichment leave RESERVED_SLOTS free so a
+kill report never queues behind images. A waiting request only starts when no
+higher class is waiting for a slot. When the link is slow (moving average of
+request time above SLOW_LINK_SECONDS) the classes below enrichment drop to one
+request each. While the game is under load (kills being processed or
+reported) leaderboards and thumbnails are deferred for up to
+DEFER_MAX_SECONDS. Calls made on the Tk main thread are never held back, so
+the UI cannot freeze behind the gate. Queue time is recorded in
+http.queue_wait{priority} and running requests in http.in_flight{priority}.
+"""
+import threading
+import time
+from typing import Any, Dict, List
+from urllib.parse import urlparse
+
+import requests
+
+import global_variables
+import metrics
+
+FAILURE_THRESHOLD = 5
+OPEN_BASE_SECONDS = 15
+OPEN_MAX_SECONDS = 5 * 60
+# Statuses that mean the host (not the request) is failing
+FAILURE_STATUSES = (500, 502, 503, 504)
+
+PRIORITIES = ('publish', 'enrichment', 'prefetch', 'leaderboards', 'thumbnails')
+DEFAULT_PRIORITY = 'enrichment'
+MAX_IN_FLIGHT = 8
+CLASS_LIMITS = {'publish': 4, 'enrichment': 3, 'prefetch': 2, 'leaderboards': 3, 'thumbnails': 2}
+RESERVED_SLOTS = 2
+DEFERRABLE = ('leaderboards', 'thumbnails')
+DEFER_MAX_SECONDS = 30.0
+SLOW_LINK_SECONDS = 2.0
+# Weight of the newest request in the request-time moving average
+LATENCY_ALPHA = 0.2
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised without sending while the breaker for `host` is open."""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"{host} is offline (circuit open); next attempt in {int(retry_in)}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+_breaker_lock = threading.Lock()
+# host -> {'state': 'closed'|'open'|'half_open', 'failures', 'opened_at', 'open_for', 'probing'}
+_breakers: Dict[str, Dict[str, Any]] = {}
+
+
+_gate = threading.Condition()
+_in_flight: Dict[str, int] = {p: 0 for p in PRIORITIES}
+_waiting: Dict[str, int] = {p: 0 for p in PRIORITIES}
+_avg_seconds = 0.0
+
+
+def _default_endpoint(url: str) -> str:
+    try:
+        return urlparse(url).netloc or 'unknown'
+    except Exception:
+        return 'unknown'
+
+
+def _breaker(host: str) -> Dict[str, Any]:
+    breaker = _breakers.get(host)
+    if breaker is None:
+        breaker = _breakers[host] = {'state': 'closed', 'failures': 0, 'opened_at': 0.0,
+                                     'open_for': OPEN_BASE_SECONDS, 'probing': False}
+    return breaker
+
+
+def _retry_in(breaker: Dict[str, Any]) -> float:
+    return max(0.0, breaker['opened_at'] + breaker['open_for'] - time.time())
+
+
+def _transition(host: str, breaker: Dict[str, Any], state: str):
+    """Set the state (caller holds _breaker_lock) and announce it outside the lock."""
+    breaker['state'] = state
+    if state == 'open':
+        breaker['opened_at'] = time.time()
+    retry_in = _retry_in(breaker) if state == 'open' else 0.0
+
+    def _announce():
+        metrics.gauge('http.breaker_open', host=host).set(0 if state == 'closed' else 1)
+        if state == 'open':
+            global_variables.log(f"{host} is unreachable; pausing requests to it for {round(retry_in)}s.")
+        elif state == 'closed':
+            global_variables.log(f"{host} is reachable again.")
+        try:
+            import event_bus
+            event_bus.publish(event_bus.TOPIC_NETWORK, host=host, state=state, retry_in=retry_in)
+        except Exception:
+            pass
+    return _announce
+
+
+def _before_request(host: str):
+    """Raise CircuitOpenError when `host` must not be contacted now; may claim the half-open probe."""
+    announce = None
+    with _breaker_lock:
+        breaker = _breaker(host)
+        if breaker['state'] == 'closed':
+            return
+        if breaker['probing'] or _retry_in(breaker) > 0:
+            metrics.counter('http.breaker_rejected', host=host).inc()
+            raise CircuitOpenError(host, _retry_in(breaker))
+        breaker['probing'] = True
+        if breaker['state'] != 'half_open':
+            announce = _transition(host, breaker, 'half_open')
+    if announce:
+        announce()
+
+
+def _after_request(host: str, outcome: str):
+    """Record 'ok', 'failure' or 'neutral' (the request failed for its own reasons)."""
+    announce = None
+    with _breaker_lock:
+        breaker = _breaker(host)
+        probing, breaker['probing'] = breaker['probing'], False
+        if outcome == 'ok':
+            breaker['failures'] = 0
+            breaker['open_for'] = OPEN_BASE_SECONDS
+            if breaker['state'] != 'closed':
+                announce = _transition(host, breaker, 'closed')
+        elif outcome == 'failure':
+            breaker['failures'] += 1
+            if breaker['state'] == 'half_open' and probing:
+                breaker['open_for'] = min(OPEN_MAX_SECONDS, breaker['open_for'] * 2)
+                announce = _transition(host, breaker, 'open')
+            elif breaker['state'] == 'closed' and breaker['failures'] >= FAILURE_THRESHOLD:
+                breaker['open_for'] = OPEN_BASE_SECONDS
+                announce = _transition(host, breaker, 'open')
+        elif breaker['state'] == 'half_open' and probing:
+            # Inconclusive probe: wait another open period at the same length
+            announce = _transition(host, breaker, 'open')
+    if announce:
+        announce()
+
+
+def breaker_status() -> List[Dict[str, Any]]:
+    """Hosts whose breaker is not closed: [{host, state, failures, retry_in}], sorted by host."""
+    with _breaker_lock:
+        return [{'host': host, 'state': b['state'], 'failures': b['failures'], 'retry_in': _retry_in(b)}
+                for host, b in sorted(_breakers.items()) if b['state'] != 'closed']
+
+
+def is_offline(url: str) -> bool:
+    """True while the breaker for `url`'s host is open (requests to it fail fast)."""
+    host = _default_endpoint(url)
+    with _breaker_lock:
+        breaker = _breakers.get(host)
+        return breaker is not None and breaker['state'] != 'closed'
+
+
+def reset_breakers():
+    """Close every breaker (used by tests and benchmarks between scenarios)."""
+    with _breaker_lock:
+        hosts = [h for h, b in _breakers.items() if b['state'] != 'closed']
+        _breakers.clear()
+    for host in hosts:
+        metrics.gauge('http.breaker_open', host=host).set(0)
+
+
+def _slow_link() -> bool:
+    return _avg_seconds > SLOW_LINK_SECONDS
+
+
+def _under_load() -> bool:
+    if _in_flight['publish'] or _waiting['publish']:
+        return True
+    try:
+        return global_variables.get_kill_processing_count() > 0
+    except Exception:
+        return False
+
+
+def _class_limit(priority: str) -> int:
+    """Concurrent requests allowed for `priority` right now (caller holds _gate)."""
+    if PRIORITIES.index(priority) > 1 and _slow_link():
+        return 1
+    return CLASS_LIMITS[priority]
+
+
+def _can_start(priority: str, defer: bool) -> bool:
+    """Whether a `priority` request may start now (caller holds _gate)."""
+    rank = PRIORITIES.index(priority)
+    if _in_flight[priority] >= _class_limit(priority):
+        return False
+    total_cap = MAX_IN_FLIGHT if rank <= 1 else MAX_IN_FLIGHT - RESERVED_SLOTS
+    if sum(_in_flight.values()) >= total_cap:
+        return False
+    # Higher classes waiting on the shared slots go first
+    for higher in PRIORITIES[:rank]:
+        if _waiting[higher] and _in_flight[higher] < _class_limit(higher):
+            return False
+    if defer and priority in DEFERRABLE and _under_load():
+        return False
+    return True
+
+
+def _acquire(priority: str):
+    """Block until a `priority` request may start (never on the Tk main thread)."""
+    started = time.perf_counter()
+    deferred = False
+    with _gate:
+        if threading.current_thread() is not threading.main_thread():
+            _waiting[priority] += 1
+            try:
+                while True:
+                    waited = time.perf_counter() - started
+                    defer = waited < DEFER_MAX_SECONDS
+                    if _can_start(priority, defer):
+                        break
+                    if defer and priority in DEFERRABLE and _under_load():
+                        deferred = True
+                    # Load is external state (kill count), so re-check periodically as well
+                    _gate.wait(timeout=0.5)
+            finally:
+                _waiting[priority] -= 1
+        _in_flight[priority] += 1
+        running = _in_flight[priority]
+    wait = time.perf_counter() - started
+    metrics.histogram('http.queue_wait', priority=priority).observe(wait)
+    metrics.gauge('http.in_flight', priority=priority).set(running)
+    if deferred:
+        metrics.counter('http.deferred', priority=priority).inc()
+
+
+def _release(priority: str, elapsed: float):
+    global _avg_seconds
+    with _gate:
+        _in_flight[priority] -= 1
+        running = _in_flight[priority]
+        _avg_seconds += LATENCY_ALPHA * (elapsed - _avg_seconds)
+        _gate.notify_all()
+    metrics.gauge('http.in_flight', priority=priority).set(running)
+
+
+def scheduler_status() -> Dict[str, Any]:
+    """Snapshot for diagnostics: in_flight and waiting per class, avg_seconds, slow_link, under_load."""
+    with _gate:
+        return {'in_flight': dict(_in_flight), 'waiting': dict(_waiting), 'avg_seconds': _avg_seconds,
+                'slow_link': _slow_link(), 'under_load': _under_load()}
+
+
+def request(method: str, url: str, endpoint: str = None, priority: str = None, **kwargs) -> requests.Response:
+    """Send a request with `requests.request`, recording metrics under `endpoint`.
+
+    Waits for a slot in `priority`'s class (default DEFAULT_PRIORITY). Raises
+    CircuitOpenError without sending or waiting while `url`'s host is offline.
+    """
+    label = endpoint or _default_endpoint(url)
+    host = _default_endpoint(url)
+    priority = priority if priority in CLASS_LIMITS else DEFAULT_PRIORITY
+    _before_request(host)
+    try:
+        _acquire(priority)
+    except BaseException:
+        _after_request(host, 'neutral')
+        raise
+    metrics.counter('http.requests', endpoint=label).inc()
+    started = time.perf_counter()
+    try:
+        resp = requests.request(method, url, **kwargs)
+    except Exception as e:
+        elapsed = time.perf_counter() - started
+        _release(priority, elapsed)
+        metrics.histogram('http.latency', endpoint=label).observe(elapsed)
+        metrics.counter('http.errors', endpoint=label).inc()
+        network = isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+        _after_request(host, 'failure' if network else 'neutral')
+        raise
+    elapsed = time.perf_counter() - started
+    _release(priority, elapsed)
+    metrics.histogram('http.latency', endpoint=label).observe(elapsed)
+    if resp.status_code >= 400:
+        metrics.counter('http.errors', endpoint=label).inc()
+    _after_request(host, 'failure' if resp.status_code in FAILURE_STATUSES else 'ok')
+    return resp
+
+
+def get(url: str, endpoint: str = None, priority: str = None, **kwargs) -> requests.Response:
+    return request('GET', url, endpoint=endpoint, priority=priority, **kwargs)
+
+
+def post(url: str, endpoint: str = None, priority: str = None, **kwargs) -> requests.Response:
+    return request('POST', url, endpoint=endpoint, priority=priority, **kwargs)
@@ -8,7 +8,8 @@ import threading
 import io
 from typing import Optional, Dict, Any
 
-import requests  # type: ignore
+import endpoints
+import net
 from PIL import Image, ImageTk  # type: ignore
 
 class OverlayManager:
@@ -177,7 +178,7 @@ class OverlayManager:
         try:
             if key in self._avatar_cache:
                 return self._avatar_cache.get(key)
-            r = requests.get(url, timeout=6)
+            r = net.get(url, priority='prefetch', timeout=6)
             if r.status_code != 200:
                 return None
             im = Image.open(io.BytesIO(r.content)).convert('RGBA')
@@ -201,10 +202,10 @@ class OverlayManager:
                 return (cached.get('org_img_url'), cached.get('avatar_url'), cached.get('org_name'))
             except Exception:
                 pass
-        url = f"https://robertsspaceindustries.com/en/citizens/{handle}"
+        url = endpoints.citizen_url(handle)
         try:
             headers = {"User-Agent": "BeowulfHunter/1.0 (overlay)", "Accept": "text/html,application/xhtml+xml"}
-            r = requests.get(url, headers=headers, timeout=6)
+            r = net.get(url, endpoint='rsi.citizen', priority='prefetch', headers=headers, timeout=6)
             if r.status_code != 200:
                 return (None, None, None)
             html = r.text
@@ -214,7 +215,7 @@ class OverlayManager:
             def _abs(u):
                 if not u:
                     return None
-                return ("https://robertsspaceindustries.com" + u) if str(u).startswith('/') else u
+                return endpoints.rsi_url(str(u))
             avatar_url = _abs(m_avatar.group(1)) if m_avatar else None
             orgimg_url = _abs(m_orgimg.group(1)) if m_orgimg else None
             org_name = m_orgname.group(1).strip() if m_orgname else None
@@ -7,6 +7,13 @@ import time
 import re
 import queue
 import global_variables
+import kill_sync
+import event_bus
+import metrics
+import endpoints
+import net
+import profiling
+import submission_queue
 # Support both running with 'src' on sys.path (top-level import) and package imports
 try:
     from rsi_profile_scraper import scrape_profile_images  # when 'src' is on sys.path
@@ -21,7 +28,12 @@ local_version = "7.0"
 api_key = {"value": None}
 # Cache of kills fetched from the API for the current run. Stored as set of
 # (victim, timestamp) tuples for fast duplicate checks by other functions.
-api_kills_cache = set()
+# This is the kill_sync store's duplicate set, kept up to date in place.
+api_kills_cache = kill_sync.duplicate_keys
+# Reuse a kill sync younger than this instead of hitting the API again
+KILL_SYNC_REUSE_SECONDS = 30.0
+# submission_queue kind for live kills that could not be reported (offline / server errors)
+KILL_SUBMISSION_KIND = 'kill'
 
 # Debounce tracking for proximity events
 _actor_stall_last_times = {}      # player -> last posted epoch (actor stall)
@@ -53,17 +65,18 @@ last_vehicle_context = {
 kill_processing_queue = queue.Queue()
 _kill_worker_started = False
 _last_scrape_ts = 0.0
+# Minimum spacing of RSI profile scrapes; load tests against the stand-in server lower it
+SCRAPE_INTERVAL_SECONDS = 1.0
 
+# Pipeline metrics (see metrics.py; shown in the Diagnostics tab)
+_lines_ingested = metrics.counter('parser.lines')
+_kill_queue_depth = metrics.gauge('kill_queue.depth')
+_kill_queue_wait = metrics.histogram('kill_queue.wait')
 
-def _update_processing_ui():
+
+def _publish_processing_count():
     try:
-        app = global_variables.get_app()
-        refs = global_variables.get_main_tab_refs()
-        updater = refs.get('update_processing_label')
-        if app is not None and callable(updater):
-            app.after(0, updater)
-        elif callable(updater):
-            updater()
+        event_bus.publish(event_bus.TOPIC_PROCESSING_COUNT, count=global_variables.get_kill_processing_count())
     except Exception:
         pass
 
@@ -76,14 +89,22 @@ def _ensure_kill_worker():
         global _last_scrape_ts
         while True:
             item = kill_processing_queue.get()
+            profiling.tick()
+            _kill_queue_depth.set(kill_processing_queue.qsize())
+            try:
+                enqueued_at = item.get('enqueued_at')
+                if enqueued_at is not None:
+                    _kill_queue_wait.observe(time.perf_counter() - enqueued_at)
+            except Exception:
+                pass
             try:
                 victim = item.get('victim')
-                # Enforce 1 req/sec before scraping
+                # Space scrapes at least SCRAPE_INTERVAL_SECONDS apart (1 req/sec by default)
                 now = time.time()
                 delta = now - _last_scrape_ts
-                if delta < 1.0:
+                if delta < SCRAPE_INTERVAL_SECONDS:
                     try:
-                        time.sleep(1.0 - delta)
+                        time.sleep(SCRAPE_INTERVAL_SECONDS - delta)
                     except Exception:
                         pass
                 _last_scrape_ts = time.time()
@@ -101,7 +122,9 @@ def _ensure_kill_worker():
                 json_data['victim_image'] = victim_image
 
                 try:
-                    publish_kill(json_data, suppress_logs=False)
+                    ok, info = publish_kill(json_data, suppress_logs=False, return_error=True)
+                    if not ok:
+                        _queue_unsent_kill(json_data, info)
                 except Exception:
                     pass
                 # Refresh overlay after new kill
@@ -137,16 +160,6 @@ def _ensure_kill_worker():
                         pass
                 except Exception:
                     pass
-                _refresh_overlay_safe()
-                try:
-                    v = json_data.get('victim') or 'Victim'
-                    ship_used = json_data.get('killers_ship') if (json_data.get('killers_ship') and json_data.get('killers_ship') != 'N/A') else None
-                    if ship_used:
-                        _append_proximity_line(f"[KILL] {v} ({ship_used})")
-                    else:
-                        _append_proximity_line(f"[KILL] {v}")
-                except Exception:
-                    pass
 
                 # Create API-like record and append to combined list
                 dt = (str(json_data.get('damage_type') or '')).lower()
@@ -171,26 +184,17 @@ def _ensure_kill_worker():
                     'org_picture': org_picture,
                     'victim_image': victim_image,
                 }
-                try:
-                    existing = []
-                    try:
-                        existing = list(global_variables.get_api_kills_all() or [])
-                    except Exception:
-                        existing = []
-                    existing.append(api_like)
-                    global_variables.set_api_kills_all(existing)
-                except Exception:
-                    pass
+                # Shared kill store republishes the combined list and duplicate set
+                kill_sync.add_local_kill(api_like)
 
-                # Refresh UI columns
+                # Kill list, overlay and proximity feed update from the event
                 try:
-                    app = global_variables.get_app()
-                    refs = global_variables.get_main_tab_refs()
-                    refresh = refs.get('refresh_kill_columns')
-                    if app is not None and callable(refresh):
-                        app.after(0, refresh)
-                    elif callable(refresh):
-                        refresh()
+                    event_bus.publish(
+                        event_bus.TOPIC_KILL,
+                        victim=json_data.get('victim'),
+                        ship=api_like.get('ship_used'),
+                        timestamp=json_data.get('time'),
+                    )
                 except Exception:
                     pass
             finally:
@@ -198,50 +202,17 @@ def _ensure_kill_worker():
                     global_variables.dec_kill_processing_count(1)
                 except Exception:
                     pass
-                _update_processing_ui()
+                _publish_processing_count()
                 try:
                     kill_processing_queue.task_done()
                 except Exception:
                     pass
+                profiling.tick()
 
     t = threading.Thread(target=_worker, daemon=True)
     t.start()
     _kill_worker_started = True
 
-# Overlay refresh helpers
-def _refresh_overlay_safe():
-    try:
-        from overlay_window import refresh_overlay  # type: ignore
-    except Exception:
-        refresh_overlay = None
-    try:
-        if refresh_overlay:
-            refresh_overlay()
-    except Exception:
-        pass
-
-def _append_proximity_line(text: str):
-    """Append a line to the Proximity tab large text box if available.
-
-    Safe from any thread: schedules via app.after when possible.
-    """
-    try:
-        refs = global_variables.get_proximity_tab_refs() or {}
-        fn = refs.get('append_report_line')
-        if not callable(fn):
-            return
-        app = global_variables.get_app()
-        if app is not None:
-            try:
-                app.after(0, lambda: fn(text))
-            except Exception:
-                fn(text)
-        else:
-            fn(text)
-    except Exception:
-        pass
-
-
 @global_variables.log_exceptions
 def update_vehicle_destruction_context(line, rsi_name=None):
     """Parse a '<Vehicle Destruction>' log line and, if caused by the local player,
@@ -312,141 +283,12 @@ def get_user_kills_from_api(user_id):
     Returns a set of (victim, time) tuples for quick duplicate checking. If
     anything goes wrong or the response format is unexpected, an empty set
     is returned and parsing proceeds normally.
-    """
-    # If caller didn't provide a user_id, try to read it from global variables
-    if not user_id:
-        try:
-            user_id = global_variables.get_user_id()
-        except Exception:
-            user_id = None
-
-    if not user_id:
-        return set()
-
-    url = f"https://beowulf.ironpoint.org/api/blackbox/user?user_id={user_id}"
-    headers = {}
-    if api_key.get('value'):
-        headers['Authorization'] = api_key['value']
-
-    try:
-        resp = requests.get(url, headers=headers, timeout=10)
-        if resp.status_code != 200:
-            global_variables.log(f"Failed to fetch user kills: {resp.status_code}")
-            return set()
-        data = resp.json()
-        # Diagnostic: log top-level response shape so we can adapt to API formats
-        try:
-            if isinstance(data, dict):
-                keys = list(data.keys())
-            else:
-                keys = None
-            # global_variables.log(f"API response type: {type(data).__name__}, top-level keys: {keys}")
-        except Exception:
-            pass
-    except Exception as e:
-        global_variables.log(f"Error fetching user kills from API: {e}")
-        return set()
-
-    kills = set()
-    try:
-        # support a few common response shapes
-        if isinstance(data, dict):
-            candidates = data.get('kills') or data.get('data') or data.get('results') or data.get('items') or []
-        elif isinstance(data, list):
-            candidates = data
-        else:
-            candidates = []
-
-        # clear existing cache for fresh fetch
-        try:
-            api_kills_cache.clear()
-        except Exception:
-            pass
 
-        # Diagnostics counters for debugging why items may be dropped
-        non_dict_items = 0
-        missing_time = 0
-        missing_victim = 0
-        added = 0
-
-        for item in candidates:
-            if not isinstance(item, dict):
-                non_dict_items += 1
-                continue
-
-            # Victim(s) may be provided as a single field or as a list under 'victims'
-            victims = []
-            if 'victims' in item and isinstance(item.get('victims'), (list, tuple)):
-                victims = item.get('victims')
-            else:
-                v = item.get('victim') or item.get('victim_name') or item.get('victimName')
-                if v:
-                    victims = [v]
-
-            # Timestamp can appear under several keys; prefer 'timestamp'
-            time_val = item.get('timestamp') or item.get('time') or item.get('kill_time') or item.get('timestamp')
-            if not time_val:
-                missing_time += 1
-                # if no time value, skip adding for duplicate detection
-                continue
-
-            time_str = str(time_val).strip()
-            if not victims:
-                missing_victim += 1
-            for victim in victims:
-                if not victim:
-                    missing_victim += 1
-                    continue
-                victim_str = str(victim).strip()
-                key = (victim_str, time_str)
-                kills.add(key)
-                try:
-                    api_kills_cache.add(key)
-                except Exception:
-                    # best-effort caching; don't break parsing for cache failures
-                    pass
-                added += 1
-    except Exception as e:
-        global_variables.log(f"Unexpected API response format when parsing kills: {e}")
-
-    # Diagnostic summary about items processed / skipped
-    try:
-        try:
-            candidates_len = len(candidates) if 'candidates' in locals() and candidates is not None else 'N/A'
-        except Exception:
-            candidates_len = 'N/A'
-        # global_variables.log(f"API candidates: {candidates_len}, added: {added}, non-dict: {non_dict_items}, missing_time: {missing_time}, missing_victim: {missing_victim}")
-        # Show a small sample of candidate items for inspection
-        try:
-            sample = candidates[:5] if isinstance(candidates, (list, tuple)) else None
-            # if sample:
-            #     global_variables.log(f"API candidates sample (first up to 5): {sample}")
-        except Exception:
-            pass
-    except Exception:
-        pass
-
-    # global_variables.log(f"Fetched {len(kills)} existing kills for user_id {user_id}")
-    # Debug: log the actual kills retrieved for easier troubleshooting.
-    # try:
-    #     if kills:
-    #         # Convert to a stable list and limit the output length to avoid
-    #         # spamming the UI if the set is large.
-    #         kills_list = list(kills)
-    #         display_count = 100
-    #         if len(kills_list) > display_count:
-    #             try:
-    #                 global_variables.log(f"API kills (first {display_count} of {len(kills_list)}): {kills_list[:display_count]}")
-    #             except Exception:
-    #                 print(f"API kills (first {display_count} of {len(kills_list)}): {kills_list[:display_count]}")
-    #         else:
-    #             try:
-    #                 global_variables.log(f"API kills: {kills_list}")
-    #             except Exception:
-    #                 print(f"API kills: {kills_list}")
-    # except Exception:
-    #     pass
-    return kills
+    Backed by the shared kill store in kill_sync: a snapshot synced within
+    KILL_SYNC_REUSE_SECONDS is reused, otherwise only newer kills are fetched.
+    """
+    kill_sync.sync(user_id, delta=True, max_age=KILL_SYNC_REUSE_SECONDS)
+    return set(api_kills_cache)
 
 
 @global_variables.log_exceptions
@@ -460,156 +302,9 @@ def fetch_and_classify_api_kills_for_ui(user_id=None):
 
     Returns (pu_list, ac_list).
     """
-    # Try to use configured user id if not provided
-    if not user_id:
-        try:
-            user_id = global_variables.get_user_id()
-        except Exception:
-            user_id = None
-
-    # If no user_id, nothing to fetch
-    if not user_id:
-        global_variables.set_api_kills_data([])
-        global_variables.set_api_kills_split([], [])
-        return ([], [])
-
-    # Ensure API key header ready
-    try:
-        key = global_variables.get_key()
-        api_key['value'] = key
-    except Exception:
-        pass
-
-    # Build request
-    url = f"https://beowulf.ironpoint.org/api/blackbox/user?user_id={user_id}"
-    headers = {}
-    if api_key.get('value'):
-        headers['Authorization'] = api_key['value']
-
-    data = None
-    try:
-        resp = requests.get(url, headers=headers, timeout=10)
-        if resp.status_code != 200:
-            global_variables.log(f"Failed to fetch user kills: {resp.status_code}")
-            global_variables.set_api_kills_data([])
-            global_variables.set_api_kills_split([], [])
-            return ([], [])
-        data = resp.json()
-    except Exception as e:
-        global_variables.log(f"Error fetching user kills from API: {e}")
-        global_variables.set_api_kills_data([])
-        global_variables.set_api_kills_split([], [])
-        return ([], [])
-
-    # Determine candidate list
-    if isinstance(data, dict):
-        candidates = data.get('kills') or data.get('data') or data.get('results') or data.get('items') or []
-    elif isinstance(data, list):
-        candidates = data
-    else:
-        candidates = []
-
-    normalized = []
-    api_like_items = []  # for api_kills_all schema
-    for item in candidates:
-        if not isinstance(item, dict):
-            continue
-        # Extract with fallbacks
-        victim = item.get('victim') or item.get('victim_name') or item.get('victimName')
-        if not victim and isinstance(item.get('victims'), (list, tuple)) and item.get('victims'):
-            try:
-                victim = item.get('victims')[0]
-            except Exception:
-                victim = None
-        time_val = item.get('timestamp') or item.get('time') or item.get('kill_time') or item.get('timestamp')
-        zone = item.get('zone') or item.get('location') or item.get('map')
-        weapon = item.get('weapon') or item.get('weapon_name')
-        game_mode_val = item.get('game_mode') or item.get('mode') or item.get('gameMode')
-        killers_ship = item.get('killers_ship') or item.get('ship') or item.get('ship_name')
-        # ship_killed indicates FPS vs ship kill per API; keep raw value
-        ship_killed = item.get('ship_killed') or item.get('shipKilled') or item.get('ship-killed')
-        damage_type = item.get('damage_type') or item.get('damageType')
-        org_sid = item.get('org_sid') or item.get('orgSid') or item.get('organization_sid')
-        org_picture = item.get('org_picture') or item.get('orgImage') or item.get('organization_image')
-        victim_image = item.get('victim_image') or item.get('victimImage') or item.get('profile_image') or item.get('profileImage')
-        # API-like fields commonly present; include with safe fallbacks
-        id_val = item.get('id') or item.get('_id') or None
-        user_id_val = item.get('user_id') or item.get('userId') or None
-        ship_used = item.get('ship_used') or item.get('killers_ship') or item.get('ship') or None
-        patch = item.get('patch') or None
-        value = item.get('value') if isinstance(item.get('value'), int) else 0
-        kill_count = item.get('kill_count') if isinstance(item.get('kill_count'), int) else 1
-        victims_list = item.get('victims') if isinstance(item.get('victims'), list) else ([victim] if victim else [])
-
-        rec = {
-            'victim': str(victim).strip() if victim else None,
-            'time': str(time_val).strip() if time_val else None,
-            'zone': str(zone).strip() if zone else None,
-            'weapon': str(weapon).strip() if weapon else None,
-            'game_mode': str(game_mode_val).strip() if game_mode_val else None,
-            'killers_ship': str(killers_ship).strip() if killers_ship else None,
-            'damage_type': str(damage_type).strip() if damage_type else None,
-            'ship_killed': str(ship_killed).strip() if ship_killed is not None else None,
-            'org_sid': str(org_sid).strip() if org_sid else None,
-            'org_picture': str(org_picture).strip() if org_picture else None,
-            'victim_image': str(victim_image).strip() if victim_image else None,
-            'source': 'api'
-        }
-        # Skip entries with neither victim nor time; insufficient for display
-        if not rec['victim'] and not rec['time']:
-            continue
-        normalized.append(rec)
-
-        # Build API-like record for combined list
-        # Map to API-like schema used by UI combined list, and include location/coordinates if present
-        loc_val = item.get('location') or item.get('zone') or item.get('map')
-        coords_val = item.get('coordinates') or item.get('coords')
-        api_item = {
-            'id': str(id_val) if id_val is not None else None,
-            'user_id': str(user_id_val) if user_id_val is not None else None,
-            'ship_used': str(ship_used).strip() if ship_used else None,
-            'ship_killed': str(ship_killed).strip() if ship_killed is not None else None,
-            'value': int(value) if isinstance(value, int) else 0,
-            'kill_count': int(kill_count) if isinstance(kill_count, int) else 1,
-            'victims': victims_list,
-            'patch': str(patch) if patch is not None else None,
-            'game_mode': str(game_mode_val).strip() if game_mode_val else None,
-            'timestamp': str(time_val).strip() if time_val else None,
-            # Optional extras consumed by Details view
-            'location': str(loc_val).strip() if loc_val else None,
-            'coordinates': str(coords_val).strip() if coords_val else None,
-            'org_sid': str(org_sid).strip() if org_sid else None,
-            'org_picture': str(org_picture).strip() if org_picture else None,
-            'victim_image': str(victim_image).strip() if victim_image else None,
-        }
-        api_like_items.append(api_item)
-
-    # Heuristic split: prefer explicit game_mode; fallback to zone/map cues
-    pu_list, ac_list = [], []
-    for rec in normalized:
-        gm = (rec.get('game_mode') or '').lower()
-        z = (rec.get('zone') or '').lower()
-        is_ac = False
-        # Common AC indicators
-        if gm in ('arena_commander', 'ac', 'electronic_access', 'ea_starfighter', 'ea_duel', 'ea_freeflight', 'ea_vanduul_swarm'):
-            is_ac = True
-        elif 'arena' in z or 'dying star' in z or 'broken moon' in z or 'electronic access' in z:
-            is_ac = True
-        # Default to PU if not matched as AC
-        if is_ac:
-            ac_list.append(rec)
-        else:
-            pu_list.append(rec)
-
-    # Store for UI
-    global_variables.set_api_kills_data(normalized)
-    global_variables.set_api_kills_split(pu_list, ac_list)
-    # Also store the API-like combined list
-    try:
-        global_variables.set_api_kills_all(api_like_items)
-    except Exception:
-        pass
-    return (pu_list, ac_list)
+    kill_sync.sync(user_id, max_age=KILL_SYNC_REUSE_SECONDS)
+    pu_list, ac_list = kill_sync.get_split()
+    return (list(pu_list), list(ac_list))
 
 
 @global_variables.log_exceptions
@@ -621,22 +316,7 @@ def refresh_api_kills_cache(user_id=None):
     The function returns the cached set of (victim, timestamp) tuples.
     """
     try:
-        kills = get_user_kills_from_api(user_id)
-        try:
-            api_kills_cache.clear()
-        except Exception:
-            pass
-        try:
-            for k in kills:
-                api_kills_cache.add(k)
-        except Exception:
-            pass
-
-        # try:
-        #     global_variables.log(f"API kills cache refreshed: {len(api_kills_cache)} entries")
-        # except Exception:
-        #     pass
-
+        kill_sync.sync(user_id, delta=True, max_age=KILL_SYNC_REUSE_SECONDS)
         return api_kills_cache
     except Exception as e:
         try:
@@ -722,6 +402,7 @@ def tail_log(log_file_location, rsi_name):
         where = sc_log.tell()
         bline = sc_log.readline()
         if not bline:
+            profiling.tick()
             time.sleep(1)
             sc_log.seek(where)
             if last_log_file_size > os.stat(log_file_location).st_size:
@@ -865,6 +546,8 @@ def parse_backup_logs(backup_dir, rsi_name, user_id=None, progress_callback=None
         duplicates_count = 0
         uploaded_count = 0
         uploaded_kills = []
+        # API-like records of published kills, recorded in the kill store/history in one batch
+        uploaded_records = []
 
         for idx, fname in enumerate(files):
             fpath = os.path.join(backup_dir, fname)
@@ -997,6 +680,28 @@ def parse_backup_logs(backup_dir, rsi_name, user_id=None, progress_callback=None
                                                         uploaded_kills.append(parsed)
                                                     except Exception:
                                                         pass
+                                                    try:
+                                                        ks = json_data.get('killers_ship')
+                                                        uploaded_records.append({
+                                                            'id': None,
+                                                            'user_id': str(user_id) if user_id else None,
+                                                            'ship_used': ks if (ks and ks != 'N/A') else None,
+                                                            'ship_killed': None,
+                                                            'value': 0,
+                                                            'kill_count': 1,
+                                                            'victims': [json_data['victim']] if json_data.get('victim') else [],
+                                                            'patch': None,
+                                                            'game_mode': json_data.get('game_mode'),
+                                                            'timestamp': json_data.get('time'),
+                                                            'zone': json_data.get('zone'),
+                                                            'location': json_data.get('location'),
+                                                            'coordinates': json_data.get('coordinates'),
+                                                            'org_sid': None,
+                                                            'org_picture': None,
+                                                            'victim_image': None,
+                                                        })
+                                                    except Exception:
+                                                        pass
                                                 else:
                                                     # If sending failed, still keep local aggregated record for reporting
                                                     try:
@@ -1024,6 +729,12 @@ def parse_backup_logs(backup_dir, rsi_name, user_id=None, progress_callback=None
         global_variables.log(f"Error in parse_backup_logs: {e}")
         return (0, 0, 0, 0)
 
+    # Make the newly published kills visible (and persisted) without waiting for a resync
+    try:
+        kill_sync.add_local_kills(uploaded_records, source='backup')
+    except Exception:
+        pass
+
     # After successfully parsing all files, compute summary of kills
     total_kills = 0
     failed_uploads = 0
@@ -1129,15 +840,13 @@ def parse_kill_line(line, target_name):
     # Queue for processing (scrape then publish and display)
     try:
         _ensure_kill_worker()
-        kill_processing_queue.put({'victim': killed, 'json_data': json_data})
+        kill_processing_queue.put({'victim': killed, 'json_data': json_data, 'enqueued_at': time.perf_counter()})
+        _kill_queue_depth.set(kill_processing_queue.qsize())
         try:
             global_variables.inc_kill_processing_count(1)
         except Exception:
             pass
-        try:
-            _update_processing_ui()
-        except Exception:
-            pass
+        _publish_processing_count()
     except Exception as e:
         global_variables.log(f"Failed to enqueue kill for processing: {e}")
 
@@ -1197,6 +906,31 @@ def parse_kill_local(line, target_name, suppress_logs=False):
         return None
 
 
+def _queue_unsent_kill(json_data, info):
+    """Hand a live kill the API could not take (network, breaker open, 408/429/5xx) to the outbox."""
+    info = info or {}
+    status = info.get('status')
+    if status is None and info.get('message') == "No API key configured":
+        return
+    if status is not None and status not in submission_queue.RETRYABLE_STATUSES:
+        return
+    item_id = f"{json_data.get('time')}-{json_data.get('victim')}"
+    if submission_queue.enqueue(KILL_SUBMISSION_KIND, item_id, json_data):
+        global_variables.log(f"Kill of {json_data.get('victim')} queued; it will be sent when the API is reachable.")
+
+
+def _send_queued_kill(payload):
+    return publish_kill(payload, suppress_logs=True, return_error=True, play_sound=False)
+
+
+def _kill_sender_ready():
+    # Without a key every send fails the same way; hold queued kills until one is set
+    return bool(global_variables.get_key())
+
+
+submission_queue.register_sender(KILL_SUBMISSION_KIND, _send_queued_kill, ready=_kill_sender_ready)
+
+
 @global_variables.log_exceptions
 def send_kill_to_api(json_data, suppress_logs=False, return_error=False):
     """Send a kill JSON payload to the API.
@@ -1214,9 +948,11 @@ def send_kill_to_api(json_data, suppress_logs=False, return_error=False):
 
 
 @global_variables.log_exceptions
-def publish_kill(json_data, suppress_logs=False, return_error=False):
+def publish_kill(json_data, suppress_logs=False, return_error=False, play_sound=True):
     """Centralized publish function used by live and backup flows.
 
+    `play_sound=False` skips the kill sound (kills delivered later from the outbox).
+
     Returns:
       - If return_error is False (default): True on success (HTTP 200/201), else False.
       - If return_error is True: (success: bool, error_info: Optional[dict]).
@@ -1241,8 +977,10 @@ def publish_kill(json_data, suppress_logs=False, return_error=False):
     }
 
     try:
-        response = requests.post(
-            "https://beowulf.ironpoint.org/api/reportkill",
+        response = net.post(
+            f"{endpoints.BEOWULF_API}/reportkill",
+            endpoint='beowulf.reportkill',
+            priority='publish',
             headers=headers,
             data=json.dumps(json_data),
             timeout=15
@@ -1252,7 +990,7 @@ def publish_kill(json_data, suppress_logs=False, return_error=False):
                 global_variables.log("Kill logged.")
             # Play kill sound if enabled
             try:
-                if global_variables.get_play_kill_sound():
+                if play_sound and global_variables.get_play_kill_sound():
                     _play_kill_sound()
             except Exception:
                 pass
@@ -1349,6 +1087,8 @@ def set_game_mode(line):
 
 @global_variables.log_exceptions
 def read_log_line(line, rsi_name, upload_kills):
+    _lines_ingested.inc()
+    profiling.tick()
     if -1 != line.find("<Context Establisher Done>"):
         set_game_mode(line)
     elif -1 != line.find(rsi_name):
@@ -1601,12 +1341,7 @@ def parse_actor_stall_event(line: str):
         global_variables.add_actor_stall_event({'timestamp': ts, 'player': player})
         _actor_stall_last_times[player] = now
         _request_proximity_sound('actor_stall')
-        _update_player_events_ui()
-        _refresh_overlay_safe()
-        try:
-            _append_proximity_line(f"[NEAR] {player}")
-        except Exception:
-            pass
+        event_bus.publish(event_bus.TOPIC_NEARBY, player=player, timestamp=ts)
     except Exception:
         pass
 
@@ -1659,42 +1394,8 @@ def parse_fake_hit_event(line: str):
     except Exception:
         pass
     _request_proximity_sound('fake_hit')
-    _update_player_events_ui()
-    _refresh_overlay_safe()
-    try:
-        if from_player and player and ship_clean:
-            _append_proximity_line(f"[SNARE] {from_player} -> {player} ({ship_clean})")
-        elif from_player and player:
-            _append_proximity_line(f"[SNARE] {from_player} -> {player}")
-        elif player and ship_clean:
-            _append_proximity_line(f"[SNARE] {player} ({ship_clean})")
-        elif player:
-            _append_proximity_line(f"[SNARE] {player}")
-    except Exception:
-        pass
-
-
-def _update_player_events_ui():
-    """Schedule UI update for player events area if available."""
     try:
-        # Prefer Proximity tab refs when available; fallback to Main tab
-        refs = {}
-        try:
-            refs = global_variables.get_proximity_tab_refs() or {}
-        except Exception:
-            refs = {}
-        if not refs:
-            refs = global_variables.get_main_tab_refs()
-        app = global_variables.get_app()
-        refresh = refs.get('refresh_player_events')
-        if callable(refresh):
-            if app is not None:
-                try:
-                    app.after(0, refresh)
-                    return
-                except Exception:
-                    pass
-            refresh()
+        event_bus.publish(event_bus.TOPIC_SNARE, player=player, from_player=from_player, ship=ship_clean, timestamp=ts)
     except Exception:
         pass
 
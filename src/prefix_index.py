@@ -0,0 +1,44 @@
+"""Sorted, case-insensitive prefix index for inline autocomplete.
+
+Names are kept sorted by their lower-cased form, so the first match for a
+prefix is found with bisect and the matches are the contiguous run after it:
+O(log n + k) per keystroke instead of scanning every option.
+"""
+from bisect import bisect_left
+from typing import Iterable, List
+
+
+class PrefixIndex:
+    __slots__ = ('_keys', '_names')
+
+    def __init__(self, names: Iterable[str] = ()):
+        entries = sorted((name.lower(), name) for name in set(names) if name)
+        self._keys = [e[0] for e in entries]
+        self._names = [e[1] for e in entries]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def names(self) -> List[str]:
+        """Every name, sorted case-insensitively."""
+        return list(self._names)
+
+    def search(self, prefix: str, limit: int = 10, exclude: Iterable[str] = ()) -> List[str]:
+        """Up to `limit` names starting with `prefix` (case-insensitive), in name order.
+
+        Names in `exclude` (e.g. entries already added) are skipped.
+        """
+        key = (prefix or '').lower()
+        if not key or limit <= 0:
+            return []
+        skip = set(exclude) if exclude else ()
+        out: List[str] = []
+        i = bisect_left(self._keys, key)
+        while i < len(self._keys) and self._keys[i].startswith(key):
+            name = self._names[i]
+            if name not in skip:
+                out.append(name)
+                if len(out) >= limit:
+                    break
+            i += 1
+        return out
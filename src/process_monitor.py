@@ -0,0 +1,170 @@
+"""Shared Star Citizen process monitor.
+
+The game indicator, crash detection and log discovery used to run their own
+`psutil.process_iter` scans (every second, on separate threads), each one
+enumerating every process on the machine. This monitor scans once to find the
+game and launcher, then only checks that the remembered processes are still
+alive via their psutil handles. While the game is not running, the monitor
+thread rescans at a slower cadence; other processes (the launcher) are only
+looked up on demand.
+
+Subscribers receive game start/stop events on the monitor thread:
+    monitor.subscribe(lambda running, exe: ...)
+UI subscribers must marshal to Tk themselves (app.after).
+"""
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import psutil
+
+import global_variables
+
+GAME_PROCESS_NAME = "StarCitizen"
+LAUNCHER_PROCESS_NAME = "RSI Launcher"
+
+# Liveness check cadence for known processes (cheap)
+CHECK_INTERVAL = 1.0
+# Full process scan cadence while the game is not found
+SCAN_INTERVAL = 3.0
+
+
+class ProcessMonitor:
+    def __init__(self):
+        self._lock = threading.RLock()
+        # name -> psutil.Process for processes found by the last scan
+        self._procs: Dict[str, psutil.Process] = {}
+        self._exes: Dict[str, Optional[str]] = {}
+        self._last_scan = 0.0
+        self._last_game_check = 0.0
+        self._game_running: Optional[bool] = None
+        self._subscribers: List[Callable[[bool, Optional[str]], None]] = []
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    # --- public API ---
+    def start(self):
+        """Start the background monitor thread (idempotent)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="process-monitor", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def subscribe(self, callback: Callable[[bool, Optional[str]], None]):
+        """Register `callback(running, exe)` for game start/stop transitions."""
+        with self._lock:
+            if callback not in self._subscribers:
+                self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            try:
+                self._subscribers.remove(callback)
+            except ValueError:
+                pass
+
+    def is_game_running(self) -> Optional[str]:
+        """Return the game executable path if Star Citizen is running, else None."""
+        # While the monitor thread runs (or right after a check), the state is at most CHECK_INTERVAL old
+        monitoring = self._thread is not None and self._thread.is_alive()
+        fresh = time.monotonic() - self._last_game_check < CHECK_INTERVAL
+        if self._game_running is None or not (monitoring or fresh):
+            self._check((GAME_PROCESS_NAME,), force_scan=True)
+        return self.get_exe(GAME_PROCESS_NAME)
+
+    def find_processes(self, *names: str) -> Dict[str, Optional[str]]:
+        """Return name -> executable path (or None) for each name, with at most one scan.
+
+        Remembered processes are only checked for liveness; names not found are
+        remembered afterwards, so later calls are cheap while they keep running.
+        """
+        self._check(names, force_scan=True)
+        with self._lock:
+            return {n: self._exes.get(n) for n in names}
+
+    def get_exe(self, name: str) -> Optional[str]:
+        with self._lock:
+            return self._exes.get(name)
+
+    # --- internals ---
+    def _check(self, names, force_scan: bool = False):
+        """Update tracked processes; scans only for names whose process is gone."""
+        now = time.monotonic()
+        with self._lock:
+            missing = []
+            for name in names:
+                proc = self._procs.get(name)
+                alive = False
+                if proc is not None:
+                    try:
+                        # is_running() also guards against PID reuse (compares create time)
+                        alive = proc.is_running() and proc.status() != psutil.STATUS_ZOMBIE
+                    except Exception:
+                        alive = False
+                if not alive:
+                    self._procs.pop(name, None)
+                    self._exes[name] = None
+                    missing.append(name)
+            if missing and (force_scan or now - self._last_scan >= SCAN_INTERVAL):
+                if GAME_PROCESS_NAME in missing:
+                    self._last_scan = now
+                for name, (proc, exe) in _scan(tuple(missing)).items():
+                    self._procs[name] = proc
+                    self._exes[name] = exe
+            if GAME_PROCESS_NAME not in names:
+                return
+            self._last_game_check = now
+            running = self._exes.get(GAME_PROCESS_NAME) is not None
+            changed = self._game_running is not None and running != self._game_running
+            self._game_running = running
+            exe = self._exes.get(GAME_PROCESS_NAME)
+            subscribers = list(self._subscribers) if changed else []
+        for cb in subscribers:
+            try:
+                cb(running, exe)
+            except Exception as e:
+                global_variables.log(f"Process monitor subscriber failed: {e}")
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self._check((GAME_PROCESS_NAME,), force_scan=self._game_running is None)
+            except Exception as e:
+                global_variables.log(f"Process monitor check failed: {e}")
+            self._stop.wait(CHECK_INTERVAL)
+
+
+def _scan(names) -> Dict[str, tuple]:
+    """One pass over the process table; returns name -> (Process, exe) for the first match of each."""
+    found = {}
+    wanted = [(n, n.lower()) for n in names]
+    for proc in psutil.process_iter(['pid', 'name', 'exe']):
+        try:
+            pname = (proc.info.get('name') or '').lower()
+        except Exception:
+            continue
+        for name, needle in wanted:
+            if name not in found and needle in pname:
+                found[name] = (proc, proc.info.get('exe'))
+        if len(found) == len(wanted):
+            break
+    return found
+
+
+_monitor: Optional[ProcessMonitor] = None
+_monitor_lock = threading.Lock()
+
+
+def get_monitor() -> ProcessMonitor:
+    """Return the shared process monitor (not started until `start()` is called)."""
+    global _monitor
+    if _monitor is None:
+        with _monitor_lock:
+            if _monitor is None:
+                _monitor = ProcessMonitor()
+    return _monitor
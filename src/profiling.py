@@ -0,0 +1,252 @@
+"""On-demand CPU and memory profiling for long-running sessions.
+
+A profiling session runs for a fixed window and writes its reports to
+<data dir>/profiles/<timestamp>/:
+
+    cpu-<thread>.prof / .txt   cProfile data (open with snakeviz or pstats) and
+                               the top functions by cumulative time
+    mem-NNN.txt                tracemalloc top allocations, diffed against the
+                               previous snapshot and the session start
+    mem-final.txt              full-window allocation growth
+
+Sessions are started by:
+    - BEOWULFHUNTER_PROFILE=<seconds> (or 1 for DEFAULT_SECONDS) at startup,
+    - the `profile_on_start=<seconds>` extended setting in killtracker_key.cfg,
+    - the Profile button in the Diagnostics tab.
+
+cProfile only sees the thread that enabled it on Python < 3.12, so the long
+running loops (Game.log tail, kill worker, Tk loop) call `tick()`, which
+enables a per-thread profiler while a session is active and disables it once
+the window ends. Outside a session `tick()` is a single global check. On
+Python 3.12+ one profiler covers every thread and `tick()` does nothing.
+"""
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Dict, Optional
+
+import global_variables
+
+DEFAULT_SECONDS = 300
+# Seconds between tracemalloc snapshots
+MEMORY_SNAPSHOT_INTERVAL = 60
+# Frames kept per allocation traceback
+MEMORY_FRAMES = 10
+TOP_ALLOCATIONS = 40
+TOP_FUNCTIONS = 60
+# Interval of the Tk tick that keeps the Tk thread's profiler in step
+TK_TICK_MS = 500
+
+# On 3.12+ cProfile uses sys.monitoring: one enabled profiler sees all threads
+_GLOBAL_PROFILER = sys.version_info >= (3, 12)
+
+
+class ProfileSession:
+    def __init__(self, seconds: float, directory: str):
+        self.seconds = seconds
+        self.directory = directory
+        self.started = time.monotonic()
+        self.ends = self.started + seconds
+        self._lock = threading.Lock()
+        # thread name -> Profile (per thread before 3.12; a single 'all' entry after)
+        self._profilers: Dict[str, cProfile.Profile] = {}
+        self._owners: Dict[int, str] = {}
+        self._stopped = threading.Event()
+        self._started_tracemalloc = False
+        self._baseline = None
+        self._previous = None
+        self._mem_index = 0
+
+    @property
+    def active(self) -> bool:
+        return not self._stopped.is_set() and time.monotonic() < self.ends
+
+    def remaining(self) -> float:
+        return max(0.0, self.ends - time.monotonic())
+
+    # --- CPU ---
+    def tick(self):
+        """Enable or disable the calling thread's profiler to match the session window."""
+        ident = threading.get_ident()
+        if self.active:
+            if ident in self._owners:
+                return
+            name = threading.current_thread().name
+            profiler = cProfile.Profile()
+            with self._lock:
+                key = name if name not in self._profilers else f"{name}-{ident}"
+                self._profilers[key] = profiler
+                self._owners[ident] = key
+            try:
+                profiler.enable()
+            except Exception as e:
+                global_variables.log(f"Profiler could not start on {name}: {e}")
+        elif ident in self._owners:
+            with self._lock:
+                key = self._owners.pop(ident)
+                profiler = self._profilers.get(key)
+            if profiler is not None:
+                profiler.disable()
+
+    # --- memory ---
+    def _memory_snapshot(self, label: str):
+        snap = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        current, peak = tracemalloc.get_traced_memory()
+        out = [f"tracemalloc {label}: current {current / 1e6:.1f} MB, peak {peak / 1e6:.1f} MB", ""]
+        if self._previous is not None:
+            out.append(f"Top {TOP_ALLOCATIONS} changes since previous snapshot:")
+            out.extend(str(s) for s in snap.compare_to(self._previous, 'lineno')[:TOP_ALLOCATIONS])
+            out.append("")
+        if self._baseline is not None:
+            out.append(f"Top {TOP_ALLOCATIONS} changes since session start:")
+            out.extend(str(s) for s in snap.compare_to(self._baseline, 'lineno')[:TOP_ALLOCATIONS])
+            out.append("")
+        out.append(f"Top {TOP_ALLOCATIONS} allocations:")
+        out.extend(str(s) for s in snap.statistics('lineno')[:TOP_ALLOCATIONS])
+        if self._baseline is None:
+            self._baseline = snap
+        self._previous = snap
+        self._write(f"mem-{label}.txt", "\n".join(out) + "\n")
+
+    # --- lifecycle ---
+    def _write(self, filename: str, text: str):
+        with open(os.path.join(self.directory, filename), 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def run(self):
+        """Session thread: memory snapshots every interval, then reports at the end."""
+        os.makedirs(self.directory, exist_ok=True)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(MEMORY_FRAMES)
+            self._started_tracemalloc = True
+        if _GLOBAL_PROFILER:
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+                self._profilers['all'] = profiler
+            except Exception as e:
+                global_variables.log(f"Profiler could not start: {e}")
+        try:
+            self._memory_snapshot(f"{self._mem_index:03d}")
+            while not self._stopped.wait(min(MEMORY_SNAPSHOT_INTERVAL, max(self.remaining(), 0.1))):
+                if not self.active:
+                    break
+                self._mem_index += 1
+                self._memory_snapshot(f"{self._mem_index:03d}")
+            self._stopped.set()
+            self._memory_snapshot("final")
+        except Exception as e:
+            global_variables.log(f"Memory profiling failed: {e}")
+        finally:
+            self._stopped.set()
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+        self._write_cpu_reports()
+        global_variables.log(f"Profile written to {self.directory}")
+
+    def _write_cpu_reports(self):
+        with self._lock:
+            profilers = dict(self._profilers)
+        for name, profiler in profilers.items():
+            safe = "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+            try:
+                # Threads that have not ticked since the window ended (a kill
+                # worker waiting on an empty queue) are read as they are now.
+                stats = pstats.Stats(profiler)
+                stats.dump_stats(os.path.join(self.directory, f"cpu-{safe}.prof"))
+                buf = io.StringIO()
+                pstats.Stats(profiler, stream=buf).sort_stats('cumulative').print_stats(TOP_FUNCTIONS)
+                self._write(f"cpu-{safe}.txt", buf.getvalue())
+            except Exception as e:
+                global_variables.log(f"Could not write CPU profile for {name}: {e}")
+
+    def stop(self):
+        self._stopped.set()
+
+
+_session: Optional[ProfileSession] = None
+_session_lock = threading.Lock()
+
+
+def tick():
+    """Called from long-running loops; keeps this thread's profiler in step with the session."""
+    session = _session
+    if session is None or _GLOBAL_PROFILER:
+        return
+    session.tick()
+
+
+def is_active() -> bool:
+    session = _session
+    return session is not None and session.active
+
+
+def get_session() -> Optional[ProfileSession]:
+    return _session
+
+
+def start(seconds: float = DEFAULT_SECONDS, app=None) -> Optional[ProfileSession]:
+    """Start a profiling session for `seconds`; returns None if one is already running."""
+    global _session
+    with _session_lock:
+        if _session is not None and _session.active:
+            return None
+        from config import get_data_dir
+        directory = os.path.join(get_data_dir(), 'profiles', datetime.now().strftime('%Y%m%d-%H%M%S'))
+        session = ProfileSession(float(seconds), directory)
+        _session = session
+    threading.Thread(target=session.run, name="profiler", daemon=True).start()
+    if app is not None and not _GLOBAL_PROFILER:
+        _tick_tk(app, session)
+    global_variables.log(f"Profiling for {int(seconds)}s; reports go to {directory}")
+    return session
+
+
+def stop():
+    """End the running session early; reports are written by the session thread."""
+    session = _session
+    if session is not None:
+        session.stop()
+
+
+def _tick_tk(app, session: ProfileSession):
+    session.tick()
+    if session.active:
+        try:
+            app.after(TK_TICK_MS, lambda: _tick_tk(app, session))
+        except Exception:
+            pass
+    else:
+        # One more tick after the window so the Tk thread's profiler is disabled
+        session.tick()
+
+
+def start_from_config(app=None) -> Optional[ProfileSession]:
+    """Start a session if BEOWULFHUNTER_PROFILE or the profile_on_start setting asks for one."""
+    value = os.environ.get('BEOWULFHUNTER_PROFILE')
+    if not value:
+        try:
+            import keys
+            value = keys.extended_settings.get('profile_on_start')
+        except Exception:
+            value = None
+    if not value or value.strip().lower() in ('0', 'false', 'no', 'off'):
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        seconds = DEFAULT_SECONDS if value.strip().lower() in ('true', 'yes', 'on') else 0
+    if seconds == 1:
+        seconds = DEFAULT_SECONDS
+    if seconds <= 0:
+        return None
+    return start(seconds, app=app)
@@ -0,0 +1,151 @@
+"""Visibility-aware refresh of the Piracy and Dogfighting leaderboards.
+
+The tabs no longer fetch when they are built. The scheduler refreshes a tab:
+
+- when it becomes the selected notebook tab and its data is older than
+  SHOW_MIN_AGE seconds (flipping between tabs does not refetch);
+- while it stays selected, whenever its data is older than
+  global_variables.get_leaderboard_max_age() (extended setting
+  `leaderboard_max_age`, default 5 minutes);
+- when a background cache refresh replaced its data (`data_changed`); a hidden
+  tab is only marked stale and refreshes the next time it is shown.
+
+A failed refresh is retried after RETRY_BASE_SECONDS, doubling up to
+RETRY_MAX_SECONDS. No scheduled refresh starts while the game is fight-heavy:
+a kill or interdiction in the last FIGHT_WINDOW_SECONDS, or kills still being
+reported. The network and CPU go to the kill pipeline, and refreshes due in
+that time run once it is quiet. The tabs' own Refresh buttons are unaffected.
+
+Each tab's refs must provide `refresh(on_done)`, which calls `on_done(ok)`
+from any thread once its fetch finished.
+"""
+import time
+from typing import Any, Callable, Dict, Optional
+
+import event_bus
+import global_variables
+import metrics
+
+TICK_MS = 15000
+SHOW_MIN_AGE = 30
+RETRY_BASE_SECONDS = 30
+RETRY_MAX_SECONDS = 15 * 60
+FIGHT_WINDOW_SECONDS = 90
+
+
+class RefreshScheduler:
+    def __init__(self, app, notebook):
+        self.app = app
+        self.notebook = notebook
+        self._tabs: Dict[str, Dict[str, Any]] = {}
+        self._last_fight = 0.0
+        try:
+            notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed, add='+')
+        except Exception:
+            pass
+        event_bus.subscribe((event_bus.TOPIC_KILL, event_bus.TOPIC_SNARE), self._on_fight_events)
+        self._schedule_tick()
+
+    # --- public API ---
+    def register(self, name: str, frame, get_refs: Callable[[], Optional[Dict[str, Any]]]):
+        """Manage tab `name`; `get_refs()` returns its refs once the tab is built."""
+        self._tabs[name] = {
+            'frame': frame,
+            'get_refs': get_refs,
+            'loaded_at': 0.0,     # when data last loaded successfully (0 = never / stale)
+            'running': False,
+            'failures': 0,
+            'retry_at': 0.0,
+        }
+
+    def in_fight(self) -> bool:
+        if time.time() - self._last_fight < FIGHT_WINDOW_SECONDS:
+            return True
+        return global_variables.get_kill_processing_count() > 0
+
+    def data_changed(self, names=None):
+        """The cached data behind `names` (default: all tabs) changed; refresh the visible one."""
+        for name, tab in self._tabs.items():
+            if names is None or name in names:
+                tab['loaded_at'] = 0.0
+        visible = self._visible()
+        if visible and (names is None or visible in names):
+            self._maybe_refresh(visible, 'data_changed', min_age=0)
+
+    # --- internals ---
+    def _visible(self) -> Optional[str]:
+        try:
+            selected = str(self.notebook.select())
+        except Exception:
+            return None
+        for name, tab in self._tabs.items():
+            if str(tab['frame']) == selected:
+                return name
+        return None
+
+    def _on_fight_events(self, _events):
+        self._last_fight = time.time()
+
+    def _on_tab_changed(self, _evt=None):
+        name = self._visible()
+        if name:
+            self._maybe_refresh(name, 'shown', min_age=SHOW_MIN_AGE)
+
+    def _schedule_tick(self):
+        try:
+            self.app.after(TICK_MS, self._tick)
+        except Exception:
+            pass
+
+    def _tick(self):
+        try:
+            name = self._visible()
+            if name:
+                self._maybe_refresh(name, 'max_age', min_age=global_variables.get_leaderboard_max_age())
+        finally:
+            self._schedule_tick()
+
+    def _maybe_refresh(self, name: str, reason: str, min_age: float):
+        tab = self._tabs.get(name)
+        refs = tab['get_refs']() if tab else None
+        refresh = (refs or {}).get('refresh')
+        if not callable(refresh) or tab['running']:
+            return
+        now = time.time()
+        if now - tab['loaded_at'] < min_age:
+            return
+        if now < tab['retry_at']:
+            metrics.counter('refresh_scheduler.skipped', tab=name, reason='backoff').inc()
+            return
+        if self.in_fight():
+            metrics.counter('refresh_scheduler.skipped', tab=name, reason='fight').inc()
+            return
+        tab['running'] = True
+        metrics.counter('refresh_scheduler.refreshes', tab=name, reason=reason).inc()
+        try:
+            refresh(on_done=lambda ok: self._done_threadsafe(name, ok))
+        except Exception as e:
+            global_variables.log(f"Scheduled {name} refresh failed: {e}")
+            self._done(name, False)
+
+    def _done_threadsafe(self, name: str, ok: bool):
+        try:
+            self.app.after(0, self._done, name, ok)
+        except Exception:
+            self._done(name, ok)
+
+    def _done(self, name: str, ok: bool):
+        tab = self._tabs.get(name)
+        if tab is None:
+            return
+        tab['running'] = False
+        if ok:
+            tab['loaded_at'] = time.time()
+            tab['failures'] = 0
+            tab['retry_at'] = 0.0
+            return
+        tab['failures'] += 1
+        delay = min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * (2 ** (tab['failures'] - 1)))
+        tab['retry_at'] = time.time() + delay
+        metrics.counter('refresh_scheduler.failures', tab=name).inc()
+        global_variables.log(f"{name} leaderboards refresh failed; retrying in {delay}s.")
@@ -4,6 +4,9 @@ from urllib.parse import quote
 
 import requests
 
+import endpoints
+import net
+
 # Regex patterns to find the first <img src="..."> after the titled sections
 PROFILE_RE = re.compile(
     r'<span class="title">\s*Profile\s*</span>.*?<img\s+src="([^"]+)"',
@@ -18,7 +21,7 @@ ORG_RE = re.compile(
 def _abs_url(u: str) -> str | None:
     if not u:
         return None
-    return ("https://robertsspaceindustries.com" + u) if u.startswith("/") else u
+    return endpoints.rsi_url(u)
 
 
 def scrape_profile_images(handle: str, retry: int = 1, timeout: int = 7) -> tuple[None | str, None | str]:
@@ -29,7 +32,7 @@ def scrape_profile_images(handle: str, retry: int = 1, timeout: int = 7) -> tupl
     h = (handle or "").strip()
     if not h:
         return (None, None)
-    url = f"https://robertsspaceindustries.com/en/citizens/{quote(h, safe='')}"
+    url = endpoints.citizen_url(quote(h, safe=''))
     headers = {
         "User-Agent": "BeowulfHunter/1.0 (lightweight)",
         "Accept": "text/html,application/xhtml+xml",
@@ -37,7 +40,7 @@ def scrape_profile_images(handle: str, retry: int = 1, timeout: int = 7) -> tupl
 
     def _try_once():
         try:
-            resp = requests.get(url, headers=headers, timeout=timeout)
+            resp = net.get(url, endpoint='rsi.citizen', priority='enrichment', headers=headers, timeout=timeout)
         except requests.RequestException:
             return (None, None, None)
         if resp.status_code == 404:
@@ -1,5 +1,4 @@
 import os
-import requests
 import webbrowser
 import tkinter as tk
 import tkinter.font as tkFont
@@ -7,7 +6,6 @@ from tkinter import ttk
 from tkinter import scrolledtext
 import sys
 from packaging import version
-from PIL import Image, ImageTk
 from config import set_sc_log_location, get_player_name, find_rsi_handle, is_game_running
 from keys import validate_api_key, save_api_key, load_existing_key
 import keys as keys_module
@@ -17,14 +15,22 @@ from filelock import FileLock, Timeout
 import tempfile
 import threading
 import time
+import importlib
 import parser
+from lazy_loader import LazyTabs
+from refresh_scheduler import RefreshScheduler
+import event_bus
+import metrics
+import endpoints
+import net
+import validation_cache
+from startup import get_orchestrator
 from tabs import main_tab as main_tab_builder
-from tabs import piracy_tab as piracy_tab_builder
-from tabs import dogfighting_tab as dogfighting_tab_builder
-from tabs import proximity_tab as proximity_tab_builder
 from tabs import log_tab as log_tab_builder
+# Piracy, Dogfighting and Proximity tabs are imported and built on first selection
 from controllers.key_controller import KeyController
 from controllers.game_controller import GameController
+from controllers.network_controller import NetworkController
 from theme import BUTTON_STYLE, apply_ttk_styles
 
 local_version = "7.0"  # Local app version used for update check
@@ -54,8 +60,8 @@ def setup_gui(game_running):
     except Exception:
         banner_path = None
 
-    # Check for Updates
-    update_message = check_for_updates()
+    # Startup network work (update check, key validation, kill sync) runs in the background
+    orchestrator = get_orchestrator(app)
 
     # No separate header; tabs will occupy the full window with tabs at the top
     header_frame = None
@@ -69,7 +75,7 @@ def setup_gui(game_running):
     except Exception:
         pass
 
-    # Tabs: Main, Piracy, Dogfighting, Log
+    # Tabs: Main, Piracy, Dogfighting, Proximity, Log, Diagnostics
     notebook = ttk.Notebook(app, style='Dark.TNotebook')
     try:
         notebook.configure(takefocus=0)
@@ -84,12 +90,14 @@ def setup_gui(game_running):
     dogfighting_tab = ttk.Frame(notebook, style='Dark.TFrame')
     proximity_tab = ttk.Frame(notebook, style='Dark.TFrame')
     log_tab = ttk.Frame(notebook, style='Dark.TFrame')
+    diagnostics_tab = ttk.Frame(notebook, style='Dark.TFrame')
 
     notebook.add(main_tab, text="Main")
     notebook.add(piracy_tab, text="Piracy")
     notebook.add(dogfighting_tab, text="Dogfighting")
     notebook.add(proximity_tab, text="Proximity")
     notebook.add(log_tab, text="Log")
+    notebook.add(diagnostics_tab, text="Diagnostics")
     # Make the notebook fill the entire application window
     notebook.pack(padx=0, pady=0, fill=tk.BOTH, expand=True)
 
@@ -101,27 +109,45 @@ def setup_gui(game_running):
         'dogfighting': dogfighting_tab,
         'proximity': proximity_tab,
         'log': log_tab,
+        'diagnostics': diagnostics_tab,
     })
 
     # Build each tab's contents via modular builders
-    main_refs = main_tab_builder.build(main_tab, app, banner_path=banner_path, update_message=update_message, on_update_click=open_github)
+    main_refs = main_tab_builder.build(main_tab, app, banner_path=banner_path, update_message=None, on_update_click=open_github)
     setattr(app, 'main_tab_refs', main_refs)
     try:
         global_variables.set_app(app)
         global_variables.set_main_tab_refs(main_refs)
     except Exception:
         pass
+
+    # Check for Updates (result shown on the Main tab when it arrives)
+    def _show_update_message(message):
+        setter = main_refs.get('set_update_message')
+        if message and callable(setter):
+            setter(message)
+
+    orchestrator.submit('update_check', 'checking for updates', check_for_updates, on_result=_show_update_message)
+
+    # Patch, summary, latest hits and users for the Piracy/Dogfighting tabs, fetched once
+    # and shared with their first refresh (see ironpoint_api.prefetch_startup)
+    def _prefetch_leaderboards():
+        import ironpoint_api
+        return ironpoint_api.prefetch_startup()
+
+    orchestrator.submit('leaderboards', 'loading leaderboards', _prefetch_leaderboards)
+
+    # Deliver hit submissions queued in a previous session
+    def _start_submission_queue():
+        import ironpoint_api  # registers the hit sender on import
+        import submission_queue
+        submission_queue.start()
+
+    orchestrator.submit('submissions', 'resuming queued submissions', _start_submission_queue)
     log_refs = log_tab_builder.build(log_tab, app)
-    piracy_refs = piracy_tab_builder.build(piracy_tab)
-    dogfighting_refs = dogfighting_tab_builder.build(dogfighting_tab)
-    proximity_refs = proximity_tab_builder.build(proximity_tab)
-    setattr(app, 'piracy_tab_refs', piracy_refs)
-    setattr(app, 'dogfighting_tab_refs', dogfighting_refs)
-    setattr(app, 'proximity_tab_refs', proximity_refs)
-    try:
-        global_variables.set_proximity_tab_refs(proximity_refs)
-    except Exception:
-        pass
+    _register_lazy_tabs(app, notebook, piracy_tab, dogfighting_tab, proximity_tab, diagnostics_tab)
+    _subscribe_views(app)
+    metrics.watch_tk_loop(app)
 
     # Make the logger reference easily available
     text_area = log_refs.get('log_text_area')
@@ -178,6 +204,152 @@ def setup_gui(game_running):
     
 
 
+def _register_lazy_tabs(app, notebook, piracy_tab, dogfighting_tab, proximity_tab, diagnostics_tab):
+    """Defer importing and building the secondary tabs until they are first shown."""
+    lazy_tabs = LazyTabs(notebook)
+    setattr(app, 'lazy_tabs', lazy_tabs)
+    setattr(app, 'piracy_tab_refs', {})
+    setattr(app, 'dogfighting_tab_refs', {})
+    setattr(app, 'proximity_tab_refs', {})
+    setattr(app, 'diagnostics_tab_refs', {})
+
+    def _builder(module_name):
+        def _build(frame):
+            module = importlib.import_module(module_name)
+            return module.build(frame)
+        return _build
+
+    def _publish(attr):
+        def _on_built(refs):
+            setattr(app, attr, refs)
+        return _on_built
+
+    # Proximity lines can arrive before the tab exists; buffer and replay them
+    pending_lines = []
+
+    def _buffer_report_line(line):
+        pending_lines.append(line)
+        del pending_lines[:-global_variables.PROXIMITY_REPORTS_MAX]
+
+    try:
+        global_variables.set_proximity_tab_refs({'append_report_line': _buffer_report_line})
+    except Exception:
+        pass
+
+    def _on_proximity_built(refs):
+        setattr(app, 'proximity_tab_refs', refs)
+        try:
+            global_variables.set_proximity_tab_refs(refs)
+        except Exception:
+            pass
+        append = refs.get('append_report_line')
+        if callable(append):
+            for line in pending_lines:
+                try:
+                    append(line)
+                except Exception:
+                    pass
+        pending_lines.clear()
+
+    lazy_tabs.register('piracy', piracy_tab, _builder('tabs.piracy_tab'), on_built=_publish('piracy_tab_refs'))
+    lazy_tabs.register('dogfighting', dogfighting_tab, _builder('tabs.dogfighting_tab'), on_built=_publish('dogfighting_tab_refs'))
+    lazy_tabs.register('proximity', proximity_tab, _builder('tabs.proximity_tab'), on_built=_on_proximity_built)
+    lazy_tabs.register('diagnostics', diagnostics_tab, _builder('tabs.diagnostics_tab'), on_built=_publish('diagnostics_tab_refs'))
+
+    # Leaderboards load when their tab is shown and refresh while it stays visible.
+    # Registered after the lazy tabs so a tab is built before its first refresh.
+    scheduler = RefreshScheduler(app, notebook)
+    setattr(app, 'refresh_scheduler', scheduler)
+    scheduler.register('piracy', piracy_tab, lambda: getattr(app, 'piracy_tab_refs', None))
+    scheduler.register('dogfighting', dogfighting_tab, lambda: getattr(app, 'dogfighting_tab_refs', None))
+    return lazy_tabs
+
+
+def _subscribe_views(app):
+    """Route parser events to the views; each runs at most once per dispatched batch."""
+    event_bus.attach(app)
+
+    def _main_ref(name):
+        try:
+            return (global_variables.get_main_tab_refs() or {}).get(name)
+        except Exception:
+            return None
+
+    def _on_processing_count(_events):
+        updater = _main_ref('update_processing_label')
+        if callable(updater):
+            updater()
+
+    def _on_kills(_events):
+        refresh = _main_ref('refresh_kill_columns')
+        if callable(refresh):
+            refresh()
+
+    def _on_player_events(events):
+        # Player events area: Proximity tab when registered, else the Main tab
+        try:
+            refs = global_variables.get_proximity_tab_refs() or {}
+        except Exception:
+            refs = {}
+        if not refs:
+            refs = global_variables.get_main_tab_refs() or {}
+        refresh = refs.get('refresh_player_events')
+        if callable(refresh) and any(e['topic'] != event_bus.TOPIC_KILL for e in events):
+            refresh()
+        # Proximity feed (buffered until the tab is first built)
+        append = refs.get('append_report_line')
+        if callable(append):
+            for e in events:
+                line = event_bus.report_line(e)
+                if line:
+                    append(line)
+
+    def _on_overlay(_events):
+        try:
+            from overlay_window import refresh_overlay  # type: ignore
+        except Exception:
+            return
+        refresh_overlay()
+
+    # Tabs first render cached leaderboards; redraw them when a background refresh replaces the data
+    leaderboard_caches = ('ironpoint.gameversion', 'ironpoint.summary', 'ironpoint.latest_hits', 'ironpoint.users')
+
+    def _on_api_data(events):
+        if not any(e.get('cache') in leaderboard_caches for e in events):
+            return
+        scheduler = getattr(app, 'refresh_scheduler', None)
+        if scheduler is not None:
+            scheduler.data_changed()
+
+    # Piracy tab outbox status (hits only); a delivered hit also refreshes the latest hits list
+    def _on_submissions(events):
+        import ironpoint_api
+        import submission_queue
+        hit_events = [e for e in events if e.get('kind') in (ironpoint_api.HIT_SUBMISSION_KIND, '')]
+        refs = getattr(app, 'piracy_tab_refs', None) or {}
+        setter = refs.get('set_submission_status')
+        if callable(setter) and hit_events:
+            counts = submission_queue.status(ironpoint_api.HIT_SUBMISSION_KIND)
+            setter(counts.get('pending', 0), counts.get('failed', 0))
+        scheduler = getattr(app, 'refresh_scheduler', None)
+        if scheduler is not None and any(e.get('result') == 'sent' for e in hit_events):
+            scheduler.data_changed(('piracy',))
+
+    # Banner offline indicator follows the circuit breakers
+    def _on_network(events):
+        controller = getattr(app, 'network_controller', None)
+        if controller is not None:
+            controller.update(events)
+
+    event_bus.subscribe(event_bus.TOPIC_PROCESSING_COUNT, _on_processing_count)
+    event_bus.subscribe(event_bus.TOPIC_KILL, _on_kills)
+    event_bus.subscribe(event_bus.PLAYER_TOPICS, _on_player_events)
+    event_bus.subscribe(event_bus.PLAYER_TOPICS, _on_overlay)
+    event_bus.subscribe(event_bus.TOPIC_API_DATA, _on_api_data)
+    event_bus.subscribe(event_bus.TOPIC_SUBMISSIONS, _on_submissions)
+    event_bus.subscribe(event_bus.TOPIC_NETWORK, _on_network)
+
+
 @global_variables.log_exceptions
 def on_game_relaunch(app, message_label=None):
     """Update the GUI when the game is detected as running."""
@@ -224,6 +396,11 @@ def initialize_game_gui(app):
     game_controller = GameController(app, banner_canvas)
     game_controller.setup_indicator()
 
+    # Offline indicator for hosts whose circuit breaker is open (net.py)
+    network_controller = NetworkController(app, banner_canvas)
+    network_controller.setup_indicator()
+    setattr(app, 'network_controller', network_controller)
+
     # API Key Input (now provided by main tab builder)
     tabs = getattr(app, 'tabs', {})
     main_tab_widget = tabs.get('main', app)
@@ -302,24 +479,43 @@ def resource_path(relative_path):
 
 @global_variables.log_exceptions
 def check_for_updates():
-    """Check for updates using the GitHub API."""
-    github_api_url = "https://api.github.com/repos/docfoxhound/BeowulfHunterPy/releases/latest"
+    """Check for updates using the GitHub API.
+
+    A release check made by this version within the update-check TTL is reused
+    from validation_cache without a request; if GitHub cannot be reached, the
+    last stored result is used whatever its age.
+    """
+    cached = validation_cache.get_release_check(local_version)
+    if cached:
+        return _update_message(cached.get("remote_version"), cached.get("download_url"))
+
+    github_api_url = f"{endpoints.GITHUB_API}/repos/docfoxhound/BeowulfHunterPy/releases/latest"
 
     try:
         headers = {'User-Agent': 'BeowulfHunter/1.0'}
-        response = requests.get(github_api_url, headers=headers, timeout=5)
+        response = net.get(github_api_url, endpoint='github.releases', priority='thumbnails', headers=headers, timeout=5)
 
         if response.status_code == 200:
             release_data = response.json()
             remote_version = release_data.get("tag_name", "v1.0").strip("v")
             download_url = release_data.get("html_url", "")
-
-            if version.parse(local_version) < version.parse(remote_version):
-                return f"Update available: {remote_version}. Download it here: {download_url}"
+            validation_cache.put_release_check(local_version, remote_version, download_url)
+            return _update_message(remote_version, download_url)
         else:
             global_variables.log(f"GitHub API error: {response.status_code}")
     except Exception as e:
         global_variables.log(f"Error checking for updates: {e}")
+    stale = validation_cache.get_release_check(local_version, allow_stale=True)
+    if stale:
+        return _update_message(stale.get("remote_version"), stale.get("download_url"))
+    return None
+
+def _update_message(remote_version, download_url):
+    try:
+        if remote_version and version.parse(local_version) < version.parse(remote_version):
+            return f"Update available: {remote_version}. Download it here: {download_url}"
+    except Exception as e:
+        global_variables.log(f"Error comparing versions: {e}")
     return None
 
 @global_variables.log_exceptions
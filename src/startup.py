@@ -0,0 +1,103 @@
+"""Background startup orchestration.
+
+Network work needed at launch (update check, key validation, initial kill
+sync) used to run on the Tk main thread before and right after the window
+was created, freezing the UI on slow links. The orchestrator runs each step
+on a daemon worker and hands results back to the Tk thread via `app.after`,
+updating a short status line on the Main tab as steps start and finish.
+"""
+import threading
+from typing import Any, Callable, Dict, Optional
+
+import global_variables
+
+
+class StartupOrchestrator:
+    def __init__(self, app):
+        self.app = app
+        self._lock = threading.Lock()
+        # task name -> human readable label for tasks still running
+        self._running: Dict[str, str] = {}
+
+    # --- public API ---
+    def submit(self, name: str, label: str, fn: Callable[[], Any],
+               on_result: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[Exception], None]] = None):
+        """Run `fn` on a background thread; deliver its result on the Tk thread.
+
+        `on_result(value)` or `on_error(exc)` is invoked through `app.after`,
+        so callbacks may touch widgets directly.
+        """
+        with self._lock:
+            self._running[name] = label
+        self._refresh_status()
+
+        def _worker():
+            try:
+                value = fn()
+            except Exception as e:
+                global_variables.log(f"Startup task '{name}' failed: {e}")
+                self._deliver(name, on_error, e)
+                return
+            self._deliver(name, on_result, value)
+
+        try:
+            threading.Thread(target=_worker, name=f"startup-{name}", daemon=True).start()
+        except Exception as e:
+            self._deliver(name, on_error, e)
+
+    def is_running(self, name: str) -> bool:
+        with self._lock:
+            return name in self._running
+
+    # --- internals ---
+    def _deliver(self, name: str, callback: Optional[Callable[[Any], None]], value: Any):
+        def _on_main():
+            with self._lock:
+                self._running.pop(name, None)
+            try:
+                if callable(callback):
+                    callback(value)
+            except Exception as e:
+                global_variables.log(f"Startup task '{name}' callback failed: {e}")
+            self._refresh_status()
+
+        try:
+            self.app.after(0, _on_main)
+        except Exception:
+            # Tk not running (e.g., during shutdown); nothing left to update
+            pass
+
+    def _refresh_status(self):
+        with self._lock:
+            labels = list(self._running.values())
+        text = ("Starting up: " + ", ".join(labels) + "…") if labels else ""
+
+        def _apply():
+            try:
+                refs = getattr(self.app, 'main_tab_refs', {}) or {}
+                setter = refs.get('set_startup_status')
+                if callable(setter):
+                    setter(text)
+            except Exception:
+                pass
+
+        if threading.current_thread() is threading.main_thread():
+            _apply()
+        else:
+            try:
+                self.app.after(0, _apply)
+            except Exception:
+                pass
+
+
+def get_orchestrator(app) -> StartupOrchestrator:
+    """Return the app's orchestrator, creating it on first use."""
+    orch = getattr(app, 'startup_orchestrator', None)
+    if orch is None:
+        orch = StartupOrchestrator(app)
+        try:
+            setattr(app, 'startup_orchestrator', orch)
+        except Exception:
+            pass
+    return orch
@@ -0,0 +1,361 @@
+"""Durable outbox for user submissions (hit reports) that must not be lost.
+
+`enqueue(kind, item_id, payload)` writes the submission to
+<data dir>/outbox/<kind>-<id>.json before anything is sent, and one background
+worker delivers it with the sender registered for `kind`:
+
+    send(payload) -> (ok, info)     info as ironpoint_api.post_hittracker(return_error=True)
+
+A submission is deleted once it is sent. Network errors, 408, 429 and 5xx are
+retried with exponential backoff (RETRY_BASE_SECONDS doubling up to
+RETRY_MAX_SECONDS, with jitter); any other status is permanent and the
+submission is kept as 'failed' until `retry_failed()` is called, so the typed
+report is never discarded. Files left by a previous run are picked up by
+`start()`, which the app calls at launch.
+
+While a host is offline (net's circuit breaker is open) sends fail at once and
+simply stay queued; when net reports a host reachable again, every waiting
+submission is retried right away instead of sitting out its backoff.
+
+A sender may be registered with `ready()`; while it returns False (e.g. no API
+key is configured for kills) submissions of that kind are held: they stay
+pending without being attempted or backed off until `retry_pending()` is
+called once the sender can deliver again.
+
+`item_id` makes enqueueing idempotent: the same id is queued once. For hits it
+is the payload's millisecond `id`, which the server also sees on every retry.
+
+Every state change publishes event_bus.TOPIC_SUBMISSIONS with the `status()`
+counts; the gauge submissions.pending{kind} and the counter
+submissions.attempts{kind, result} are kept for the Diagnostics tab.
+"""
+import json
+import os
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import global_variables
+import metrics
+
+OUTBOX_SUBDIR = 'outbox'
+RETRY_BASE_SECONDS = 5
+RETRY_MAX_SECONDS = 15 * 60
+# HTTP statuses worth retrying; anything else is reported back to the user
+RETRYABLE_STATUSES = (408, 425, 429, 500, 502, 503, 504)
+
+_lock = threading.Lock()
+_wake = threading.Event()
+# item key -> {'key', 'kind', 'id', 'payload', 'state', 'attempts', 'next_attempt_at', 'created_at', 'last_error'}
+_items: Dict[str, Dict[str, Any]] = {}
+_senders: Dict[str, Callable[[Dict[str, Any]], Tuple[bool, Optional[Dict[str, Any]]]]] = {}
+# kind -> callable returning False while its sender cannot deliver (submissions are held)
+_ready: Dict[str, Callable[[], bool]] = {}
+_loaded = False
+_subscribed = False
+_worker: Optional[threading.Thread] = None
+
+
+def _outbox_dir() -> str:
+    from config import get_data_dir
+    path = os.path.join(get_data_dir(), OUTBOX_SUBDIR)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _item_key(kind: str, item_id: str) -> str:
+    return ''.join(c if c.isalnum() or c in '-_' else '_' for c in f"{kind}-{item_id}")
+
+
+def _path(key: str) -> str:
+    return os.path.join(_outbox_dir(), key + '.json')
+
+
+def _save(item: Dict[str, Any]):
+    try:
+        path = _path(item['key'])
+        tmp = path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(item, f)
+        os.replace(tmp, path)
+    except Exception as e:
+        global_variables.log(f"Could not persist queued submission {item.get('key')}: {e}")
+
+
+def _remove(key: str):
+    try:
+        os.remove(_path(key))
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        global_variables.log(f"Could not remove sent submission {key}: {e}")
+
+
+def _load_outbox():
+    global _loaded
+    with _lock:
+        if _loaded:
+            return
+        _loaded = True
+    try:
+        directory = _outbox_dir()
+        names = [n for n in os.listdir(directory) if n.endswith('.json')]
+    except Exception as e:
+        global_variables.log(f"Could not read the submission outbox: {e}")
+        return
+    loaded = 0
+    for name in names:
+        try:
+            with open(os.path.join(directory, name), 'r', encoding='utf-8') as f:
+                item = json.load(f)
+            if not isinstance(item, dict) or not item.get('key') or not item.get('kind'):
+                continue
+            with _lock:
+                _items.setdefault(item['key'], item)
+            loaded += 1
+        except Exception as e:
+            global_variables.log(f"Ignoring unreadable queued submission {name}: {e}")
+    if loaded:
+        counts = status()
+        global_variables.log(f"Submission queue: {counts['pending']} pending, {counts['failed']} failed from a previous session.")
+        _publish('', '', 'loaded')
+
+
+def _backoff(attempts: int) -> float:
+    delay = min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * (2 ** max(0, attempts - 1)))
+    return delay * random.uniform(0.8, 1.2)
+
+
+def _publish(kind: str, item_id: str, result: str):
+    counts = status()
+    for k in ({kind} if kind else set()) | set(counts['by_kind']):
+        metrics.gauge('submissions.pending', kind=k).set(counts['by_kind'].get(k, 0))
+    try:
+        import event_bus
+        event_bus.publish(event_bus.TOPIC_SUBMISSIONS, kind=kind, id=item_id, result=result,
+                          pending=counts['pending'], failed=counts['failed'])
+    except Exception:
+        pass
+
+
+def _describe(info: Optional[Dict[str, Any]]) -> str:
+    info = info or {}
+    parts = [f"status {info.get('status')}" if info.get('status') is not None else 'no response']
+    for field in ('message', 'exception', 'response'):
+        if info.get(field):
+            parts.append(str(info[field])[:300])
+    return '; '.join(parts)
+
+
+def register_sender(kind: str, send: Callable[[Dict[str, Any]], Tuple[bool, Optional[Dict[str, Any]]]],
+                    ready: Optional[Callable[[], bool]] = None):
+    """Deliver submissions of `kind` with `send(payload) -> (ok, info)`, holding them while `ready()` is False."""
+    with _lock:
+        _senders[kind] = send
+        if ready is not None:
+            _ready[kind] = ready
+        else:
+            _ready.pop(kind, None)
+    _wake.set()
+
+
+def _held_kinds() -> set:
+    held = set()
+    for kind, ready in list(_ready.items()):
+        try:
+            if not ready():
+                held.add(kind)
+        except Exception:
+            held.add(kind)
+    return held
+
+
+def _on_network(events: List[Dict[str, Any]]):
+    if any(e.get('state') == 'closed' for e in events):
+        retry_pending()
+
+
+def _subscribe_network():
+    global _subscribed
+    with _lock:
+        if _subscribed:
+            return
+        _subscribed = True
+    try:
+        import event_bus
+        event_bus.subscribe(event_bus.TOPIC_NETWORK, _on_network)
+    except Exception:
+        pass
+
+
+def start():
+    """Load submissions left by a previous run and start the delivery worker (idempotent)."""
+    global _worker
+    _load_outbox()
+    _subscribe_network()
+    with _lock:
+        if _worker is not None and _worker.is_alive():
+            _wake.set()
+            return
+        _worker = threading.Thread(target=_run, name='submission-queue', daemon=True)
+        _worker.start()
+
+
+def enqueue(kind: str, item_id: str, payload: Dict[str, Any]) -> bool:
+    """Persist a submission and schedule its delivery; False when `item_id` is already queued."""
+    _load_outbox()
+    key = _item_key(kind, str(item_id))
+    item = {
+        'key': key, 'kind': kind, 'id': str(item_id), 'payload': payload, 'state': 'pending',
+        'attempts': 0, 'next_attempt_at': 0.0, 'created_at': time.time(), 'last_error': None,
+    }
+    with _lock:
+        if key in _items:
+            return False
+        _items[key] = item
+    _save(item)
+    _publish(kind, item['id'], 'queued')
+    start()
+    return True
+
+
+def retry_failed(kind: Optional[str] = None) -> int:
+    """Move failed submissions (of `kind`, default all) back to pending for an immediate attempt.
+
+    Returns how many were moved.
+    """
+    moved: List[Dict[str, Any]] = []
+    with _lock:
+        for item in _items.values():
+            if item.get('state') == 'failed' and (kind is None or item.get('kind') == kind):
+                item['state'] = 'pending'
+                item['next_attempt_at'] = 0.0
+                moved.append(item)
+    for item in moved:
+        _save(item)
+    if moved:
+        announced = {}
+        for item in moved:
+            announced.setdefault(item['kind'], item['id'])
+        for moved_kind, item_id in announced.items():
+            _publish(moved_kind, item_id, 'queued')
+        start()
+    return len(moved)
+
+
+def retry_pending() -> int:
+    """Attempt every waiting submission now, skipping its backoff; returns how many were backing off.
+
+    Also wakes the worker for held submissions whose sender has become ready.
+    """
+    count = 0
+    waiting = False
+    with _lock:
+        for item in _items.values():
+            if item.get('state') == 'pending':
+                waiting = True
+                if item.get('next_attempt_at'):
+                    item['next_attempt_at'] = 0.0
+                    count += 1
+    if waiting:
+        _wake.set()
+    return count
+
+
+def status(kind: Optional[str] = None) -> Dict[str, Any]:
+    """Counts for the UI: pending, failed, by_kind (pending per kind), next_attempt_in, last_error.
+
+    With `kind`, only submissions of that kind are counted.
+    """
+    now = time.time()
+    pending = failed = 0
+    by_kind: Dict[str, int] = {}
+    next_at: Optional[float] = None
+    last_error = None
+    with _lock:
+        for item in _items.values():
+            if kind is not None and item.get('kind') != kind:
+                continue
+            if item.get('state') == 'failed':
+                failed += 1
+                last_error = item.get('last_error') or last_error
+                continue
+            pending += 1
+            by_kind[item['kind']] = by_kind.get(item['kind'], 0) + 1
+            at = float(item.get('next_attempt_at') or 0)
+            next_at = at if next_at is None else min(next_at, at)
+            if item.get('attempts'):
+                last_error = item.get('last_error') or last_error
+    return {
+        'pending': pending,
+        'failed': failed,
+        'by_kind': by_kind,
+        'next_attempt_in': max(0.0, next_at - now) if next_at is not None else None,
+        'last_error': last_error,
+    }
+
+
+def _next_due() -> Tuple[Optional[Dict[str, Any]], Optional[float]]:
+    """The oldest due pending item with a ready sender, else (None, seconds until the next one)."""
+    held = _held_kinds()
+    now = time.time()
+    due = None
+    wait = None
+    with _lock:
+        for item in sorted(_items.values(), key=lambda it: it.get('created_at') or 0):
+            if item.get('state') != 'pending' or item['kind'] not in _senders or item['kind'] in held:
+                continue
+            at = float(item.get('next_attempt_at') or 0)
+            if at <= now:
+                due = item
+                break
+            wait = at - now if wait is None else min(wait, at - now)
+    return due, wait
+
+
+def _attempt(item: Dict[str, Any]):
+    send = _senders.get(item['kind'])
+    try:
+        ok, info = send(item['payload'])
+    except Exception as e:
+        ok, info = False, {'status': None, 'message': 'Exception', 'exception': str(e)}
+    item['attempts'] = int(item.get('attempts') or 0) + 1
+    if ok:
+        with _lock:
+            _items.pop(item['key'], None)
+        _remove(item['key'])
+        metrics.counter('submissions.attempts', kind=item['kind'], result='sent').inc()
+        global_variables.log(f"Queued {item['kind']} submission {item['id']} sent.")
+        _publish(item['kind'], item['id'], 'sent')
+        return
+    status_code = (info or {}).get('status')
+    item['last_error'] = _describe(info)
+    if status_code is None or status_code in RETRYABLE_STATUSES:
+        delay = _backoff(item['attempts'])
+        item['next_attempt_at'] = time.time() + delay
+        result = 'retry'
+        global_variables.log(f"Submitting {item['kind']} {item['id']} failed ({item['last_error']}); "
+                             f"retrying in {int(delay)}s.")
+    else:
+        item['state'] = 'failed'
+        result = 'failed'
+        global_variables.log(f"Submitting {item['kind']} {item['id']} was rejected ({item['last_error']}); "
+                             f"it is kept in the outbox until retried.")
+    metrics.counter('submissions.attempts', kind=item['kind'], result=result).inc()
+    _save(item)
+    _publish(item['kind'], item['id'], result)
+
+
+def _run():
+    while True:
+        try:
+            item, wait = _next_due()
+            if item is not None:
+                _attempt(item)
+                continue
+            _wake.wait(timeout=wait if wait is not None else None)
+            _wake.clear()
+        except Exception as e:
+            global_variables.log(f"Submission queue worker error: {e}")
+            time.sleep(RETRY_BASE_SECONDS)
@@ -180,10 +180,8 @@ def open_add_new(parent: tk.Misc) -> None:
     row_idx += 1
 
     # Data containers
-    all_users: List[Dict[str, str]] = []  # [{id, name}]
-    all_commodities: List[str] = []
-    commodities_full: List[Dict[str, Any]] = []
-    commodity_to_price: Dict[str, float] = {}
+    users = ironpoint_api.UserDirectory()  # replaced once /users/ is loaded
+    catalog = ironpoint_api.CommodityCatalog()  # replaced once commodities are loaded
     recent_fleets: List[Dict[str, Any]] = []
     gang_display_to_fleet: Dict[str, Dict[str, Any]] = {}
     selected_crew_names: List[str] = []
@@ -206,13 +204,8 @@ def open_add_new(parent: tk.Misc) -> None:
             prefix = text[:pos]
             if not prefix:
                 return
-            best = None
-            pl = prefix.lower()
-            for u in all_users:
-                nm = u.get('name', '')
-                if nm and nm not in selected_crew_names and nm.lower().startswith(pl):
-                    best = nm
-                    break
+            matches = users.search(prefix, limit=1, exclude=selected_crew_names)
+            best = matches[0] if matches else None
             if not best or best == text:
                 return
             _auto_flags["crew"] = True
@@ -258,8 +251,7 @@ def open_add_new(parent: tk.Misc) -> None:
             name = crew_name_var.get().strip()
             if not name:
                 return
-            names = {u.get('name'): u.get('id') for u in all_users}
-            if name not in names:
+            if users.id_for(name) is None:
                 return
             if name in selected_crew_names:
                 return
@@ -288,12 +280,8 @@ def open_add_new(parent: tk.Misc) -> None:
             prefix = text[:pos]
             if not prefix:
                 return
-            pl = prefix.lower()
-            best = None
-            for nm in all_commodities:
-                if nm and nm.lower().startswith(pl):
-                    best = nm
-                    break
+            matches = catalog.search(prefix, limit=1)
+            best = matches[0] if matches else None
             if not best or best == text:
                 return
             _auto_flags["cargo"] = True
@@ -319,7 +307,7 @@ def open_add_new(parent: tk.Misc) -> None:
             # Default quantity and price on add; allow editing in the list rows
             q = 1
             try:
-                pr = float(commodity_to_price.get(name, 0) or 0)
+                pr = catalog.price(name)
             except Exception:
                 pr = 0.0
             row = tk.Frame(cargo_items_container, bg=COLORS['bg'])
@@ -374,17 +362,10 @@ def open_add_new(parent: tk.Misc) -> None:
             fleet = gang_display_to_fleet.get(sel)
             if not fleet:
                 return
-            users = fleet.get('users') or []
-            # Build id->display name map from all_users
-            id_to_name = {}
-            try:
-                id_to_name = {str(u.get('id')): str(u.get('name')) for u in (all_users or []) if u.get('id') and u.get('name')}
-            except Exception:
-                id_to_name = {}
-            for u in users:
+            for u in fleet.get('users') or []:
                 try:
                     uid = str(u.get('id') or '')
-                    disp = id_to_name.get(uid) or str(u.get('nickname') or u.get('username') or uid)
+                    disp = users.names.get(uid) or str(u.get('nickname') or u.get('username') or uid)
                     if not disp:
                         continue
                     if disp in selected_crew_names:
@@ -429,35 +410,19 @@ def open_add_new(parent: tk.Misc) -> None:
 
 
     def _load_data_worker():
-        nonlocal all_users, all_commodities, commodities_full, commodity_to_price, recent_fleets
+        nonlocal users, catalog, recent_fleets
         try:
             recent_fleets = ironpoint_api.get_recent_fleets(10)
         except Exception:
             recent_fleets = []
         try:
-            all_users = ironpoint_api.get_all_user_display_options()
+            users = ironpoint_api.get_user_directory()
         except Exception:
-            all_users = []
+            pass
         try:
-            all_commodities = ironpoint_api.get_commodity_names()
-            try:
-                commodities_full = ironpoint_api.get_commodities_full()
-                commodity_to_price = {}
-                for it in (commodities_full or []):
-                    try:
-                        nm = str(it.get('commodity_name') or '').strip()
-                        if not nm:
-                            continue
-                        buy = float(it.get('price_buy_avg') or 0)
-                        sell = float(it.get('price_sell_avg') or 0)
-                        commodity_to_price[nm] = max(buy, sell)
-                    except Exception:
-                        continue
-            except Exception:
-                commodities_full = []
-                commodity_to_price = {}
+            catalog = ironpoint_api.get_commodity_catalog()
         except Exception:
-            all_commodities = []
+            pass
         try:
             win.after(0, _load_gangs_ui, recent_fleets)
         except Exception:
@@ -471,17 +436,16 @@ def open_add_new(parent: tk.Misc) -> None:
             title = (title_var.get() or '').strip()
             gang = (gang_var.get() or '').strip()
             selected_names = list(selected_crew_names)
-            name_to_id = {u.get('name'): u.get('id') for u in all_users}
             # assists (ids) and assists_usernames aligned order (excluding current user for now)
             assists_ids: List[str] = []
             assists_usernames: List[str] = []
             for nm in selected_names:
-                uid = name_to_id.get(nm)
+                uid = users.id_for(nm)
                 if uid:
                     assists_ids.append(str(uid))
                     assists_usernames.append(str(nm))
             # guests are those not matched to a known user id
-            guests = [str(nm) for nm in selected_names if name_to_id.get(nm) is None]
+            guests = [str(nm) for nm in selected_names if users.id_for(nm) is None]
 
             # cargo as array of {commodity_name, scuAmount, avg_price}
             cargo_items: List[Dict[str, Any]] = []
@@ -607,57 +571,16 @@ def open_add_new(parent: tk.Misc) -> None:
                 gv.log("No user_id set. Please validate your key first.")
                 return
 
-            def _submit():
-                try:
-                    ok, info = ironpoint_api.post_hittracker(payload, return_error=True)
-                    if ok:
-                        gv.log("Hit submitted successfully.")
-                        # Refresh latest pirate hits on Piracy tab
-                        try:
-                            latest = ironpoint_api.get_latest_pirate_hits()
-                        except Exception:
-                            latest = []
-                        try:
-                            app = gv.get_app()
-                            if app is not None:
-                                refs = getattr(app, 'piracy_tab_refs', {})
-                                setter = refs.get('set_pirate_hit_cards') if isinstance(refs, dict) else None
-                                if callable(setter):
-                                    try:
-                                        app.after(0, setter, latest)
-                                    except Exception:
-                                        setter(latest)
-                        except Exception:
-                            pass
-                    else:
-                        # Log a clear, human-readable error
-                        try:
-                            status = (info or {}).get('status')
-                            msg = (info or {}).get('message') or 'Request failed'
-                            resp_snippet = (info or {}).get('response')
-                            err_ex = (info or {}).get('exception')
-                            parts = [f"Failed to submit hit. Status: {status}"] if status is not None else ["Failed to submit hit."]
-                            parts.append(f"Reason: {msg}")
-                            if err_ex:
-                                parts.append(f"Exception: {err_ex}")
-                            if resp_snippet:
-                                parts.append(f"Response: {str(resp_snippet)[:500]}")
-                            gv.log(" ".join(parts))
-                        except Exception:
-                            try:
-                                gv.log(f"Failed to submit hit: {info}")
-                            except Exception:
-                                pass
-                except Exception as e:
-                    try:
-                        gv.log(f"Exception submitting hit: {e}")
-                    except Exception:
-                        pass
-
-            threading.Thread(target=_submit, daemon=True).start()
+            # Persisted before the window closes; delivered and retried in the background
+            try:
+                if not ironpoint_api.submit_hit(payload):
+                    gv.log("This hit is already queued for submission.")
+            except Exception as e:
+                gv.log(f"Could not queue hit for submission: {e}")
+                return
             try:
                 fid = (fleet_obj or {}).get('id', '')
-                gv.log(f"Submitting hit: title='{title}', patch='{patch}', gang='{gang}', gang_id='{fid}', total_value={int(total_value)}, assists={assists_ids}, cargo_items={cargo_items}")
+                gv.log(f"Queued hit: title='{title}', patch='{patch}', gang='{gang}', gang_id='{fid}', total_value={int(total_value)}, assists={assists_ids}, cargo_items={cargo_items}")
             except Exception:
                 pass
             win.destroy()
@@ -4,7 +4,8 @@ import io
 from datetime import datetime, timezone, timedelta
 from collections import Counter
 import global_variables
-import requests
+import kill_db
+import net
 from PIL import Image, ImageTk
 
 
@@ -26,36 +27,49 @@ def open_details_window(app):
     # )
     # header.pack(side=tk.TOP, anchor='w', padx=8, pady=(8, 4))
 
-    # Fetch combined kills
+    # Query the local history database when available; otherwise aggregate the in-memory list
+    use_db = False
     try:
-        all_items = global_variables.get_api_kills_all() or []
+        use_db = bool(kill_db.get_active_user()) and kill_db.is_available()
     except Exception:
-        all_items = []
+        use_db = False
 
-    # Analytics: Top victims, top ships killed (excluding FPS), and favorite ships used
-    victim_counter = Counter()
-    ship_counter = Counter()
-    ship_used_counter = Counter()
-    for it in all_items:
+    all_items = []
+    if use_db:
+        top_victims = kill_db.top_victims(limit=3)
+        top_ships = kill_db.top_ships_killed(limit=3)
+        top_fav_ships = kill_db.top_ships_used(limit=3)
+    else:
+        # Fetch combined kills
         try:
-            vs = it.get('victims') if isinstance(it.get('victims'), list) else []
-            for v in vs:
-                if v:
-                    victim_counter[v] += 1
-            sk = it.get('ship_killed')
-            if isinstance(sk, str) and sk.strip() and sk.strip().upper() != 'FPS':
-                ship_counter[sk.strip()] += 1
-            su = it.get('ship_used')
-            if isinstance(su, str):
-                su_s = su.strip()
-                if su_s and su_s.lower() != 'null':
-                    ship_used_counter[su_s] += 1
+            all_items = global_variables.get_api_kills_all() or []
         except Exception:
-            continue
+            all_items = []
+
+        # Analytics: Top victims, top ships killed (excluding FPS), and favorite ships used
+        victim_counter = Counter()
+        ship_counter = Counter()
+        ship_used_counter = Counter()
+        for it in all_items:
+            try:
+                vs = it.get('victims') if isinstance(it.get('victims'), list) else []
+                for v in vs:
+                    if v:
+                        victim_counter[v] += 1
+                sk = it.get('ship_killed')
+                if isinstance(sk, str) and sk.strip() and sk.strip().upper() != 'FPS':
+                    ship_counter[sk.strip()] += 1
+                su = it.get('ship_used')
+                if isinstance(su, str):
+                    su_s = su.strip()
+                    if su_s and su_s.lower() != 'null':
+                        ship_used_counter[su_s] += 1
+            except Exception:
+                continue
 
-    top_victims = victim_counter.most_common(3)
-    top_ships = ship_counter.most_common(3)
-    top_fav_ships = ship_used_counter.most_common(3)
+        top_victims = victim_counter.most_common(3)
+        top_ships = ship_counter.most_common(3)
+        top_fav_ships = ship_used_counter.most_common(3)
 
     # Top stats row
     stats_row = tk.Frame(win, bg="#1a1a1a")
@@ -256,7 +270,7 @@ def open_details_window(app):
         def worker():
             content = None
             try:
-                resp = requests.get(url, timeout=10)
+                resp = net.get(url, priority='thumbnails', timeout=10)
                 if resp.status_code == 200:
                     content = resp.content
             except Exception:
@@ -410,22 +424,25 @@ def open_details_window(app):
         txt.pack(fill=tk.X)
         card.pack(fill=tk.X, padx=6, pady=(0, 6))
 
-    # Deduplicate, sort newest-first, and render with lazy chunking
-    seen = set()
-    unique_items = []
-    for it in all_items:
-        try:
-            ts = str(it.get('timestamp') or '').strip()
-            victims_list = it.get('victims') if isinstance(it.get('victims'), list) else []
-            key = (ts, tuple(victims_list), (it.get('game_mode') or '').upper())
-            if key in seen:
+    # Deduplicate, sort newest-first, and render with lazy chunking.
+    # With the history database, pages are read newest-first straight from the index.
+    sorted_items = []
+    if not use_db:
+        seen = set()
+        unique_items = []
+        for it in all_items:
+            try:
+                ts = str(it.get('timestamp') or '').strip()
+                victims_list = it.get('victims') if isinstance(it.get('victims'), list) else []
+                key = (ts, tuple(victims_list), (it.get('game_mode') or '').upper())
+                if key in seen:
+                    continue
+                seen.add(key)
+                unique_items.append(it)
+            except Exception:
                 continue
-            seen.add(key)
-            unique_items.append(it)
-        except Exception:
-            continue
 
-    sorted_items = sorted(unique_items, key=lambda it: (_parse_ts(str(it.get('timestamp') or '')) or datetime.fromtimestamp(0, tz=timezone.utc)), reverse=True)
+        sorted_items = sorted(unique_items, key=lambda it: (_parse_ts(str(it.get('timestamp') or '')) or datetime.fromtimestamp(0, tz=timezone.utc)), reverse=True)
 
     # Log a few samples if location/coordinates appear missing to help debugging
     missing_loc_samples = 0
@@ -444,7 +461,7 @@ def open_details_window(app):
     status_lbl = tk.Label(btn_frame, text="", font=("Times New Roman", 10), fg="#bcbcd8", bg="#1a1a1a")
     status_lbl.pack(side=tk.LEFT)
 
-    # Precompute safe-normalized records to avoid repeated dict lookups during chunked render
+    # Safe-normalize records into card arguments as each chunk is rendered
     def _normalize_record(rec):
         try:
             victims = rec.get('victims') if isinstance(rec.get('victims'), list) else []
@@ -481,11 +498,17 @@ def open_details_window(app):
         except Exception:
             return ('Unknown Victim', None, None, getattr(app, 'icon_ship', None), '#3b82f6', None, None, None, None, None)
 
-    normalized_cache = [_normalize_record(rec) for rec in sorted_items]
-
-    total = len(normalized_cache)
+    if use_db:
+        total = kill_db.count_kills() or 0
+    else:
+        total = len(sorted_items)
     shown_count = 0
 
+    def _records(start_idx, end):
+        if use_db:
+            return kill_db.latest_kills(limit=end - start_idx, offset=start_idx)
+        return sorted_items[start_idx:end]
+
     def _update_status():
         try:
             status_lbl.config(text=f"Showing {shown_count} of {total} kills")
@@ -495,9 +518,9 @@ def open_details_window(app):
     def _render_chunk(start_idx, count):
         nonlocal shown_count
         end = min(start_idx + count, total)
-        for i in range(start_idx, end):
+        for rec in _records(start_idx, end):
             try:
-                title, secondary, meta, icon, accent, border, org_pic, org_sid, victim_img, coords_raw = normalized_cache[i]
+                title, secondary, meta, icon, accent, border, org_pic, org_sid, victim_img, coords_raw = _normalize_record(rec)
                 _add_card(all_col['container'], title, secondary, meta, icon, accent, border, org_picture_url=org_pic, org_sid_tooltip=org_sid, victim_image_url=victim_img, coords_value=coords_raw)
             except Exception:
                 continue
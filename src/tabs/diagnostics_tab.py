@@ -0,0 +1,207 @@
+import tkinter as tk
+from typing import Dict, Any, Optional
+
+import global_variables as gv
+import keys
+import metrics
+import profiling
+import tk_profiler
+from theme import BUTTON_STYLE
+
+# Builds the Diagnostics tab: headline pipeline figures, a table of every
+# metric in the registry, recent UI stalls, and buttons to export a snapshot,
+# reset counters, capture a CPU/memory profile or toggle the UI stall watcher
+# (tk_profiler). The view refreshes once per second while the tab is visible.
+
+COLORS = {
+    'bg': '#1a1a1a',
+    'fg': '#ffffff',
+    'muted': '#bcbcd8',
+    'border': '#2a2a2a',
+    'card_bg': '#0f0f0f',
+    'accent': '#ff5555',
+}
+
+REFRESH_MS = 1000
+# Stall records listed below the metrics table
+STALLS_SHOWN = 10
+
+
+def _ms(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return '-'
+    return f"{seconds * 1000:.1f}ms"
+
+
+def _format_row(key: str, data: Dict[str, Any]) -> str:
+    kind = data.get('type')
+    if kind == 'counter':
+        detail = f"{data.get('value', 0):>10}   {data.get('rate', 0):>8.2f}/s"
+    elif kind == 'gauge':
+        detail = f"{data.get('value', 0):>10g}   max {data.get('max', 0):g}"
+    else:
+        detail = (f"{data.get('count', 0):>10}   p50 {_ms(data.get('p50'))}  p95 {_ms(data.get('p95'))}"
+                  f"  p99 {_ms(data.get('p99'))}  max {_ms(data.get('max'))}")
+    return f"{key:<52} {detail}"
+
+
+def _headline(snap: Dict[str, Any]) -> str:
+    m = snap.get('metrics', {})
+    lines = m.get('parser.lines', {})
+    depth = m.get('kill_queue.depth', {})
+    wait = m.get('kill_queue.wait', {})
+    lag = m.get('tk.loop_lag', {})
+    return (f"Lines/s: {lines.get('rate', 0):.1f}    "
+            f"Kill queue: {depth.get('value', 0):g} (wait p95 {_ms(wait.get('p95'))})    "
+            f"Tk lag p95: {_ms(lag.get('p95'))}    "
+            f"Uptime: {snap.get('uptime_s', 0):.0f}s")
+
+
+def _innermost_frame(stack) -> str:
+    """'File "x.py", line 12, in fn' from the last entry of a formatted stack."""
+    if not stack:
+        return ''
+    return str(stack[-1]).strip().splitlines()[0]
+
+
+def render_text(snap: Dict[str, Any]) -> str:
+    """Plain-text table of a metrics snapshot (also used for the copy/paste view)."""
+    out = []
+    for key, data in snap.get('metrics', {}).items():
+        out.append(_format_row(key, data))
+    derived = snap.get('derived', {})
+    if derived:
+        out.append('')
+        for key, value in derived.items():
+            out.append(f"{key:<52} {value:>10.1%}")
+    stalls = (snap.get('sections') or {}).get('ui_stalls') or []
+    if isinstance(stalls, list) and stalls:
+        out.append('')
+        out.append(f"Recent UI stalls (newest first, {len(stalls)} kept):")
+        for stall in reversed(stalls[-STALLS_SHOWN:]):
+            out.append(f"  {stall.get('at', '')}  {stall.get('duration_ms', 0):>8.0f}ms  {stall.get('callback', '?')}")
+            where = _innermost_frame(stall.get('stack') or [])
+            if where:
+                out.append(f"      at {where}")
+    return "\n".join(out) if out else "No metrics recorded yet."
+
+
+def build(parent: tk.Misc) -> Dict[str, Any]:
+    refs: Dict[str, Any] = {}
+
+    try:
+        tk.Label(parent, text="Diagnostics", fg=COLORS['muted'], bg=COLORS['bg'], font=("Times New Roman", 12)).pack(anchor='nw', padx=6, pady=(6, 4))
+    except Exception:
+        pass
+
+    headline = tk.Label(parent, text="", fg=COLORS['fg'], bg=COLORS['bg'], anchor='w', font=("Times New Roman", 12, "bold"))
+    headline.pack(side=tk.TOP, fill=tk.X, padx=6, pady=(0, 4))
+
+    body = tk.Frame(parent, bg=COLORS['bg'], highlightthickness=1, highlightbackground=COLORS['border'])
+    body.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=6, pady=(0, 4))
+    text = tk.Text(body, bg=COLORS['card_bg'], fg=COLORS['fg'], wrap='none', font=("Consolas", 10),
+                   highlightthickness=0, borderwidth=0)
+    yscroll = tk.Scrollbar(body, orient=tk.VERTICAL, command=text.yview)
+    text.configure(yscrollcommand=yscroll.set, state='disabled')
+    yscroll.pack(side=tk.RIGHT, fill=tk.Y)
+    text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+    actions = tk.Frame(parent, bg=COLORS['bg'])
+    actions.pack(side=tk.TOP, fill=tk.X, padx=6, pady=(0, 6))
+    status = tk.Label(actions, text="", fg=COLORS['muted'], bg=COLORS['bg'], anchor='w', font=("Times New Roman", 11))
+
+    def _refresh():
+        snap = metrics.snapshot()
+        headline.config(text=_headline(snap))
+        content = render_text(snap)
+        top = text.yview()[0]
+        text.configure(state='normal')
+        text.delete('1.0', tk.END)
+        text.insert('1.0', content)
+        text.configure(state='disabled')
+        text.yview_moveto(top)
+
+    def _tick():
+        try:
+            # Notebook unmaps hidden tabs; skip the work unless someone is looking
+            if parent.winfo_ismapped():
+                _refresh()
+                _update_profile_button()
+        except Exception:
+            pass
+        try:
+            parent.after(REFRESH_MS, _tick)
+        except Exception:
+            pass
+
+    def _export():
+        try:
+            path = metrics.export_snapshot()
+        except Exception as e:
+            status.config(text=f"Export failed: {e}")
+            gv.log(f"Metrics snapshot export failed: {e}")
+            return
+        status.config(text=f"Saved {path}")
+        gv.log(f"Metrics snapshot written to {path}")
+
+    def _reset():
+        metrics.reset()
+        tk_profiler.clear_stalls()
+        status.config(text="Metrics reset.")
+        _refresh()
+
+    profile_btn = tk.Button(actions, text="Profile 5 min", **BUTTON_STYLE)
+
+    def _update_profile_button():
+        session = profiling.get_session()
+        if session is not None and session.active:
+            profile_btn.config(text=f"Stop Profiling ({session.remaining():.0f}s)")
+        else:
+            profile_btn.config(text="Profile 5 min")
+
+    def _toggle_profile():
+        if profiling.is_active():
+            profiling.stop()
+            status.config(text="Profiling stopped; writing reports...")
+        else:
+            session = profiling.start(profiling.DEFAULT_SECONDS, app=parent.winfo_toplevel())
+            if session is not None:
+                status.config(text=f"Profiling to {session.directory}")
+        _update_profile_button()
+
+    stalls_btn = tk.Button(actions, **BUTTON_STYLE)
+
+    def _update_stalls_button():
+        stalls_btn.config(text="Stop Watching UI Stalls" if tk_profiler.is_installed() else "Watch UI Stalls")
+
+    def _toggle_stalls():
+        # Saved as the tk_profiler setting so the choice survives a restart
+        if tk_profiler.is_installed():
+            tk_profiler.uninstall()
+            keys.save_extended_settings({'tk_profiler': '0'})
+            status.config(text="UI stall watcher off.")
+        else:
+            tk_profiler.install(parent.winfo_toplevel())
+            keys.save_extended_settings({'tk_profiler': '1'})
+            status.config(text="Watching for UI stalls.")
+        _update_stalls_button()
+
+    stalls_btn.config(command=_toggle_stalls)
+    _update_stalls_button()
+    profile_btn.config(command=_toggle_profile)
+    tk.Button(actions, text="Export Snapshot", command=_export, **BUTTON_STYLE).pack(side=tk.LEFT)
+    tk.Button(actions, text="Reset", command=_reset, **BUTTON_STYLE).pack(side=tk.LEFT, padx=(6, 0))
+    profile_btn.pack(side=tk.LEFT, padx=(6, 0))
+    stalls_btn.pack(side=tk.LEFT, padx=(6, 0))
+    status.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(8, 0))
+
+    _refresh()
+    parent.after(REFRESH_MS, _tick)
+
+    refs.update({
+        'diagnostics_text': text,
+        'diagnostics_headline': headline,
+        'diagnostics_status': status,
+        'refresh': _refresh,
+    })
+    return refs
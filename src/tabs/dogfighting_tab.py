@@ -1,15 +1,16 @@
 import tkinter as tk
 from typing import Dict, Any, List, Tuple
 import threading
-import graphs
 
 import global_variables as gv
 try:
     # When imported as 'src.tabs.dogfighting_tab'
     from .. import ironpoint_api  # type: ignore
+    from .. import leaderboard_model  # type: ignore
 except Exception:
     # When imported as 'tabs.dogfighting_tab'
     import ironpoint_api  # type: ignore
+    import leaderboard_model  # type: ignore
 # Removed keys import (no longer used after removing sound pickers)
 
 # Builds the Dogfighting tab contents mirroring the Piracy tab layout.
@@ -28,7 +29,8 @@ COLORS = {
 def _make_listbox_section(master: tk.Misc, title: str) -> Dict[str, Any]:
     """Create a titled section containing a Listbox + vertical scrollbar.
 
-    Returns dict with keys: outer, header, listbox, scrollbar, set_items, clear
+    Returns dict with keys: outer, header, listbox, scrollbar, set_items,
+    set_items_and_ids, set_rows, clear, highlight_user
     """
     outer = tk.Frame(master, bg=COLORS['bg'], highlightthickness=1, highlightbackground=COLORS['border'])
     header = tk.Label(outer, text=title, fg=COLORS['fg'], bg=COLORS['bg'], font=("Times New Roman", 12, "bold"))
@@ -51,71 +53,59 @@ def _make_listbox_section(master: tk.Misc, title: str) -> Dict[str, Any]:
 
     lb.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-    # Keep row IDs parallel to rendered items so we can highlight a specific user
+    # Rows currently shown as (text, user id), so updates only touch rows that changed
+    lb._rows = []  # type: ignore[attr-defined]
+    # Row IDs parallel to rendered items so we can highlight a specific user
     lb._row_ids = []  # type: ignore[attr-defined]
+    lb._highlighted = []  # type: ignore[attr-defined]
 
-    def _reset_row_styles():
+    def set_rows(rows: List[Tuple[str, str]]):
+        """Show ready-to-insert rows [(text, user_id)] (leaderboard_model views).
+
+        Only rows that differ from what is shown are replaced, so an unchanged
+        refresh costs no listbox calls.
+        """
         try:
-            size = lb.size()
-            for i in range(size):
-                try:
-                    lb.itemconfig(i, fg=COLORS['fg'], bg=COLORS['card_bg'])
-                except Exception:
-                    pass
+            current = getattr(lb, '_rows', [])
+            changes, count = leaderboard_model.diff_rows(current, rows)
+            shown = len(current)
+            if shown > count:
+                lb.delete(count, tk.END)
+            for idx, (text, _rid) in changes:
+                if idx < min(shown, count):
+                    lb.delete(idx)
+                    lb.insert(idx, text)
+                else:
+                    lb.insert(tk.END, text)
+            lb._rows = list(rows)  # type: ignore[attr-defined]
+            lb._row_ids = [rid for _text, rid in rows]  # type: ignore[attr-defined]
         except Exception:
             pass
 
     def set_items(items: List[Tuple[str, Any]]):
-        try:
-            lb.delete(0, tk.END)
-            lb._row_ids = []  # type: ignore[attr-defined]
-            # items expected as list of (name, value)
-            for i, (name, value) in enumerate(items, start=1):
-                try:
-                    if isinstance(value, (int, float)):
-                        text_val = f"{value:,.0f}" if isinstance(value, int) else f"{value:,.2f}"
-                    else:
-                        text_val = str(value)
-                except Exception:
-                    text_val = str(value)
-                # Show value before the name so the important number is visible even if truncated
-                lb.insert(tk.END, f"{text_val} - {name}")
-            _reset_row_styles()
-        except Exception:
-            pass
+        # items expected as list of (name, value); value shown first so it stays visible if truncated
+        set_rows([(f"{leaderboard_model.format_value(value)} - {name}", '') for name, value in items])
 
     def set_items_and_ids(items: List[Tuple[str, Any]], row_ids: List[str]):
-        try:
-            lb.delete(0, tk.END)
-            lb._row_ids = list(row_ids) if row_ids is not None else []  # type: ignore[attr-defined]
-            for i, (name, value) in enumerate(items, start=1):
-                try:
-                    if isinstance(value, (int, float)):
-                        text_val = f"{value:,.0f}" if isinstance(value, int) else f"{value:,.2f}"
-                    else:
-                        text_val = str(value)
-                except Exception:
-                    text_val = str(value)
-                # Show value before the name so the important number is visible even if truncated
-                lb.insert(tk.END, f"{text_val} - {name}")
-            _reset_row_styles()
-        except Exception:
-            pass
+        ids = list(row_ids) if row_ids is not None else []
+        ids += [''] * (len(items) - len(ids))
+        set_rows([(f"{leaderboard_model.format_value(value)} - {name}", str(rid))
+                  for (name, value), rid in zip(items, ids)])
 
     def clear():
-        try:
-            lb.delete(0, tk.END)
-            try:
-                lb._row_ids = []  # type: ignore[attr-defined]
-            except Exception:
-                pass
-        except Exception:
-            pass
+        set_rows([])
 
     def highlight_user(user_id: str):
         """Highlight any rows belonging to the provided user_id in gold."""
         try:
-            _reset_row_styles()
+            size = lb.size()
+            for idx in getattr(lb, '_highlighted', []):
+                if idx < size:
+                    try:
+                        lb.itemconfig(idx, fg=COLORS['fg'], bg=COLORS['card_bg'])
+                    except Exception:
+                        pass
+            lb._highlighted = []  # type: ignore[attr-defined]
             if not user_id:
                 return
             ids = getattr(lb, '_row_ids', [])
@@ -123,6 +113,7 @@ def _make_listbox_section(master: tk.Misc, title: str) -> Dict[str, Any]:
                 try:
                     if str(rid) == str(user_id):
                         lb.itemconfig(idx, fg='#000000', bg=COLORS['gold'])
+                        lb._highlighted.append(idx)  # type: ignore[attr-defined]
                 except Exception:
                     pass
         except Exception:
@@ -135,6 +126,7 @@ def _make_listbox_section(master: tk.Misc, title: str) -> Dict[str, Any]:
         'scrollbar': None,  # scrollbar removed to save space
         'set_items': set_items,
         'set_items_and_ids': set_items_and_ids,
+        'set_rows': set_rows,
         'clear': clear,
         'highlight_user': highlight_user,
     }
@@ -226,205 +218,30 @@ def build(parent: tk.Misc) -> Dict[str, Any]:
         "font": ("Times New Roman", 12),
     }
 
-    def _refresh_from_api():
+    def _refresh_from_api(on_done=None):
         """Fetch latest patch and leaderboard data from the IronPoint API and update UI.
 
-        Currently mirrors the Piracy tab behavior.
+        Currently mirrors the Piracy tab behavior, including `on_done(ok)`.
         """
         app = gv.get_app()
 
         def _update_ui(patch_version: str,
-                        piracy_rows: List[dict],
-                        blackbox_rows: List[dict]):
+                        views: Dict[str, List[Tuple[str, str]]],
+                        row_counts: Tuple[int, int]):
+            """Insert the ranked views computed on the worker (leaderboard_model)."""
             # Save patch version globally
             try:
                 gv.set_patch_version(patch_version)
             except Exception:
                 pass
 
-            # Build leaderboards
-            try:
-                # Top-right: Most PU $ in Damages (from blackbox summary value_pu)
-                damages_items = []    # (display_name, value_pu)
-                damages_ids: List[str] = []
-                for r in blackbox_rows:
-                    user_ident = r.get("user_id") or r.get("player_id") or ""
-                    value_pu = r.get("value_pu", 0) or 0
-                    try:
-                        value_pu = int(value_pu)
-                    except Exception:
-                        try:
-                            value_pu = float(value_pu)
-                        except Exception:
-                            value_pu = 0
-                    damages_items.append((user_ident or "Unknown", value_pu))
-                    damages_ids.append(str(user_ident))
-
-                # Top-left: Top Ranked Arena Commander (by rating from blackbox summary)
-                rating_items = []  # (display_name, rating)
-                rating_ids: List[str] = []
-                for r in blackbox_rows:
-                    user_ident = r.get("user_id") or r.get("player_id") or ""
-                    rating = r.get("rating", 0) or 0
-                    try:
-                        rating = float(rating)
-                    except Exception:
-                        rating = 0.0
-                    rating_items.append((user_ident or "Unknown", rating))
-                    rating_ids.append(str(user_ident))
-
-                # Resolve display names for all unique IDs used in these lists
-                try:
-                    ids_for_names = [n for n, _ in rating_items] + [n for n, _ in damages_items]
-                    name_map = ironpoint_api.resolve_user_display_names(ids_for_names)
-                except Exception:
-                    name_map = {}
-
-                # Ensure current user's nickname is shown even if not in filtered cache
-                try:
-                    cur_uid = gv.get_user_id()
-                    if cur_uid:
-                        friendly = ironpoint_api.get_user_display_name_fallback(cur_uid)
-                        if isinstance(friendly, str) and friendly and friendly != cur_uid:
-                            name_map[str(cur_uid)] = friendly
-                except Exception:
-                    pass
-
-                # Filter out entries without a proper nickname mapping
-                def _filter_and_map(items, ids, mapping):
-                    new_items = []
-                    new_ids = []
-                    try:
-                        for (raw_name, val), rid in zip(items, ids):
-                            disp = mapping.get(rid)
-                            if isinstance(disp, str) and disp.strip() and disp != rid:
-                                new_items.append((disp, val))
-                                new_ids.append(rid)
-                    except Exception:
-                        pass
-                    return new_items, new_ids
-
-                rating_items, rating_ids = _filter_and_map(rating_items, rating_ids, name_map)
-                damages_items, damages_ids = _filter_and_map(damages_items, damages_ids, name_map)
-
-                # Sort desc and keep ids aligned
-                def _sort_with_ids(items, ids):
-                    pairs = list(zip(items, ids))
-                    pairs.sort(key=lambda p: p[0][1], reverse=True)
-                    sorted_items = [p[0] for p in pairs]
-                    sorted_ids = [p[1] for p in pairs]
-                    return sorted_items, sorted_ids
-
-                rating_items, rating_ids = _sort_with_ids(rating_items, rating_ids)
-                damages_items, damages_ids = _sort_with_ids(damages_items, damages_ids)
-
-                # Format ratings with no decimal places (rounded) for display only
-                rating_items_display: List[Tuple[str, Any]] = []
-                try:
-                    for name, val in rating_items[:100]:
-                        try:
-                            # Round to nearest whole number and add commas
-                            rounded = int(round(float(val)))
-                            text_val = f"{rounded:,}"
-                        except Exception:
-                            text_val = str(val)
-                        rating_items_display.append((name, text_val))
-                except Exception:
-                    rating_items_display = [(name, str(val)) for name, val in rating_items[:100]]
-
-                # Format damages with a leading $ for display only
-                damages_items_display: List[Tuple[str, Any]] = []
-                try:
-                    for name, val in damages_items[:100]:
-                        try:
-                            if isinstance(val, int):
-                                text_val = f"${val:,}"
-                            else:
-                                # floats or other numerics
-                                text_val = f"${float(val):,.2f}"
-                        except Exception:
-                            text_val = f"${val}"
-                        damages_items_display.append((name, text_val))
-                except Exception:
-                    damages_items_display = [(name, f"${val}") for name, val in damages_items[:100]]
-
-                tl['set_items_and_ids'](rating_items_display, rating_ids[:100])
-                tr['set_items_and_ids'](damages_items_display, damages_ids[:100])
-            except Exception:
-                pass
-
-            # Ship kills from blackbox rows (fallback to FPS kills if ship_* fields not present)
-            try:
-                ac_items = []
-                pu_items = []
-                ac_ids: List[str] = []
-                pu_ids: List[str] = []
-                for r in blackbox_rows:
-                    user_ident = r.get("user_id") or r.get("player_id") or ""
-                    # Prefer ship_kills_* fields; gracefully fall back to fps_kills_*
-                    ac = r.get("ship_kills_ac", r.get("fps_kills_ac", 0)) or 0
-                    pu = r.get("ship_kills_pu", r.get("fps_kills_pu", 0)) or 0
-                    try:
-                        ac = int(ac)
-                    except Exception:
-                        ac = 0
-                    try:
-                        pu = int(pu)
-                    except Exception:
-                        pu = 0
-                    ac_items.append((user_ident or "Unknown", ac))
-                    pu_items.append((user_ident or "Unknown", pu))
-                    ac_ids.append(str(user_ident))
-                    pu_ids.append(str(user_ident))
-                # Resolve names for ship kill lists
-                try:
-                    ids_for_names = [n for n, _ in ac_items] + [n for n, _ in pu_items]
-                    name_map = ironpoint_api.resolve_user_display_names(ids_for_names)
-                except Exception:
-                    name_map = {}
-
-                # Ensure current user's nickname is shown even if not in filtered cache
+            # Top-left: AC rating; top-right: PU $ in damages; bottom: ship kills AC / PU
+            for section, view in ((tl, 'ac_rating'), (tr, 'pu_damages'), (bl_ship_ac, 'ship_kills_ac'), (bl_ship_pu, 'ship_kills_pu')):
                 try:
-                    cur_uid = gv.get_user_id()
-                    if cur_uid:
-                        friendly = ironpoint_api.get_user_display_name_fallback(cur_uid)
-                        if isinstance(friendly, str) and friendly and friendly != cur_uid:
-                            name_map[str(cur_uid)] = friendly
+                    section['set_rows'](views.get(view) or [])
                 except Exception:
                     pass
 
-                # Filter out entries without a proper nickname mapping
-                def _filter_and_map(items, ids, mapping):
-                    new_items = []
-                    new_ids = []
-                    try:
-                        for (raw_name, val), rid in zip(items, ids):
-                            disp = mapping.get(rid)
-                            if isinstance(disp, str) and disp.strip() and disp != rid:
-                                new_items.append((disp, val))
-                                new_ids.append(rid)
-                    except Exception:
-                        pass
-                    return new_items, new_ids
-
-                ac_items, ac_ids = _filter_and_map(ac_items, ac_ids, name_map)
-                pu_items, pu_ids = _filter_and_map(pu_items, pu_ids, name_map)
-
-                def _sort_with_ids(items, ids):
-                    pairs = list(zip(items, ids))
-                    pairs.sort(key=lambda p: p[0][1], reverse=True)
-                    sorted_items = [p[0] for p in pairs]
-                    sorted_ids = [p[1] for p in pairs]
-                    return sorted_items, sorted_ids
-
-                ac_items, ac_ids = _sort_with_ids(ac_items, ac_ids)
-                pu_items, pu_ids = _sort_with_ids(pu_items, pu_ids)
-
-                bl_ship_ac['set_items_and_ids'](ac_items[:100], ac_ids[:100])
-                bl_ship_pu['set_items_and_ids'](pu_items[:100], pu_ids[:100])
-            except Exception:
-                pass
-
             # Highlight current user if present
             try:
                 current_uid = gv.get_user_id()
@@ -437,15 +254,17 @@ def build(parent: tk.Misc) -> Dict[str, Any]:
                 pass
 
             try:
-                gv.log(f"Dogfighting data loaded for patch {patch_version}: piracy rows={len(piracy_rows)}, blackbox rows={len(blackbox_rows)}")
+                gv.log(f"Dogfighting data loaded for patch {patch_version}: piracy rows={row_counts[0]}, blackbox rows={row_counts[1]}")
             except Exception:
                 pass
 
         def _worker():
+            ok = False
             try:
                 # Determine latest patch
                 try:
                     latest_patch = ironpoint_api.get_latest_patch_version()
+                    ok = bool(latest_patch)
                 except Exception:
                     latest_patch = gv.get_patch_version()
                 if not latest_patch:
@@ -454,18 +273,24 @@ def build(parent: tk.Misc) -> Dict[str, Any]:
                 # Fetch data for that patch (same endpoints as Piracy for now)
                 piracy = ironpoint_api.get_piracy_summary(latest_patch) if latest_patch else []
                 blackbox = ironpoint_api.get_blackbox_summary(latest_patch) if latest_patch else []
+                # Rank and format here so the Tk thread only inserts rows
+                views = leaderboard_model.dogfighting_views(blackbox)
+                counts = (len(piracy), len(blackbox))
 
                 # Schedule UI update on main thread
                 try:
                     if app is not None:
-                        app.after(0, _update_ui, latest_patch, piracy, blackbox)
+                        app.after(0, _update_ui, latest_patch, views, counts)
                 except Exception:
-                    _update_ui(latest_patch, piracy, blackbox)
+                    _update_ui(latest_patch, views, counts)
             except Exception as e:
                 try:
                     gv.log(f"Dogfighting tab refresh failed: {e}")
                 except Exception:
                     pass
+                ok = False
+            if callable(on_done):
+                on_done(ok)
 
         threading.Thread(target=_worker, daemon=True).start()
 
@@ -556,6 +381,8 @@ def build(parent: tk.Misc) -> Dict[str, Any]:
             container.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
 
             try:
+                # Deferred import: graphs pulls in plotly/kaleido only when first opened
+                import graphs  # type: ignore
                 gw = graphs.GraphWidget(container)
                 graphs_window_ref['widget'] = gw
             except Exception:
@@ -592,16 +419,13 @@ def build(parent: tk.Misc) -> Dict[str, Any]:
 
     refs.update({
         'refresh_button': refresh_btn,
+        'refresh': _refresh_from_api,
         'clear_button': clear_btn,
         'graphs_button': graphs_btn,
         'open_graphs_window': _open_graphs_window,
         'graphs_window_ref': graphs_window_ref,
     })
 
-    # Seed with example data so the UI looks alive on first open
-    try:
-        _refresh_from_api()
-    except Exception:
-        pass
+    # Data is loaded by refresh_scheduler when the tab is shown
 
     return refs
@@ -3,6 +3,7 @@ from tkinter import scrolledtext
 from typing import Dict, Any
 import global_variables
 import backup_loader
+import keys
 
 # Shared button style (kept in sync with setup_gui if imported there)
 BUTTON_STYLE = {
@@ -29,6 +30,26 @@ def build(parent: tk.Misc, app) -> Dict[str, Any]:
     except Exception:
         pass
 
+    # Level filter for the console (persisted in the cfg extended settings)
+    level_row = tk.Frame(parent, bg="#1a1a1a")
+    level_row.pack(side=tk.TOP, fill=tk.X, padx=4, pady=(0, 4))
+    tk.Label(level_row, text="Show:", fg="#bcbcd8", bg="#1a1a1a", font=("Times New Roman", 11)).pack(side=tk.LEFT)
+    level_var = tk.StringVar(value=global_variables.get_log_level())
+
+    def _on_level_change(value):
+        global_variables.set_log_level(value)
+        try:
+            keys.save_extended_settings({'log_level': value})
+        except Exception:
+            pass
+
+    level_menu = tk.OptionMenu(level_row, level_var, *global_variables.LOG_LEVELS, command=_on_level_change)
+    try:
+        level_menu.configure(bg="#0f0f0f", fg="#ff5555", highlightthickness=1)
+    except Exception:
+        pass
+    level_menu.pack(side=tk.LEFT, padx=(6, 0))
+
     # Log text area
     log_text_container = tk.Frame(parent, bg="#1a1a1a")
     log_text_container.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
@@ -60,5 +81,6 @@ def build(parent: tk.Misc, app) -> Dict[str, Any]:
     refs.update({
         'log_controls_container': log_controls_container,
         'log_text_area': text_area,
+        'log_level_var': level_var,
     })
     return refs
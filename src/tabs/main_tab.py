@@ -6,8 +6,10 @@ from datetime import datetime, timezone, timedelta
 import tkinter as tk
 from typing import Dict, Any, Optional, Callable
 from PIL import Image, ImageTk
-import requests
 import global_variables
+import kill_db
+import endpoints
+import net
 from tabs.details_window import open_details_window
 
 # This module is responsible for building content inside the Main tab.
@@ -234,12 +236,12 @@ def build(parent: tk.Misc, app, banner_path: Optional[str] = None, update_messag
             return (None, None, None)
         try:
             h = str(handle).strip()
-            url = f"https://robertsspaceindustries.com/en/citizens/{h}"
+            url = endpoints.citizen_url(h)
             headers = {
                 "User-Agent": "BeowulfHunter/1.0 (proximity)",
                 "Accept": "text/html,application/xhtml+xml",
             }
-            resp = requests.get(url, headers=headers, timeout=timeout)
+            resp = net.get(url, endpoint='rsi.citizen', priority='prefetch', headers=headers, timeout=timeout)
             if resp.status_code != 200 or not resp.text:
                 return (None, None, None)
             html = resp.text
@@ -251,7 +253,7 @@ def build(parent: tk.Misc, app, banner_path: Optional[str] = None, update_messag
             def _abs(u):
                 if not u:
                     return None
-                return ("https://robertsspaceindustries.com" + u) if u.startswith("/") else u
+                return endpoints.rsi_url(u)
             avatar_url = _abs(m_avatar.group(1)) if m_avatar else None
             orgimg_url = _abs(m_orgimg.group(1)) if m_orgimg else None
             org_name = m_orgname.group(1).strip() if m_orgname else None
@@ -264,7 +266,7 @@ def build(parent: tk.Misc, app, banner_path: Optional[str] = None, update_messag
         if not url:
             return None
         try:
-            r = requests.get(url, timeout=8)
+            r = net.get(url, priority='prefetch', timeout=8)
             if r.status_code != 200:
                 return None
             im = Image.open(io.BytesIO(r.content)).convert('RGBA')
@@ -374,7 +376,7 @@ def build(parent: tk.Misc, app, banner_path: Optional[str] = None, update_messag
         def worker():
             content = None
             try:
-                resp = requests.get(url, timeout=10)
+                resp = net.get(url, priority='thumbnails', timeout=10)
                 if resp.status_code == 200:
                     content = resp.content
             except Exception:
@@ -421,28 +423,62 @@ def build(parent: tk.Misc, app, banner_path: Optional[str] = None, update_messag
     def _load_avatar_async(label: tk.Label, url: Optional[str]):
         _load_avatar_async_sized(label, url, 50)
 
-    # Update label (optional)
-    if update_message:
+    # Holds the update notice and startup status; stays packed so late notices keep their place
+    notice_area = tk.Frame(parent, bg="#1a1a1a")
+    notice_area.pack(side=tk.TOP, fill=tk.X)
+
+    key_section = tk.Frame(parent, bg="#1a1a1a")
+    key_section.pack(side=tk.TOP, fill=tk.X, padx=6, pady=6)
+
+    # Startup progress (update check, key validation, kill sync); hidden when idle
+    startup_status_label = tk.Label(
+        notice_area,
+        text="",
+        font=("Times New Roman", 10),
+        fg="#bcbcd8",
+        bg="#1a1a1a",
+    )
+
+    def set_startup_status(text: Optional[str]):
+        """Show a short startup progress line above the key section; empty hides it."""
         try:
-            update_label = tk.Label(
-                parent,
-                text=update_message,
-                font=("Times New Roman", 12),
-                fg="#ff5555",
-                bg="#1a1a1a",
-                wraplength=700,
-                justify="center",
-                cursor="hand2",
-            )
-            update_label.pack(pady=(4, 8))
+            if text:
+                startup_status_label.config(text=text)
+                if not startup_status_label.winfo_ismapped():
+                    startup_status_label.pack(side=tk.BOTTOM, pady=(0, 2))
+            else:
+                startup_status_label.pack_forget()
+        except Exception:
+            pass
+
+    # Update label (optional); may be set later once the background update check returns
+    def set_update_message(message: Optional[str]):
+        if not message:
+            return
+        try:
+            update_label = widgets.get('update_label')
+            if update_label is None:
+                update_label = tk.Label(
+                    notice_area,
+                    text=message,
+                    font=("Times New Roman", 12),
+                    fg="#ff5555",
+                    bg="#1a1a1a",
+                    wraplength=700,
+                    justify="center",
+                    cursor="hand2",
+                )
+                update_label.pack(side=tk.TOP, pady=(4, 8))
+                widgets['update_label'] = update_label
+            else:
+                update_label.config(text=message)
             if on_update_click is not None:
-                update_label.bind("<Button-1>", lambda event: on_update_click(event, update_message))
-            widgets['update_label'] = update_label
+                update_label.bind("<Button-1>", lambda event: on_update_click(event, message))
         except Exception:
             pass
 
-    key_section = tk.Frame(parent, bg="#1a1a1a")
-    key_section.pack(side=tk.TOP, fill=tk.X, padx=6, pady=6)
+    if update_message:
+        set_update_message(update_message)
 
     # Center container for key widgets (keeps label+entry centered horizontally)
     key_center = tk.Frame(key_section, bg="#1a1a1a")
@@ -1192,50 +1228,21 @@ def build(parent: tk.Misc, app, banner_path: Optional[str] = None, update_messag
                 pass
 
     # Refresh lists from the combined API-like kills list (API + live)
-    def refresh_kill_columns():
+    def _latest_from_history():
+        """(pu_total, ac_total, pu_latest, ac_latest) from kill_db, or None when unavailable."""
         try:
-            all_items = global_variables.get_api_kills_all() or []
+            if not kill_db.get_active_user() or not kill_db.is_available():
+                return None
+            pu_total = kill_db.count_kills(ac=False)
+            ac_total = kill_db.count_kills(ac=True)
+            if pu_total is None or ac_total is None:
+                return None
+            return (pu_total, ac_total, kill_db.latest_kills(ac=False, limit=10), kill_db.latest_kills(ac=True, limit=10))
         except Exception:
-            all_items = []
-
-        # Deduplicate by (timestamp, victims, game_mode)
-        seen = set()
-        pu_items = []
-        ac_items = []
-
-        def _is_ac_record(rec: Dict[str, Any]) -> bool:
-            # Determine AC using both game_mode and zone/location heuristics
-            mode = (rec.get('game_mode') or '').lower()
-            if mode in (
-                'arena_commander', 'ac', 'electronic_access', 'ea_starfighter',
-                'ea_duel', 'ea_freeflight', 'ea_vanduul_swarm'
-            ) or any(x in mode for x in ('arena', 'electronic access')):
-                return True
-            zone = (rec.get('zone') or rec.get('location') or rec.get('map') or '')
-            zl = zone.lower()
-            # Common AC map cues
-            if any(k in zl for k in ('dying star', 'broken moon', 'electronic access', 'arena')):
-                return True
-            return False
-
-        # Normalize and split
-        for it in all_items:
-            try:
-                ts = str(it.get('timestamp') or '').strip()
-                # victims is a list; use first for display, full for dedupe key
-                victims_list = it.get('victims') if isinstance(it.get('victims'), list) else []
-                key = (ts, tuple(victims_list), (it.get('game_mode') or '').upper())
-                if key in seen:
-                    continue
-                seen.add(key)
-                if _is_ac_record(it):
-                    ac_items.append(it)
-                else:
-                    pu_items.append(it)
-            except Exception:
-                continue
+            return None
 
-        # Sort by timestamp descending
+    def refresh_kill_columns():
+        # Used for sorting (fallback path) and the "recent kill" border
         def _parse_ts(s: str):
             try:
                 if not s:
@@ -1255,20 +1262,69 @@ def build(parent: tk.Misc, app, banner_path: Optional[str] = None, update_messag
             except Exception:
                 return None
 
-        def _sort_key(it):
-            dt = _parse_ts(str(it.get('timestamp') or ''))
-            return dt or datetime.fromtimestamp(0, tz=timezone.utc)
+        # The local history database answers counts and the newest 10 per column
+        # with indexed queries; fall back to scanning the in-memory list without it
+        history = _latest_from_history()
+        if history is not None:
+            pu_total, ac_total, pu_items_sorted, ac_items_sorted = history
+        else:
+            try:
+                all_items = global_variables.get_api_kills_all() or []
+            except Exception:
+                all_items = []
+
+            # Deduplicate by (timestamp, victims, game_mode)
+            seen = set()
+            pu_items = []
+            ac_items = []
+
+            def _is_ac_record(rec: Dict[str, Any]) -> bool:
+                # Determine AC using both game_mode and zone/location heuristics
+                mode = (rec.get('game_mode') or '').lower()
+                if mode in (
+                    'arena_commander', 'ac', 'electronic_access', 'ea_starfighter',
+                    'ea_duel', 'ea_freeflight', 'ea_vanduul_swarm'
+                ) or any(x in mode for x in ('arena', 'electronic access')):
+                    return True
+                zone = (rec.get('zone') or rec.get('location') or rec.get('map') or '')
+                zl = zone.lower()
+                # Common AC map cues
+                if any(k in zl for k in ('dying star', 'broken moon', 'electronic access', 'arena')):
+                    return True
+                return False
+
+            # Normalize and split
+            for it in all_items:
+                try:
+                    ts = str(it.get('timestamp') or '').strip()
+                    # victims is a list; use first for display, full for dedupe key
+                    victims_list = it.get('victims') if isinstance(it.get('victims'), list) else []
+                    key = (ts, tuple(victims_list), (it.get('game_mode') or '').upper())
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    if _is_ac_record(it):
+                        ac_items.append(it)
+                    else:
+                        pu_items.append(it)
+                except Exception:
+                    continue
+
+            def _sort_key(it):
+                dt = _parse_ts(str(it.get('timestamp') or ''))
+                return dt or datetime.fromtimestamp(0, tz=timezone.utc)
 
-        pu_items_sorted = sorted(pu_items, key=_sort_key, reverse=True)
-        ac_items_sorted = sorted(ac_items, key=_sort_key, reverse=True)
+            pu_items_sorted = sorted(pu_items, key=_sort_key, reverse=True)
+            ac_items_sorted = sorted(ac_items, key=_sort_key, reverse=True)
+            pu_total, ac_total = len(pu_items_sorted), len(ac_items_sorted)
 
         # Update headers with grand totals
         try:
-            set_pu_kills_count(len(pu_items_sorted))
+            set_pu_kills_count(pu_total)
         except Exception:
             pass
         try:
-            set_ac_kills_count(len(ac_items_sorted))
+            set_ac_kills_count(ac_total)
         except Exception:
             pass
 
@@ -1309,6 +1365,9 @@ def build(parent: tk.Misc, app, banner_path: Optional[str] = None, update_messag
 
     widgets.update({
         'key_section': key_section,
+        'set_update_message': set_update_message,
+        'startup_status_label': startup_status_label,
+        'set_startup_status': set_startup_status,
         'key_entry': key_entry,
         'org_key_entry': org_key_entry,
         'org_error_label': org_error_label,
@@ -3,13 +3,16 @@ from typing import Dict, Any, List, Tuple
 import threading
 
 import global_variables as gv
+import submission_queue
 try:
     # When imported as 'src.tabs.piracy_tab'
     from .. import ironpoint_api  # type: ignore
+    from .. import leaderboard_model  # type: ignore
     from . import add_hit_form  # type: ignore
 except Exception:
     # When imported as 'tabs.piracy_tab'
     import ironpoint_api  # type: ignore
+    import leaderboard_model  # type: ignore
     from tabs import add_hit_form  # type: ignore
 
 # Builds the Piracy tab contents with four areas:
@@ -36,7 +39,8 @@ ACTION_STRIP_MIN_WIDTH = 250
 def _make_listbox_section(master: tk.Misc, title: str) -> Dict[str, Any]:
     """Create a titled section containing a Listbox + vertical scrollbar.
 
-    Returns dict with keys: outer, header, listbox, scrollbar, set_items, clear
+    Returns dict with keys: outer, header, listbox, scrollbar, set_items,
+    set_items_and_ids, set_rows, clear, highlight_user
     """
     outer = tk.Frame(master, bg=COLORS['bg'], highlightthickness=1, highlightbackground=COLORS['border'])
     header = tk.Label(outer, text=title, fg=COLORS['fg'], bg=COLORS['bg'], font=("Times New Roman", 12, "bold"))
@@ -59,71 +63,59 @@ def _make_listbox_section(master: tk.Misc, title: str) -> Dict[str, Any]:
 
     lb.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-    # Keep row IDs parallel to rendered items so we can highlight a specific user
+    # Rows currently shown as (text, user id), so updates only touch rows that changed
+    lb._rows = []  # type: ignore[attr-defined]
+    # Row IDs parallel to rendered items so we can highlight a specific user
     lb._row_ids = []  # type: ignore[attr-defined]
+    lb._highlighted = []  # type: ignore[attr-defined]
 
-    def _reset_row_styles():
+    def set_rows(rows: List[Tuple[str, str]]):
+        """Show ready-to-insert rows [(text, user_id)] (leaderboard_model views).
+
+        Only rows that differ from what is shown are replaced, so an unchanged
+        refresh costs no listbox calls.
+        """
         try:
-            size = lb.size()
-            for i in range(size):
-                try:
-                    lb.itemconfig(i, fg=COLORS['fg'], bg=COLORS['card_bg'])
-                except Exception:
-                    pass
+            current = getattr(lb, '_rows', [])
+            changes, count = leaderboard_model.diff_rows(current, rows)
+            shown = len(current)
+            if shown > count:
+                lb.delete(count, tk.END)
+            for idx, (text, _rid) in changes:
+                if idx < min(shown, count):
+                    lb.delete(idx)
+                    lb.insert(idx, text)
+                else:
+                    lb.insert(tk.END, text)
+            lb._rows = list(rows)  # type: ignore[attr-defined]
+            lb._row_ids = [rid for _text, rid in rows]  # type: ignore[attr-defined]
         except Exception:
             pass
 
     def set_items(items: List[Tuple[str, Any]]):
-        try:
-            lb.delete(0, tk.END)
-            lb._row_ids = []  # type: ignore[attr-defined]
-            # items expected as list of (name, value)
-            for i, (name, value) in enumerate(items, start=1):
-                try:
-                    if isinstance(value, (int, float)):
-                        text_val = f"{value:,.0f}" if isinstance(value, int) else f"{value:,.2f}"
-                    else:
-                        text_val = str(value)
-                except Exception:
-                    text_val = str(value)
-                # Show value before the name so the important number is visible even if truncated
-                lb.insert(tk.END, f"{text_val} - {name}")
-            _reset_row_styles()
-        except Exception:
-            pass
+        # items expected as list of (name, value); value shown first so it stays visible if truncated
+        set_rows([(f"{leaderboard_model.format_value(value)} - {name}", '') for name, value in items])
 
     def set_items_and_ids(items: List[Tuple[str, Any]], row_ids: List[str]):
-        try:
-            lb.delete(0, tk.END)
-            lb._row_ids = list(row_ids) if row_ids is not None else []  # type: ignore[attr-defined]
-            for i, (name, value) in enumerate(items, start=1):
-                try:
-                    if isinstance(value, (int, float)):
-                        text_val = f"{value:,.0f}" if isinstance(value, int) else f"{value:,.2f}"
-                    else:
-                        text_val = str(value)
-                except Exception:
-                    text_val = str(value)
-                # Show value before the name so the important number is visible even if truncated
-                lb.insert(tk.END, f"{text_val} - {name}")
-            _reset_row_styles()
-        except Exception:
-            pass
+        ids = list(row_ids) if row_ids is not None else []
+        ids += [''] * (len(items) - len(ids))
+        set_rows([(f"{leaderboard_model.format_value(value)} - {name}", str(rid))
+                  for (name, value), rid in zip(items, ids)])
 
     def clear():
-        try:
-            lb.delete(0, tk.END)
-            try:
-                lb._row_ids = []  # type: ignore[attr-defined]
-            except Exception:
-                pass
-        except Exception:
-            pass
+        set_rows([])
 
     def highlight_user(user_id: str):
         """Highlight any rows belonging to the provided user_id in gold."""
         try:
-            _reset_row_styles()
+            size = lb.size()
+            for idx in getattr(lb, '_highlighted', []):
+                if idx < size:
+                    try:
+                        lb.itemconfig(idx, fg=COLORS['fg'], bg=COLORS['card_bg'])
+                    except Exception:
+                        pass
+            lb._highlighted = []  # type: ignore[attr-defined]
             if not user_id:
                 return
             ids = getattr(lb, '_row_ids', [])
@@ -131,6 +123,7 @@ def _make_listbox_section(master: tk.Misc, title: str) -> Dict[str, Any]:
                 try:
                     if str(rid) == str(user_id):
                         lb.itemconfig(idx, fg='#000000', bg=COLORS['gold'])
+                        lb._highlighted.append(idx)  # type: ignore[attr-defined]
                 except Exception:
                     pass
         except Exception:
@@ -143,6 +136,7 @@ def _make_listbox_section(master: tk.Misc, title: str) -> Dict[str, Any]:
         'scrollbar': None,  # scrollbar removed to save space
         'set_items': set_items,
         'set_items_and_ids': set_items_and_ids,
+        'set_rows': set_rows,
         'clear': clear,
         'highlight_user': highlight_user,
     }
@@ -211,6 +205,42 @@ def build(parent: tk.Misc) -> Dict[str, Any]:
     actions_header = tk.Label(br_outer, text="Pirate Hits (10 most recent)", fg=COLORS['fg'], bg=COLORS['bg'], font=("Times New Roman", 12, "bold"))
     actions_header.pack(side=tk.TOP, anchor='w', padx=6, pady=(6, 4))
 
+    # Queued hit submissions (submission_queue); hidden while the outbox is empty.
+    # Clicking it while some are rejected sends those again.
+    submission_label = tk.Label(br_outer, text='', fg=COLORS['muted'], bg=COLORS['bg'], anchor='w', justify='left',
+                                wraplength=ACTION_STRIP_MIN_WIDTH, cursor='hand2')
+
+    def _set_submission_status(pending: int, failed: int):
+        try:
+            parts = []
+            if pending:
+                parts.append(f"{pending} hit{'s' if pending != 1 else ''} waiting to send")
+            if failed:
+                parts.append(f"{failed} rejected (click to retry)")
+            if not parts:
+                submission_label.pack_forget()
+                return
+            submission_label.configure(text=' · '.join(parts), fg=COLORS['accent'] if failed else COLORS['muted'])
+            if not submission_label.winfo_ismapped():
+                submission_label.pack(side=tk.TOP, anchor='w', padx=6, pady=(0, 4), after=actions_header)
+        except Exception:
+            pass
+
+    def _on_submission_click(_evt=None):
+        try:
+            if submission_queue.status(ironpoint_api.HIT_SUBMISSION_KIND).get('failed'):
+                submission_queue.retry_failed(ironpoint_api.HIT_SUBMISSION_KIND)
+        except Exception:
+            pass
+
+    submission_label.bind('<Button-1>', _on_submission_click)
+    refs['set_submission_status'] = _set_submission_status
+    try:
+        _initial = submission_queue.status(ironpoint_api.HIT_SUBMISSION_KIND)
+        _set_submission_status(_initial.get('pending', 0), _initial.get('failed', 0))
+    except Exception:
+        pass
+
     # Scrollable card list for latest pirate hits. We keep this inside the
     # existing right-side column so overall grid widths remain unchanged.
     cards_container = tk.Frame(br_outer, bg=COLORS['bg'])
@@ -384,171 +414,31 @@ def build(parent: tk.Misc) -> Dict[str, Any]:
 
     # No action buttons are required here anymore; only the latest hits list is shown.
 
-    def _refresh_from_api():
-        """Fetch latest patch and leaderboard data from the IronPoint API and update UI."""
+    def _refresh_from_api(on_done=None):
+        """Fetch latest patch and leaderboard data from the IronPoint API and update UI.
+
+        `on_done(ok)` is called from the worker thread when the fetch finished;
+        ok is False when the latest patch could not be determined from the API.
+        """
         app = gv.get_app()
 
         def _update_ui(patch_version: str,
-                        piracy_rows: List[dict],
-                        blackbox_rows: List[dict],
-                        latest_hits: List[dict]):
+                        views: Dict[str, List[Tuple[str, str]]],
+                        latest_hits: List[dict],
+                        row_counts: Tuple[int, int]):
+            """Insert the ranked views computed on the worker (leaderboard_model)."""
             # Save patch version globally
             try:
                 gv.set_patch_version(patch_version)
             except Exception:
                 pass
 
-            # Build leaderboards
-            try:
-                # Most aUEC Stolen: from piracy_rows total_value sum per player
-                # API rows already represent totals per player, so use total_value and hits_created
-                stolen_items = []  # (display_name, value)
-                hits_items = []    # (display_name, value)
-                stolen_ids: List[str] = []
-                hits_ids: List[str] = []
-                for r in piracy_rows:
-                    user_ident = r.get("player_id") or r.get("user_id") or ""
-                    total_value = r.get("total_value", 0) or 0
-                    hits_created = r.get("hits_created", 0) or 0
-                    # Coerce strings to ints if necessary
-                    try:
-                        total_value = int(total_value)
-                    except Exception:
-                        total_value = 0
-                    try:
-                        hits_created = int(hits_created)
-                    except Exception:
-                        hits_created = 0
-                    stolen_items.append((user_ident or "Unknown", total_value))
-                    hits_items.append((user_ident or "Unknown", hits_created))
-                    stolen_ids.append(str(user_ident))
-                    hits_ids.append(str(user_ident))
-
-                # Resolve display names for all unique IDs used in these lists
-                try:
-                    ids_for_names = [n for n, _ in stolen_items] + [n for n, _ in hits_items]
-                    name_map = ironpoint_api.resolve_user_display_names(ids_for_names)
-                except Exception:
-                    name_map = {}
-
-                # Ensure current user's nickname is shown even if not in filtered cache
-                try:
-                    cur_uid = gv.get_user_id()
-                    if cur_uid:
-                        friendly = ironpoint_api.get_user_display_name_fallback(cur_uid)
-                        if isinstance(friendly, str) and friendly and friendly != cur_uid:
-                            name_map[str(cur_uid)] = friendly
-                except Exception:
-                    pass
-
-                # Filter out any entries that don't resolve to a proper nickname
-                def _filter_and_map(items, ids, mapping):
-                    new_items = []
-                    new_ids = []
-                    try:
-                        for (raw_name, val), rid in zip(items, ids):
-                            disp = mapping.get(rid)
-                            if isinstance(disp, str) and disp.strip() and disp != rid:
-                                new_items.append((disp, val))
-                                new_ids.append(rid)
-                    except Exception:
-                        pass
-                    return new_items, new_ids
-
-                stolen_items, stolen_ids = _filter_and_map(stolen_items, stolen_ids, name_map)
-                hits_items, hits_ids = _filter_and_map(hits_items, hits_ids, name_map)
-
-                # Sort desc
-                stolen_items.sort(key=lambda x: x[1], reverse=True)
-                hits_items.sort(key=lambda x: x[1], reverse=True)
-                # Maintain same ordering for ids after sort by recomputing order
-                def _sort_with_ids(items, ids):
-                    pairs = list(zip(items, ids))
-                    pairs.sort(key=lambda p: p[0][1], reverse=True)
-                    sorted_items = [p[0] for p in pairs]
-                    sorted_ids = [p[1] for p in pairs]
-                    return sorted_items, sorted_ids
-
-                stolen_items, stolen_ids = _sort_with_ids(stolen_items, stolen_ids)
-                hits_items, hits_ids = _sort_with_ids(hits_items, hits_ids)
-
-                tl['set_items_and_ids'](stolen_items[:100], stolen_ids[:100])
-                tr['set_items_and_ids'](hits_items[:100], hits_ids[:100])
-            except Exception:
-                pass
-
-            # FPS kills from blackbox rows
-            try:
-                ac_items = []
-                pu_items = []
-                ac_ids: List[str] = []
-                pu_ids: List[str] = []
-                for r in blackbox_rows:
-                    user_ident = r.get("user_id") or r.get("player_id") or ""
-                    ac = r.get("fps_kills_ac", 0) or 0
-                    pu = r.get("fps_kills_pu", 0) or 0
-                    try:
-                        ac = int(ac)
-                    except Exception:
-                        ac = 0
-                    try:
-                        pu = int(pu)
-                    except Exception:
-                        pu = 0
-                    ac_items.append((user_ident or "Unknown", ac))
-                    pu_items.append((user_ident or "Unknown", pu))
-                    ac_ids.append(str(user_ident))
-                    pu_ids.append(str(user_ident))
-                # Resolve names for FPS lists
-                try:
-                    ids_for_names = [n for n, _ in ac_items] + [n for n, _ in pu_items]
-                    name_map = ironpoint_api.resolve_user_display_names(ids_for_names)
-                except Exception:
-                    name_map = {}
-
-                # Ensure current user's nickname is shown even if not in filtered cache
+            for section, view in ((tl, 'uec_stolen'), (tr, 'pirate_hits'), (bl_ac, 'fps_kills_ac'), (bl_pu, 'fps_kills_pu')):
                 try:
-                    cur_uid = gv.get_user_id()
-                    if cur_uid:
-                        friendly = ironpoint_api.get_user_display_name_fallback(cur_uid)
-                        if isinstance(friendly, str) and friendly and friendly != cur_uid:
-                            name_map[str(cur_uid)] = friendly
+                    section['set_rows'](views.get(view) or [])
                 except Exception:
                     pass
 
-                # Filter out entries with no proper nickname mapping
-                def _filter_and_map(items, ids, mapping):
-                    new_items = []
-                    new_ids = []
-                    try:
-                        for (raw_name, val), rid in zip(items, ids):
-                            disp = mapping.get(rid)
-                            if isinstance(disp, str) and disp.strip() and disp != rid:
-                                new_items.append((disp, val))
-                                new_ids.append(rid)
-                    except Exception:
-                        pass
-                    return new_items, new_ids
-
-                ac_items, ac_ids = _filter_and_map(ac_items, ac_ids, name_map)
-                pu_items, pu_ids = _filter_and_map(pu_items, pu_ids, name_map)
-
-                # Keep ids aligned with sorted items
-                def _sort_with_ids(items, ids):
-                    pairs = list(zip(items, ids))
-                    pairs.sort(key=lambda p: p[0][1], reverse=True)
-                    sorted_items = [p[0] for p in pairs]
-                    sorted_ids = [p[1] for p in pairs]
-                    return sorted_items, sorted_ids
-
-                ac_items, ac_ids = _sort_with_ids(ac_items, ac_ids)
-                pu_items, pu_ids = _sort_with_ids(pu_items, pu_ids)
-
-                bl_ac['set_items_and_ids'](ac_items[:100], ac_ids[:100])
-                bl_pu['set_items_and_ids'](pu_items[:100], pu_ids[:100])
-            except Exception:
-                pass
-
             # Latest hits cards
             try:
                 _set_hit_cards(latest_hits or [])
@@ -567,15 +457,17 @@ def build(parent: tk.Misc) -> Dict[str, Any]:
                 pass
 
             try:
-                gv.log(f"Piracy data loaded for patch {patch_version}: piracy rows={len(piracy_rows)}, blackbox rows={len(blackbox_rows)}, latest_hits={len(latest_hits) if isinstance(latest_hits, list) else 0}")
+                gv.log(f"Piracy data loaded for patch {patch_version}: piracy rows={row_counts[0]}, blackbox rows={row_counts[1]}, latest_hits={len(latest_hits) if isinstance(latest_hits, list) else 0}")
             except Exception:
                 pass
 
         def _worker():
+            ok = False
             try:
                 # Determine latest patch
                 try:
                     latest_patch = ironpoint_api.get_latest_patch_version()
+                    ok = bool(latest_patch)
                 except Exception:
                     latest_patch = gv.get_patch_version()
                 if not latest_patch:
@@ -586,18 +478,24 @@ def build(parent: tk.Misc) -> Dict[str, Any]:
                 piracy = ironpoint_api.get_piracy_summary(latest_patch) if latest_patch else []
                 blackbox = ironpoint_api.get_blackbox_summary(latest_patch) if latest_patch else []
                 hits_latest = ironpoint_api.get_latest_pirate_hits()
+                # Rank and format here so the Tk thread only inserts rows
+                views = leaderboard_model.piracy_views(piracy, blackbox)
+                counts = (len(piracy), len(blackbox))
 
                 # Schedule UI update on main thread
                 try:
                     if app is not None:
-                        app.after(0, _update_ui, latest_patch, piracy, blackbox, hits_latest)
+                        app.after(0, _update_ui, latest_patch, views, hits_latest, counts)
                 except Exception:
-                    _update_ui(latest_patch, piracy, blackbox, hits_latest)
+                    _update_ui(latest_patch, views, hits_latest, counts)
             except Exception as e:
                 try:
                     gv.log(f"Piracy tab refresh failed: {e}")
                 except Exception:
                     pass
+                ok = False
+            if callable(on_done):
+                on_done(ok)
 
         threading.Thread(target=_worker, daemon=True).start()
 
@@ -629,14 +527,11 @@ def build(parent: tk.Misc) -> Dict[str, Any]:
         'set_fps_kills_ac': set_fps_kills_ac,
         'set_fps_kills_pu': set_fps_kills_pu,
         'clear_all_piracy_lists': _placeholder_clear,
+        'refresh': _refresh_from_api,
     })
 
     # Removed deprecated "Insert Hit"/"Add New" actions and buttons.
 
-    # Seed with example data so the UI looks alive on first open
-    try:
-        _refresh_from_api()
-    except Exception:
-        pass
+    # Data is loaded by refresh_scheduler when the tab is shown
 
     return refs
@@ -7,7 +7,8 @@ import re
 import io
 
 from PIL import Image, ImageTk  # type: ignore
-import requests  # type: ignore
+import endpoints
+import net
 
 import global_variables as gv
 
@@ -108,7 +109,7 @@ def build(parent: tk.Misc) -> Dict[str, Any]:
         if key in _avatar_cache:
             return _avatar_cache.get(key)
         try:
-            r = requests.get(url, timeout=6)
+            r = net.get(url, priority='prefetch', timeout=6)
             if r.status_code != 200:
                 return None
             im = Image.open(io.BytesIO(r.content)).convert('RGBA')
@@ -142,7 +143,7 @@ def build(parent: tk.Misc) -> Dict[str, Any]:
                 return url
             if url.startswith('http://') or url.startswith('https://'):
                 return url
-            base = 'https://robertsspaceindustries.com'
+            base = endpoints.RSI_SITE
             if not url.startswith('/'):
                 url = '/' + url
             return base + url
@@ -152,10 +153,10 @@ def build(parent: tk.Misc) -> Dict[str, Any]:
     def _fetch_rsi_profile(handle: Optional[str]):
         if not isinstance(handle, str) or not handle:
             return (None, None, None)
-        url = f"https://robertsspaceindustries.com/en/citizens/{handle}"
+        url = endpoints.citizen_url(handle)
         try:
             headers = {"User-Agent": "BeowulfHunter/1.0 (proximity-tab)", "Accept": "text/html,application/xhtml+xml"}
-            r = requests.get(url, headers=headers, timeout=8)
+            r = net.get(url, endpoint='rsi.citizen', priority='prefetch', headers=headers, timeout=8)
             if r.status_code != 200:
                 return (None, None, None)
             html = r.text
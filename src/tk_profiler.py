@@ -0,0 +1,244 @@
+"""Tk event loop stall detector and slow-callback profiler.
+
+`install(app)` wraps `after()`/`after_idle()` on every widget so each
+scheduled callback is timed (histogram `tk.callback{callback}`), and starts a
+watchdog thread that notices when the Tk thread has been busy for longer than
+STALL_THRESHOLD_MS. For a stall the watchdog captures the Tk thread's stack
+while it is still blocked, so the record names the offending code rather than
+whatever runs next:
+
+    {'at', 'callback', 'duration_ms', 'stack'}
+
+`callback` is the module-qualified name of the after() callback, or
+EVENT_HANDLER when the loop was blocked outside an after() callback
+(a button click, a <Configure> binding, geometry/redraw). Recent stalls are kept in memory,
+logged as warnings and included in metrics snapshots (Diagnostics tab).
+
+Off by default, since it patches Tk for the whole process. Turn it on with
+BEOWULFHUNTER_TK_PROFILER=1, the `tk_profiler=1` extended setting, or the
+Diagnostics tab (which saves that setting).
+"""
+import os
+import sys
+import threading
+import time
+import tkinter as tk
+import traceback
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import global_variables
+import metrics
+
+# Busy time on the Tk thread that counts as a stall
+STALL_THRESHOLD_MS = 200
+# Watchdog poll interval and Tk heartbeat interval
+WATCHDOG_INTERVAL_MS = 50
+HEARTBEAT_MS = 100
+# Recent stall records kept for the Diagnostics tab
+MAX_STALLS = 50
+# Innermost frames kept per captured stack
+STACK_DEPTH = 25
+
+EVENT_HANDLER = '<event handler or redraw>'
+
+_lock = threading.Lock()
+_stalls: deque = deque(maxlen=MAX_STALLS)
+_installed = False
+# Bumped on every install/uninstall so the previous heartbeat and watchdog stop
+_generation = 0
+_tk_thread_id: Optional[int] = None
+# Callback currently running on the Tk thread: {'name', 'start', 'record'}
+_active: Optional[Dict[str, Any]] = None
+_heartbeat = 0.0
+# End of the last after() callback; the heartbeat may be late because of it
+_last_callback_end = 0.0
+_loop_stall: Optional[Dict[str, Any]] = None
+_histograms: Dict[str, Any] = {}
+
+_original_after = tk.Misc.after
+_original_after_idle = tk.Misc.after_idle
+
+
+def _callback_name(func) -> str:
+    target = getattr(func, '__func__', func)
+    qualname = getattr(target, '__qualname__', None) or type(target).__name__
+    module = getattr(target, '__module__', None)
+    return f"{module}.{qualname}" if module else qualname
+
+
+def _capture_stack() -> List[str]:
+    frame = sys._current_frames().get(_tk_thread_id)
+    if frame is None:
+        return []
+    return traceback.format_stack(frame, limit=STACK_DEPTH)
+
+
+def _new_record(name: str, started: float) -> Dict[str, Any]:
+    return {
+        'at': datetime.now(timezone.utc).isoformat(timespec='milliseconds'),
+        'callback': name,
+        'duration_ms': round((time.perf_counter() - started) * 1000.0, 1),
+        'stack': _capture_stack(),
+    }
+
+
+def _timed(func):
+    name = _callback_name(func)
+
+    def _run(*args):
+        global _active, _last_callback_end
+        started = time.perf_counter()
+        active = {'name': name, 'start': started, 'record': None}
+        previous, _active = _active, active
+        try:
+            return func(*args)
+        finally:
+            _last_callback_end = time.perf_counter()
+            elapsed = _last_callback_end - started
+            _active = previous
+            hist = _histograms.get(name)
+            if hist is None:
+                hist = _histograms[name] = metrics.histogram('tk.callback', callback=name)
+            hist.observe(elapsed)
+            if elapsed * 1000.0 >= STALL_THRESHOLD_MS:
+                _finish_stall(active, elapsed)
+
+    _run.__wrapped__ = func
+    return _run
+
+
+def _finish_stall(active: Dict[str, Any], elapsed: float):
+    with _lock:
+        record = active.get('record')
+        if record is None:
+            # Watchdog did not sample it in time; keep the stall without a stack
+            record = _new_record(active['name'], active['start'])
+            record['stack'] = []
+            _stalls.append(record)
+            metrics.counter('tk.stalls').inc()
+        record['duration_ms'] = round(elapsed * 1000.0, 1)
+    global_variables.log(
+        f"UI stall: {record['callback']} blocked the event loop for {record['duration_ms']:.0f}ms",
+        level='warning',
+    )
+
+
+def _after(self, ms, func=None, *args):
+    if func is None:
+        return _original_after(self, ms)
+    return _original_after(self, ms, _timed(func), *args)
+
+
+def _after_idle(self, func, *args):
+    return _original_after_idle(self, _timed(func), *args)
+
+
+def _beat(app, generation: int):
+    global _heartbeat, _loop_stall
+    if generation != _generation:
+        return
+    _heartbeat = time.perf_counter()
+    stall = _loop_stall
+    if stall is not None:
+        _loop_stall = None
+        with _lock:
+            stall['duration_ms'] = round((_heartbeat - stall['_since']) * 1000.0, 1)
+            stall.pop('_since', None)
+        global_variables.log(
+            f"UI stall: {stall['callback']} blocked the event loop for {stall['duration_ms']:.0f}ms",
+            level='warning',
+        )
+    try:
+        _original_after(app, HEARTBEAT_MS, lambda: _beat(app, generation))
+    except Exception:
+        pass
+
+
+def _watchdog(generation: int):
+    global _loop_stall
+    threshold = STALL_THRESHOLD_MS / 1000.0
+    while generation == _generation:
+        time.sleep(WATCHDOG_INTERVAL_MS / 1000.0)
+        try:
+            now = time.perf_counter()
+            active = _active
+            if active is not None:
+                if active['record'] is None and now - active['start'] >= threshold:
+                    with _lock:
+                        if active['record'] is None and _active is active:
+                            record = _new_record(active['name'], active['start'])
+                            active['record'] = record
+                            _stalls.append(record)
+                            metrics.counter('tk.stalls').inc()
+                continue
+            # No after() callback running but the heartbeat is late: a bound event handler is blocking
+            since = max(_heartbeat + HEARTBEAT_MS / 1000.0, _last_callback_end)
+            if _heartbeat and _loop_stall is None and now - since >= threshold:
+                with _lock:
+                    record = _new_record(EVENT_HANDLER, since)
+                    record['_since'] = since
+                    _loop_stall = record
+                    _stalls.append(record)
+                    metrics.counter('tk.stalls').inc()
+        except Exception:
+            pass
+
+
+def get_stalls() -> List[Dict[str, Any]]:
+    """Recent stalls, newest last."""
+    with _lock:
+        return [{k: v for k, v in r.items() if not k.startswith('_')} for r in _stalls]
+
+
+def clear_stalls():
+    with _lock:
+        _stalls.clear()
+
+
+def is_installed() -> bool:
+    return _installed
+
+
+def install(app):
+    """Instrument Tk callbacks and start the stall watchdog (idempotent). Call on the Tk thread."""
+    global _installed, _generation, _tk_thread_id
+    if _installed:
+        return
+    _installed = True
+    _generation += 1
+    _tk_thread_id = threading.get_ident()
+    tk.Misc.after = _after
+    tk.Misc.after_idle = _after_idle
+    metrics.register_section('ui_stalls', get_stalls)
+    _beat(app, _generation)
+    threading.Thread(target=_watchdog, args=(_generation,), name="tk-watchdog", daemon=True).start()
+
+
+def uninstall():
+    """Restore Tk's after()/after_idle() and stop the watchdog. Call on the Tk thread."""
+    global _installed, _generation, _active, _loop_stall
+    if not _installed:
+        return
+    _installed = False
+    _generation += 1
+    tk.Misc.after = _original_after
+    tk.Misc.after_idle = _original_after_idle
+    _active = None
+    _loop_stall = None
+
+
+def install_from_config(app) -> bool:
+    """Install if BEOWULFHUNTER_TK_PROFILER or the tk_profiler setting asks for it."""
+    value = os.environ.get('BEOWULFHUNTER_TK_PROFILER')
+    if not value:
+        try:
+            import keys
+            value = keys.extended_settings.get('tk_profiler')
+        except Exception:
+            value = None
+    if not value or value.strip().lower() not in ('1', 'true', 'yes', 'on'):
+        return False
+    install(app)
+    return True
@@ -0,0 +1,58 @@
+"""In-memory index over the org's /users/ list.
+
+Built from compact rows, `[id, display_name, is_member]`, where `is_member` is
+1 when the user holds one of ironpoint_api.ALLOWED_RANK_IDS. ironpoint_api
+stores those rows in the persistent HTTP cache (so the directory is available
+right after a restart) and rebuilds the directory whenever the cached rows are
+refreshed; views only read from it:
+
+    names          id -> display name, every user
+    member_names   id -> display name, allowed ranks only (leaderboard names)
+    id_for(name)   display name -> id
+    search(prefix) display names starting with `prefix` (prefix_index)
+"""
+from typing import Any, Dict, Iterable, List, Optional
+
+from prefix_index import PrefixIndex
+
+
+class UserDirectory:
+    __slots__ = ('names', 'member_names', '_ids_by_name', '_index')
+
+    def __init__(self, rows: Optional[Iterable[Any]] = None):
+        names: Dict[str, str] = {}
+        member_names: Dict[str, str] = {}
+        for row in rows or ():
+            try:
+                uid, name, is_member = str(row[0]), str(row[1]), bool(row[2])
+            except Exception:
+                continue
+            if not uid or not name:
+                continue
+            names[uid] = name
+            if is_member:
+                member_names[uid] = name
+        ids_by_name: Dict[str, str] = {}
+        for uid, name in sorted(names.items()):
+            ids_by_name.setdefault(name, uid)
+        self.names = names
+        self.member_names = member_names
+        self._ids_by_name = ids_by_name
+        self._index = PrefixIndex(names.values())
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def id_for(self, name: str) -> Optional[str]:
+        """Id of the user with this exact display name, or None for guests."""
+        return self._ids_by_name.get(name)
+
+    def search(self, prefix: str, limit: int = 10, exclude: Iterable[str] = ()) -> List[str]:
+        """Up to `limit` display names starting with `prefix`, skipping `exclude`."""
+        return self._index.search(prefix, limit=limit, exclude=exclude)
+
+    def options(self) -> List[Dict[str, str]]:
+        """Every user as {id, name}, sorted case-insensitively by name."""
+        out = [{"id": uid, "name": name} for uid, name in self.names.items()]
+        out.sort(key=lambda x: (x["name"].lower(), x["name"], x["id"]))
+        return out
@@ -0,0 +1,182 @@
+"""Signed local record of the last successful key validation and release check.
+
+Launch used to wait on three round-trips before the app was usable: the ORG key
+(api.starcitizen-api.com), the player key (Beowulf /keys/validatekey) and the
+GitHub latest-release lookup. This module keeps the outcome of the last
+successful ones in <data dir>/validation_cache.json so the next launch can
+start from them and re-check in the background:
+
+    keys      sha256 fingerprint of (player key, ORG key), user_id, username, validated_at
+    release   local_version, remote_version, download_url, checked_at
+
+Raw keys are never written. Each entry is signed with HMAC-SHA256 using a
+random secret kept next to it (validation_cache.secret), so an edited, copied
+or truncated entry is ignored instead of trusted. This is tamper detection for
+a local file, not secrecy: anyone who can read the data dir can re-sign it.
+
+Entries expire after global_variables.get_key_validation_ttl() and
+get_update_check_ttl() seconds (extended settings `key_validation_ttl`,
+`update_check_ttl`); a TTL of 0 turns the shortcut off.
+"""
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import global_variables
+
+CACHE_FILE = 'validation_cache.json'
+SECRET_FILE = 'validation_cache.secret'
+
+_lock = threading.Lock()
+_secret: Optional[bytes] = None
+
+
+def _data_path(name: str) -> str:
+    from config import get_data_dir
+    return os.path.join(get_data_dir(), name)
+
+
+def _get_secret() -> bytes:
+    global _secret
+    if _secret is not None:
+        return _secret
+    path = _data_path(SECRET_FILE)
+    try:
+        with open(path, 'rb') as f:
+            secret = f.read()
+        if len(secret) >= 32:
+            _secret = secret
+            return secret
+    except FileNotFoundError:
+        pass
+    secret = secrets.token_bytes(32)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(secret)
+    _secret = secret
+    return secret
+
+
+def _sign(name: str, record: Dict[str, Any]) -> str:
+    body = json.dumps({'name': name, 'record': record}, sort_keys=True, separators=(',', ':'))
+    return hmac.new(_get_secret(), body.encode('utf-8'), hashlib.sha256).hexdigest()
+
+
+def _read_all() -> Dict[str, Any]:
+    try:
+        with open(_data_path(CACHE_FILE), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        global_variables.log(f"Ignoring unreadable validation cache: {e}")
+        return {}
+
+
+def _write_all(data: Dict[str, Any]):
+    path = _data_path(CACHE_FILE)
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+def _load(name: str) -> Optional[Dict[str, Any]]:
+    """The verified record stored under `name`, or None."""
+    try:
+        with _lock:
+            entry = _read_all().get(name)
+            if not isinstance(entry, dict) or not isinstance(entry.get('record'), dict):
+                return None
+            record = entry['record']
+            if not hmac.compare_digest(str(entry.get('sig') or ''), _sign(name, record)):
+                global_variables.log(f"Validation cache entry '{name}' failed its signature check; ignoring it.")
+                return None
+            return record
+    except Exception as e:
+        global_variables.log(f"Could not read validation cache entry '{name}': {e}")
+        return None
+
+
+def _store(name: str, record: Optional[Dict[str, Any]]):
+    """Sign and persist `record` under `name`; None removes the entry."""
+    try:
+        with _lock:
+            data = _read_all()
+            if record is None:
+                if name not in data:
+                    return
+                data.pop(name, None)
+            else:
+                data[name] = {'record': record, 'sig': _sign(name, record)}
+            _write_all(data)
+    except Exception as e:
+        global_variables.log(f"Could not update validation cache entry '{name}': {e}")
+
+
+def _fresh(stamp: Any, ttl: float) -> bool:
+    try:
+        age = time.time() - float(stamp)
+    except Exception:
+        return False
+    # A stamp from the future means the clock moved; do not trust it
+    return 0 <= age < ttl
+
+
+def key_fingerprint(player_key: str, org_key: str) -> str:
+    material = f"{(player_key or '').strip()}\n{(org_key or '').strip()}"
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+
+def get_key_validation(player_key: str, org_key: str) -> Optional[Dict[str, Any]]:
+    """The last successful validation of exactly these keys, if still within the TTL."""
+    ttl = global_variables.get_key_validation_ttl()
+    if ttl <= 0 or not player_key or not org_key:
+        return None
+    record = _load('keys')
+    if not record or record.get('key_hash') != key_fingerprint(player_key, org_key):
+        return None
+    if not _fresh(record.get('validated_at'), ttl):
+        return None
+    return record
+
+
+def put_key_validation(player_key: str, org_key: str, user_id: Optional[str], username: Optional[str] = None):
+    _store('keys', {
+        'key_hash': key_fingerprint(player_key, org_key),
+        'user_id': str(user_id) if user_id else None,
+        'username': str(username) if username else None,
+        'validated_at': time.time(),
+    })
+
+
+def clear_key_validation():
+    _store('keys', None)
+
+
+def get_release_check(local_version: str, allow_stale: bool = False) -> Optional[Dict[str, Any]]:
+    """The last release check made by this version, if within the TTL (or any age with `allow_stale`)."""
+    ttl = global_variables.get_update_check_ttl()
+    if ttl <= 0 and not allow_stale:
+        return None
+    record = _load('release')
+    if not record or record.get('local_version') != local_version:
+        return None
+    if not allow_stale and not _fresh(record.get('checked_at'), ttl):
+        return None
+    return record
+
+
+def put_release_check(local_version: str, remote_version: str, download_url: str):
+    _store('release', {
+        'local_version': local_version,
+        'remote_version': remote_version,
+        'download_url': download_url,
+        'checked_at': time.time(),
+    })